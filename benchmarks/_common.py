@@ -0,0 +1,86 @@
+"""Shared helpers for the benchmark scripts in this directory.
+
+Benchmarks are run as scripts, i.e. `python benchmarks/bench_queued.py`, and only use the stdlib.
+"""
+
+from __future__ import annotations
+
+import logging
+import logging.config
+from pathlib import Path
+import time
+import typing as t
+
+def reset_logging() -> None:
+    """Close all configured handlers and return logging to an empty config."""
+    logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the `pct` percentile (0-100) of a list of samples."""
+    if not samples:
+        return 0.0
+
+    ordered: list[float] = sorted(samples)
+    idx: int = min(len(ordered) - 1, int(round((pct / 100) * (len(ordered) - 1))))
+
+    return ordered[idx]
+
+
+def time_calls(func: t.Callable[[int], t.Any], count: int) -> list[float]:
+    """Call `func(i)` `count` times, and return the duration of each call in microseconds."""
+    samples: list[float] = []
+    _perf = time.perf_counter_ns
+
+    for i in range(count):
+        start = _perf()
+        func(i)
+        samples.append((_perf() - start) / 1000)
+
+    return samples
+
+
+def time_total(func: t.Callable[[], t.Any]) -> tuple[float, float]:
+    """Call `func()` once, and return the (wall clock, CPU) time it took in seconds."""
+    wall_start: float = time.perf_counter()
+    cpu_start: float = time.process_time()
+    func()
+
+    return time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def print_table(headers: list[str], rows: list[list[t.Any]]) -> None:
+    """Print a simple, aligned text table."""
+    cells: list[list[str]] = [headers] + [
+        [f"{c:,.2f}" if isinstance(c, float) else f"{c}" for c in row] for row in rows
+    ]
+    widths: list[int] = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+
+    for n, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            print("  ".join("-" * w for w in widths))
+
+
+class SlowStream:
+    """A file-like object that stalls every `stall_every` writes."""
+
+    def __init__(self, path: Path, stall_every: int, stall_ms: float) -> None:
+        """Open `path` for appending."""
+        self._file = open(path, "a")
+        self._writes: int = 0
+        self.stall_every: int = stall_every
+        self.stall_ms: float = stall_ms
+
+    def write(self, s: str) -> int:
+        self._writes += 1
+        if self.stall_every and self._writes % self.stall_every == 0:
+            time.sleep(self.stall_ms / 1000)
+
+        return self._file.write(s)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,94 @@
+"""Compare `asctime` rendering in `logging.Formatter` vs. `CachedTimeFormatter` at different log rates.
+
+`--count` records are created with timestamps spaced for each rate, so at 1 record/s every record is in
+a new second, and at 1M records/s nearly every record reuses the cached second. `formatTime()` and the
+full `format()` with `MESSAGE_FMT_STANDARD` are timed for each formatter, best of `--repeat` runs.
+
+Usage:
+    python benchmarks/bench_asctime.py --count 100000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+import typing as t
+
+import red_logging
+
+from _common import print_table
+
+RATES: list[int] = [1, 100, 10_000, 1_000_000]
+
+
+def _records(rate: int, count: int) -> list[logging.LogRecord]:
+    start: float = time.time()
+    records: list[logging.LogRecord] = []
+    for i in range(count):
+        record = logging.LogRecord("app", logging.INFO, __file__, 1, "tick %d", (i,), None)
+        record.created = start + i / rate
+        record.msecs = int((record.created - int(record.created)) * 1000) + 0.0
+        records.append(record)
+
+    return records
+
+
+def ns_per_record(
+    func: t.Callable[[logging.LogRecord], str], records: list[logging.LogRecord], repeat: int
+) -> float:
+    best: int = 0
+    for _ in range(repeat):
+        start: int = time.perf_counter_ns()
+        for record in records:
+            func(record)
+        elapsed: int = time.perf_counter_ns() - start
+        best = elapsed if not best else min(best, elapsed)
+
+    return best / len(records)
+
+
+def run(count: int, repeat: int) -> None:
+    fmt: str = red_logging.fmts.MESSAGE_FMT_STANDARD
+    datefmt: str = red_logging.fmts.DATE_FMT_STANDARD
+    formatters: dict[str, logging.Formatter] = {
+        "logging.Formatter": logging.Formatter(fmt, datefmt),
+        "CachedTimeFormatter": red_logging.formatters.CachedTimeFormatter(fmt, datefmt),
+        "CompiledFormatter": red_logging.formatters.CompiledFormatter(fmt, datefmt),
+    }
+
+    rows: list[list] = []
+    for rate in RATES:
+        records: list[logging.LogRecord] = _records(rate, count)
+        baseline: dict[str, float] = {}
+        for label, formatter in formatters.items():
+            time_ns: float = ns_per_record(
+                lambda record: formatter.formatTime(record, datefmt), records, repeat
+            )
+            format_ns: float = ns_per_record(formatter.format, records, repeat)
+            baseline = baseline or {"time": time_ns, "format": format_ns}
+            rows.append(
+                [
+                    f"{rate:,}/s",
+                    label,
+                    f"{time_ns:,.0f}",
+                    f"{baseline['time'] / time_ns:.2f}x",
+                    f"{format_ns:,.0f}",
+                    f"{1e9 / format_ns:,.0f}",
+                    f"{baseline['format'] / format_ns:.2f}x",
+                ]
+            )
+
+    print_table(
+        ["log rate", "formatter", "formatTime ns", "speedup", "format ns", "records/s", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
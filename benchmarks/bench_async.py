@@ -0,0 +1,125 @@
+"""Compare asyncio event loop lag with synchronous handlers vs. `asyncio_handlers=True`.
+
+Each mode logs `--count` records from a coroutine, in bursts of `--burst` records, through a console
+handler and a file handler. The console handler writes to a file that sleeps for `--stall-ms` every
+`--stall-every` writes, to simulate a slow terminal or a disk stall. While the records are logged, a
+second coroutine asks to wake up every millisecond, and how late it wakes up (the event loop lag) is
+recorded. Records/sec includes awaiting `shutdown_async_handlers()`, so every record is written.
+
+Usage:
+    python benchmarks/bench_async.py --count 50000 --burst 100 --stall-every 50 --stall-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import tempfile
+import time
+
+import red_logging
+
+from _common import SlowStream, percentile, print_table, reset_logging
+
+def build_config(logdir: Path, asyncio_handlers: bool, stream: SlowStream) -> dict:
+    formatter = red_logging.get_formatter_config(name="default")
+    console = red_logging.config_classes.StreamHandlerConfig(
+        name="console",
+        formatter="default",
+        stream=stream,
+    )
+    app_file = red_logging.config_classes.FileHandlerConfig(
+        name="app_file",
+        level="DEBUG",
+        formatter="default",
+        filename=str(logdir / "app.log"),
+    )
+    logger = red_logging.get_logger_config(
+        name="bench", handlers=["console", "app_file"], level="DEBUG"
+    )
+
+    return red_logging.assemble_configdict(
+        root_handlers=[],
+        formatters=[formatter],
+        handlers=[console, app_file],
+        loggers=[logger],
+        asyncio_handlers=asyncio_handlers,
+    )
+
+
+async def measure(count: int, burst: int) -> tuple[float, list[float]]:
+    """Log `count` records while sampling event loop lag. Return (seconds, lag samples in ms)."""
+    log = logging.getLogger("bench")
+    lags: list[float] = []
+    done: asyncio.Event = asyncio.Event()
+
+    async def _ticker() -> None:
+        while not done.is_set():
+            expected: float = time.perf_counter() + 0.001
+            await asyncio.sleep(0.001)
+            lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    ticker: asyncio.Task = asyncio.create_task(_ticker())
+    start: float = time.perf_counter()
+    for i in range(count):
+        log.info("request %d handled in %s ms", i, 12.5)
+        if i % burst == burst - 1:
+            await asyncio.sleep(0)
+
+    await red_logging.handlers.shutdown_async_handlers()
+    elapsed: float = time.perf_counter() - start
+    done.set()
+    await ticker
+
+    return elapsed, lags
+
+
+def run(count: int, burst: int, stall_every: int, stall_ms: float) -> None:
+    rows: list[list] = []
+
+    for asyncio_handlers in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            stream = SlowStream(
+                Path(tmp) / "console.log", stall_every=stall_every, stall_ms=stall_ms
+            )
+            logging.config.dictConfig(
+                build_config(Path(tmp), asyncio_handlers=asyncio_handlers, stream=stream)
+            )
+
+            elapsed, lags = asyncio.run(measure(count=count, burst=burst))
+            reset_logging()
+            stream.close()
+
+        rows.append(
+            [
+                "asyncio_handlers" if asyncio_handlers else "sync",
+                count,
+                count / elapsed,
+                percentile(lags, 50),
+                percentile(lags, 99),
+                max(lags),
+            ]
+        )
+
+    print_table(
+        ["mode", "records", "records/sec", "lag p50 (ms)", "lag p99 (ms)", "lag max (ms)"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--burst", type=int, default=100)
+    parser.add_argument("--stall-every", type=int, default=50)
+    parser.add_argument("--stall-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    run(
+        count=args.count,
+        burst=args.burst,
+        stall_every=args.stall_every,
+        stall_ms=args.stall_ms,
+    )
@@ -0,0 +1,105 @@
+"""Compare `BinaryFileHandler` vs. a `FileHandler` with `MESSAGE_FMT_STANDARD`: file size & write throughput.
+
+`--count` records are logged through a logger with each handler, from 4 call sites with typical args
+(a request path, a user id, a duration & a status). Both handlers flush after every record. The file
+size, bytes per record & records/second are reported, and the decode speed of
+`python -m red_logging.decode` back to `MESSAGE_FMT_STANDARD` text.
+
+Usage:
+    python benchmarks/bench_binary.py --count 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import tempfile
+import time
+
+import red_logging
+
+from _common import print_table, reset_logging
+
+def log_records(logger: logging.Logger, count: int) -> None:
+    for i in range(count // 4):
+        logger.info("GET %s user=%d took %.3f ms", "/api/v1/orders", 1000 + i % 97, 12.5 + i % 13)
+        logger.debug("cache hit for key %s", f"order:{i % 500}")
+        logger.info("request %s finished with status %d", f"req-{i}", 200)
+        logger.warning("slow query on %s", "orders")
+
+
+def write(handler: logging.Handler, count: int) -> float:
+    logger = logging.getLogger("app.http")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        start: float = time.perf_counter()
+        log_records(logger, count)
+        elapsed: float = time.perf_counter() - start
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    return elapsed
+
+
+def run(count: int) -> None:
+    reset_logging()
+    fmt: str = red_logging.fmts.MESSAGE_FMT_STANDARD
+    datefmt: str = red_logging.fmts.DATE_FMT_STANDARD
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_file: Path = Path(tmp) / "app.log"
+        binary_file: Path = Path(tmp) / "app.rlog"
+
+        text_handler = logging.FileHandler(text_file, encoding="utf-8")
+        text_handler.setFormatter(logging.Formatter(fmt, datefmt))
+        text_elapsed: float = write(text_handler, count)
+        binary_elapsed: float = write(red_logging.handlers.BinaryFileHandler(str(binary_file)), count)
+
+        text_size: int = text_file.stat().st_size
+        binary_size: int = binary_file.stat().st_size
+
+        formatter = red_logging.formatters.CompiledFormatter(fmt, datefmt)
+        start: float = time.perf_counter()
+        decoded: int = sum(
+            len(line.encode("utf-8"))
+            for line in red_logging.decode.decode_records([binary_file], formatter=formatter)
+        )
+        decode_elapsed: float = time.perf_counter() - start
+
+    print_table(
+        ["handler", "file bytes", "bytes/record", "size", "records/s", "throughput"],
+        [
+            [
+                "FileHandler (MESSAGE_FMT_STANDARD)",
+                f"{text_size:,}",
+                f"{text_size / count:.1f}",
+                "100%",
+                f"{count / text_elapsed:,.0f}",
+                "1.00x",
+            ],
+            [
+                "BinaryFileHandler",
+                f"{binary_size:,}",
+                f"{binary_size / count:.1f}",
+                f"{binary_size / text_size:.0%}",
+                f"{count / binary_elapsed:,.0f}",
+                f"{text_elapsed / binary_elapsed:.2f}x",
+            ],
+        ],
+    )
+    print(
+        f"\nDecode to text: {count / decode_elapsed:,.0f} records/s"
+        f" ({decoded:,} bytes of text, vs. {text_size:,} in the text file)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    run(count=args.count)
@@ -0,0 +1,76 @@
+"""Compare `logging.Logger` vs. `CachedCallerLogger` caller lookup, with `MESSAGE_FMT_STANDARD`.
+
+`findCaller()` alone, `log.info()` to a `NullHandler` (the record is created, but not formatted), and a
+full `log.info()` call through a `StreamHandler` writing to `os.devnull`, directly and through a wrapper
+that logs with `stacklevel=2`, are timed `--count` times for each logger class. The best of `--repeat` runs is reported, in calls/second.
+
+Usage:
+    python benchmarks/bench_caller.py --count 200000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+import typing as t
+
+import red_logging
+
+from _common import print_table
+
+def calls_per_sec(funcs: list[t.Callable[[], t.Any]], count: int, repeat: int) -> list[float]:
+    """Time each function, alternating between them in each run so a slow moment affects both."""
+    best: list[int] = [0] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            start: int = time.perf_counter_ns()
+            for _ in range(count):
+                func()
+            elapsed: int = time.perf_counter_ns() - start
+            best[i] = elapsed if not best[i] else min(best[i], elapsed)
+
+    return [count / (elapsed / 1e9) for elapsed in best]
+
+
+def run(count: int, repeat: int) -> None:
+    stdlib = logging.Logger("bench.caller.stdlib")
+    cached = red_logging.loggers.CachedCallerLogger("bench.caller.cached")
+
+    def info(logger: logging.Logger) -> t.Callable[[], None]:
+        return lambda: logger.info("request %s took %d ms", "GET /users", 12)
+
+    def wrapped(logger: logging.Logger) -> t.Callable[[], None]:
+        ## Reports the wrapper's caller
+        return lambda: logger.info("request %s took %d ms", "GET /users", 12, stacklevel=2)
+
+    rows: list[list] = []
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(
+            logging.Formatter(red_logging.fmts.MESSAGE_FMT_STANDARD, red_logging.fmts.DATE_FMT_STANDARD)
+        )
+
+        cases: list[tuple[str, logging.Handler, t.Callable]] = [
+            ("findCaller()", logging.NullHandler(), lambda logger: logger.findCaller),
+            ("log.info() NullHandler", logging.NullHandler(), info),
+            ("log.info()", handler, info),
+            ("log.info(stacklevel=2)", handler, wrapped),
+        ]
+        for label, case_handler, make_call in cases:
+            for logger in (stdlib, cached):
+                logger.handlers = [case_handler]
+            before, after = calls_per_sec([make_call(stdlib), make_call(cached)], count, repeat)
+            rows.append([label, f"{before:,.0f}", f"{after:,.0f}", f"{after / before:.2f}x"])
+
+    print_table(["call", "logging.Logger/s", "CachedCallerLogger/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
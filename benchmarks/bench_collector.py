@@ -0,0 +1,174 @@
+"""Load-test `python -m red_logging.collector` with many concurrent producer connections.
+
+The collector is started as a subprocess, pinned to 1 CPU core where the OS allows it, writing records
+with the `%(message)s` format to a rotating file. `--producer-processes` processes open `--producers`
+connections between them, and each connection sends `--records` records, in frames of `--batch` records
+(`1` is what a stdlib `SocketHandler` sends, more is what a `BatchedSocketHandler` sends). Every
+message has the same length, so the run ends when the log files reach the expected total size.
+
+Usage:
+    python benchmarks/bench_collector.py --producers 2000 --records 50 --batch 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+from pathlib import Path
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import red_logging
+
+from _common import print_table
+
+## "<producer:06d>-<record:06d>" + newline
+LINE_BYTES: int = 14
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _frames(producer: int, records: int, batch: int) -> bytes:
+    record_dicts: list[dict] = [
+        red_logging.handlers.record_to_dict(
+            logging.LogRecord(
+                "bench.producer", logging.INFO, __file__, 0, f"{producer:06d}-{i:06d}", None, None
+            )
+        )
+        for i in range(records)
+    ]
+
+    return b"".join(
+        red_logging.handlers.encode_frame(record_dicts[i : i + batch])
+        for i in range(0, records, batch)
+    )
+
+
+async def _produce(
+    port: int, producers: range, records: int, batch: int, start_at: float
+) -> None:
+    payloads: list[bytes] = [_frames(n, records, batch) for n in producers]
+    writers: list[asyncio.StreamWriter] = []
+    for _ in producers:
+        _reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writers.append(writer)
+
+    await asyncio.sleep(max(0.0, start_at - time.time()))
+
+    async def _send(writer: asyncio.StreamWriter, payload: bytes) -> None:
+        writer.write(payload)
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    await asyncio.gather(*(_send(w, p) for w, p in zip(writers, payloads)))
+
+
+def _producer_process(
+    port: int, first: int, last: int, records: int, batch: int, start_at: float
+) -> None:
+    asyncio.run(_produce(port, range(first, last), records, batch, start_at))
+
+
+def _logged_bytes(logfile: Path) -> int:
+    return sum(f.stat().st_size for f in logfile.parent.glob(f"{logfile.name}*"))
+
+
+def run(producers: int, records: int, batch: int, producer_processes: int) -> None:
+    total: int = producers * records
+    port: int = _free_port()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logfile: Path = Path(tmp) / "collector.log"
+        collector = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "red_logging.collector",
+                "--port",
+                str(port),
+                "--filename",
+                str(logfile),
+                "--fmt",
+                "%(message)s",
+                "--max-bytes",
+                str(64 * 1024 * 1024),
+                "--backup-count",
+                "100",
+            ],
+            stderr=subprocess.DEVNULL,
+        )
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(collector.pid, {min(os.sched_getaffinity(0))})
+
+        try:
+            while True:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                    break
+                except OSError:
+                    time.sleep(0.05)
+
+            start_at: float = time.time() + 2.0 + producers / 2000
+            per_process: int = -(-producers // producer_processes)
+            processes: list[mp.Process] = [
+                mp.Process(
+                    target=_producer_process,
+                    args=(
+                        port,
+                        first,
+                        min(first + per_process, producers),
+                        records,
+                        batch,
+                        start_at,
+                    ),
+                )
+                for first in range(0, producers, per_process)
+            ]
+            for p in processes:
+                p.start()
+
+            expected: int = total * LINE_BYTES
+            while time.time() < start_at:
+                time.sleep(0.001)
+            while _logged_bytes(logfile) < expected and time.time() - start_at < 300:
+                time.sleep(0.01)
+            elapsed: float = time.time() - start_at
+            logged: int = _logged_bytes(logfile) // LINE_BYTES
+
+            for p in processes:
+                p.join()
+        finally:
+            collector.terminate()
+            collector.wait()
+
+    print_table(
+        ["producers", "records", "records/frame", "ingested", "seconds", "records/sec"],
+        [[producers, total, batch, logged, elapsed, logged / elapsed]],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--producers", type=int, default=2000)
+    parser.add_argument("--records", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=1)
+    parser.add_argument("--producer-processes", type=int, default=2)
+    args = parser.parse_args()
+
+    run(
+        producers=args.producers,
+        records=args.records,
+        batch=args.batch,
+        producer_processes=args.producer_processes,
+    )
@@ -0,0 +1,93 @@
+"""Compare a handler's chain of filters vs. the same filters fused into 1 `CompiledFilter`.
+
+Each handler gets `info_filter`, a `logging.Filter("app")`, a `FilterConfig` function and a
+`RateSamplingFilter(rate=1.0)`. The first table times `handler.filter(record)` for a record that passes
+every filter, and for a DEBUG record the first filter rejects. The second table logs `--count` INFO
+records through a logger with `--handlers` handlers whose `emit()` does nothing, and reports the best
+of `--repeat` runs, since building each LogRecord costs more than the filters do.
+
+Usage:
+    python benchmarks/bench_compiled_filters.py --count 200000 --handlers 3 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+import red_logging
+
+from _common import print_table, time_total
+
+class DiscardHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def _not_health_check(record: logging.LogRecord) -> bool:
+    return record.msg != "health check"
+
+
+def make_handler(compiled: bool) -> logging.Handler:
+    handler = DiscardHandler()
+    for _filter in (
+        red_logging.filters.info_filter,
+        logging.Filter("app"),
+        red_logging.filters.FilterConfig(name="no_health", func=_not_health_check).get_filter(),
+        red_logging.filters.RateSamplingFilter(rate=1.0),
+    ):
+        handler.addFilter(_filter)
+    if compiled:
+        red_logging.filters.compile_handler_filters(handler)
+
+    return handler
+
+
+def filter_ns(handler: logging.Handler, record: logging.LogRecord, count: int) -> float:
+    _filter = handler.filter
+
+    start: int = time.perf_counter_ns()
+    for _ in range(count):
+        _filter(record)
+
+    return (time.perf_counter_ns() - start) / count
+
+
+def run(count: int, handlers: int, repeat: int) -> None:
+    passing = logging.makeLogRecord({"name": "app.db", "levelno": logging.INFO, "msg": "query"})
+    rejected = logging.makeLogRecord({"name": "app.db", "levelno": logging.DEBUG, "msg": "query"})
+
+    rows: list[list] = []
+    for label, compiled in (("filter chain", False), ("CompiledFilter", True)):
+        handler = make_handler(compiled)
+        rows.append(
+            [label, filter_ns(handler, passing, count), filter_ns(handler, rejected, count)]
+        )
+    print_table(["filters", "passing record ns", "rejected record ns"], rows)
+    print()
+
+    rows = []
+    for label, compiled in (("filter chain", False), ("CompiledFilter", True)):
+        log = logging.getLogger(f"app.{label.replace(' ', '_')}")
+        log.propagate = False
+        log.setLevel(logging.DEBUG)
+        log.handlers = [make_handler(compiled) for _ in range(handlers)]
+
+        wall, cpu = min(
+            time_total(lambda: [log.info("query %d", i) for i in range(count)])
+            for _ in range(repeat)
+        )
+        rows.append([label, handlers, count, count / wall, cpu / count * 1e6])
+
+    print_table(["filters", "handlers", "records", "records/sec", "CPU us/record"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--handlers", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(count=args.count, handlers=args.handlers, repeat=args.repeat)
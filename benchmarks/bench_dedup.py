@@ -0,0 +1,92 @@
+"""Compare a file handler vs. a `DedupHandlerConfig` in front of it, during a retry storm.
+
+The workload logs `--count` warnings. Runs of `--run-length` identical retry warnings alternate with
+a unique record, i.e. a crash loop that logs the same error until something changes. Both setups are
+built with `assemble_configdict()`; the report shows throughput, CPU time and bytes written.
+
+Usage:
+    python benchmarks/bench_dedup.py --count 200000 --run-length 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import tempfile
+
+import red_logging
+
+from _common import print_table, reset_logging, time_total
+
+def run(count: int, run_length: int, window: int) -> None:
+    rows: list[list] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("FileHandlerConfig", "DedupHandlerConfig"):
+            log_file: Path = Path(tmp) / f"{label}.log"
+            handlers: list = [
+                red_logging.config_classes.FileHandlerConfig(
+                    name="app_file", level="DEBUG", formatter="default", filename=str(log_file)
+                )
+            ]
+            if label == "DedupHandlerConfig":
+                handlers.append(
+                    red_logging.config_classes.handlers.DedupHandlerConfig(
+                        name="dedup", target="app_file", window=window
+                    )
+                )
+
+            logging.config.dictConfig(
+                red_logging.assemble_configdict(
+                    root_handlers=[],
+                    formatters=[red_logging.get_formatter_config(name="default")],
+                    handlers=handlers,
+                    loggers=[
+                        red_logging.get_logger_config(
+                            name="bench",
+                            handlers=["dedup" if label == "DedupHandlerConfig" else "app_file"],
+                        )
+                    ],
+                )
+            )
+            log = logging.getLogger("bench")
+
+            def workload() -> None:
+                for i in range(count):
+                    if i % run_length:
+                        log.warning("connection to %s refused, retrying", "db-1")
+                    else:
+                        log.warning("restarted worker %d", i)
+
+            wall, cpu = time_total(workload)
+            reset_logging()
+
+            with open(log_file) as f:
+                lines: int = sum(1 for _ in f)
+
+            rows.append(
+                [
+                    label,
+                    count,
+                    count / wall,
+                    cpu / count * 1e6,
+                    lines,
+                    log_file.stat().st_size / 1024,
+                ]
+            )
+
+    print_table(
+        ["handler", "records", "records/sec", "CPU us/record", "lines written", "KiB written"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--run-length", type=int, default=100)
+    parser.add_argument("--window", type=int, default=1)
+    args = parser.parse_args()
+
+    run(count=args.count, run_length=args.run_length, window=args.window)
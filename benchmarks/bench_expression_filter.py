@@ -0,0 +1,93 @@
+"""Compare an `ExpressionFilter` vs. the same check as a hand-written function, and as a filter chain.
+
+The expression is `levelno >= WARNING and name.startswith("app.db") and not msg.startswith("heartbeat")`.
+Each filter is added to a handler, and `handler.filter(record)` is timed `--count` times for a record
+that passes, and for records rejected by the 1st and the last condition. The one-time cost of parsing,
+checking & compiling the expression is reported separately.
+
+Usage:
+    python benchmarks/bench_expression_filter.py --count 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+import red_logging
+
+from _common import print_table
+
+EXPRESSION: str = (
+    'levelno >= WARNING and name.startswith("app.db") and not msg.startswith("heartbeat")'
+)
+
+
+def hand_written(record: logging.LogRecord) -> bool:
+    return (
+        record.levelno >= logging.WARNING
+        and record.name.startswith("app.db")
+        and not record.msg.startswith("heartbeat")
+    )
+
+
+def _not_heartbeat(record: logging.LogRecord) -> bool:
+    return not record.msg.startswith("heartbeat")
+
+
+def filter_ns(handler: logging.Handler, record: logging.LogRecord, count: int) -> float:
+    _filter = handler.filter
+
+    start: int = time.perf_counter_ns()
+    for _ in range(count):
+        _filter(record)
+
+    return (time.perf_counter_ns() - start) / count
+
+
+def run(count: int) -> None:
+    records: list[logging.LogRecord] = [
+        logging.makeLogRecord({"name": "app.db", "levelno": logging.ERROR, "msg": "query failed"}),
+        logging.makeLogRecord({"name": "app.db", "levelno": logging.INFO, "msg": "query ok"}),
+        logging.makeLogRecord({"name": "app.db", "levelno": logging.ERROR, "msg": "heartbeat late"}),
+    ]
+
+    setups: dict[str, list] = {
+        "hand-written function": [
+            red_logging.filters.FilterConfig(name="db", func=hand_written).get_filter()
+        ],
+        "FilterConfig(expression=...)": [
+            red_logging.filters.FilterConfig(name="db", expression=EXPRESSION).get_filter()
+        ],
+        "filter chain": [
+            red_logging.filters.warning_filter,
+            logging.Filter("app.db"),
+            red_logging.filters.FilterConfig(name="db", func=_not_heartbeat).get_filter(),
+        ],
+    }
+
+    rows: list[list] = []
+    for label, filters in setups.items():
+        handler = logging.Handler()
+        for _filter in filters:
+            handler.addFilter(_filter)
+        rows.append([label, *(filter_ns(handler, record, count) for record in records)])
+
+    print_table(
+        ["filter", "passing ns", "rejected by level ns", "rejected by msg ns"],
+        rows,
+    )
+
+    start: int = time.perf_counter_ns()
+    for _ in range(100):
+        red_logging.filters.compile_expression(EXPRESSION)
+    print(f"\nParse, check & compile: {(time.perf_counter_ns() - start) / 100 / 1000:,.1f} us (once per filter)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500_000)
+    args = parser.parse_args()
+
+    run(count=args.count)
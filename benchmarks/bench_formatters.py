@@ -0,0 +1,93 @@
+"""Compare `logging.Formatter` vs. `CompiledFormatter` throughput, for each of the built-in `fmts`.
+
+For each format, `formatMessage(record)` (the `%` interpolation the compiled function replaces) and the
+full `format(record)` (which adds the message & `asctime`) are timed `--count` times on the same record.
+The best of `--repeat` runs is reported, in records/second.
+
+Usage:
+    python benchmarks/bench_formatters.py --count 200000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+import typing as t
+
+import red_logging
+
+from _common import print_table
+
+def records_per_sec(func: t.Callable[[logging.LogRecord], str], record: logging.LogRecord, count: int, repeat: int) -> float:
+    best: int = 0
+    for _ in range(repeat):
+        start: int = time.perf_counter_ns()
+        for _ in range(count):
+            func(record)
+        elapsed: int = time.perf_counter_ns() - start
+        best = elapsed if not best else min(best, elapsed)
+
+    return count / (best / 1e9)
+
+
+def run(count: int, repeat: int) -> None:
+    fmts: dict[str, str] = {
+        name: value
+        for name, value in vars(red_logging.fmts).items()
+        if "FMT" in name and not name.startswith("DATE") and isinstance(value, str)
+    }
+
+    record = logging.LogRecord(
+        "app.db", logging.INFO, __file__, 42, "query %s took %d ms", ("users", 12), None, func="run"
+    )
+    ## Attributes used by MESSAGE_FMT_SHARDED
+    record.seq = 1
+    record.created_ns = time.time_ns()
+
+    rows: list[list] = []
+    for name, fmt in sorted(fmts.items()):
+        stdlib = logging.Formatter(fmt, red_logging.fmts.DATE_FMT_STANDARD)
+        compiled = red_logging.formatters.CompiledFormatter(fmt, red_logging.fmts.DATE_FMT_STANDARD)
+        ## formatMessage() reads the attributes format() sets
+        stdlib.format(record)
+        if compiled.format(record) != stdlib.format(record):
+            raise RuntimeError(f"Output differs for {name}")
+
+        stdlib_msg: float = records_per_sec(stdlib.formatMessage, record, count, repeat)
+        compiled_msg: float = records_per_sec(compiled.formatMessage, record, count, repeat)
+        stdlib_full: float = records_per_sec(stdlib.format, record, count, repeat)
+        compiled_full: float = records_per_sec(compiled.format, record, count, repeat)
+        rows.append(
+            [
+                name,
+                f"{stdlib_msg:,.0f}",
+                f"{compiled_msg:,.0f}",
+                f"{compiled_msg / stdlib_msg:.2f}x",
+                f"{stdlib_full:,.0f}",
+                f"{compiled_full:,.0f}",
+                f"{compiled_full / stdlib_full:.2f}x",
+            ]
+        )
+
+    print_table(
+        [
+            "fmt",
+            "formatMessage stdlib/s",
+            "compiled/s",
+            "speedup",
+            "format stdlib/s",
+            "compiled/s",
+            "speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
@@ -0,0 +1,83 @@
+"""Compare dropping records with a logger filter vs. a gate, when 90% of logging calls are dropped.
+
+A logger logs `--count` calls through a `StreamHandler` (writing to `os.devnull`) with
+`MESSAGE_FMT_STANDARD`. 9 of every 10 calls are `"heartbeat %d"`, which is dropped by either a logger
+filter (which sees each record after it is created) or a `TemplateGate` (which sees the call before a
+record is created), both matching the same regex. The best of `--repeat` runs is reported, in calls/second.
+
+Usage:
+    python benchmarks/bench_gates.py --count 200000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+import typing as t
+
+import red_logging
+
+from _common import print_table
+
+def calls_per_sec(funcs: list[t.Callable[[int], t.Any]], count: int, repeat: int) -> list[float]:
+    """Time each function, alternating between them in each run so a slow moment affects both."""
+    best: list[int] = [0] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            start: int = time.perf_counter_ns()
+            for n in range(count):
+                func(n)
+            elapsed: int = time.perf_counter_ns() - start
+            best[i] = elapsed if not best[i] else min(best[i], elapsed)
+
+    return [count / (elapsed / 1e9) for elapsed in best]
+
+
+def run(count: int, repeat: int) -> None:
+    templates: list[str] = ["^heartbeat"]
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(
+            logging.Formatter(red_logging.fmts.MESSAGE_FMT_STANDARD, red_logging.fmts.DATE_FMT_STANDARD)
+        )
+
+        loggers: dict[str, logging.Logger] = {
+            name: logging.Logger(f"bench.gates.{name}") for name in ("none", "filter", "gate")
+        }
+        for logger in loggers.values():
+            logger.addHandler(handler)
+        ## The logger filter equivalent of the gate
+        filter_gate = red_logging.loggers.TemplateGate(templates)
+        loggers["filter"].addFilter(lambda record: filter_gate(record.name, record.levelno, record.msg))
+        red_logging.loggers.install_gates(loggers["gate"], [red_logging.loggers.TemplateGate(templates)])
+
+        def calls(logger: logging.Logger) -> t.Callable[[int], None]:
+            def call(n: int) -> None:
+                if n % 10:
+                    logger.info("heartbeat %d", n)
+                else:
+                    logger.info("request %s took %d ms", "GET /users", n)
+
+            return call
+
+        none, filtered, gated = calls_per_sec([calls(logger) for logger in loggers.values()], count, repeat)
+
+    print_table(
+        ["dropped by", "calls/s", "vs. filter"],
+        [
+            ["nothing (all written)", f"{none:,.0f}", f"{none / filtered:.2f}x"],
+            ["logger filter", f"{filtered:,.0f}", "1.00x"],
+            ["TemplateGate", f"{gated:,.0f}", f"{gated / filtered:.2f}x"],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
@@ -0,0 +1,91 @@
+"""Compare logging throughput with every `LogRecord` attribute collected vs. only those the format reads.
+
+For each built-in `fmts` format, a config with 1 `StreamHandler` (writing to `os.devnull`) is applied, and
+`log.info()` is called `--count` times, first with the `logging` module's defaults (thread, process &
+caller info always collected), then after `configure_record_introspection()`. The best of `--repeat` runs
+is reported, in records/second. `MESSAGE_FMT_SHARDED` is skipped, its fields are set by `ShardedFileHandler`.
+
+Usage:
+    python benchmarks/bench_introspection.py --count 100000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import logging.config
+import os
+import time
+
+import red_logging
+
+from _common import print_table, reset_logging
+
+def records_per_sec(log: logging.Logger, count: int, repeat: int) -> float:
+    best: int = 0
+    for _ in range(repeat):
+        start: int = time.perf_counter_ns()
+        for i in range(count):
+            log.info("request %s took %d ms", "GET /users", i)
+        elapsed: int = time.perf_counter_ns() - start
+        best = elapsed if not best else min(best, elapsed)
+
+    return count / (best / 1e9)
+
+
+def run(count: int, repeat: int) -> None:
+    fmts: dict[str, str] = {
+        name: value
+        for name, value in vars(red_logging.fmts).items()
+        if "FMT" in name
+        and not name.startswith("DATE")
+        and name != "MESSAGE_FMT_SHARDED"
+        and isinstance(value, str)
+    }
+    defaults: dict[str, object] = {
+        name: getattr(logging, name)
+        for name in ("logThreads", "logProcesses", "logMultiprocessing", "_srcfile")
+    }
+
+    rows: list[list] = []
+    with open(os.devnull, "w") as devnull:
+        for name, fmt in sorted(fmts.items()):
+            config: dict = red_logging.helpers.assemble_configdict(
+                formatters=[red_logging.helpers.get_formatter_config(fmt=fmt)],
+                handlers=[red_logging.helpers.get_streamhandler_config(level="DEBUG")],
+                root_handlers=["console"],
+            )
+            config["handlers"]["console"]["stream"] = devnull
+            logging.config.dictConfig(config)
+            log: logging.Logger = logging.getLogger("bench.introspection")
+
+            for switch, value in defaults.items():
+                setattr(logging, switch, value)
+            default_rate: float = records_per_sec(log, count, repeat)
+
+            applied: dict[str, bool] = red_logging.helpers.configure_record_introspection(config)
+            auto_rate: float = records_per_sec(log, count, repeat)
+            rows.append(
+                [
+                    name,
+                    ", ".join(switch for switch, on in applied.items() if on) or "-",
+                    f"{default_rate:,.0f}",
+                    f"{auto_rate:,.0f}",
+                    f"{auto_rate / default_rate:.2f}x",
+                ]
+            )
+
+            for switch, value in defaults.items():
+                setattr(logging, switch, value)
+            reset_logging()
+
+    print_table(["fmt", "still on", "all on/s", "auto/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
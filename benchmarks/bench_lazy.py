@@ -0,0 +1,84 @@
+"""Compare eager vs. lazy logging args, for records a handler drops and records it writes.
+
+Each call logs the `repr()` of a dict with 200 entries, built 3 ways: eagerly (`repr(state)` at the call
+site), as a `Lazy(repr, state)` arg, and as a `lambda` through a `LazyAdapter`. The logger is enabled for
+DEBUG, and its `StreamHandler` (writing to `os.devnull` with `MESSAGE_FMT_BASIC`) only writes INFO and
+above. Calls at DEBUG create a record the handler drops; calls at INFO are written. The best of
+`--repeat` runs of `--count` calls is reported, in calls/second.
+
+Usage:
+    python benchmarks/bench_lazy.py --count 5000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+import typing as t
+
+import red_logging
+
+from _common import print_table
+
+def calls_per_sec(funcs: list[t.Callable[[], t.Any]], count: int, repeat: int) -> list[float]:
+    """Time each function, alternating between them in each run so a slow moment affects both."""
+    best: list[int] = [0] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            start: int = time.perf_counter_ns()
+            for _ in range(count):
+                func()
+            elapsed: int = time.perf_counter_ns() - start
+            best[i] = elapsed if not best[i] else min(best[i], elapsed)
+
+    return [count / (elapsed / 1e9) for elapsed in best]
+
+
+def run(count: int, repeat: int) -> None:
+    state: dict[str, t.Any] = {f"key_{i}": {"id": i, "tags": ["a", "b"]} for i in range(200)}
+    Lazy = red_logging.loggers.Lazy
+
+    rows: list[list] = []
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(
+            logging.Formatter(red_logging.fmts.MESSAGE_FMT_BASIC, red_logging.fmts.DATE_FMT_STANDARD)
+        )
+        logger = logging.Logger("bench.lazy", logging.DEBUG)
+        logger.addHandler(handler)
+        adapter = red_logging.loggers.LazyAdapter(logger)
+
+        for label, level in [("dropped by handler", logging.DEBUG), ("written", logging.INFO)]:
+            eager, lazy, adapted = calls_per_sec(
+                [
+                    lambda: logger.log(level, "state: %s", repr(state)),
+                    lambda: logger.log(level, "state: %s", Lazy(repr, state)),
+                    lambda: adapter.log(level, "state: %s", lambda: repr(state)),
+                ],
+                count,
+                repeat,
+            )
+            rows.append(
+                [
+                    label,
+                    f"{eager:,.0f}",
+                    f"{lazy:,.0f}",
+                    f"{lazy / eager:.2f}x",
+                    f"{adapted:,.0f}",
+                    f"{adapted / eager:.2f}x",
+                ]
+            )
+
+    print_table(["record", "eager/s", "Lazy/s", "speedup", "LazyAdapter/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
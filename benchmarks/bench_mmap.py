@@ -0,0 +1,84 @@
+"""Compare file logging throughput of `FileHandlerConfig` vs. `MmapFileHandlerConfig`.
+
+Each handler is built from its config class with `assemble_configdict()`, then `--count` records
+are logged. Records/sec & CPU time are measured up to & including closing the handler.
+
+The `standard` format (`MESSAGE_FMT_STANDARD`) shows the end-to-end difference, the `message` format
+(`%(message)s`) keeps formatting cheap so the cost of getting bytes into the file stands out.
+
+Usage:
+    python benchmarks/bench_mmap.py --count 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import tempfile
+
+import red_logging
+
+from _common import print_table, reset_logging, time_total
+
+FORMATS: dict[str, str] = {
+    "standard": red_logging.fmts.MESSAGE_FMT_STANDARD,
+    "message": "%(message)s",
+}
+
+
+def build_config(
+    handler: red_logging.config_classes.handlers.FileHandlerConfig, fmt: str
+) -> dict:
+    return red_logging.assemble_configdict(
+        root_handlers=[],
+        formatters=[red_logging.get_formatter_config(name="default", fmt=fmt)],
+        handlers=[handler],
+        loggers=[red_logging.get_logger_config(name="bench", handlers=[handler.name])],
+    )
+
+
+def run(count: int, chunk_size: int) -> None:
+    rows: list[list] = []
+
+    for fmt_name, fmt in FORMATS.items():
+        for label in ("FileHandlerConfig", "MmapFileHandlerConfig"):
+            with tempfile.TemporaryDirectory() as tmp:
+                log_file: Path = Path(tmp) / "bench.log"
+                if label == "FileHandlerConfig":
+                    handler = red_logging.config_classes.FileHandlerConfig(
+                        name="bench_file", formatter="default", filename=str(log_file)
+                    )
+                else:
+                    handler = red_logging.config_classes.handlers.MmapFileHandlerConfig(
+                        name="bench_file",
+                        formatter="default",
+                        filename=str(log_file),
+                        chunk_size=chunk_size,
+                    )
+
+                logging.config.dictConfig(build_config(handler, fmt))
+                log = logging.getLogger("bench")
+
+                def _log_all() -> None:
+                    for i in range(count):
+                        log.info("request %d handled in %s ms", i, 12.5)
+                    reset_logging()
+
+                wall, cpu = time_total(_log_all)
+                size: int = log_file.stat().st_size
+
+            rows.append([label, fmt_name, count, count / wall, cpu / count * 1e6, size])
+
+    print_table(
+        ["handler", "format", "records", "records/sec", "CPU us/record", "bytes"], rows
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=4 * 1024 * 1024)
+    args = parser.parse_args()
+
+    run(count=args.count, chunk_size=args.chunk_size)
@@ -0,0 +1,88 @@
+"""Compare caller-side logging latency with synchronous handlers vs. `queued=True`.
+
+Each mode logs `--count` records through a console handler and a file handler. The console
+handler writes to a file that sleeps for `--stall-ms` every `--stall-every` writes, to simulate
+a slow terminal or a disk stall. The time each `log.info()` call takes on the calling thread is
+recorded, and the p50/p99/max latencies are reported.
+
+Usage:
+    python benchmarks/bench_queued.py --count 50000 --stall-every 50 --stall-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import tempfile
+
+import red_logging
+
+from _common import SlowStream, percentile, print_table, reset_logging, time_calls
+
+def build_config(logdir: Path, queued: bool, stream: SlowStream) -> dict:
+    formatter = red_logging.get_formatter_config(name="default")
+    console = red_logging.config_classes.StreamHandlerConfig(
+        name="console",
+        formatter="default",
+        stream=stream,
+    )
+    app_file = red_logging.config_classes.FileHandlerConfig(
+        name="app_file",
+        level="DEBUG",
+        formatter="default",
+        filename=str(logdir / "app.log"),
+    )
+    logger = red_logging.get_logger_config(
+        name="bench", handlers=["console", "app_file"], level="DEBUG"
+    )
+
+    return red_logging.assemble_configdict(
+        root_handlers=[],
+        formatters=[formatter],
+        handlers=[console, app_file],
+        loggers=[logger],
+        queued=queued,
+    )
+
+
+def run(count: int, stall_every: int, stall_ms: float) -> None:
+    rows: list[list] = []
+
+    for queued in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            stream = SlowStream(
+                Path(tmp) / "console.log", stall_every=stall_every, stall_ms=stall_ms
+            )
+            logging.config.dictConfig(
+                build_config(Path(tmp), queued=queued, stream=stream)
+            )
+            log = logging.getLogger("bench")
+
+            samples: list[float] = time_calls(
+                lambda i: log.info("request %d handled in %s ms", i, 12.5), count
+            )
+            reset_logging()
+            stream.close()
+
+        rows.append(
+            [
+                "queued" if queued else "sync",
+                count,
+                percentile(samples, 50),
+                percentile(samples, 99),
+                max(samples),
+            ]
+        )
+
+    print_table(["mode", "records", "p50 (us)", "p99 (us)", "max (us)"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--stall-every", type=int, default=50)
+    parser.add_argument("--stall-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    run(count=args.count, stall_every=args.stall_every, stall_ms=args.stall_ms)
@@ -0,0 +1,101 @@
+"""Measure `RateLimitFilter` on a hot loop that logs the same warning, and its per-record cost.
+
+The first table logs `--count` warnings from 1 call site to a file handler, with & without a
+`RateLimitFilterConfig` on the handler, and reports throughput & bytes written. The second table calls
+`.filter()` directly on prebuilt records from 1, `--max-keys`, and 100x `--max-keys` call sites, to show
+the decision cost stays flat when the LRU table is full & evicting.
+
+Usage:
+    python benchmarks/bench_ratelimit.py --count 200000 --max-keys 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import tempfile
+import time
+
+import red_logging
+
+from _common import print_table, reset_logging, time_total
+
+def run_hot_loop(count: int, max_keys: int) -> None:
+    rows: list[list] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("no filter", "RateLimitFilter"):
+            log_file: Path = Path(tmp) / f"{label.replace(' ', '_')}.log"
+            filter_config = (
+                red_logging.filters.RateLimitFilterConfig(
+                    name="per_call_site", rate=10.0, burst=20, max_keys=max_keys
+                )
+                if label == "RateLimitFilter"
+                else None
+            )
+            logging.config.dictConfig(
+                red_logging.assemble_configdict(
+                    root_handlers=[],
+                    formatters=[red_logging.get_formatter_config(name="default")],
+                    handlers=[
+                        red_logging.config_classes.FileHandlerConfig(
+                            name="app_file",
+                            level="WARNING",
+                            formatter="default",
+                            filename=str(log_file),
+                            filters=["per_call_site"] if filter_config else None,
+                        )
+                    ],
+                    loggers=[
+                        red_logging.get_logger_config(name="bench", handlers=["app_file"])
+                    ],
+                    filters=[filter_config] if filter_config else None,
+                )
+            )
+            log = logging.getLogger("bench")
+
+            wall, cpu = time_total(
+                lambda: [log.warning("disk %s is slow, retry %d", "sda", i) for i in range(count)]
+            )
+            reset_logging()
+
+            rows.append(
+                [label, count, count / wall, cpu / count * 1e6, log_file.stat().st_size / 1024]
+            )
+
+    print_table(["handler filter", "records", "records/sec", "CPU us/record", "KiB written"], rows)
+
+
+def run_decision_cost(count: int, max_keys: int) -> None:
+    rows: list[list] = []
+
+    for call_sites in (1, max_keys, max_keys * 100):
+        _filter = red_logging.filters.RateLimitFilter(rate=10.0, burst=20, max_keys=max_keys)
+        records: list[logging.LogRecord] = [
+            logging.makeLogRecord(
+                {"msg": "disk is slow", "levelno": logging.WARNING, "pathname": "app.py", "lineno": i}
+            )
+            for i in range(min(call_sites, count))
+        ]
+        _filter_call = _filter.filter
+
+        start: int = time.perf_counter_ns()
+        for i in range(count):
+            _filter_call(records[i % len(records)])
+        elapsed: int = time.perf_counter_ns() - start
+
+        rows.append([call_sites, max_keys, len(_filter), _filter.evicted, elapsed / count])
+
+    print_table(["call sites", "max_keys", "tracked", "evicted", "ns/record"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--max-keys", type=int, default=1024)
+    args = parser.parse_args()
+
+    run_hot_loop(count=args.count, max_keys=args.max_keys)
+    print()
+    run_decision_cost(count=args.count, max_keys=args.max_keys)
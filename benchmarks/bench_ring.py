@@ -0,0 +1,100 @@
+"""Compare the cost of keeping DEBUG context in a `RingBufferHandlerConfig` vs. writing DEBUG to a file.
+
+The workload logs `--count` records, 9 DEBUG records for every INFO record, through 3 setups:
+
+- `INFO file`: the logger is at INFO, so DEBUG calls return early. No DEBUG context is kept.
+- `DEBUG file`: the logger & file handler are at DEBUG, so every record is formatted & written.
+- `INFO file + ring`: the file handler stays at INFO, and a ring buffer keeps the last `--capacity`
+  records, which are only written to a crash file if an error is logged (never, in this run).
+
+Usage:
+    python benchmarks/bench_ring.py --count 200000 --capacity 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import tempfile
+
+import red_logging
+
+from _common import print_table, reset_logging, time_total
+
+def configure(tmp: Path, label: str, capacity: int) -> logging.Handler | None:
+    handlers: list = [
+        red_logging.config_classes.FileHandlerConfig(
+            name="app_file",
+            level="INFO" if label != "DEBUG file" else "DEBUG",
+            formatter="default",
+            filename=str(tmp / f"{label.replace(' ', '_')}.log"),
+        )
+    ]
+    logger_handlers: list[str] = ["app_file"]
+    if label == "INFO file + ring":
+        handlers += [
+            red_logging.config_classes.FileHandlerConfig(
+                name="crash_file",
+                level="DEBUG",
+                formatter="default",
+                filename=str(tmp / "crash.log"),
+            ),
+            red_logging.config_classes.handlers.RingBufferHandlerConfig(
+                name="flight_recorder", capacity=capacity, target="crash_file"
+            ),
+        ]
+        logger_handlers.append("flight_recorder")
+
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="default")],
+            handlers=handlers,
+            loggers=[
+                red_logging.get_logger_config(
+                    name="bench",
+                    handlers=logger_handlers,
+                    level="INFO" if label == "INFO file" else "DEBUG",
+                )
+            ],
+        )
+    )
+
+    return logging._handlers.get("flight_recorder")
+
+
+def run(count: int, capacity: int) -> None:
+    rows: list[list] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("INFO file", "DEBUG file", "INFO file + ring"):
+            ring = configure(Path(tmp), label, capacity)
+            log = logging.getLogger("bench")
+
+            def workload() -> None:
+                for i in range(count):
+                    if i % 10:
+                        log.debug("cache lookup %d for key %s", i, "user:42")
+                    else:
+                        log.info("request %d handled in %s ms", i, 12.5)
+
+            wall, cpu = time_total(workload)
+            memory: int = ring.memory_usage() if ring is not None else 0
+            reset_logging()
+
+            rows.append([label, count, count / wall, cpu / count * 1e6, memory / 1024])
+
+    print_table(
+        ["setup", "records", "records/sec", "CPU us/record", "ring KiB"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=1000)
+    args = parser.parse_args()
+
+    run(count=args.count, capacity=args.capacity)
@@ -0,0 +1,130 @@
+"""Measure how long the logging thread stalls during rollovers, stdlib vs. background rotation.
+
+Each handler rotates at `--max-bytes`, keeps `--backup-count` backups and compresses them with
+`--compression`. For the stdlib `RotatingFileHandler`, compression is done with a `rotator`
+(the approach from the logging cookbook), so it runs inside `emit()`. The time spent in each
+`doRollover()` call (the stall every thread that logs sees) is reported, along with the worst
+single `log.info()` call.
+
+Usage:
+    python benchmarks/bench_rotation.py --count 300000 --compression gzip
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import logging.handlers
+from pathlib import Path
+import tempfile
+import time
+
+import red_logging
+from red_logging.handlers._rotating import compress_file
+
+from _common import percentile, print_table, time_calls
+
+def _stdlib_handler(
+    filename: Path, max_bytes: int, backup_count: int, compression: str | None
+) -> logging.Handler:
+    handler = logging.handlers.RotatingFileHandler(
+        filename, maxBytes=max_bytes, backupCount=backup_count
+    )
+    if compression:
+        ext: str = {"gzip": ".gz", "bz2": ".bz2", "lzma": ".xz"}[compression]
+        handler.namer = lambda name: f"{name}{ext}"
+        handler.rotator = lambda source, dest: compress_file(source, dest, compression)
+
+    return handler
+
+
+def _background_handler(
+    filename: Path, max_bytes: int, backup_count: int, compression: str | None
+) -> logging.Handler:
+    return red_logging.handlers.BackgroundRotatingFileHandler(
+        filename, maxBytes=max_bytes, backupCount=backup_count, compression=compression
+    )
+
+
+def _time_rollovers(handler: logging.handlers.RotatingFileHandler) -> list[float]:
+    """Wrap the handler's `doRollover()` to record how long each call takes, in milliseconds."""
+    stalls: list[float] = []
+    _do_rollover = handler.doRollover
+
+    def _timed_rollover() -> None:
+        start: float = time.perf_counter()
+        _do_rollover()
+        stalls.append((time.perf_counter() - start) * 1000)
+
+    handler.doRollover = _timed_rollover
+
+    return stalls
+
+
+def run(count: int, max_bytes: int, backup_count: int, compression: str | None) -> None:
+    rows: list[list] = []
+
+    for label, factory in (
+        ("RotatingFileHandler", _stdlib_handler),
+        ("BackgroundRotatingFileHandler", _background_handler),
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            handler = factory(Path(tmp) / "app.log", max_bytes, backup_count, compression)
+            handler.setFormatter(logging.Formatter(red_logging.fmts.MESSAGE_FMT_STANDARD))
+            stalls: list[float] = _time_rollovers(handler)
+
+            log = logging.getLogger("bench")
+            log.propagate = False
+            log.setLevel(logging.DEBUG)
+            log.addHandler(handler)
+
+            samples: list[float] = time_calls(
+                lambda i: log.info("request %d handled in %s ms", i, 12.5), count
+            )
+            log.removeHandler(handler)
+            close_start: float = time.perf_counter()
+            handler.close()
+            close_ms: float = (time.perf_counter() - close_start) * 1000
+
+        rows.append(
+            [
+                label,
+                len(stalls),
+                sum(stalls) / max(len(stalls), 1),
+                max(stalls, default=0.0),
+                percentile(samples, 99.9) / 1000,
+                max(samples) / 1000,
+                close_ms,
+            ]
+        )
+
+    print_table(
+        [
+            "handler",
+            "rollovers",
+            "mean stall (ms)",
+            "max stall (ms)",
+            "p99.9 call (ms)",
+            "max call (ms)",
+            "close (ms)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=300_000)
+    parser.add_argument("--max-bytes", type=int, default=5 * 1024 * 1024)
+    parser.add_argument("--backup-count", type=int, default=5)
+    parser.add_argument(
+        "--compression", choices=["gzip", "bz2", "lzma", "none"], default="gzip"
+    )
+    args = parser.parse_args()
+
+    run(
+        count=args.count,
+        max_bytes=args.max_bytes,
+        backup_count=args.backup_count,
+        compression=None if args.compression == "none" else args.compression,
+    )
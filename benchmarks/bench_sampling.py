@@ -0,0 +1,121 @@
+"""Measure `RateSamplingFilter` & `KeyedSamplingFilter` throughput at 1%, 10% and 100% sampling.
+
+Each run logs `--count` INFO records (with a `request_id` extra, 10 records per request) to a file
+handler that has the filter in its `filters`, configured with `assemble_configdict()`. The decision
+cost alone is measured by calling the filter's `.filter()` directly on a prebuilt record.
+
+Usage:
+    python benchmarks/bench_sampling.py --count 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import tempfile
+import time
+
+import red_logging
+
+from _common import print_table, reset_logging, time_total
+
+def configure(log_file: Path, filter_config) -> None:
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="default")],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="app_file",
+                    level="INFO",
+                    formatter="default",
+                    filename=str(log_file),
+                    filters=[filter_config.name] if filter_config else None,
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(name="bench", handlers=["app_file"], level="INFO")
+            ],
+            filters=[filter_config] if filter_config else None,
+        )
+    )
+
+
+def decision_ns(filter_config, count: int) -> float:
+    _filter: logging.Filter = filter_config.get_filter()
+    record: logging.LogRecord = logging.makeLogRecord(
+        {"msg": "request handled", "levelno": logging.INFO, "request_id": "req-123456"}
+    )
+    _filter_call = _filter.filter
+
+    start: int = time.perf_counter_ns()
+    for _ in range(count):
+        _filter_call(record)
+
+    return (time.perf_counter_ns() - start) / count
+
+
+def run(count: int) -> None:
+    rows: list[list] = []
+    setups: list[tuple[str, float, object]] = [("no filter", 1.0, None)]
+    for rate in (0.01, 0.1, 1.0):
+        setups.append(
+            (
+                "RateSamplingFilter",
+                rate,
+                red_logging.filters.RateSamplingFilterConfig(name="sample", rate=rate),
+            )
+        )
+        setups.append(
+            (
+                "KeyedSamplingFilter",
+                rate,
+                red_logging.filters.KeyedSamplingFilterConfig(name="sample", rate=rate),
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n, (label, rate, filter_config) in enumerate(setups):
+            log_file: Path = Path(tmp) / f"{n}.log"
+            configure(log_file, filter_config)
+            log = logging.getLogger("bench")
+
+            def workload() -> None:
+                for i in range(count):
+                    log.info(
+                        "request %d handled in %s ms",
+                        i,
+                        12.5,
+                        extra={"request_id": f"req-{i // 10}"},
+                    )
+
+            wall, cpu = time_total(workload)
+            reset_logging()
+
+            with open(log_file) as f:
+                kept: int = sum(1 for _ in f)
+
+            rows.append(
+                [
+                    label,
+                    f"{rate:.0%}",
+                    count / wall,
+                    cpu / count * 1e6,
+                    kept / count * 100,
+                    decision_ns(filter_config, count) if filter_config else 0.0,
+                ]
+            )
+
+    print_table(
+        ["filter", "rate", "records/sec", "CPU us/record", "kept %", "decision ns"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    run(count=args.count)
@@ -0,0 +1,93 @@
+"""Compare formatting a record in every handler vs. once, with `share_output=True`, for 1, 3 & 5 handlers.
+
+Each handler is a `StreamHandler` writing to `os.devnull`, and all of a logger's handlers use the same
+formatter, as handlers naming 1 formatter in a dictConfig do: a `CompiledFormatter` with
+`MESSAGE_FMT_STANDARD`, or a `JSONFormatter`. Each call logs 1 INFO record with 2 args. The best of
+`--repeat` runs of `--count` calls is reported, in calls/second.
+
+Usage:
+    python benchmarks/bench_shared_format.py --count 20000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+import typing as t
+
+import red_logging
+
+from _common import print_table
+
+def calls_per_sec(funcs: list[t.Callable[[], t.Any]], count: int, repeat: int) -> list[float]:
+    """Time each function, alternating between them in each run so a slow moment affects both."""
+    best: list[int] = [0] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            start: int = time.perf_counter_ns()
+            for _ in range(count):
+                func()
+            elapsed: int = time.perf_counter_ns() - start
+            best[i] = elapsed if not best[i] else min(best[i], elapsed)
+
+    return [count / (elapsed / 1e9) for elapsed in best]
+
+
+def make_logger(
+    name: str, formatter: logging.Formatter, handlers: int, stream: t.TextIO
+) -> logging.Logger:
+    logger = logging.Logger(name, logging.INFO)
+    for _ in range(handlers):
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    return logger
+
+
+def run(count: int, repeat: int) -> None:
+    formatters: dict[str, t.Callable[[bool], logging.Formatter]] = {
+        "CompiledFormatter": lambda share: red_logging.formatters.CompiledFormatter(
+            red_logging.fmts.MESSAGE_FMT_STANDARD,
+            red_logging.fmts.DATE_FMT_STANDARD,
+            share_output=share,
+        ),
+        "JSONFormatter": lambda share: red_logging.formatters.JSONFormatter(share_output=share),
+    }
+
+    rows: list[list] = []
+    with open(os.devnull, "w") as devnull:
+        for label, make_formatter in formatters.items():
+            for handlers in (1, 3, 5):
+                each = make_logger("bench.each", make_formatter(False), handlers, devnull)
+                shared = make_logger("bench.shared", make_formatter(True), handlers, devnull)
+                each_rate, shared_rate = calls_per_sec(
+                    [
+                        lambda: each.info("request %s took %d ms", "GET /", 12),
+                        lambda: shared.info("request %s took %d ms", "GET /", 12),
+                    ],
+                    count,
+                    repeat,
+                )
+                rows.append(
+                    [
+                        label,
+                        handlers,
+                        f"{each_rate:,.0f}",
+                        f"{shared_rate:,.0f}",
+                        f"{shared_rate / each_rate:.2f}x",
+                    ]
+                )
+
+    print_table(["formatter", "handlers", "each handler/s", "shared/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
@@ -0,0 +1,132 @@
+"""Compare `SMTPHandlerConfig` vs. `DigestSMTPHandlerConfig` during a burst of error records.
+
+A loopback stand-in mail server accepts messages, waiting `--latency-ms` before each reply to stand
+in for a remote server's round trips. `--count` errors from `--templates` distinct message templates
+are logged, and the time each logging call blocks the caller is measured, along with the number of
+emails the server receives.
+
+Usage:
+    python benchmarks/bench_smtp.py --count 200 --latency-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import socketserver
+import threading
+import time
+
+import red_logging
+
+from _common import percentile, print_table, reset_logging, time_calls
+
+class MailServer(socketserver.ThreadingTCPServer):
+    """Accept SMTP messages on a free loopback port, and count them."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, latency: float) -> None:
+        """Listen on a free loopback port, on a background thread."""
+        self.latency: float = latency
+        self.received: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), MailRequestHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+class MailRequestHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str) -> None:
+        time.sleep(self.server.latency)
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        self.reply("220 localhost")
+        for raw in self.rfile:
+            command: bytes = raw.strip().upper()
+            if command.startswith(b"DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                for data in self.rfile:
+                    if data.rstrip(b"\r\n") == b".":
+                        break
+                with self.server._lock:
+                    self.server.received += 1
+                self.reply("250 OK")
+            elif command.startswith(b"QUIT"):
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+def run(count: int, templates: int, latency_ms: float) -> None:
+    rows: list[list] = []
+
+    for label in ("SMTPHandlerConfig", "DigestSMTPHandlerConfig"):
+        server = MailServer(latency_ms / 1000)
+        mailhost: list = ["127.0.0.1", server.server_address[1]]
+        if label == "SMTPHandlerConfig":
+            handler = red_logging.config_classes.handlers.SMTPHandlerConfig(
+                name="mail", mailhost=mailhost, toaddrs=["to@example.com"]
+            )
+        else:
+            handler = red_logging.config_classes.handlers.DigestSMTPHandlerConfig(
+                name="mail", mailhost=mailhost, toaddrs=["to@example.com"]
+            )
+
+        logging.config.dictConfig(
+            red_logging.assemble_configdict(
+                root_handlers=[],
+                formatters=[red_logging.get_formatter_config(name="default")],
+                handlers=[handler],
+                loggers=[red_logging.get_logger_config(name="bench", handlers=["mail"])],
+            )
+        )
+        log = logging.getLogger("bench")
+
+        start: float = time.perf_counter()
+        samples: list[float] = time_calls(
+            lambda i: log.error(f"upstream {i % templates} failed: %s", "connection reset"),
+            count,
+        )
+        wall: float = time.perf_counter() - start
+        ## Closing the digest handler sends its digest
+        reset_logging()
+
+        rows.append(
+            [
+                label,
+                count,
+                wall,
+                percentile(samples, 50),
+                percentile(samples, 99),
+                max(samples),
+                server.received,
+            ]
+        )
+        server.shutdown()
+        server.server_close()
+
+    print_table(
+        [
+            "handler",
+            "records",
+            "caller seconds",
+            "p50 us/call",
+            "p99 us/call",
+            "max us/call",
+            "emails sent",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--templates", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    run(count=args.count, templates=args.templates, latency_ms=args.latency_ms)
@@ -0,0 +1,113 @@
+"""Compare `SocketHandlerConfig` vs. `BatchedSocketHandlerConfig` sending records to a loopback receiver.
+
+Each handler is built from its config class with `assemble_configdict()`, then `--count` records
+are logged. Caller records/sec is measured by the logging calls alone; delivery lasts until the
+receiver has decoded every record. The receiver runs in the same process, so CPU time includes it.
+
+Usage:
+    python benchmarks/bench_socket.py --count 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import socketserver
+import threading
+import time
+
+import red_logging
+
+from _common import print_table, reset_logging, time_total
+
+class CountingReceiver(socketserver.ThreadingTCPServer):
+    """Decode frames from any number of connections, and count the records in them."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """Listen on a free loopback port, on a background thread."""
+        self.received: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), CountingRequestHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+class CountingRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for frame in red_logging.handlers.iter_frames(self.rfile):
+            records = [logging.makeLogRecord(record_dict) for record_dict in frame]
+            with self.server._lock:
+                self.server.received += len(records)
+
+
+def run(count: int, batch_size: int) -> None:
+    rows: list[list] = []
+
+    for label in ("SocketHandlerConfig", "BatchedSocketHandlerConfig"):
+        receiver = CountingReceiver()
+        port: int = receiver.server_address[1]
+        if label == "SocketHandlerConfig":
+            handler = red_logging.config_classes.handlers.SocketHandlerConfig(
+                name="log_server", host="127.0.0.1", port=port
+            )
+        else:
+            handler = red_logging.config_classes.handlers.BatchedSocketHandlerConfig(
+                name="log_server", host="127.0.0.1", port=port, batch_size=batch_size
+            )
+
+        logging.config.dictConfig(
+            red_logging.assemble_configdict(
+                root_handlers=[],
+                formatters=[red_logging.get_formatter_config(name="default")],
+                handlers=[handler],
+                loggers=[
+                    red_logging.get_logger_config(name="bench", handlers=["log_server"])
+                ],
+            )
+        )
+        log = logging.getLogger("bench")
+
+        start: float = time.perf_counter()
+        wall, cpu = time_total(
+            lambda: [log.info("request %d handled in %s ms", i, 12.5) for i in range(count)]
+        )
+        reset_logging()
+        while receiver.received < count and time.perf_counter() - start < 60:
+            time.sleep(0.005)
+        delivered: float = time.perf_counter() - start
+
+        rows.append(
+            [
+                label,
+                count,
+                count / wall,
+                cpu / count * 1e6,
+                receiver.received,
+                count / delivered,
+            ]
+        )
+        receiver.shutdown()
+        receiver.server_close()
+
+    print_table(
+        [
+            "handler",
+            "records",
+            "caller records/sec",
+            "process CPU us/record",
+            "received",
+            "delivered records/sec",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    run(count=args.count, batch_size=args.batch_size)
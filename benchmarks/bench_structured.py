@@ -0,0 +1,97 @@
+"""Compare `JSONFormatter` & `LogfmtFormatter` throughput vs. a `json.dumps()` formatter & `logging.Formatter`.
+
+The `json.dumps()` formatter is the usual hand-written NDJSON formatter: build a dict of the same fields
+& extras for each record, then `json.dumps()` it. Each formatter formats `--count` records, with no
+extras, with 4 `extra` values, and with an `extra` value that needs the fallback. The best of `--repeat`
+runs is reported, in records/second.
+
+Usage:
+    python benchmarks/bench_structured.py --count 100000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+from decimal import Decimal
+import json
+import logging
+import time
+
+import red_logging
+
+from _common import print_table
+
+FIELDS: list[str] = ["asctime", "levelname", "name", "message"]
+_STANDARD: frozenset[str] = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+class DumpsFormatter(logging.Formatter):
+    """A dict + `json.dumps()` formatter, writing the same fields & extras as `JSONFormatter`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        data: dict = {name: record.__dict__.get(name) for name in FIELDS}
+        data.update((k, v) for k, v in record.__dict__.items() if k not in _STANDARD)
+
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+def records_per_sec(formatter: logging.Formatter, records: list[logging.LogRecord], repeat: int) -> float:
+    _format = formatter.format
+    best: int = 0
+    for _ in range(repeat):
+        start: int = time.perf_counter_ns()
+        for record in records:
+            _format(record)
+        elapsed: int = time.perf_counter_ns() - start
+        best = elapsed if not best else min(best, elapsed)
+
+    return len(records) / (best / 1e9)
+
+
+def _records(count: int, extra: dict) -> list[logging.LogRecord]:
+    records: list[logging.LogRecord] = []
+    for i in range(count):
+        record = logging.LogRecord(
+            "app.db", logging.INFO, __file__, 1, "query %s took %d ms", ("users", i), None
+        )
+        record.__dict__.update(extra)
+        records.append(record)
+
+    return records
+
+
+def run(count: int, repeat: int) -> None:
+    cases: dict[str, dict] = {
+        "no extras": {},
+        "4 extras": {"request_id": "r-123", "user_id": 42, "duration": 0.125, "cached": False},
+        "fallback extra": {"request_id": "r-123", "amount": Decimal("12.50")},
+    }
+    formatters: dict[str, logging.Formatter] = {
+        "logging.Formatter (text)": logging.Formatter(red_logging.fmts.MESSAGE_FMT_STANDARD),
+        "json.dumps() formatter": DumpsFormatter(),
+        "JSONFormatter": red_logging.formatters.JSONFormatter(fields=FIELDS),
+        "LogfmtFormatter": red_logging.formatters.LogfmtFormatter(fields=FIELDS),
+    }
+
+    rows: list[list] = []
+    for case, extra in cases.items():
+        records: list[logging.LogRecord] = _records(count, extra)
+        baseline: float = 0.0
+        for label, formatter in formatters.items():
+            rate: float = records_per_sec(formatter, records, repeat)
+            if label == "json.dumps() formatter":
+                baseline = rate
+            rows.append([case, label, f"{rate:,.0f}", f"{rate / baseline:.2f}x" if baseline else ""])
+
+    print_table(["records", "formatter", "records/s", "vs json.dumps()"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(count=args.count, repeat=args.repeat)
@@ -8,7 +8,18 @@ can be compiled down to `logging.config.dictConfig`-compatible dicts using each
 
 from __future__ import annotations
 
-from . import config_classes, fmts, helpers
+from . import (
+    collector,
+    config_classes,
+    decode,
+    filters,
+    fmts,
+    formatters,
+    handlers,
+    helpers,
+    loggers,
+    merge,
+)
 from .__base import BASE_LOGGING_CONFIG_DICT
 from .helpers import (
     assemble_configdict,
@@ -0,0 +1,14 @@
+"""Receive log records sent by `SocketHandler`s from other processes/hosts, and write them locally.
+
+Run as a module to write collected records to a rotating file, i.e.
+`python -m red_logging.collector --port 9020 --filename logs/collector.log --max-bytes 10485760 --backup-count 5`.
+"""
+
+from __future__ import annotations
+
+from ._collector import (
+    COLLECTOR_LOGGER_NAME,
+    DEFAULT_PORT,
+    LogCollector,
+    get_collector_configdict,
+)
@@ -0,0 +1,100 @@
+"""Entry point for `python -m red_logging.collector`."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import logging.config
+import signal
+import sys
+
+from red_logging.collector._collector import (
+    COLLECTOR_LOGGER_NAME,
+    DEFAULT_PORT,
+    LogCollector,
+    get_collector_configdict,
+)
+from red_logging.fmts import DATE_FMT_STANDARD, MESSAGE_FMT_STANDARD
+
+async def _serve(collector: LogCollector) -> None:
+    await collector.start()
+
+    stop: asyncio.Event = asyncio.Event()
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            ## i.e. Windows, where KeyboardInterrupt still stops the collector
+            pass
+
+    try:
+        await stop.wait()
+    finally:
+        await collector.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m red_logging.collector",
+        description="Receive log records from SocketHandlers and write them to a rotating file.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on.")
+    parser.add_argument(
+        "--filename", default="logs/collector.log", help="File to write collected records to."
+    )
+    parser.add_argument(
+        "--max-bytes", type=int, default=10 * 1024 * 1024, help="Rotate the file at this size."
+    )
+    parser.add_argument(
+        "--backup-count", type=int, default=5, help="Number of rotated files to keep."
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["gzip", "bz2", "lzma"],
+        default=None,
+        help="Compress rotated files.",
+    )
+    parser.add_argument("--fmt", default=MESSAGE_FMT_STANDARD, help="Format for collected records.")
+    parser.add_argument(
+        "--datefmt", default=DATE_FMT_STANDARD, help="Format for asctime in collected records."
+    )
+    parser.add_argument(
+        "--config",
+        metavar="JSON_FILE",
+        help=f"A logging dictConfig saved with save_configdict(). Configure the '{COLLECTOR_LOGGER_NAME}' "
+        "logger's handlers in it. Overrides the file options above.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.config:
+        with open(args.config, "r") as f:
+            logging_config: dict = json.load(f)
+    else:
+        logging_config = get_collector_configdict(
+            filename=args.filename,
+            maxBytes=args.max_bytes,
+            backupCount=args.backup_count,
+            fmt=args.fmt,
+            datefmt=args.datefmt,
+            compression=args.compression,
+        )
+
+    logging.config.dictConfig(logging_config)
+    ## Print the collector's own status messages, if the config does not handle them
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+
+    collector: LogCollector = LogCollector(host=args.host, port=args.port)
+    try:
+        asyncio.run(_serve(collector))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
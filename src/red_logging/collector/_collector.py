@@ -0,0 +1,239 @@
+"""An asyncio TCP server that receives log records from `SocketHandler`s and writes them locally.
+
+The collector accepts any number of producer connections on a single event loop. Each connection is
+an `asyncio.Protocol`, which parses length-prefixed frames straight out of the bytes it receives, so
+no task or coroutine is needed per connection. Frames from a stdlib `SocketHandler` (1 record each),
+`AsyncSocketHandler` (1 record each) and `BatchedSocketHandler` (many records each) are all accepted.
+
+Each decoded record is passed to the handlers of a single logger (`COLLECTOR_LOGGER_NAME` by default),
+keeping the record's original name, level & timestamp. Configure that logger's handlers with this
+package's config classes, i.e. with `get_collector_configdict()`, which builds a rotating file handler.
+
+Frames are decoded with `decode_frame(restricted=True)`, so a producer cannot make the collector import
+classes. Records with values that are not builtin types are counted in `.errors` and skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import logging.handlers
+import typing as t
+
+from red_logging.config_classes.handlers import RotatingFileHandlerConfig
+from red_logging.fmts import DATE_FMT_STANDARD, MESSAGE_FMT_STANDARD
+from red_logging.handlers import FRAME_HEADER, decode_frame
+from red_logging.helpers import (
+    assemble_configdict,
+    get_formatter_config,
+    get_logger_config,
+    get_rotatingfilehandler_config,
+)
+
+log = logging.getLogger("red_logging.collector")
+
+COLLECTOR_LOGGER_NAME: str = "red_logging.collector.records"
+DEFAULT_PORT: int = logging.handlers.DEFAULT_TCP_LOGGING_PORT
+
+
+def get_collector_configdict(
+    filename: str = "logs/collector.log",
+    maxBytes: int = 10 * 1024 * 1024,
+    backupCount: int = 5,
+    fmt: str = MESSAGE_FMT_STANDARD,
+    datefmt: str = DATE_FMT_STANDARD,
+    background: bool = True,
+    compression: str | None = None,
+    logger_name: str = COLLECTOR_LOGGER_NAME,
+) -> dict[str, t.Any]:
+    """Return a logging dictConfig that writes collected records to a rotating file.
+
+    Params:
+        filename (str): The file to write collected records to.
+        maxBytes (int): The maximum size of the file (in bytes) before it is rotated.
+        backupCount (int): Number of rotated log files to keep.
+        fmt (str): The format for collected records.
+        datefmt (str): The format for `asctime` in collected records.
+        background (bool): When `True`, rotated files are renamed/compressed on a background thread, so
+            a rollover does not stall the collector.
+        compression (str | None): Compress rotated files with `gzip`, `bz2` or `lzma`. Requires `background=True`.
+        logger_name (str): The name of the logger the collector passes records to.
+
+    Returns:
+        (dict[str, Any]): A logging dictConfig dict.
+
+    """
+    ## Creates the log file's parent directories
+    _handler: RotatingFileHandlerConfig = get_rotatingfilehandler_config(
+        name="collector_file",
+        level="NOTSET",
+        formatter="collector",
+        filename=filename,
+        maxBytes=maxBytes,
+        backupCount=backupCount,
+        background=background,
+        compression=compression,
+    )
+
+    return assemble_configdict(
+        root_handlers=[],
+        formatters=[get_formatter_config(name="collector", fmt=fmt, datefmt=datefmt)],
+        handlers=[_handler],
+        loggers=[
+            get_logger_config(
+                name=logger_name, handlers=[_handler.name], level="NOTSET"
+            )
+        ],
+    )
+
+
+## Attributes of an empty LogRecord, for records whose sender left some out
+_RECORD_DEFAULTS: dict[str, t.Any] = dict(logging.makeLogRecord({}).__dict__)
+
+
+def _make_record(record_dict: dict[str, t.Any]) -> logging.LogRecord:
+    """Build a LogRecord like `logging.makeLogRecord()`, without running `LogRecord.__init__()`.
+
+    The sender already filled in every attribute, so there is no need to look up the time, process,
+    thread, etc. in the collector only to overwrite them.
+    """
+    record: logging.LogRecord = logging.LogRecord.__new__(logging.LogRecord)
+    record.__dict__.update(_RECORD_DEFAULTS)
+    record.__dict__.update(record_dict)
+
+    return record
+
+
+class _CollectorProtocol(asyncio.Protocol):
+    """Parse frames from 1 producer connection and pass them to the collector."""
+
+    def __init__(self, collector: LogCollector) -> None:
+        self.collector: LogCollector = collector
+        self.transport: asyncio.Transport | None = None
+        self._buffer: bytearray = bytearray()
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.collector.connections += 1
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.collector.connections -= 1
+        self._buffer.clear()
+
+    def data_received(self, data: bytes) -> None:
+        buffer: bytearray = self._buffer
+        buffer += data
+
+        header_size: int = FRAME_HEADER.size
+        size: int = len(buffer)
+        offset: int = 0
+        while size - offset >= header_size:
+            (length,) = FRAME_HEADER.unpack_from(buffer, offset)
+            if length > self.collector.max_frame_bytes:
+                ## A broken (or hostile) producer, stop reading from it
+                self.collector.errors += 1
+                self.transport.close()
+                buffer.clear()
+
+                return
+
+            end: int = offset + header_size + length
+            if end > size:
+                break
+
+            self.collector.handle_frame(bytes(buffer[offset + header_size : end]))
+            offset = end
+
+        if offset:
+            del buffer[:offset]
+
+
+class LogCollector:
+    """Receive framed log records over TCP, and pass them to a local logger's handlers.
+
+    Params:
+        host (str): The address to listen on. Defaults to loopback only.
+        port (int): The port to listen on. `0` picks a free port, see `.port` once started.
+        logger_name (str): The name of the logger whose handlers write the collected records.
+        max_frame_bytes (int): Producers that send a frame larger than this are disconnected.
+        backlog (int): The maximum number of connections waiting to be accepted.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        logger_name: str = COLLECTOR_LOGGER_NAME,
+        max_frame_bytes: int = 16 * 1024 * 1024,
+        backlog: int = 4096,
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.logger: logging.Logger = logging.getLogger(logger_name)
+        self.max_frame_bytes: int = max_frame_bytes
+        self.backlog: int = backlog
+
+        self.records: int = 0
+        self.frames: int = 0
+        self.errors: int = 0
+        self.connections: int = 0
+        self.server: asyncio.Server | None = None
+
+    def handle_frame(self, payload: bytes) -> None:
+        """Decode a frame's payload and pass each record in it to the collector's logger."""
+        try:
+            record_dicts: list[dict[str, t.Any]] = decode_frame(payload, restricted=True)
+        except Exception as exc:
+            self.errors += 1
+            log.debug(f"Skipping a frame that could not be decoded. Details: {exc}")
+
+            return
+
+        self.frames += 1
+        _handle = self.logger.handle
+        _make = (
+            _make_record
+            if logging.getLogRecordFactory() is logging.LogRecord
+            else logging.makeLogRecord
+        )
+        handled: int = 0
+        for record_dict in record_dicts:
+            try:
+                _handle(_make(record_dict))
+            except Exception:
+                ## i.e. a dict that is missing record attributes like `levelno`
+                self.errors += 1
+
+                continue
+
+            handled += 1
+        self.records += handled
+
+    async def start(self) -> None:
+        """Start listening for producers."""
+        self.server = await asyncio.get_running_loop().create_server(
+            lambda: _CollectorProtocol(self),
+            host=self.host,
+            port=self.port,
+            backlog=self.backlog,
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        log.info(f"Collecting log records on {self.host}:{self.port}")
+
+    async def serve_forever(self) -> None:
+        """Start the collector (if needed), and serve until the task is cancelled."""
+        if self.server is None:
+            await self.start()
+
+        await self.server.serve_forever()
+
+    async def stop(self) -> None:
+        """Stop accepting producers, and close the server."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+        log.info(
+            f"Collected {self.records} record(s) in {self.frames} frame(s), {self.errors} error(s)"
+        )
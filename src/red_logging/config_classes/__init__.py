@@ -24,6 +24,7 @@ from .prefab.third_party.prefab_red_logging import (
     get_red_logging_logger,
 )
 from .types import (
+    FORMATTER_CLASSES_TYPE,
     HANDLER_CLASSES_TYPE,
     HANDLER_CLASSES_TYPE_ANNOTATION,
     LOGGING_CONFIG_DICT_TYPE,
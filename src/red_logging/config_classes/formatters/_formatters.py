@@ -6,7 +6,8 @@ that can be added to a logging config dict.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import typing as t
 
 from red_logging.config_classes.base import BaseLoggingConfig
 from red_logging.fmts._formats import (
@@ -32,6 +33,14 @@ class FormatterConfig(BaseLoggingConfig):
             means formats need to be written like `%(asctime)s %(levelname)s %(message)s`. If
             you change this style, make sure the `fmt` you pass uses the correct formatting style.
         validate (bool): When `True`, the configuration dict this formatter returns will be validated by the logging module.
+        compiled (bool): When `True`, use a `red_logging.formatters.CompiledFormatter`, which compiles a
+            `%`-style `fmt` into a function once, instead of interpolating it for every record. Its
+            `asctime` is cached like `cache_time`.
+        cache_time (bool): When `True`, use a `red_logging.formatters.CachedTimeFormatter`, which renders
+            `asctime` once per second instead of once per record.
+        utc (bool): When `True`, render `asctime` in UTC instead of local time.
+        share_output (bool): When `True`, the handlers that use this formatter format each record once
+            between them, instead of once per handler.
 
     """
 
@@ -40,9 +49,16 @@ class FormatterConfig(BaseLoggingConfig):
     datefmt: str = DATE_FMT_STANDARD
     style: str = "%"
     validate: bool = True
+    compiled: bool = False
+    cache_time: bool = False
+    utc: bool = False
+    share_output: bool = False
 
     def get_configdict(self) -> dict[str, dict[str, str]]:
         """Return a dict representation of the formatter described by this class."""
+        if self.compiled or self.cache_time or self.utc or self.share_output:
+            return self._get_factory_configdict()
+
         formatter_dict: dict[str, dict[str, str]] = {self.name: {"format": self.fmt}}
         if self.datefmt:
             formatter_dict[self.name]["datefmt"] = self.datefmt
@@ -51,3 +67,102 @@ class FormatterConfig(BaseLoggingConfig):
         formatter_dict[self.name]["validate"] = self.validate
 
         return formatter_dict
+
+    def _get_factory_configdict(self) -> dict[str, dict[str, t.Any]]:
+        ## A formatter's "class" key is only passed fmt, datefmt, style & validate, so use a "()" factory
+        #  to pass utc & share_output as well
+        formatter_class: str = (
+            "red_logging.formatters.CompiledFormatter"
+            if self.compiled
+            else "red_logging.formatters.CachedTimeFormatter"
+        )
+        formatter_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {"()": formatter_class, "fmt": self.fmt}
+        }
+        if self.datefmt:
+            formatter_dict[self.name]["datefmt"] = self.datefmt
+        if self.style:
+            formatter_dict[self.name]["style"] = self.style
+        formatter_dict[self.name]["validate"] = self.validate
+        if self.utc:
+            formatter_dict[self.name]["utc"] = self.utc
+        if self.share_output:
+            formatter_dict[self.name]["share_output"] = self.share_output
+
+        return formatter_dict
+
+
+@dataclass
+class JSONFormatterConfig(BaseLoggingConfig):
+    """Define a JSONFormatter, which writes each record as a single-line JSON object (NDJSON).
+
+    Params:
+        name (str): The name of the formatter.
+        fields (list[str]): The record attributes to write, in order. `message` is the formatted message,
+            `asctime` the formatted time & `exc_info` the formatted exception.
+        rename (dict[str, str]): Output keys for attributes, i.e. `{"levelname": "level"}`.
+        extras (bool): When `True`, also write non-standard record attributes, like `extra` values.
+        datefmt (str | None): The string formatting to use for `asctime`.
+        utc (bool): When `True`, render `asctime` in UTC instead of local time.
+        max_fallback_length (int): The most characters written for a value that is not a `str`, number,
+            `bool` or `None`.
+        share_output (bool): When `True`, the handlers that use this formatter format each record once
+            between them, instead of once per handler.
+
+    """
+
+    name: str = None
+    fields: list[str] = field(
+        default_factory=lambda: ["asctime", "levelname", "name", "message"]
+    )
+    rename: dict[str, str] = field(default_factory=lambda: {})
+    extras: bool = True
+    datefmt: str | None = None
+    utc: bool = False
+    max_fallback_length: int = 1024
+    share_output: bool = False
+
+    def get_formatter_class(self) -> str:
+        """Return the logging formatter class this class represents.
+
+        Returns:
+            (str): `red_logging.formatters.JSONFormatter`.
+
+        """
+        return "red_logging.formatters.JSONFormatter"
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the formatter described by this class."""
+        formatter_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "()": self.get_formatter_class(),
+                "fields": self.fields,
+                "rename": self.rename,
+                "extras": self.extras,
+                "utc": self.utc,
+                "max_fallback_length": self.max_fallback_length,
+            }
+        }
+        if self.datefmt:
+            formatter_dict[self.name]["datefmt"] = self.datefmt
+        if self.share_output:
+            formatter_dict[self.name]["share_output"] = self.share_output
+
+        return formatter_dict
+
+
+@dataclass
+class LogfmtFormatterConfig(JSONFormatterConfig):
+    """Define a LogfmtFormatter, which writes each record as a line of `key=value` pairs.
+
+    Takes the same params as `JSONFormatterConfig`.
+    """
+
+    def get_formatter_class(self) -> str:
+        """Return the logging formatter class this class represents.
+
+        Returns:
+            (str): `red_logging.formatters.LogfmtFormatter`.
+
+        """
+        return "red_logging.formatters.LogfmtFormatter"
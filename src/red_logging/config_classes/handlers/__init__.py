@@ -6,10 +6,22 @@ Handlers define what to do with log messages as they are created.
 from __future__ import annotations
 
 from ._handlers import (
+    AsyncFileHandlerConfig,
+    AsyncSocketHandlerConfig,
+    AsyncStreamHandlerConfig,
+    BatchedSocketHandlerConfig,
+    BinaryFileHandlerConfig,
+    BufferedFileHandlerConfig,
+    DedupHandlerConfig,
+    DigestSMTPHandlerConfig,
     FileHandlerConfig,
+    MmapFileHandlerConfig,
+    QueuedHandlerConfig,
     QueueHandlerConfig,
     QueueListenerConfig,
+    RingBufferHandlerConfig,
     RotatingFileHandlerConfig,
+    ShardedFileHandlerConfig,
     SMTPHandlerConfig,
     SocketHandlerConfig,
     StreamHandlerConfig,
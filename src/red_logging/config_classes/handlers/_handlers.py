@@ -37,7 +37,7 @@ class StreamHandlerConfig(BaseHandlerConfig):
             }
         }
         if self.filters:
-            handler_dict["filters"] = self.filters
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -70,6 +70,8 @@ class FileHandlerConfig(BaseHandlerConfig):
                 "filename": self.filename,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -82,6 +84,178 @@ class FileHandlerConfig(BaseHandlerConfig):
         return "logging.FileHandler"
 
 
+@dataclass
+class BufferedFileHandlerConfig(BaseHandlerConfig):
+    """Define a BufferedFileHandler, which writes log records to a file in batches.
+
+    Params:
+        filename (str): The name of the file to log messages to.
+        flush_bytes (int): Write the buffered records once they add up to this many bytes.
+        flush_interval_ms (int): Write the buffered records once the oldest is this many milliseconds old.
+            `0` disables the time threshold.
+        flush_level (str): Records at this level or higher are written immediately, along with
+            any records buffered before them.
+    """
+
+    filename: str | None = field(default="app.log")
+    flush_bytes: int = 65536
+    flush_interval_ms: int = 1000
+    flush_level: str = "ERROR"
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "flush_bytes": self.flush_bytes,
+                "flush_interval_ms": self.flush_interval_ms,
+                "flush_level": self.flush_level,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.BufferedFileHandler`.
+
+        """
+        return "red_logging.handlers.BufferedFileHandler"
+
+
+@dataclass
+class BinaryFileHandlerConfig(BaseHandlerConfig):
+    """Define a BinaryFileHandler, which writes records as binary frames with a dictionary of templates.
+
+    Decode the file with `python -m red_logging.decode`. A text `formatter` is ignored by the handler.
+
+    Params:
+        filename (str): The name of the file to log messages to.
+        mode (str): The mode to open the file in, `a` (append) or `w` (truncate).
+        delay (bool): When `True`, the file is not opened until the first record is written.
+        max_entries (int): Start a new dictionary in the file once it holds this many entries.
+    """
+
+    filename: str | None = field(default="app.rlog")
+    mode: str = "a"
+    delay: bool = False
+    max_entries: int = 65536
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "mode": self.mode,
+                "delay": self.delay,
+                "max_entries": self.max_entries,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.BinaryFileHandler`.
+
+        """
+        return "red_logging.handlers.BinaryFileHandler"
+
+
+@dataclass
+class ShardedFileHandlerConfig(BaseHandlerConfig):
+    """Define a ShardedFileHandler, which writes 1 log file per process, i.e. `app.<pid>.log`.
+
+    Use the `MESSAGE_FMT_SHARDED` format to include the sequence number & nanosecond timestamp that
+    `python -m red_logging.merge` uses to combine the shards in order.
+
+    Params:
+        filename (str): The log file name shard names are built from, i.e. `app.log` for `app.<pid>.log`.
+    """
+
+    filename: str | None = field(default="app.log")
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.ShardedFileHandler`.
+
+        """
+        return "red_logging.handlers.ShardedFileHandler"
+
+
+@dataclass
+class MmapFileHandlerConfig(BaseHandlerConfig):
+    """Define a MmapFileHandler, which appends log records to a memory-mapped file.
+
+    The file starts with a binary header. Read it back with `red_logging.handlers.read_mmap_log()`.
+
+    Params:
+        filename (str): The name/path of the file to log messages to.
+        chunk_size (int): How many bytes to grow the file by when it is full.
+        maxBytes (int): Rotate the file when its log data would exceed this many bytes. `0` disables rotation.
+        backupCount (int): Number of rotated log files to keep.
+    """
+
+    filename: str | None = field(default="app.log")
+    chunk_size: int = 4 * 1024 * 1024
+    maxBytes: int = 0
+    backupCount: int = 0
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "chunk_size": self.chunk_size,
+                "maxBytes": self.maxBytes,
+                "backupCount": self.backupCount,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.MmapFileHandler`.
+
+        """
+        return "red_logging.handlers.MmapFileHandler"
+
+
 @dataclass
 class RotatingFileHandlerConfig(BaseHandlerConfig):
     """Define a logging RotatingFileHandler.
@@ -90,12 +264,20 @@ class RotatingFileHandlerConfig(BaseHandlerConfig):
         filename (str | None): The name/path of the file to log messages to.
         maxBytes (int): The maximum size of the file (in bytes) before a new file is rotated.
         backupCount (int): Number of rotated log files to keep.
+        background (bool): When `True`, use a `red_logging.handlers.BackgroundRotatingFileHandler`, which
+            only swaps to a new file on the logging thread and rotates/compresses backups on a worker thread.
+        compression (str | None): Compress rotated files with `gzip`, `bz2` or `lzma`. Requires `background=True`.
+        multiprocess (bool): When `True`, use a `red_logging.handlers.MultiProcessRotatingFileHandler`, which
+            is safe to use when several processes (i.e. gunicorn workers) log to the same file. POSIX only.
 
     """
 
     filename: str | None = field(default="app.log")
     maxBytes: int = 0
     backupCount: int = 0
+    background: bool = False
+    compression: str | None = None
+    multiprocess: bool = False
 
     def get_configdict(self) -> dict[str, dict[str, t.Any]]:
         """Return a dict representation of the handler described by this class."""
@@ -109,15 +291,31 @@ class RotatingFileHandlerConfig(BaseHandlerConfig):
                 "backupCount": self.backupCount,
             }
         }
+        if self.compression:
+            if not self.background:
+                raise ValueError("Compressing rotated files requires background=True")
+            handler_dict[self.name]["compression"] = self.compression
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
         """Return the logging handler class this class represents.
 
         Returns:
-            (str): `logging.RotatingFileHandler`.
+            (str): `logging.RotatingFileHandler`, `red_logging.handlers.BackgroundRotatingFileHandler`
+                when `background=True`, or `red_logging.handlers.MultiProcessRotatingFileHandler` when
+                `multiprocess=True`.
 
         """
+        if self.multiprocess:
+            if self.background:
+                raise ValueError("A RotatingFileHandlerConfig cannot set both background & multiprocess")
+
+            return "red_logging.handlers.MultiProcessRotatingFileHandler"
+        if self.background:
+            return "red_logging.handlers.BackgroundRotatingFileHandler"
+
         return "logging.handlers.RotatingFileHandler"
 
 
@@ -131,12 +329,17 @@ class TimedRotatingFileHandlerConfig(BaseHandlerConfig):
         interval (int): When to rotate the file as the interval defined in `when` occurs.
             `1=every occurrence`, `2=every other occurrence`, etc.
         backupCount (int): The number of rotated log files to save.
+        background (bool): When `True`, use a `red_logging.handlers.BackgroundTimedRotatingFileHandler`, which
+            only swaps to a new file on the logging thread and rotates/compresses backups on a worker thread.
+        compression (str | None): Compress rotated files with `gzip`, `bz2` or `lzma`. Requires `background=True`.
     """
 
     filename: str | None = field(default="app.log")
     when: str | None = field(default="midnight")
     interval: int = 1
     backupCount: int = 0
+    background: bool = False
+    compression: str | None = None
 
     def get_configdict(self) -> dict[str, dict[str, t.Any]]:
         """Return a dict representation of the handler described by this class."""
@@ -151,15 +354,25 @@ class TimedRotatingFileHandlerConfig(BaseHandlerConfig):
                 "backupCount": self.backupCount,
             }
         }
+        if self.compression:
+            if not self.background:
+                raise ValueError("Compressing rotated files requires background=True")
+            handler_dict[self.name]["compression"] = self.compression
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
         """Return the logging handler class this class represents.
 
         Returns:
-            (str): `logging.handlers.TimedRotatingFileHandler`.
+            (str): `logging.handlers.TimedRotatingFileHandler`, or
+                `red_logging.handlers.BackgroundTimedRotatingFileHandler` when `background=True`.
 
         """
+        if self.background:
+            return "red_logging.handlers.BackgroundTimedRotatingFileHandler"
+
         return "logging.handlers.TimedRotatingFileHandler"
 
 
@@ -186,6 +399,8 @@ class SocketHandlerConfig(BaseHandlerConfig):
                 "port": self.port,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -198,6 +413,191 @@ class SocketHandlerConfig(BaseHandlerConfig):
         return "logging.handlers.SocketHandler"
 
 
+@dataclass
+class BatchedSocketHandlerConfig(BaseHandlerConfig):
+    """Define a BatchedSocketHandler, which sends many records per frame to a socket from a background thread.
+
+    By default, each frame holds a pickled list of record dicts, which a receiver written for the stdlib
+    `SocketHandler` (`logging.makeLogRecord(pickle.loads(chunk))`) cannot read. Set `frame_per_record`
+    to send stdlib frames, or read the frames with `red_logging.handlers.decode_frame()`.
+
+    Params:
+        host (str): Host IP/FQDN.
+        port (int): Host port where log messages should be sent.
+        batch_size (int): The maximum number of records to send in 1 frame.
+        flush_interval_ms (int): How long to wait for more records before sending a batch that is not full.
+        queue_size (int): The maximum number of records waiting to be sent. Records are dropped when it is full.
+        retry_start (float): Seconds to wait before the first reconnect attempt.
+        retry_max (float): The longest wait (in seconds) between reconnect attempts.
+        frame_per_record (bool): Send each record in its own stdlib `SocketHandler` frame (1 pickled
+            dict), instead of 1 frame per batch.
+    """
+
+    host: str = "localhost"
+    port: int = 0
+    batch_size: int = 256
+    flush_interval_ms: int = 100
+    queue_size: int = 10000
+    retry_start: float = 0.5
+    retry_max: float = 30.0
+    frame_per_record: bool = False
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "host": self.host,
+                "port": self.port,
+                "batch_size": self.batch_size,
+                "flush_interval_ms": self.flush_interval_ms,
+                "queue_size": self.queue_size,
+                "retry_start": self.retry_start,
+                "retry_max": self.retry_max,
+            }
+        }
+        if self.frame_per_record:
+            handler_dict[self.name]["frame_per_record"] = True
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.BatchedSocketHandler`.
+
+        """
+        return "red_logging.handlers.BatchedSocketHandler"
+
+
+@dataclass
+class AsyncStreamHandlerConfig(BaseHandlerConfig):
+    """Define an AsyncStreamHandler, which writes to a stream without blocking the asyncio event loop.
+
+    Params:
+        stream (Any): The stream this handler controls, i.e. `ext://sys.stdout`, `ext://sys.stderr`, etc.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        batch_size (int): The maximum number of records written at once.
+    """
+
+    level: str = "DEBUG"
+    stream: t.Any | None = "ext://sys.stdout"
+    queue_size: int = 0
+    batch_size: int = 512
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "stream": self.stream,
+                "queue_size": self.queue_size,
+                "batch_size": self.batch_size,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.AsyncStreamHandler`.
+
+        """
+        return "red_logging.handlers.AsyncStreamHandler"
+
+
+@dataclass
+class AsyncFileHandlerConfig(BaseHandlerConfig):
+    """Define an AsyncFileHandler, which writes to a file without blocking the asyncio event loop.
+
+    Params:
+        filename (str): The name of the file to log messages to.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        batch_size (int): The maximum number of records written at once.
+    """
+
+    filename: str | None = field(default="app.log")
+    queue_size: int = 0
+    batch_size: int = 512
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "queue_size": self.queue_size,
+                "batch_size": self.batch_size,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.AsyncFileHandler`.
+
+        """
+        return "red_logging.handlers.AsyncFileHandler"
+
+
+@dataclass
+class AsyncSocketHandlerConfig(BaseHandlerConfig):
+    """Define an AsyncSocketHandler, which sends records to a socket over a non-blocking asyncio stream.
+
+    Params:
+        host (str): Host IP/FQDN.
+        port (int): Host port where log messages should be sent.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        batch_size (int): The maximum number of records sent at once.
+    """
+
+    host: str = "localhost"
+    port: int = 0
+    queue_size: int = 0
+    batch_size: int = 512
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "host": self.host,
+                "port": self.port,
+                "queue_size": self.queue_size,
+                "batch_size": self.batch_size,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.AsyncSocketHandler`.
+
+        """
+        return "red_logging.handlers.AsyncSocketHandler"
+
+
 @dataclass
 class SMTPHandlerConfig(BaseHandlerConfig):
     """Define a logging SMTPHandler.
@@ -235,6 +635,8 @@ class SMTPHandlerConfig(BaseHandlerConfig):
             handler_dict[self.name]["credentials"] = self.credentials
         if self.secure:
             handler_dict[self.name]["secure"] = self.secure
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -247,6 +649,167 @@ class SMTPHandlerConfig(BaseHandlerConfig):
         return "logging.handlers.SMTPHandler"
 
 
+@dataclass
+class DigestSMTPHandlerConfig(BaseHandlerConfig):
+    """Define a DigestSMTPHandler, which emails a digest of log records from a background thread.
+
+    Records are grouped by level, logger name & message template, and each group is counted. A digest
+    is sent at most once every `window_seconds`, and at most `max_emails_per_hour` times an hour.
+
+    Params:
+        mailhost (Any): The mail server, i.e. `localhost` or `["smtp.example.com", 587]`.
+        fromaddr (str): The address the digest is sent from.
+        toaddrs (list): The address(es) the digest is sent to.
+        subject (str): The digest's subject. The number of records in the digest is added to it.
+        credentials (tuple): A `(username, password)` to log in to the mail server with.
+        secure (tuple): When set, use STARTTLS, like a `SMTPHandler`.
+        window_seconds (float): How long to collect records before sending a digest.
+        max_emails_per_hour (int): The most digests to send in any hour. `0` means no limit.
+        max_groups (int): The most groups to keep in 1 digest. Records that do not fit are only counted.
+    """
+
+    level: str = "ERROR"
+    mailhost: t.Any = "localhost"
+    fromaddr: str = "from@example.com"
+    toaddrs: list = field(default_factory=lambda: [])
+    subject: str = "Log digest"
+    credentials: tuple | None = None
+    secure: tuple | None = None
+    window_seconds: float = 60.0
+    max_emails_per_hour: int = 12
+    max_groups: int = 100
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "mailhost": self.mailhost,
+                "fromaddr": self.fromaddr,
+                "toaddrs": self.toaddrs,
+                "subject": self.subject,
+                "window_seconds": self.window_seconds,
+                "max_emails_per_hour": self.max_emails_per_hour,
+                "max_groups": self.max_groups,
+            }
+        }
+        if self.credentials:
+            handler_dict[self.name]["credentials"] = self.credentials
+        if self.secure is not None:
+            handler_dict[self.name]["secure"] = self.secure
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.DigestSMTPHandler`.
+
+        """
+        return "red_logging.handlers.DigestSMTPHandler"
+
+
+@dataclass
+class DedupHandlerConfig(BaseHandlerConfig):
+    """Define a DedupHandler, which collapses repeated records before passing them to a target handler.
+
+    Repeats of a record (same logger, level, message template & args) are counted instead of passed on,
+    and 1 "(message repeated N times)" record is sent when the run ends or `timeout` passes.
+
+    Params:
+        target (str): The name of the handler to pass records to. It must exist in the logging dictConfig.
+        window (int): How many distinct recent records to track. `1` only collapses consecutive duplicates.
+        timeout (float): The most seconds a duplicate is held before its summary is sent.
+        flushOnClose (bool): When `True`, send held summaries when the handler is closed.
+    """
+
+    target: str | None = None
+    window: int = 1
+    timeout: float = 5.0
+    flushOnClose: bool = True
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "window": self.window,
+                "timeout": self.timeout,
+                "flushOnClose": self.flushOnClose,
+            }
+        }
+        if self.target:
+            handler_dict[self.name]["target"] = self.target
+        if self.formatter:
+            handler_dict[self.name]["formatter"] = self.formatter
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.DedupHandler`.
+
+        """
+        return "red_logging.handlers.DedupHandler"
+
+
+@dataclass
+class RingBufferHandlerConfig(BaseHandlerConfig):
+    """Define a RingBufferHandler, which keeps recent records and passes them to a target handler on error.
+
+    The handler's `level` (`DEBUG` by default) decides which records are kept. The logger must also
+    let those records through, while the other handlers can stay at a higher level, like `INFO`.
+
+    Params:
+        capacity (int): The number of records to keep.
+        flushLevel (str): Pass the kept records to the target when a record at this level or above arrives.
+        target (str): The name of the handler to pass records to. It must exist in the logging dictConfig.
+        flushOnClose (bool): When `True`, pass the kept records to the target when the handler is closed.
+    """
+
+    level: str = "DEBUG"
+    capacity: int = 1000
+    flushLevel: str = "ERROR"
+    target: str | None = None
+    flushOnClose: bool = False
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "capacity": self.capacity,
+                "flushLevel": self.flushLevel,
+                "flushOnClose": self.flushOnClose,
+            }
+        }
+        if self.target:
+            handler_dict[self.name]["target"] = self.target
+        if self.formatter:
+            handler_dict[self.name]["formatter"] = self.formatter
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.RingBufferHandler`.
+
+        """
+        return "red_logging.handlers.RingBufferHandler"
+
+
 @dataclass
 class QueueHandlerConfig(BaseHandlerConfig):
     """Define a logging QueueHandler.
@@ -267,6 +830,8 @@ class QueueHandlerConfig(BaseHandlerConfig):
                 "queue": self.queue,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -312,4 +877,53 @@ class QueueListenerConfig(BaseLoggingConfig):
             (str): `logging.handlers.QueueListener`.
 
         """
-        return "logging.handleres.QueueListener"
+        return "logging.handlers.QueueListener"
+
+
+@dataclass
+class QueuedHandlerConfig(BaseHandlerConfig):
+    """Define a QueuedHandler, which writes records to other handlers from a background thread.
+
+    Params:
+        handlers (list[str]): List of handler names the queue's listener should write to. These
+            handlers must exist in the logging dictConfig.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        block (bool): When `True`, a logging call waits for room on a full queue. When `False`,
+            records are dropped while the queue is full.
+        respect_handler_level (bool): When `True`, each handler's level is checked by the listener.
+    """
+
+    level: str = "NOTSET"
+    handlers: list[str] = field(default_factory=lambda: [])
+    queue_size: int = 0
+    block: bool = False
+    respect_handler_level: bool = True
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        ## Use a factory (`()`) instead of `class`, so Python 3.12+ does not treat this
+        #  QueueHandler subclass as a stdlib QueueHandler and build a second listener.
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "()": self.get_handler_class(),
+                "level": self.level,
+                "handlers": self.handlers,
+                "queue_size": self.queue_size,
+                "block": self.block,
+                "respect_handler_level": self.respect_handler_level,
+            }
+        }
+        if self.formatter:
+            handler_dict[self.name]["formatter"] = self.formatter
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_logging.handlers.QueuedHandler`.
+
+        """
+        return "red_logging.handlers.QueuedHandler"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import typing as t
 
 from red_logging.config_classes.base import BaseLoggingConfig
@@ -16,12 +16,17 @@ class LoggerConfig(BaseLoggingConfig):
         level (str): The level of log messages this logger should show (NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL).
         handlers (list[str]): List of handler names this logger should use. These handlers must exist in the logging dictConfig.
         propagate (bool): If `True`, messages will be propagated up/down to the root logger.
+        gates (list[str | dict | callable]): Gates that drop this logger's logging calls before a record
+            is created, i.e. `[{"templates": ["^heartbeat"]}]` for a `red_logging.loggers.TemplateGate`.
+            `dictConfig()` ignores them, `setup_logging()` (or `red_logging.loggers.configure_logger_gates()`)
+            installs them.
     """
 
     name: str
     level: str
     handlers: list[str]
     propagate: bool = False
+    gates: list = field(default_factory=lambda: [])
 
     def get_configdict(self) -> dict:
         """Return a dict representation of the logger described by this class."""
@@ -32,4 +37,6 @@ class LoggerConfig(BaseLoggingConfig):
                 "propagate": self.propagate,
             }
         }
+        if self.gates:
+            logger_dict[self.name]["gates"] = self.gates
         return logger_dict
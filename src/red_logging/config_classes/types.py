@@ -4,11 +4,25 @@ from __future__ import annotations
 
 import typing as t
 
+from .formatters import FormatterConfig, JSONFormatterConfig, LogfmtFormatterConfig
 from .handlers import (
+    AsyncFileHandlerConfig,
+    AsyncSocketHandlerConfig,
+    AsyncStreamHandlerConfig,
+    BatchedSocketHandlerConfig,
+    BinaryFileHandlerConfig,
+    BufferedFileHandlerConfig,
+    DedupHandlerConfig,
+    DigestSMTPHandlerConfig,
     FileHandlerConfig,
+    MmapFileHandlerConfig,
+    QueuedHandlerConfig,
     QueueHandlerConfig,
     QueueListenerConfig,
+    RingBufferHandlerConfig,
     RotatingFileHandlerConfig,
+    ShardedFileHandlerConfig,
+    SMTPHandlerConfig,
     SocketHandlerConfig,
     StreamHandlerConfig,
     TimedRotatingFileHandlerConfig,
@@ -16,12 +30,30 @@ from .handlers import (
 
 HANDLER_CLASSES_TYPE = t.Union[
     FileHandlerConfig,
+    BufferedFileHandlerConfig,
+    BinaryFileHandlerConfig,
+    MmapFileHandlerConfig,
     RotatingFileHandlerConfig,
+    ShardedFileHandlerConfig,
     TimedRotatingFileHandlerConfig,
     StreamHandlerConfig,
     SocketHandlerConfig,
+    BatchedSocketHandlerConfig,
+    SMTPHandlerConfig,
+    DigestSMTPHandlerConfig,
+    AsyncStreamHandlerConfig,
+    AsyncFileHandlerConfig,
+    AsyncSocketHandlerConfig,
+    RingBufferHandlerConfig,
+    DedupHandlerConfig,
     QueueHandlerConfig,
     QueueListenerConfig,
+    QueuedHandlerConfig,
+]
+FORMATTER_CLASSES_TYPE = t.Union[
+    FormatterConfig,
+    JSONFormatterConfig,
+    LogfmtFormatterConfig,
 ]
 HANDLER_CLASSES_TYPE_ANNOTATION = t.Annotated[
     HANDLER_CLASSES_TYPE,
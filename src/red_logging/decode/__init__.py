@@ -0,0 +1,9 @@
+"""Decode the binary logs written by a `BinaryFileHandler` back into text.
+
+Run as a module to write a binary log as text, i.e.
+`python -m red_logging.decode logs/app.rlog --fmt MESSAGE_FMT_DETAILED -o logs/app.log`.
+"""
+
+from __future__ import annotations
+
+from ._decode import decode_records, iter_records
@@ -0,0 +1,54 @@
+"""Entry point for `python -m red_logging.decode`."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from red_logging import fmts
+from red_logging.decode._decode import decode_records
+from red_logging.formatters import CompiledFormatter
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m red_logging.decode",
+        description="Write the records in binary logs from a BinaryFileHandler as text.",
+    )
+    parser.add_argument("paths", nargs="+", help="Binary log files to decode, in order.")
+    parser.add_argument(
+        "--fmt",
+        default="MESSAGE_FMT_STANDARD",
+        help="The name of a format in red_logging.fmts (i.e. MESSAGE_FMT_DETAILED), or a %%-style format string.",
+    )
+    parser.add_argument(
+        "--datefmt",
+        default="DATE_FMT_STANDARD",
+        help="The name of a date format in red_logging.fmts, or a strftime() format.",
+    )
+    parser.add_argument("--utc", action="store_true", help="Render asctime in UTC.")
+    parser.add_argument(
+        "-o", "--output", help="File to write decoded records to. Defaults to stdout."
+    )
+    args = parser.parse_args(argv)
+
+    formatter = CompiledFormatter(
+        getattr(fmts, args.fmt, args.fmt), getattr(fmts, args.datefmt, args.datefmt), utc=args.utc
+    )
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for text in decode_records(args.paths, formatter=formatter):
+            out.write(text)
+    except ValueError as exc:
+        print(f"{parser.prog}: {exc}", file=sys.stderr)
+
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
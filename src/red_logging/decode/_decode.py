@@ -0,0 +1,226 @@
+"""Read the binary logs written by a `BinaryFileHandler` back into `LogRecord`s, or text.
+
+The file is read 1 frame at a time, so memory use depends on the size of its dictionary (the strings,
+call sites & contexts it defines), not on the number of records. Records can be formatted with any
+formatter, i.e. with a `MESSAGE_FMT_*` format from `red_logging.fmts`. Like a `ShardedFileHandler`, each
+record gets a `seq` (its position in the file, from 1) and a `created_ns` timestamp, so
+`MESSAGE_FMT_SHARDED` works as well.
+
+`relativeCreated` is rebuilt from the writing process's start time, which is stored in the file.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import typing as t
+
+from red_logging.fmts import DATE_FMT_STANDARD, MESSAGE_FMT_STANDARD
+from red_logging.formatters import CompiledFormatter
+from red_logging.formatters._binary import (
+    ARG_FALSE,
+    ARG_FLOAT,
+    ARG_INT,
+    ARG_NONE,
+    ARG_STR,
+    ARG_TRUE,
+    CONTEXT,
+    CONTEXT_NO_PROCESS,
+    CONTEXT_NO_THREAD,
+    FLOAT_ARG,
+    FRAME_CONTEXT,
+    FRAME_RECORD,
+    FRAME_SESSION,
+    FRAME_SITE,
+    FRAME_STRING,
+    INT_ARG,
+    LENGTH,
+    MAGIC,
+    NONE_ID,
+    RECORD,
+    RECORD_EXC_TEXT,
+    RECORD_MESSAGE,
+    RECORD_STACK_INFO,
+    SESSION,
+    SITE,
+    STRING,
+    VERSION,
+)
+
+def _read(stream: t.BinaryIO, size: int) -> bytes:
+    data: bytes = stream.read(size)
+    if len(data) != size:
+        raise ValueError(f"Truncated binary log: expected {size} bytes, got {len(data)}.")
+
+    return data
+
+
+def _read_text(stream: t.BinaryIO) -> str:
+    (length,) = LENGTH.unpack(_read(stream, LENGTH.size))
+
+    return _read(stream, length).decode("utf-8", "surrogateescape")
+
+
+def _read_args(stream: t.BinaryIO, count: int) -> tuple:
+    args: list[t.Any] = []
+    for _ in range(count):
+        tag: bytes = _read(stream, 1)
+        if tag == ARG_STR:
+            (length,) = LENGTH.unpack(_read(stream, LENGTH.size))
+            args.append(_read(stream, length).decode("utf-8", "surrogateescape"))
+        elif tag == ARG_INT:
+            args.append(INT_ARG.unpack(tag + _read(stream, INT_ARG.size - 1))[1])
+        elif tag == ARG_FLOAT:
+            args.append(FLOAT_ARG.unpack(tag + _read(stream, FLOAT_ARG.size - 1))[1])
+        elif tag == ARG_NONE:
+            args.append(None)
+        elif tag == ARG_TRUE:
+            args.append(True)
+        elif tag == ARG_FALSE:
+            args.append(False)
+        else:
+            raise ValueError(f"Unknown arg type {tag!r} in binary log.")
+
+    return tuple(args)
+
+
+def iter_records(stream: t.BinaryIO) -> t.Iterator[logging.LogRecord]:
+    """Yield the records in a binary log, in the order they were written.
+
+    Params:
+        stream (BinaryIO): The binary log, opened in binary mode.
+
+    Returns:
+        (Iterator[logging.LogRecord]): The decoded records.
+
+    Raises:
+        ValueError: If the stream is not a binary log, ends in the middle of a frame, or refers to a
+            dictionary entry it never defined.
+
+    """
+    strings: dict[int, str | None] = {NONE_ID: None}
+    sites: dict[int, dict[str, t.Any]] = {}
+    contexts: dict[int, dict[str, t.Any]] = {}
+    start_time: float = 0.0
+    seq: int = 0
+    started: bool = False
+
+    while True:
+        frame: bytes = stream.read(1)
+        if not frame:
+            return
+
+        try:
+            if frame == FRAME_RECORD:
+                if not started:
+                    raise ValueError("Binary log record before the session header.")
+
+                _, created, site_id, context_id, msecs, flags, nargs = RECORD.unpack(
+                    frame + _read(stream, RECORD.size - 1)
+                )
+                args: tuple = _read_args(stream, nargs) if nargs else ()
+                seq += 1
+
+                attributes: dict[str, t.Any] = dict(sites[site_id])
+                attributes.update(contexts[context_id])
+                attributes["args"] = args
+                attributes["created"] = created
+                attributes["msecs"] = msecs + 0.0
+                attributes["relativeCreated"] = (created - start_time) * 1000
+                attributes["seq"] = seq
+                attributes["created_ns"] = int(created * 1_000_000_000)
+                if flags & RECORD_MESSAGE:
+                    attributes["msg"] = _read_text(stream)
+                    attributes["args"] = ()
+                if flags & RECORD_EXC_TEXT:
+                    attributes["exc_text"] = _read_text(stream)
+                if flags & RECORD_STACK_INFO:
+                    attributes["stack_info"] = _read_text(stream)
+
+                yield logging.makeLogRecord(attributes)
+
+            elif frame == FRAME_STRING:
+                _, string_id, length = STRING.unpack(frame + _read(stream, STRING.size - 1))
+                strings[string_id] = _read(stream, length).decode("utf-8", "surrogateescape")
+
+            elif frame == FRAME_SITE:
+                _, site_id, levelno, levelname, name, msg, pathname, func_name, lineno = SITE.unpack(
+                    frame + _read(stream, SITE.size - 1)
+                )
+                site: dict[str, t.Any] = {
+                    "levelno": levelno,
+                    "levelname": strings[levelname],
+                    "name": strings[name],
+                    "msg": strings[msg],
+                    "pathname": strings[pathname],
+                    "funcName": strings[func_name],
+                    "lineno": lineno,
+                }
+                ## Derived from pathname, the way LogRecord does it
+                try:
+                    site["filename"] = os.path.basename(site["pathname"])
+                    site["module"] = os.path.splitext(site["filename"])[0]
+                except (TypeError, ValueError, AttributeError):
+                    site["filename"] = site["pathname"]
+                    site["module"] = "Unknown module"
+                sites[site_id] = site
+
+            elif frame == FRAME_CONTEXT:
+                _, context_id, flags, thread, thread_name, process, process_name = CONTEXT.unpack(
+                    frame + _read(stream, CONTEXT.size - 1)
+                )
+                contexts[context_id] = {
+                    "thread": None if flags & CONTEXT_NO_THREAD else thread,
+                    "threadName": strings[thread_name],
+                    "process": None if flags & CONTEXT_NO_PROCESS else process,
+                    "processName": strings[process_name],
+                }
+
+            elif frame == FRAME_SESSION:
+                _, magic, version, start_time = SESSION.unpack(frame + _read(stream, SESSION.size - 1))
+                if magic != MAGIC or version != VERSION:
+                    raise ValueError(f"Not a version {VERSION} binary log (header {magic!r} v{version}).")
+                strings = {NONE_ID: None}
+                sites.clear()
+                contexts.clear()
+                started = True
+
+            else:
+                raise ValueError(f"Unknown frame type {frame!r} in binary log.")
+
+        except KeyError as e:
+            raise ValueError(
+                f"Binary log refers to dictionary id {e.args[0]}, which it never defined."
+            ) from None
+
+def decode_records(
+    paths: t.Sequence[t.Union[str, Path]], formatter: logging.Formatter | None = None
+) -> t.Iterator[str]:
+    """Yield each record in 1 or more binary logs as text, ending with a newline.
+
+    Params:
+        paths (Sequence[str | Path]): The binary logs to read, in order.
+        formatter (logging.Formatter | None): The formatter for each record. Defaults to
+            `MESSAGE_FMT_STANDARD` with `DATE_FMT_STANDARD`.
+
+    Returns:
+        (Iterator[str]): The formatted records. A record whose message template does not match its
+            args is written as the template followed by the args.
+
+    """
+    if formatter is None:
+        formatter = CompiledFormatter(MESSAGE_FMT_STANDARD, DATE_FMT_STANDARD)
+
+    for path in paths:
+        with open(path, "rb") as stream:
+            for record in iter_records(stream):
+                try:
+                    text: str = formatter.format(record)
+                except TypeError:
+                    ## The template does not match its args. Logging it as text would have failed in
+                    #  Handler.handleError(), so write both instead
+                    record.msg, record.args = f"{record.msg} {record.args!r}", ()
+                    text = formatter.format(record)
+
+                yield text + "\n"
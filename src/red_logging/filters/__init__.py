@@ -6,8 +6,23 @@ do need to import the filter function into whatever script runs the `logging.con
 
 from __future__ import annotations
 
-from . import loglevel_filters
-from ._filters import FilterConfig
+from . import (
+    compiled_filters,
+    expression_filters,
+    loglevel_filters,
+    ratelimit_filters,
+    sampling_filters,
+)
+from ._filters import (
+    FILTER_CLASSES_TYPE,
+    CompiledFilterConfig,
+    FilterConfig,
+    KeyedSamplingFilterConfig,
+    RateLimitFilterConfig,
+    RateSamplingFilterConfig,
+)
+from .compiled_filters import CompiledFilter, compile_filters, compile_handler_filters
+from .expression_filters import ExpressionFilter, compile_expression
 from .loglevel_filters import (
     critical_filter,
     debug_filter,
@@ -15,3 +30,5 @@ from .loglevel_filters import (
     info_filter,
     warning_filter,
 )
+from .ratelimit_filters import RateLimitFilter
+from .sampling_filters import KeyedSamplingFilter, RateSamplingFilter
@@ -2,24 +2,214 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+import typing as t
 
 from red_logging.config_classes.base import BaseLoggingConfig
 
+from .compiled_filters import CompiledFilter
+from .expression_filters import ExpressionFilter, compile_expression
+from .ratelimit_filters import RateLimitFilter
+from .sampling_filters import KeyedSamplingFilter, RateSamplingFilter
+
 @dataclass
 class FilterConfig(BaseLoggingConfig):
-    """Define a logging filter.
+    """Define a logging filter, from a function or an expression.
+
+    An expression, i.e. `levelno >= WARNING and not msg.startswith("heartbeat")`, is checked when the
+    class is created, and compiled into a predicate by a `red_logging.filters.ExpressionFilter`. Unlike
+    a function, it can be saved in a JSON config with `save_configdict()`.
 
     Params:
         name (str): A name for the filter, which can be added to a dictConfig's `filters` param.
         func (callable): The filter function to use when this class is called by a handler.
+        expression (str): A filter expression to use instead of `func`.
     """
 
     name: str
-    func: callable
+    func: callable = None
+    expression: str | None = None
+
+    def __post_init__(self) -> None:
+        if (self.func is None) == (self.expression is None):
+            raise ValueError(f"FilterConfig '{self.name}' needs either a func or an expression.")
+        if self.expression is not None:
+            ## Raise a ValueError for an invalid expression now, instead of in dictConfig()
+            compile_expression(self.expression)
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the filter described by this class."""
+        if self.expression is not None:
+            return {
+                self.name: {
+                    "()": "red_logging.filters.ExpressionFilter",
+                    "expression": self.expression,
+                }
+            }
+
+        return {self.name: {"()": self.get_filter}}
 
     def get_filter(self) -> logging.Filter:
+        if self.expression is not None:
+            return ExpressionFilter(self.expression)
+
         filter_obj = logging.Filter(name=self.name)
         filter_obj.filter = self.func
         return filter_obj
+
+
+@dataclass
+class RateSamplingFilterConfig(BaseLoggingConfig):
+    """Define a RateSamplingFilter, which keeps a random sample of records with a fixed rate for each level.
+
+    Params:
+        name (str): A name for the filter, which can be added to a handler's `filters` param.
+        rate (float): The fraction of records to keep (`0.0`-`1.0`) for levels not in `rates`.
+        rates (dict[str, float]): Rates for specific levels, i.e. `{"DEBUG": 0.01, "INFO": 0.1}`.
+    """
+
+    name: str
+    rate: float = 1.0
+    rates: dict[str, float] = field(default_factory=lambda: {})
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the filter described by this class."""
+        return {
+            self.name: {
+                "()": "red_logging.filters.RateSamplingFilter",
+                "rate": self.rate,
+                "rates": self.rates,
+            }
+        }
+
+    def get_filter(self) -> RateSamplingFilter:
+        return RateSamplingFilter(rate=self.rate, rates=self.rates)
+
+
+@dataclass
+class KeyedSamplingFilterConfig(BaseLoggingConfig):
+    """Define a KeyedSamplingFilter, which keeps or drops records by the hash of an attribute, like a request ID.
+
+    Params:
+        name (str): A name for the filter, which can be added to a handler's `filters` param.
+        rate (float): The fraction of values to keep (`0.0`-`1.0`).
+        key (str): The record attribute to hash, i.e. an `extra={"request_id": ...}` value.
+        keep_missing (bool): Keep records that do not have the `key` attribute.
+        keep_level (str | None): Always keep records at this level or above. `None` samples every level.
+        salt (str): Added to each value before hashing. Change it to sample a different set of values.
+    """
+
+    name: str
+    rate: float = 1.0
+    key: str = "request_id"
+    keep_missing: bool = True
+    keep_level: str | None = "WARNING"
+    salt: str = ""
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the filter described by this class."""
+        return {
+            self.name: {
+                "()": "red_logging.filters.KeyedSamplingFilter",
+                "rate": self.rate,
+                "key": self.key,
+                "keep_missing": self.keep_missing,
+                "keep_level": self.keep_level,
+                "salt": self.salt,
+            }
+        }
+
+    def get_filter(self) -> KeyedSamplingFilter:
+        return KeyedSamplingFilter(
+            rate=self.rate,
+            key=self.key,
+            keep_missing=self.keep_missing,
+            keep_level=self.keep_level,
+            salt=self.salt,
+        )
+
+
+@dataclass
+class RateLimitFilterConfig(BaseLoggingConfig):
+    """Define a RateLimitFilter, which drops records from a call site that logs faster than `rate` per second.
+
+    Params:
+        name (str): A name for the filter, which can be added to a handler's `filters` param.
+        rate (float): Records per second each call site (`pathname`, `lineno`) can log, after a `burst`.
+        burst (int): How many records a call site can log at once.
+        max_keys (int): The most call sites to track. The least recently used is evicted when full.
+        keep_level (str | None): Never limit records at this level or above. `None` limits every level.
+    """
+
+    name: str
+    rate: float = 1.0
+    burst: int = 10
+    max_keys: int = 1024
+    keep_level: str | None = None
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the filter described by this class."""
+        return {
+            self.name: {
+                "()": "red_logging.filters.RateLimitFilter",
+                "rate": self.rate,
+                "burst": self.burst,
+                "max_keys": self.max_keys,
+                "keep_level": self.keep_level,
+            }
+        }
+
+    def get_filter(self) -> RateLimitFilter:
+        return RateLimitFilter(
+            rate=self.rate,
+            burst=self.burst,
+            max_keys=self.max_keys,
+            keep_level=self.keep_level,
+        )
+
+
+@dataclass
+class CompiledFilterConfig(BaseLoggingConfig):
+    """Define a CompiledFilter, which runs a list of filters & checks as 1 generated function.
+
+    Add it as a handler's only filter, instead of a chain of filters.
+
+    Params:
+        name (str): A name for the filter, which can be added to a handler's `filters` param.
+        filters (list[str | callable]): Filters to fuse, in order. Strings are import paths, i.e.
+            `red_logging.filters.info_filter`.
+        level (str | None): The minimum level a record must have.
+        names (list[str] | None): Logger names. A record must come from 1 of them, or a child logger.
+    """
+
+    name: str
+    filters: list = field(default_factory=lambda: [])
+    level: str | None = None
+    names: list[str] | None = None
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the filter described by this class."""
+        filter_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "()": "red_logging.filters.CompiledFilter",
+                "filters": self.filters,
+            }
+        }
+        if self.level is not None:
+            filter_dict[self.name]["level"] = self.level
+        if self.names is not None:
+            filter_dict[self.name]["names"] = self.names
+        return filter_dict
+
+    def get_filter(self) -> CompiledFilter:
+        return CompiledFilter(filters=self.filters, level=self.level, names=self.names)
+
+
+FILTER_CLASSES_TYPE = t.Union[
+    FilterConfig,
+    RateSamplingFilterConfig,
+    KeyedSamplingFilterConfig,
+    RateLimitFilterConfig,
+    CompiledFilterConfig,
+]
@@ -0,0 +1,5 @@
+"""Fuse a handler's filters into 1 generated predicate."""
+
+from __future__ import annotations
+
+from ._compiled_filters import CompiledFilter, compile_filters, compile_handler_filters
@@ -0,0 +1,173 @@
+"""Fuse a handler's filters into 1 generated predicate, so each record costs 1 filter call.
+
+`logging.Filterer.filter()` loops over a handler's filters, calling each one (and `hasattr()` on each)
+for every record. `CompiledFilter` takes the same list, plus optional level & logger name conditions,
+and generates a single function from it:
+
+- The `*_filter` functions in `red_logging.filters.loglevel_filters`, and the `level` param, are folded
+  into 1 `record.levelno` comparison.
+- Plain `logging.Filter(name)` objects, and the `names` param, become inline logger name checks.
+- Any other filter (a function, or an object with a `.filter()` method) is called from the generated
+  function, in the order given.
+
+The cheap checks run first, so most rejected records never reach a Python-level filter call. Other
+filters keep their order, because they can have side effects (i.e. a `RateLimitFilter` counts records).
+
+Like a `Filterer` on Python < 3.12, only the truth of each filter's result is used; a `LogRecord`
+returned by a filter does not replace the record.
+"""
+
+from __future__ import annotations
+
+import logging
+import pkgutil
+import typing as t
+
+from red_logging.filters.loglevel_filters import (
+    critical_filter,
+    debug_filter,
+    error_filter,
+    info_filter,
+    warning_filter,
+)
+
+## Filters that are nothing more than a level threshold
+_LEVEL_FILTERS: dict[t.Callable, int] = {
+    debug_filter: logging.DEBUG,
+    info_filter: logging.INFO,
+    warning_filter: logging.WARNING,
+    error_filter: logging.ERROR,
+    critical_filter: logging.CRITICAL,
+}
+
+FILTER_TYPE = t.Union[str, t.Callable[[logging.LogRecord], t.Any], logging.Filter]
+
+
+def _resolve(_filter: FILTER_TYPE) -> tuple[str, t.Any]:
+    """Return the kind of check a filter compiles to (`level`, `name` or `call`), and its value."""
+    if isinstance(_filter, str):
+        ## An import path, i.e. `red_logging.filters.info_filter`
+        _filter = pkgutil.resolve_name(_filter)
+
+    func: t.Any = _filter
+    if isinstance(_filter, logging.Filter):
+        if "filter" in _filter.__dict__:
+            ## i.e. from FilterConfig.get_filter(), which replaces `.filter` with a function
+            func = _filter.__dict__["filter"]
+        elif type(_filter).filter is logging.Filter.filter:
+            return "name", _filter.name
+        else:
+            func = _filter.filter
+    elif not callable(func) and hasattr(func, "filter"):
+        func = func.filter
+
+    try:
+        if func in _LEVEL_FILTERS:
+            return "level", _LEVEL_FILTERS[func]
+    except TypeError:
+        ## An unhashable callable, which can only be called
+        pass
+
+    if not callable(func):
+        raise TypeError(f"Cannot compile {_filter!r}, it is not callable and has no .filter() method.")
+
+    return "call", func
+
+
+def compile_filters(
+    filters: t.Iterable[FILTER_TYPE] = (),
+    level: t.Union[int, str, None] = None,
+    names: t.Iterable[str] | None = None,
+) -> tuple[t.Callable[[logging.LogRecord], bool], str]:
+    """Generate 1 predicate that returns `True` only if a record passes every check.
+
+    Params:
+        filters (Iterable[str | Callable | logging.Filter]): Filters, as they would be added to a handler.
+            Strings are import paths, i.e. `red_logging.filters.info_filter`.
+        level (int | str | None): The minimum level a record must have.
+        names (Iterable[str] | None): Logger names. A record must come from 1 of them, or a child logger.
+
+    Returns:
+        (tuple[Callable[[logging.LogRecord], bool], str]): The predicate, and its generated source code.
+
+    """
+    thresholds: list[int] = [logging._checkLevel(level)] if level is not None else []
+    required_names: list[str] = []
+    calls: list[t.Callable] = []
+
+    for _filter in filters:
+        kind, value = _resolve(_filter)
+        if kind == "level":
+            thresholds.append(value)
+        elif kind == "name":
+            if value:
+                required_names.append(value)
+        else:
+            calls.append(value)
+
+    namespace: dict[str, t.Any] = {}
+    body: list[str] = []
+
+    ## Cheapest checks first: 1 int comparison, then string checks, then calls
+    if thresholds:
+        body.append(f"    if record.levelno < {max(thresholds)}: return False")
+    if required_names or names is not None:
+        body.append("    name = record.name")
+    for i, required in enumerate(required_names):
+        namespace[f"_name{i}"], namespace[f"_prefix{i}"] = required, f"{required}."
+        body.append(f"    if name != _name{i} and not name.startswith(_prefix{i}): return False")
+    if names is not None:
+        names = list(names)
+        namespace["_any_names"] = frozenset(names)
+        namespace["_any_prefixes"] = tuple(f"{name}." for name in names)
+        body.append(
+            "    if name not in _any_names and not name.startswith(_any_prefixes): return False"
+        )
+    for i, call in enumerate(calls):
+        namespace[f"_call{i}"] = call
+        body.append(f"    if not _call{i}(record): return False")
+    body.append("    return True")
+
+    source: str = "\n".join(["def compiled_filter(record):", *body])
+    exec(compile(source, "<red_logging.filters.CompiledFilter>", "exec"), namespace)
+
+    return namespace["compiled_filter"], source
+
+
+class CompiledFilter(logging.Filter):
+    """A filter that runs a list of filters, level & logger name checks as 1 generated function.
+
+    Params:
+        filters (list[str | Callable | logging.Filter] | None): Filters, as they would be added to a handler.
+            Strings are import paths, i.e. `red_logging.filters.info_filter`.
+        level (int | str | None): The minimum level a record must have.
+        names (list[str] | None): Logger names. A record must come from 1 of them, or a child logger.
+    """
+
+    def __init__(
+        self,
+        filters: list[FILTER_TYPE] | None = None,
+        level: t.Union[int, str, None] = None,
+        names: list[str] | None = None,
+    ) -> None:
+        super().__init__()
+
+        predicate, self.source = compile_filters(filters or (), level=level, names=names)
+        ## An instance attribute, so Filterer.filter() calls the generated function directly
+        self.filter: t.Callable[[logging.LogRecord], bool] = predicate
+
+
+def compile_handler_filters(filterer: logging.Filterer) -> CompiledFilter:
+    """Replace a handler's (or logger's) filters with 1 `CompiledFilter` that runs them all.
+
+    Params:
+        filterer (logging.Filterer): The handler or logger, after its filters have been added.
+
+    Returns:
+        (CompiledFilter): The filter that replaced the handler's filters.
+
+    """
+    compiled: CompiledFilter = CompiledFilter(list(filterer.filters))
+    filterer.filters = [compiled]
+
+    return compiled
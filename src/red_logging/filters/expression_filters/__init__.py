@@ -0,0 +1,5 @@
+"""Filters declared as expressions, compiled once into a predicate."""
+
+from __future__ import annotations
+
+from ._expression_filters import ExpressionFilter, compile_expression
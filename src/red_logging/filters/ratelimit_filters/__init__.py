@@ -0,0 +1,5 @@
+"""Filter classes that limit how often a call site can log."""
+
+from __future__ import annotations
+
+from ._ratelimit_filters import RateLimitFilter
@@ -0,0 +1,160 @@
+"""A filter that rate limits log records from each call site, so a hot loop cannot flood a handler.
+
+Each call site (`pathname`, `lineno`) gets a token bucket, which holds up to `burst` tokens and refills
+at `rate` tokens per second. A record that finds a token in its bucket is kept; otherwise it is dropped
+and counted. When the bucket refills and its call site logs again, a summary record ("Suppressed N
+messages from app.py:42") is logged to the `red_logging.ratelimit` logger, and the record that got
+through carries the count in `record.suppressed`. The record's `msg` is not changed, so filters &
+handlers that group records by their message template still see the same template. When a record
+passes more than 1 `RateLimitFilter`, the counts are added.
+
+Buckets live in an LRU table of at most `max_keys` call sites, so memory stays bounded. When a bucket
+with dropped records is evicted, or its call site never logs again, the count is not lost: its summary
+is logged on eviction, when `report_suppressed()` is called, or at exit. A bucket's timestamp is the
+`created` time of the last record that used it, so no extra clock call is made, and each record costs
+1 dict lookup & a few float operations.
+"""
+
+from __future__ import annotations
+
+import atexit
+import collections
+import logging
+import typing as t
+import weakref
+
+log = logging.getLogger("red_logging.ratelimit")
+
+_RATE_LIMIT_FILTERS: weakref.WeakSet = weakref.WeakSet()
+
+class _Bucket:
+    __slots__ = ("tokens", "updated", "suppressed")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens: float = tokens
+        self.updated: float = updated
+        self.suppressed: int = 0
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop records from a call site once it logs faster than `rate` records per second, after a `burst`.
+
+    When a record is kept after others from its call site were dropped, a summary record with the number
+    dropped is logged to the `red_logging.ratelimit` logger (which this filter never limits), and
+    `record.suppressed` is set to the number (added to any count an earlier `RateLimitFilter` set).
+    Counts no kept record reports are logged as summaries on eviction, by `report_suppressed()` or at exit.
+
+    Params:
+        rate (float): Tokens added to each call site's bucket per second.
+        burst (int): The most tokens a bucket can hold, i.e. how many records a call site can log at once.
+        max_keys (int): The most call sites to track. The least recently used is evicted when full.
+        keep_level (str | int | None): Never limit records at this level or above. `None` limits every level.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 10,
+        max_keys: int = 1024,
+        keep_level: t.Union[str, int, None] = None,
+    ) -> None:
+        super().__init__()
+
+        if rate <= 0 or burst < 1 or max_keys < 1:
+            raise ValueError("rate must be > 0, and burst & max_keys must be at least 1.")
+
+        self.rate: float = rate
+        self.burst: float = float(burst)
+        self.max_keys: int = max_keys
+        self.keep_level: int = (
+            logging._checkLevel(keep_level) if keep_level is not None else logging.CRITICAL + 1
+        )
+        self.suppressed: int = 0
+        self.evicted: int = 0
+        self._buckets: collections.OrderedDict[tuple[str, int], _Bucket] = (
+            collections.OrderedDict()
+        )
+        _RATE_LIMIT_FILTERS.add(self)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return `True` if the record's call site has a token to spend."""
+        if record.levelno >= self.keep_level or record.name == log.name:
+            return True
+
+        key: tuple[str, int] = (record.pathname, record.lineno)
+        now: float = record.created
+        buckets: collections.OrderedDict[tuple[str, int], _Bucket] = self._buckets
+
+        ## No lock: each OrderedDict call is atomic, and a race between threads can only make a count
+        #  slightly off. A lock would cost more than the rest of the filter.
+        bucket: _Bucket | None = buckets.get(key)
+        if bucket is None:
+            if len(buckets) >= self.max_keys:
+                try:
+                    evicted_key, evicted = buckets.popitem(last=False)
+                    self.evicted += 1
+                    if evicted.suppressed:
+                        _report(evicted_key, evicted.suppressed)
+                except KeyError:
+                    pass
+            bucket = buckets[key] = _Bucket(self.burst, now)
+        else:
+            try:
+                buckets.move_to_end(key)
+            except KeyError:
+                ## Evicted by another thread since the lookup
+                buckets[key] = bucket
+
+            elapsed: float = now - bucket.updated
+            if elapsed > 0:
+                tokens: float = bucket.tokens + elapsed * self.rate
+                bucket.tokens = tokens if tokens < self.burst else self.burst
+                bucket.updated = now
+
+        if bucket.tokens < 1.0:
+            bucket.suppressed += 1
+            self.suppressed += 1
+
+            return False
+
+        bucket.tokens -= 1.0
+        if bucket.suppressed:
+            suppressed: int = bucket.suppressed
+            bucket.suppressed = 0
+            ## An earlier RateLimitFilter only counts the records it dropped, which never got here
+            record.suppressed = record.__dict__.get("suppressed", 0) + suppressed
+            _report(key, suppressed)
+
+        return True
+
+    def report_suppressed(self) -> int:
+        """Log a summary record for each call site with dropped records no kept record has reported yet.
+
+        Returns:
+            (int): The number of dropped records reported.
+
+        """
+        reported: int = 0
+        for key, bucket in list(self._buckets.items()):
+            suppressed: int = bucket.suppressed
+            if suppressed:
+                bucket.suppressed = 0
+                _report(key, suppressed)
+                reported += suppressed
+
+        return reported
+
+    def __len__(self) -> int:
+        """Return the number of call sites being tracked."""
+        return len(self._buckets)
+
+
+def _report(key: tuple[str, int], suppressed: int) -> None:
+    log.warning("Suppressed %d messages from %s:%d", suppressed, *key, extra={"suppressed": suppressed})
+
+
+## Registered after logging's own atexit hook, so it runs first, while handlers are still open
+@atexit.register
+def _report_all_suppressed() -> None:
+    for _filter in list(_RATE_LIMIT_FILTERS):
+        _filter.report_suppressed()
@@ -0,0 +1,5 @@
+"""Filter classes that keep a sample of log records."""
+
+from __future__ import annotations
+
+from ._sampling_filters import KeyedSamplingFilter, RateSamplingFilter
@@ -0,0 +1,115 @@
+"""Filters that keep a sample of log records, to cut the volume of high-traffic logs.
+
+`RateSamplingFilter` keeps each record at random, with a fixed rate for each level. `KeyedSamplingFilter`
+decides from a hash of a record attribute, like a request ID. Every record with the same value is either
+kept or dropped, in every process, so a sampled request's logs are complete.
+
+Both are `logging.Filter` classes. Reference them in a dictConfig's `filters` section with the `()` key, i.e.
+`{"sample_requests": {"()": "red_logging.filters.KeyedSamplingFilter", "rate": 0.1, "key": "request_id"}}`,
+or use `red_logging.filters.RateSamplingFilterConfig` & `red_logging.filters.KeyedSamplingFilterConfig`.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import typing as t
+import zlib
+
+## crc32 returns an unsigned 32 bit int, so a rate maps to a threshold in [0, 2**32]
+_HASH_RANGE: int = 1 << 32
+
+
+def _check_rate(rate: float) -> float:
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"Sampling rate must be between 0.0 and 1.0, not {rate}.")
+
+    return rate
+
+
+class RateSamplingFilter(logging.Filter):
+    """Keep a random sample of records, with a fixed rate for each level.
+
+    Params:
+        rate (float): The fraction of records to keep (`0.0`-`1.0`) for levels not in `rates`.
+        rates (dict[str | int, float] | None): Rates for specific levels, i.e. `{"DEBUG": 0.01, "INFO": 0.1}`.
+    """
+
+    def __init__(
+        self, rate: float = 1.0, rates: dict[t.Union[str, int], float] | None = None
+    ) -> None:
+        super().__init__()
+
+        self.rate: float = _check_rate(rate)
+        self.rates: dict[int, float] = {
+            logging._checkLevel(level): _check_rate(level_rate)
+            for level, level_rate in (rates or {}).items()
+        }
+        self._random: t.Callable[[], float] = random.random
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return `True` if the record is sampled."""
+        rate: float = self.rates.get(record.levelno, self.rate)
+
+        return rate >= 1.0 or self._random() < rate
+
+
+class KeyedSamplingFilter(logging.Filter):
+    """Keep or drop records by the crc32 hash of an attribute, so related records are sampled together.
+
+    crc32 does not depend on `PYTHONHASHSEED`, so the same value is sampled the same way in every process.
+
+    Params:
+        rate (float): The fraction of values to keep (`0.0`-`1.0`).
+        key (str): The record attribute to hash, i.e. an `extra={"request_id": ...}` value.
+        keep_missing (bool): Keep records that do not have the `key` attribute.
+        keep_level (str | int | None): Always keep records at this level or above, so errors are not
+            sampled out. `None` samples every level.
+        salt (str): Added to each value before hashing. Change it to sample a different set of values.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        key: str = "request_id",
+        keep_missing: bool = True,
+        keep_level: t.Union[str, int, None] = logging.WARNING,
+        salt: str = "",
+    ) -> None:
+        super().__init__()
+
+        self.rate: float = _check_rate(rate)
+        self.key: str = key
+        self.keep_missing: bool = keep_missing
+        self.keep_level: int = (
+            logging._checkLevel(keep_level) if keep_level is not None else logging.CRITICAL + 1
+        )
+        self.salt: str = salt
+        self._threshold: int = int(rate * _HASH_RANGE)
+        ## crc32(value, crc32(salt)) is the crc32 of salt + value, without joining them per record
+        self._seed: int = zlib.crc32(salt.encode())
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return `True` if the record's `key` value is sampled."""
+        if record.levelno >= self.keep_level:
+            return True
+
+        value: t.Any = record.__dict__.get(self.key)
+        if value is None:
+            return self.keep_missing
+        if value.__class__ is str:
+            ## The common case, hashed inline to save a method call per record
+            return zlib.crc32(value.encode(), self._seed) < self._threshold
+
+        return self.sampled(value)
+
+    def sampled(self, value: t.Any) -> bool:
+        """Return `True` if records with this `key` value are kept."""
+        if isinstance(value, str):
+            data: bytes = value.encode()
+        elif isinstance(value, bytes):
+            data = value
+        else:
+            data = str(value).encode()
+
+        return zlib.crc32(data, self._seed) < self._threshold
@@ -8,6 +8,7 @@ from ._formats import (
     DATE_FMT_TIME_ONLY,
     MESSAGE_FMT_BASIC,
     MESSAGE_FMT_DETAILED,
+    MESSAGE_FMT_SHARDED,
     MESSAGE_FMT_STANDARD,
     red_logging_DETAIL_FMT,
     red_logging_FMT,
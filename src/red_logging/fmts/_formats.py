@@ -15,6 +15,9 @@ MESSAGE_FMT_STANDARD: str = str(
 MESSAGE_FMT_DETAILED: str = str(
     "[%(asctime)s] [%(levelname)s] [logger:%(name)s] [module:%(module)s] [path:%(pathname)s:%(lineno)d] [method:%(funcName)s()]: %(message)s"
 )
+MESSAGE_FMT_SHARDED: str = str(
+    "%(created_ns)d %(seq)d [%(asctime)s] [%(levelname)s] [logger:%(name)s] [%(module)s:%(lineno)d > %(funcName)s()]: %(message)s"
+)
 MESSAGE_FMT_BASIC: str = "%(asctime)-19s %(levelname)-8s : %(message)s"
 DATE_FMT_STANDARD: str = "%Y-%m-%d %H:%M:%S"
 DATE_FMT_DATE_ONLY: str = "%Y-%m-%d"
@@ -0,0 +1,21 @@
+"""Logging formatters, which can be used as a formatter's `class` in a logging dictConfig.
+
+`CompiledFormatter` is a drop-in `logging.Formatter` that compiles its format string into a function,
+once, instead of interpolating it for every record. `CachedTimeFormatter` renders `asctime` once per
+second instead of once per record, and `CompiledFormatter` does the same.
+
+`JSONFormatter` & `LogfmtFormatter` write structured records, 1 per line, for log pipelines.
+`BinaryFormatter` encodes records for a `red_logging.handlers.BinaryFileHandler`.
+
+`CachedTimeFormatter`, `CompiledFormatter`, `JSONFormatter` & `LogfmtFormatter` take `share_output=True`,
+which lets the handlers that use the same formatter format a record once between them. `share_output()`
+does the same for any `logging.Formatter`.
+"""
+
+from __future__ import annotations
+
+from ._binary import BinaryFormatter, TemplateDictionary
+from ._cached_time import CachedTimeFormatter
+from ._compiled import CompiledFormatter, compile_format
+from ._shared import FORMAT_CACHE_ATTRIBUTE, format_bytes, share_output
+from ._structured import JSONFormatter, LogfmtFormatter
@@ -0,0 +1,302 @@
+"""A compact binary encoding for log records, written by `BinaryFileHandler` & read by `red_logging.decode`.
+
+A binary log is a stream of `struct`-packed frames. Each frame starts with a 1 byte type:
+
+- `M` (session): Starts a file, or a new dictionary. The decoder forgets every dictionary entry before it.
+- `D` (string): A string, with an id. Message templates, logger names, paths & function names are
+  written once, then referenced by id.
+- `S` (call site): The values that are the same for every record from 1 logging call: level, logger
+  name, message template, path, function & line number, as string ids.
+- `C` (context): The thread & process a record came from.
+- `R` (record): The creation time, call site id, context id, and the message's `args`, each packed by
+  type (`int`, `float`, `str`, `bool`, `None`). Exception & stack text follow when the record has them.
+
+A dictionary entry is always written before the first record that uses it, so a file can be decoded as a
+stream. When a record's message cannot be rebuilt from its template and args (a non-`str` message, a
+mapping, or an arg that is not 1 of the packed types), the formatted message is stored with the record.
+Once the dictionary holds `max_entries` entries, a new session is started, so a program that logs an
+unbounded number of distinct messages (i.e. f-strings) cannot grow it without limit.
+
+A dictionary adds entries as a record is encoded, before its frames are written. If encoding fails, or
+the frames never reach the file, the dictionary is invalidated, and the next record starts a new
+session, so no record refers to an entry that was never written.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+import typing as t
+
+MAGIC: bytes = b"RLOG"
+VERSION: int = 1
+
+FRAME_SESSION: bytes = b"M"
+FRAME_STRING: bytes = b"D"
+FRAME_SITE: bytes = b"S"
+FRAME_CONTEXT: bytes = b"C"
+FRAME_RECORD: bytes = b"R"
+
+## type, magic, version, the writing process's logging start time (for relativeCreated)
+SESSION: struct.Struct = struct.Struct("<c4sBd")
+## type, id, length of the UTF-8 bytes that follow
+STRING: struct.Struct = struct.Struct("<cII")
+## type, id, levelno, levelname, name, msg, pathname, funcName, lineno
+SITE: struct.Struct = struct.Struct("<cIHIIIIII")
+## type, id, flags, thread, threadName, process, processName
+CONTEXT: struct.Struct = struct.Struct("<cIBQIII")
+## type, created, site, context, msecs, flags, number of args
+RECORD: struct.Struct = struct.Struct("<cdIIHBB")
+## Length of a str arg, or of text stored with a record
+LENGTH: struct.Struct = struct.Struct("<I")
+INT_ARG: struct.Struct = struct.Struct("<cq")
+FLOAT_ARG: struct.Struct = struct.Struct("<cd")
+STR_ARG: struct.Struct = struct.Struct("<cI")
+
+ARG_INT: bytes = b"i"
+ARG_FLOAT: bytes = b"f"
+ARG_STR: bytes = b"s"
+ARG_NONE: bytes = b"n"
+ARG_TRUE: bytes = b"T"
+ARG_FALSE: bytes = b"F"
+
+## The string id written for None, i.e. a record without a funcName
+NONE_ID: int = 0xFFFFFFFF
+
+## Record flags: which text follows the args
+RECORD_MESSAGE: int = 1
+RECORD_EXC_TEXT: int = 2
+RECORD_STACK_INFO: int = 4
+## Context flags: which ids are None
+CONTEXT_NO_THREAD: int = 1
+CONTEXT_NO_PROCESS: int = 2
+
+_INT_MIN: int = -(1 << 63)
+_INT_MAX: int = (1 << 63) - 1
+
+
+def _start_time() -> float:
+    ## A float in seconds before Python 3.13, nanoseconds after
+    start: float | int = logging._startTime
+
+    return start / 1e9 if isinstance(start, int) else start
+
+
+class TemplateDictionary:
+    """The strings, call sites & contexts already written to a binary log, by id.
+
+    Each file needs its own dictionary. `BinaryFileHandler` creates one, and calls `start()` whenever it
+    opens its file.
+
+    Params:
+        max_entries (int): Start a new session when the dictionary holds this many entries.
+    """
+
+    def __init__(self, max_entries: int = 65536) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, not {max_entries}.")
+
+        self.max_entries: int = max_entries
+        self.sessions: int = 0
+        ## Set when entries were added for frames that were never written
+        self.invalidated: bool = False
+        self.strings: dict[str, int] = {}
+        self.sites: dict[tuple, int] = {}
+        self.contexts: dict[tuple, int] = {}
+        self._next_id: int = 0
+
+    def __len__(self) -> int:
+        return self._next_id
+
+    def start(self) -> bytes:
+        """Clear the dictionary, and return the session frame that tells a decoder to do the same."""
+        self.strings.clear()
+        self.sites.clear()
+        self.contexts.clear()
+        self._next_id = 0
+        self.sessions += 1
+        self.invalidated = False
+
+        return SESSION.pack(FRAME_SESSION, MAGIC, VERSION, _start_time())
+
+    def invalidate(self) -> None:
+        """Start a new session with the next record, because frames that used the dictionary were lost."""
+        self.invalidated = True
+
+    def string(self, value: str | None, out: bytearray) -> int:
+        """Return the id of a string, adding its frame to `out` the first time it is seen."""
+        if value is None:
+            return NONE_ID
+
+        string_id: int | None = self.strings.get(value)
+        if string_id is None:
+            string_id = self.strings[value] = self._next_id
+            self._next_id += 1
+            data: bytes = str(value).encode("utf-8", "surrogateescape")
+            out += STRING.pack(FRAME_STRING, string_id, len(data))
+            out += data
+
+        return string_id
+
+    def site(self, key: tuple, out: bytearray) -> int:
+        """Add a call site's frame (and its strings' frames) to `out`, and return its id."""
+        levelno, levelname, name, template, pathname, func_name, lineno = key
+        ## Strings are added to `out` before the site frame that refers to them
+        string_ids: list[int] = [
+            self.string(value, out) for value in (levelname, name, template, pathname, func_name)
+        ]
+        site_id: int = self._next_id
+        self._next_id += 1
+        out += SITE.pack(FRAME_SITE, site_id, levelno, *string_ids, lineno)
+        self.sites[key] = site_id
+
+        return site_id
+
+    def context(self, key: tuple, out: bytearray) -> int:
+        """Add a thread & process context's frame to `out`, and return its id."""
+        thread, thread_name, process, process_name = key
+        thread_name_id: int = self.string(thread_name, out)
+        process_name_id: int = self.string(process_name, out)
+        context_id: int = self._next_id
+        self._next_id += 1
+        flags: int = (CONTEXT_NO_THREAD if thread is None else 0) | (
+            CONTEXT_NO_PROCESS if process is None else 0
+        )
+        out += CONTEXT.pack(
+            FRAME_CONTEXT,
+            context_id,
+            flags,
+            thread or 0,
+            thread_name_id,
+            process or 0,
+            process_name_id,
+        )
+        self.contexts[key] = context_id
+
+        return context_id
+
+
+def _pack_args(args: tuple, out: bytearray) -> bool:
+    """Add each arg to `out`, packed by type. Return `False` if an arg cannot be packed."""
+    for arg in args:
+        cls: type = arg.__class__
+        if cls is str:
+            data: bytes = arg.encode("utf-8", "surrogateescape")
+            out += STR_ARG.pack(ARG_STR, len(data))
+            out += data
+        elif cls is int:
+            if not _INT_MIN <= arg <= _INT_MAX:
+                return False
+            out += INT_ARG.pack(ARG_INT, arg)
+        elif cls is float:
+            out += FLOAT_ARG.pack(ARG_FLOAT, arg)
+        elif arg is None:
+            out += ARG_NONE
+        elif arg is True:
+            out += ARG_TRUE
+        elif arg is False:
+            out += ARG_FALSE
+        else:
+            ## Subclasses too (i.e. an IntEnum), whose str() differs from their base type's
+            return False
+
+    return True
+
+
+def _pack_text(text: str, out: bytearray) -> None:
+    data: bytes = text.encode("utf-8", "surrogateescape")
+    out += LENGTH.pack(len(data))
+    out += data
+
+
+class BinaryFormatter(logging.Formatter):
+    """Encode records as binary log frames, for a `BinaryFileHandler`.
+
+    `encode()` writes the binary form. `format()` is `logging.Formatter.format()`, so the formatter still
+    produces text if it is given to another handler. Exceptions are formatted with `formatException()`,
+    as text formatters do.
+    """
+
+    def encode(self, record: logging.LogRecord, dictionary: TemplateDictionary) -> bytes:
+        """Return the frames for a record, including any dictionary entries it adds.
+
+        Params:
+            record (logging.LogRecord): The record to encode.
+            dictionary (TemplateDictionary): The dictionary of the file the frames will be written to.
+
+        Returns:
+            (bytes): The frames to write.
+
+        Raises:
+            struct.error: If a value does not fit its frame, i.e. a custom `levelno` over 65535. The
+                dictionary is invalidated, since it may hold entries from the frames that were dropped.
+
+        """
+        try:
+            return self._encode(record, dictionary)
+        except Exception:
+            dictionary.invalidate()
+            raise
+
+    def _encode(self, record: logging.LogRecord, dictionary: TemplateDictionary) -> bytes:
+        out: bytearray = bytearray()
+        if dictionary.invalidated or len(dictionary) >= dictionary.max_entries:
+            out += dictionary.start()
+
+        msg: t.Any = record.msg
+        template: str | None = msg if msg.__class__ is str else None
+
+        site_key: tuple = (
+            record.levelno,
+            record.levelname,
+            record.name,
+            template,
+            record.pathname,
+            record.funcName,
+            record.lineno,
+        )
+        site_id: int | None = dictionary.sites.get(site_key)
+        if site_id is None:
+            site_id = dictionary.site(site_key, out)
+
+        context_key: tuple = (record.thread, record.threadName, record.process, record.processName)
+        context_id: int | None = dictionary.contexts.get(context_key)
+        if context_id is None:
+            context_id = dictionary.context(context_key, out)
+
+        args: t.Any = record.args
+        packed_args: bytearray = bytearray()
+        flags: int = 0
+        nargs: int = 0
+        if template is None or (
+            args
+            and (
+                args.__class__ is not tuple
+                or len(args) > 255
+                or not _pack_args(args, packed_args)
+            )
+        ):
+            flags |= RECORD_MESSAGE
+        elif args:
+            nargs = len(args)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            flags |= RECORD_EXC_TEXT
+        if record.stack_info:
+            flags |= RECORD_STACK_INFO
+
+        out += RECORD.pack(
+            FRAME_RECORD, record.created, site_id, context_id, int(record.msecs), flags, nargs
+        )
+        if nargs:
+            out += packed_args
+        if flags & RECORD_MESSAGE:
+            _pack_text(record.getMessage(), out)
+        if flags & RECORD_EXC_TEXT:
+            _pack_text(record.exc_text, out)
+        if flags & RECORD_STACK_INFO:
+            _pack_text(record.stack_info, out)
+
+        return bytes(out)
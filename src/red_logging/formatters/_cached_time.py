@@ -0,0 +1,77 @@
+"""A formatter that renders each second's `asctime` once, instead of once per record.
+
+`logging.Formatter.formatTime()` calls `time.localtime()` (or `time.gmtime()`) and `time.strftime()` for
+every record, though `strftime()` has 1 second resolution. `CachedTimeFormatter` keeps the rendered
+string for the last second it formatted, and reuses it for every record from the same second. Only the
+milliseconds (`,123` when there is no `datefmt`) are added per record.
+
+The cache is keyed by the absolute epoch second, not the local time, so a DST change (when the same local
+time happens twice, or is skipped) renders exactly what `logging.Formatter` does. A process that changes
+its timezone with `time.tzset()` can see the old timezone for the rest of the current second.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import typing as t
+
+from ._shared import share_output as _share_output
+
+class CachedTimeFormatter(logging.Formatter):
+    """A `logging.Formatter` that caches the rendered `asctime` for the current second.
+
+    Takes the same params as `logging.Formatter`, and produces the same output.
+
+    Params:
+        fmt (str | None): The format string.
+        datefmt (str | None): The `time.strftime()` format for `%(asctime)s`.
+        style (str): The format style.
+        validate (bool): When `True`, check the format string matches its style.
+        defaults (dict[str, Any] | None): Values for fields a record does not have.
+        utc (bool): When `True`, render times in UTC instead of local time.
+        share_output (bool): When `True`, handlers that share this formatter reuse the output of the
+            first handler to format a record.
+    """
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        style: str = "%",
+        validate: bool = True,
+        *,
+        defaults: dict[str, t.Any] | None = None,
+        utc: bool = False,
+        share_output: bool = False,
+    ) -> None:
+        super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+
+        self.utc: bool = utc
+        self.share_output: bool = share_output
+        if share_output:
+            _share_output(self)
+        if utc:
+            self.converter = time.gmtime
+        ## (second, datefmt, converter, rendered), replaced as 1 tuple so threads never see a partial update
+        self._time_cache: tuple = (None, None, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return the record's creation time as text, rendering it only once per second."""
+        created: float = record.created
+        second: int = int(created)
+        cache: tuple = self._time_cache
+
+        if second == cache[0] and datefmt == cache[1] and self.converter == cache[2]:
+            rendered: str = cache[3]
+        elif created < 0:
+            ## int() rounds toward 0, but the converters round down
+            return super().formatTime(record, datefmt)
+        else:
+            rendered = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._time_cache = (second, datefmt, self.converter, rendered)
+
+        if datefmt or not self.default_msec_format:
+            return rendered
+
+        return self.default_msec_format % (rendered, record.msecs)
@@ -0,0 +1,172 @@
+"""A formatter that compiles its `%`-style format string into a function, once.
+
+`logging.Formatter` formats every record with `fmt % record.__dict__`, which parses the format string
+again for each record. `CompiledFormatter` parses it once, into an f-string expression that reads each
+field from `record.__dict__`:
+
+- `%(name)s` becomes `{d["name"]!s}`, which calls `str()` exactly like `%s` does. A width & precision
+  become a format spec, i.e. `%(levelname)-8s` becomes `{d["levelname"]!s:<8}`. `%r` & `%a` work the same.
+- Other fields (i.e. `%(lineno)05d`, `%(relativeCreated).3f`) keep their `%` spec, applied to that 1
+  value: `{"%05d" % (d["lineno"],)}`.
+- `%%` becomes a literal `%`.
+
+The output is identical to `logging.Formatter`, including the `ValueError` for a field missing from the
+record. Only `formatMessage()` is replaced, so `asctime`, exceptions & stack info are handled by
+`logging.Formatter.format()` as usual, with `asctime` cached per second by `CachedTimeFormatter`. A
+format string the compiler does not handle (another `style`, or a `*` width) is formatted by
+`logging.Formatter`.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import re
+import typing as t
+
+from ._cached_time import CachedTimeFormatter
+
+## The same field syntax `%`-formatting accepts with a mapping: `%(key)[flags][width][.precision]type`
+_FIELD: re.Pattern = re.compile(
+    r"%(?:(?P<percent>%)|\((?P<key>[^)]*)\)"
+    r"(?P<spec>(?P<flags>[#0+ -]*)(?P<width>\d*)(?P<precision>\.\d+)?(?P<type>[diouxXeEfFgGcrsa])))"
+)
+
+
+def compile_format(
+    fmt: str, defaults: dict[str, t.Any] | None = None
+) -> tuple[t.Callable[[logging.LogRecord], str], str] | None:
+    """Compile a `%`-style format string into a function that formats a record's attributes.
+
+    Params:
+        fmt (str): The format string, i.e. `"%(asctime)s %(levelname)-8s %(message)s"`.
+        defaults (dict[str, Any] | None): Values for fields a record does not have, like a `Formatter`'s
+            `defaults`.
+
+    Returns:
+        (tuple[Callable[[logging.LogRecord], str], str] | None): The function & its source code, or
+            `None` if the format string uses syntax the compiler does not handle.
+
+    """
+    if "%" in _FIELD.sub("", fmt):
+        ## A `%` that is not part of a field this compiler understands
+        return None
+
+    namespace: dict[str, t.Any] = {"__builtins__": {}, "KeyError": KeyError, "ValueError": ValueError}
+    parts: list[ast.expr] = []
+    literal: list[str] = []
+    pos: int = 0
+
+    for match in _FIELD.finditer(fmt):
+        literal.append(fmt[pos : match.start()])
+        pos = match.end()
+        if match["percent"]:
+            literal.append("%")
+            continue
+
+        if literal:
+            parts.append(ast.Constant("".join(literal)))
+            literal = []
+
+        value: ast.expr = ast.Subscript(
+            ast.Name("d", ast.Load()), ast.Constant(match["key"]), ast.Load()
+        )
+        if match["type"] in "sra" and match["flags"] in ("", "-"):
+            ## `%-8s` pads str(value) exactly like `{value!s:<8}`, without a `%` operation per record
+            spec: str = ""
+            if match["width"]:
+                spec = ("<" if match["flags"] else ">") + match["width"]
+            spec += match["precision"] or ""
+            parts.append(
+                ast.FormattedValue(
+                    value,
+                    conversion=ord(match["type"]),
+                    format_spec=ast.JoinedStr([ast.Constant(spec)]) if spec else None,
+                )
+            )
+        else:
+            spec_name: str = f"_spec{len(parts)}"
+            namespace[spec_name] = f"%{match['spec']}"
+            parts.append(
+                ast.FormattedValue(
+                    ast.BinOp(
+                        ast.Name(spec_name, ast.Load()),
+                        ast.Mod(),
+                        ast.Tuple([value], ast.Load()),
+                    ),
+                    conversion=-1,
+                    format_spec=None,
+                )
+            )
+
+    literal.append(fmt[pos:])
+    if "".join(literal):
+        parts.append(ast.Constant("".join(literal)))
+
+    ## `defaults | record.__dict__` is what PercentStyle formats, when there are defaults
+    if defaults:
+        namespace["_defaults"] = dict(defaults)
+        values: str = "_defaults | record.__dict__"
+    else:
+        values = "record.__dict__"
+
+    template: ast.Module = ast.parse(
+        "\n".join(
+            [
+                "def format_message(record):",
+                f"    d = {values}",
+                "    try:",
+                "        return FORMATTED",
+                "    except KeyError as e:",
+                "        raise ValueError('Formatting field not found in record: %s' % e)",
+            ]
+        )
+    )
+    ## Swap the placeholder for the f-string, built as an AST so literal text needs no escaping
+    template.body[0].body[1].body[0].value = ast.JoinedStr(parts) if parts else ast.Constant("")
+    ast.fix_missing_locations(template)
+
+    exec(compile(template, "<red_logging.formatters.CompiledFormatter>", "exec"), namespace)
+
+    return namespace["format_message"], ast.unparse(template)
+
+
+class CompiledFormatter(CachedTimeFormatter):
+    """A `logging.Formatter` that formats `%`-style format strings with a function compiled once.
+
+    Takes the same params as `logging.Formatter`, and produces the same output. `asctime` is rendered
+    once per second, like a `CachedTimeFormatter`.
+
+    Params:
+        fmt (str | None): The format string.
+        datefmt (str | None): The `time.strftime()` format for `%(asctime)s`.
+        style (str): The format style. Only `%` formats are compiled.
+        validate (bool): When `True`, check the format string matches its style.
+        defaults (dict[str, Any] | None): Values for fields a record does not have.
+        utc (bool): When `True`, render times in UTC instead of local time.
+        share_output (bool): When `True`, handlers that share this formatter reuse the output of the
+            first handler to format a record.
+    """
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        style: str = "%",
+        validate: bool = True,
+        *,
+        defaults: dict[str, t.Any] | None = None,
+        utc: bool = False,
+        share_output: bool = False,
+    ) -> None:
+        super().__init__(
+            fmt, datefmt, style, validate, defaults=defaults, utc=utc, share_output=share_output
+        )
+
+        self.source: str | None = None
+        ## StrFormatStyle & StringTemplateStyle subclass PercentStyle, so check the exact class
+        if self._style.__class__ is logging.PercentStyle:
+            compiled = compile_format(self._style._fmt, defaults)
+            if compiled is not None:
+                ## An instance attribute, so Formatter.format() calls the compiled function directly
+                self.formatMessage, self.source = compiled
@@ -0,0 +1,103 @@
+"""Share a formatter's output between the handlers that format the same record with it.
+
+In a dictConfig, handlers that name the same formatter (i.e. a console & a file handler using `default`)
+get the same formatter object, and each calls its `format()` on the same record. A formatter created with
+`share_output=True` keeps its output on the record, keyed by the formatter, so only the first handler
+formats it. Handlers with a different formatter format the record themselves, as usual.
+
+An entry is only reused while the record's `msg` & `args` are the same objects, and no attribute has been
+added to it since, so a handler filter that rewrites the message (i.e. a `RateLimitFilter`), or adds an
+attribute the format reads, gets a freshly formatted record. A filter that changes the value of an
+attribute the record already had is not detected.
+
+Handlers that encode each record themselves (`BufferedFileHandler`, `MmapFileHandler`,
+`MultiProcessRotatingFileHandler`) share the encoded bytes too, with `format_bytes()`.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing as t
+
+## The record attribute the cache is kept in
+FORMAT_CACHE_ATTRIBUTE: str = "_formatted"
+
+
+class _FormatCache(dict):
+    """Formatted output by formatter. Pickled as an empty dict, so it is not sent with a record."""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple:
+        return (dict, ())
+
+
+def share_output(formatter: logging.Formatter) -> None:
+    """Make a formatter reuse its output for a record it has already formatted.
+
+    Params:
+        formatter (logging.Formatter): The formatter. Its `format()` is replaced on the instance.
+
+    """
+    format_record: t.Callable[[logging.LogRecord], str] = formatter.format
+
+    def format(record: logging.LogRecord) -> str:
+        values: dict[str, t.Any] = record.__dict__
+        cache: _FormatCache | None = values.get(FORMAT_CACHE_ATTRIBUTE)
+        if cache is None:
+            cache = values[FORMAT_CACHE_ATTRIBUTE] = _FormatCache()
+        else:
+            entry: tuple | None = cache.get(formatter)
+            if (
+                entry is not None
+                and entry[0] is record.msg
+                and entry[1] is record.args
+                and entry[2] == len(values)
+            ):
+                return entry[3]
+
+        text: str = format_record(record)
+        ## The length after formatting, which adds `message` & `asctime` the first time
+        cache[formatter] = (record.msg, record.args, len(values), text)
+
+        return text
+
+    formatter.share_output = True
+    ## An instance attribute, so handlers call it instead of the class's format()
+    formatter.format = format
+
+
+def format_bytes(
+    handler: logging.Handler, record: logging.LogRecord, encoding: str, errors: str
+) -> bytes:
+    """Return a handler's formatted record, with its terminator, encoded.
+
+    When the handler's formatter shares its output, the bytes are shared too, with other handlers that
+    use the same formatter, terminator & encoding.
+
+    Params:
+        handler (logging.Handler): The handler, which has a `terminator`.
+        record (logging.LogRecord): The record to format.
+        encoding (str): The encoding.
+        errors (str): How to handle encoding errors.
+
+    Returns:
+        (bytes): The encoded line.
+
+    """
+    text: str = handler.format(record)
+    formatter: logging.Formatter | None = handler.formatter
+    if not getattr(formatter, "share_output", False):
+        return (text + handler.terminator).encode(encoding, errors)
+
+    cache: _FormatCache = record.__dict__[FORMAT_CACHE_ATTRIBUTE]
+    key: tuple = (formatter, handler.terminator, encoding, errors)
+    entry: tuple | None = cache.get(key)
+    ## The text is the same object while the formatter's entry is reused
+    if entry is not None and entry[0] is text:
+        return entry[1]
+
+    data: bytes = (text + handler.terminator).encode(encoding, errors)
+    cache[key] = (text, data)
+
+    return data
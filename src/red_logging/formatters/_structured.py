@@ -0,0 +1,257 @@
+"""Structured formatters, which write each record as a JSON object (1 per line) or a logfmt line.
+
+Both formatters build a field plan when they are created: the record attributes to write, in order, with
+each output key already escaped (`"levelname":` for JSON, `levelname=` for logfmt). Formatting a record
+only serializes its values. `str`, `int`, `float`, `bool` & `None` values are written by a per-type
+encoder. Other values, like `extra={"user": User(...)}`, go through a fallback that writes their `str()`,
+cut to `max_fallback_length` characters, so a large or unserializable `extra` cannot stall logging.
+
+Attributes a record has that are not standard `LogRecord` attributes (i.e. `extra` values, or attributes
+set by filters) are written after the planned fields when `extras=True`. Exceptions and stack info are
+written as `exc_info` & `stack_info` when a record has them.
+
+Only the standard library is used. The output is a `str`, like any formatter's.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import json.encoder
+import logging
+import math
+import re
+import typing as t
+
+from ._cached_time import CachedTimeFormatter
+from ._shared import FORMAT_CACHE_ATTRIBUTE
+
+DEFAULT_FIELDS: tuple[str, ...] = ("asctime", "levelname", "name", "message")
+
+## Attributes every LogRecord has. Anything else on a record is an `extra`
+_STANDARD_ATTRIBUTES: frozenset[str] = frozenset(logging.makeLogRecord({}).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+    ## Set on every record by the record factory a ShardedFileHandler installs
+    "created_ns",
+    FORMAT_CACHE_ATTRIBUTE,
+}
+## LogRecord.__init__() sets these first, so `extra` values & attributes set later (by filters, or
+#  makeLogRecord()) come after them in the record's __dict__
+_INIT_ATTRIBUTES: int = len(logging.LogRecord("", 0, "", 0, "", (), None).__dict__)
+## The most `extra` keys to keep escaped, so a record with unbounded key names cannot grow the cache
+_MAX_CACHED_KEYS: int = 1024
+
+## A JSON string literal, with `"`, `\` & control characters escaped. C-accelerated when available
+_json_str: t.Callable[[str], str] = json.encoder.encode_basestring
+## A logfmt value that can be written without quotes
+_LOGFMT_BARE: re.Pattern = re.compile(r'[^\s"=\\]+')
+_LOGFMT_KEY_INVALID: re.Pattern = re.compile(r'[\s"=\\]')
+
+
+def _json_float(value: float) -> str:
+    if math.isfinite(value):
+        return float.__repr__(value)
+
+    ## The same tokens json.dumps() writes
+    return "NaN" if value != value else ("Infinity" if value > 0 else "-Infinity")
+
+
+def _logfmt_str(value: str) -> str:
+    if _LOGFMT_BARE.fullmatch(value):
+        return value
+
+    return _json_str(value)
+
+
+class _StructuredFormatter(CachedTimeFormatter):
+    """Build the field plan, and prepare records, for the structured formatters.
+
+    Subclasses set `_encoders` and implement `_key()`, `_fallback()` & `format()`.
+    """
+
+    _encoders: dict[type, t.Callable[[t.Any], str]] = {}
+
+    def __init__(
+        self,
+        fields: t.Sequence[str] | None = None,
+        rename: dict[str, str] | None = None,
+        extras: bool = True,
+        datefmt: str | None = None,
+        utc: bool = False,
+        max_fallback_length: int = 1024,
+        share_output: bool = False,
+    ) -> None:
+        super().__init__("%(message)s", datefmt, utc=utc, share_output=share_output)
+
+        if max_fallback_length < 1:
+            raise ValueError(f"max_fallback_length must be at least 1, not {max_fallback_length}.")
+
+        self.fields: list[str] = list(fields if fields is not None else DEFAULT_FIELDS)
+        self.rename: dict[str, str] = dict(rename or {})
+        self.extras: bool = extras
+        self.max_fallback_length: int = max_fallback_length
+
+        self._uses_asctime: bool = "asctime" in self.fields
+        self._keys: dict[str, str] = {}
+        ## (escaped key, attribute to read) for each field. The exception is read from its formatted text
+        self._plan: tuple[tuple[str, str], ...] = tuple(
+            (self._escaped_key(name), "exc_text" if name == "exc_info" else name)
+            for name in self.fields
+        )
+        ## Attributes that are never written as extras
+        self._skip: frozenset[str] = _STANDARD_ATTRIBUTES | set(self.fields)
+
+    def _key(self, name: str) -> str:
+        raise NotImplementedError
+
+    def _fallback(self, value: t.Any) -> str:
+        raise NotImplementedError
+
+    def _escaped_key(self, name: str) -> str:
+        key: str | None = self._keys.get(name)
+        if key is None:
+            key = self._key(self.rename.get(name, name))
+            if len(self._keys) < _MAX_CACHED_KEYS:
+                self._keys[name] = key
+
+        return key
+
+    def _bounded_str(self, value: t.Any) -> str:
+        """Return `str(value)`, cut to `max_fallback_length` characters."""
+        try:
+            text: str = str(value)
+        except Exception:
+            text = f"<unprintable {value.__class__.__name__}>"
+
+        if len(text) > self.max_fallback_length:
+            return text[: self.max_fallback_length] + "..."
+
+        return text
+
+    def _encoded(self, record: logging.LogRecord) -> list[str]:
+        """Return the record's `key` + encoded value strings, in order."""
+        encoders: dict[type, t.Callable[[t.Any], str]] = self._encoders
+        fallback: t.Callable[[t.Any], str] = self._fallback
+        parts: list[str] = []
+        for key, value in self._prepare(record):
+            encoder: t.Callable[[t.Any], str] | None = encoders.get(value.__class__)
+            parts.append(key + (encoder(value) if encoder is not None else fallback(value)))
+
+        return parts
+
+    def _prepare(self, record: logging.LogRecord) -> list[tuple[str, t.Any]]:
+        """Set the record's message, time & exception text, and return its (escaped key, value) pairs."""
+        record.message = record.getMessage()
+        if self._uses_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+
+        values: dict[str, t.Any] = record.__dict__
+        items: list[tuple[str, t.Any]] = [(key, values.get(name)) for key, name in self._plan]
+
+        if record.exc_text and "exc_info" not in self.fields:
+            items.append((self._escaped_key("exc_info"), record.exc_text))
+        if record.stack_info and "stack_info" not in self.fields:
+            items.append((self._escaped_key("stack_info"), record.stack_info))
+
+        if self.extras:
+            skip: frozenset[str] = self._skip
+            keys: dict[str, str] = self._keys
+            items += [
+                (keys.get(name) or self._escaped_key(name), values[name])
+                for name in itertools.islice(values, _INIT_ATTRIBUTES, None)
+                if name not in skip
+            ]
+
+        return items
+
+
+class JSONFormatter(_StructuredFormatter):
+    """Format each record as a single-line JSON object, for NDJSON log pipelines.
+
+    Params:
+        fields (Sequence[str] | None): The record attributes to write, in order. `message` is the
+            formatted message, `asctime` the formatted time & `exc_info` the formatted exception.
+        rename (dict[str, str] | None): Output keys for attributes, i.e. `{"levelname": "level"}`.
+        extras (bool): When `True`, also write non-standard record attributes, like `extra` values.
+        datefmt (str | None): The `time.strftime()` format for `asctime`.
+        utc (bool): When `True`, render `asctime` in UTC instead of local time.
+        max_fallback_length (int): The most characters written for a value JSON cannot encode
+            directly, or for a `list`/`dict` value.
+        share_output (bool): When `True`, handlers that share this formatter reuse the output of the
+            first handler to format a record.
+    """
+
+    _encoders: dict[type, t.Callable[[t.Any], str]] = {
+        str: _json_str,
+        int: int.__repr__,
+        float: _json_float,
+        bool: lambda value: "true" if value else "false",
+        type(None): lambda value: "null",
+    }
+
+    def _key(self, name: str) -> str:
+        return _json_str(name) + ":"
+
+    def _fallback(self, value: t.Any) -> str:
+        """Encode a container with `json.dumps()`, or any other value as its `str()`, within the bound."""
+        if isinstance(value, (dict, list, tuple)):
+            try:
+                text: str = json.dumps(
+                    value, default=self._bounded_str, ensure_ascii=False, separators=(",", ":")
+                )
+            except (TypeError, ValueError, RecursionError):
+                ## Non-string keys or a circular reference
+                text = ""
+            if text and len(text) <= self.max_fallback_length:
+                return text
+            if text:
+                return _json_str(text[: self.max_fallback_length] + "...")
+
+        return _json_str(self._bounded_str(value))
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the record as a JSON object."""
+        return "{" + ",".join(self._encoded(record)) + "}"
+
+
+class LogfmtFormatter(_StructuredFormatter):
+    """Format each record as a logfmt line of `key=value` pairs.
+
+    Values with spaces, quotes, `=` or control characters are quoted, with JSON string escapes, so a
+    record is always 1 line. `None` is written as an empty value (`key=`).
+
+    Params:
+        fields (Sequence[str] | None): The record attributes to write, in order. `message` is the
+            formatted message, `asctime` the formatted time & `exc_info` the formatted exception.
+        rename (dict[str, str] | None): Output keys for attributes, i.e. `{"levelname": "level"}`.
+        extras (bool): When `True`, also write non-standard record attributes, like `extra` values.
+        datefmt (str | None): The `time.strftime()` format for `asctime`.
+        utc (bool): When `True`, render `asctime` in UTC instead of local time.
+        max_fallback_length (int): The most characters written for a value that is not a `str`,
+            number, `bool` or `None`.
+        share_output (bool): When `True`, handlers that share this formatter reuse the output of the
+            first handler to format a record.
+    """
+
+    _encoders: dict[type, t.Callable[[t.Any], str]] = {
+        str: _logfmt_str,
+        int: int.__repr__,
+        float: float.__repr__,
+        bool: lambda value: "true" if value else "false",
+        type(None): lambda value: "",
+    }
+
+    def _key(self, name: str) -> str:
+        return _LOGFMT_KEY_INVALID.sub("_", name) + "="
+
+    def _fallback(self, value: t.Any) -> str:
+        """Write any other value as its `str()`, within the bound."""
+        return _logfmt_str(self._bounded_str(value))
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the record as a logfmt line."""
+        return " ".join(self._encoded(record))
@@ -0,0 +1,37 @@
+"""Handler classes that can be referenced in a logging dictConfig.
+
+These handlers are not part of the stdlib `logging` module. Each has a matching config class in
+`red_logging.config_classes.handlers`, which returns the import path of the handler in its `.get_configdict()`.
+"""
+
+from __future__ import annotations
+
+from ._async import (
+    AsyncFileHandler,
+    AsyncHandler,
+    AsyncSocketHandler,
+    AsyncStreamHandler,
+    shutdown_async_handlers,
+)
+from ._binary import BinaryFileHandler
+from ._buffered import BufferedFileHandler
+from ._dedup import DedupHandler
+from ._mmap import MmapFileHandler, read_mmap_log
+from ._multiprocess import MultiProcessRotatingFileHandler
+from ._queued import QueuedHandler
+from ._ring import RingBufferHandler
+from ._rotating import (
+    BackgroundRotatingFileHandler,
+    BackgroundTimedRotatingFileHandler,
+)
+from ._sharded import ShardedFileHandler, shard_filename
+from ._smtp import DigestSMTPHandler
+from ._socket import (
+    FRAME_HEADER,
+    BatchedSocketHandler,
+    decode_frame,
+    encode_frame,
+    encode_record_frames,
+    iter_frames,
+    record_to_dict,
+)
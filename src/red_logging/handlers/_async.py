@@ -0,0 +1,428 @@
+"""Handlers for asyncio applications, which never block the event loop on log I/O.
+
+`emit()` only puts the record on an `asyncio.Queue`. The first record emitted while an event loop is
+running starts a consumer task on that loop, which takes records off the queue in batches, formats
+them and writes them:
+
+- `AsyncSocketHandler` sends records over a non-blocking asyncio stream (`asyncio.open_connection()`),
+  in the same wire format as the stdlib `SocketHandler`.
+- `AsyncStreamHandler` & `AsyncFileHandler` write each batch on the handler's own writer thread.
+  Regular files & terminals cannot be put in non-blocking mode, so the event loop awaits the write
+  instead of waiting on it.
+
+Records are formatted by the consumer task, not in `emit()`, so objects passed as message arguments
+should not be changed after the logging call.
+
+Before the event loop stops, call `await shutdown_async_handlers()` (or `await handler.shutdown()`)
+to write the records left in the queue. Records emitted when no event loop is running, and records
+still queued when the loop is closed, are written synchronously.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import io
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import typing as t
+import weakref
+
+_ASYNC_HANDLERS: weakref.WeakSet = weakref.WeakSet()
+## Put on the queue by shutdown() to stop the consumer task
+_SENTINEL: None = None
+
+
+async def shutdown_async_handlers() -> None:
+    """Write the queued records of every async handler, then stop their consumer tasks."""
+    await asyncio.gather(*(handler.shutdown() for handler in list(_ASYNC_HANDLERS)))
+
+
+class AsyncHandler(logging.Handler):
+    """Base class for handlers whose `emit()` only puts records on an `asyncio.Queue`.
+
+    Subclasses implement `_awrite()`, which writes a batch of records from the consumer task, and
+    `_write_sync()`, which writes records when no event loop is running.
+
+    Params:
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit. When
+            the queue is full, records are dropped and `.dropped` is incremented.
+        batch_size (int): The maximum number of records the consumer task writes at once.
+    """
+
+    terminator: str = "\n"
+
+    def __init__(self, queue_size: int = 0, batch_size: int = 512) -> None:
+        super().__init__()
+
+        self.queue_size: int = queue_size
+        self.batch_size: int = max(1, batch_size)
+        self.dropped: int = 0
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        _ASYNC_HANDLERS.add(self)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Create the queue & consumer task on a running event loop."""
+        ## Records left from a previous (closed) event loop are written first
+        self._drain_sync()
+
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = loop.create_task(
+            self._consume(self._queue), name=f"{self.__class__.__name__}-consumer"
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue, starting the consumer task if needed."""
+        loop: asyncio.AbstractEventLoop | None = self._loop
+        if loop is None or loop.is_closed():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                ## No event loop to block, write the record now
+                self._drain_sync()
+                self._write_sync([record])
+
+                return
+
+            self.start(loop)
+
+        if threading.get_ident() == self._loop_thread:
+            self._put(record)
+        else:
+            try:
+                loop.call_soon_threadsafe(self._put, record)
+            except RuntimeError:
+                ## The loop was closed by another thread
+                self._write_sync([record])
+
+    def _put(self, record: logging.LogRecord) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _consume(self, queue: asyncio.Queue) -> None:
+        """Take records off the queue in batches and write them, until the sentinel is found."""
+        try:
+            while True:
+                batch: list[logging.LogRecord | None] = [await queue.get()]
+                while len(batch) < self.batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                stop: bool = _SENTINEL in batch
+                if stop:
+                    batch = batch[: batch.index(_SENTINEL)]
+
+                if batch:
+                    try:
+                        await self._awrite(batch)
+                    except Exception:
+                        self.handleError(batch[-1])
+
+                if stop:
+                    return
+        except asyncio.CancelledError:
+            ## i.e. asyncio.run() returned without shutdown() being awaited
+            self._drain_sync(queue)
+
+            raise
+
+    def _drain_sync(self, queue: asyncio.Queue | None = None) -> None:
+        """Write any records left on a queue synchronously."""
+        queue = self._queue if queue is None else queue
+        if queue is None:
+            return
+
+        records: list[logging.LogRecord] = []
+        while not queue.empty():
+            record: logging.LogRecord | None = queue.get_nowait()
+            if record is not _SENTINEL:
+                records.append(record)
+
+        if records:
+            self._write_sync(records)
+
+    def _format_batch(self, records: list[logging.LogRecord]) -> str:
+        """Format records into a single string, skipping (and reporting) records that fail."""
+        lines: list[str] = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+
+        return "".join(lines)
+
+    async def _awrite(self, records: list[logging.LogRecord]) -> None:
+        raise NotImplementedError("_awrite must be implemented by AsyncHandler subclasses")
+
+    def _write_sync(self, records: list[logging.LogRecord]) -> None:
+        raise NotImplementedError(
+            "_write_sync must be implemented by AsyncHandler subclasses"
+        )
+
+    async def _aclose(self) -> None:
+        """Close any resources that belong to the event loop."""
+
+    async def shutdown(self) -> None:
+        """Wait for the consumer task to write all queued records, then stop it."""
+        task: asyncio.Task | None = self._task
+        self._task = None
+
+        if task is not None and not task.done():
+            if self._loop is asyncio.get_running_loop():
+                await self._queue.put(_SENTINEL)
+                await task
+            else:
+                task.cancel()
+
+        self._drain_sync()
+        await self._aclose()
+
+    def close(self) -> None:
+        """Write any records left on the queue synchronously."""
+        self.acquire()
+        try:
+            self._drain_sync()
+        finally:
+            self.release()
+
+        super().close()
+
+
+class _ThreadedTextWriterMixin:
+    """Write formatted batches on a dedicated writer thread, so the event loop only awaits them."""
+
+    _executor: ThreadPoolExecutor | None = None
+    _write_lock: threading.Lock
+
+    def _write_text(self, text: str) -> None:
+        raise NotImplementedError
+
+    async def _awrite(self, records: list[logging.LogRecord]) -> None:
+        text: str = self._format_batch(records)
+        if not text:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=self.__class__.__name__
+            )
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._write_text, text
+        )
+
+    def _write_sync(self, records: list[logging.LogRecord]) -> None:
+        text: str = self._format_batch(records)
+        if text:
+            self._write_text(text)
+
+    def _shutdown_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class AsyncStreamHandler(_ThreadedTextWriterMixin, AsyncHandler):
+    """Write log records to a stream (i.e. `sys.stderr`) without blocking the event loop.
+
+    Params:
+        stream (TextIO | None): The stream to write to. Defaults to `sys.stderr`.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        batch_size (int): The maximum number of records written at once.
+    """
+
+    def __init__(
+        self, stream: t.TextIO | None = None, queue_size: int = 0, batch_size: int = 512
+    ) -> None:
+        super().__init__(queue_size=queue_size, batch_size=batch_size)
+
+        self.stream: t.TextIO = sys.stderr if stream is None else stream
+        self._write_lock = threading.Lock()
+
+    def _write_text(self, text: str) -> None:
+        with self._write_lock:
+            self.stream.write(text)
+            if hasattr(self.stream, "flush"):
+                self.stream.flush()
+
+    def close(self) -> None:
+        """Write any records left on the queue, then stop the writer thread."""
+        try:
+            super().close()
+        finally:
+            self._shutdown_executor()
+
+
+class AsyncFileHandler(_ThreadedTextWriterMixin, AsyncHandler):
+    """Write log records to a file without blocking the event loop.
+
+    Params:
+        filename (str): The name/path of the file to log messages to.
+        mode (str): The mode to open the file in.
+        encoding (str | None): The encoding to use for log messages.
+        errors (str | None): How encoding errors are handled.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        batch_size (int): The maximum number of records written at once.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: str | None = None,
+        errors: str | None = None,
+        queue_size: int = 0,
+        batch_size: int = 512,
+    ) -> None:
+        super().__init__(queue_size=queue_size, batch_size=batch_size)
+
+        self.baseFilename: str = os.path.abspath(os.fspath(filename))
+        self.mode: str = mode
+        self.encoding: str | None = (
+            io.text_encoding(encoding) if "b" not in mode else None
+        )
+        self.errors: str | None = errors
+        self.stream: t.TextIO | None = open(
+            self.baseFilename, mode, encoding=self.encoding, errors=errors
+        )
+        self._write_lock = threading.Lock()
+
+    def _write_text(self, text: str) -> None:
+        with self._write_lock:
+            if self.stream is None:
+                self.stream = open(
+                    self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors
+                )
+            self.stream.write(text)
+            self.stream.flush()
+
+    def close(self) -> None:
+        """Write any records left on the queue, then close the file and stop the writer thread."""
+        try:
+            super().close()
+        finally:
+            self._shutdown_executor()
+            with self._write_lock:
+                if self.stream is not None:
+                    self.stream.close()
+                    self.stream = None
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.baseFilename} ({level})>"
+
+
+class AsyncSocketHandler(AsyncHandler):
+    """Send log records to a TCP socket over a non-blocking asyncio stream.
+
+    Records are pickled with the same length-prefixed format as the stdlib `SocketHandler`, so any
+    receiver that works with a `SocketHandlerConfig` works with this handler. While the connection
+    is down, records are dropped, and reconnects are retried with the same backoff as `SocketHandler`.
+
+    Params:
+        host (str): Host IP/FQDN.
+        port (int): Host port where log messages should be sent.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        batch_size (int): The maximum number of records sent at once.
+    """
+
+    retryStart: float = 1.0
+    retryMax: float = 30.0
+    retryFactor: float = 2.0
+
+    def __init__(
+        self, host: str, port: int, queue_size: int = 0, batch_size: int = 512
+    ) -> None:
+        super().__init__(queue_size=queue_size, batch_size=batch_size)
+
+        self.host: str = host
+        self.port: int = port
+        self._writer: asyncio.StreamWriter | None = None
+        self._retry_time: float | None = None
+        self._retry_period: float = self.retryStart
+        self._sync_handler: logging.handlers.SocketHandler | None = None
+
+    def makePickle(self, record: logging.LogRecord) -> bytes:
+        """Pickle a record the same way as the stdlib `SocketHandler`."""
+        return logging.handlers.SocketHandler.makePickle(self, record)
+
+    async def _connect(self) -> bool:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._retry_time is not None and loop.time() < self._retry_time:
+            return False
+
+        try:
+            _reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        except OSError:
+            self._retry_time = loop.time() + self._retry_period
+            self._retry_period = min(self._retry_period * self.retryFactor, self.retryMax)
+
+            return False
+
+        self._retry_time = None
+        self._retry_period = self.retryStart
+
+        return True
+
+    async def _awrite(self, records: list[logging.LogRecord]) -> None:
+        if self._writer is None and not await self._connect():
+            return
+
+        data: list[bytes] = []
+        for record in records:
+            try:
+                data.append(self.makePickle(record))
+            except Exception:
+                self.handleError(record)
+
+        try:
+            self._writer.write(b"".join(data))
+            await self._writer.drain()
+        except OSError:
+            self._writer.close()
+            self._writer = None
+
+    def _write_sync(self, records: list[logging.LogRecord]) -> None:
+        if self._sync_handler is None:
+            self._sync_handler = logging.handlers.SocketHandler(self.host, self.port)
+            self._sync_handler.setFormatter(self.formatter)
+
+        for record in records:
+            self._sync_handler.emit(record)
+
+    async def _aclose(self) -> None:
+        if self._writer is not None:
+            writer: asyncio.StreamWriter = self._writer
+            self._writer = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Write any records left on the queue, then close the connection."""
+        try:
+            super().close()
+        finally:
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                except RuntimeError:
+                    ## The event loop is already closed
+                    pass
+                self._writer = None
+            if self._sync_handler is not None:
+                self._sync_handler.close()
+                self._sync_handler = None
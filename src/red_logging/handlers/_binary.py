@@ -0,0 +1,79 @@
+"""A FileHandler that writes records in a compact binary format, instead of as text.
+
+Text logs repeat the same timestamp layout, logger name, path, function & message template on every
+line. `BinaryFileHandler` writes each of those once, in a dictionary kept in the file, and then writes
+each record as a small `struct`-packed frame: its time, 2 dictionary ids and the message's `args`. See
+`red_logging.formatters._binary` for the layout.
+
+Read the file back with `python -m red_logging.decode app.rlog`, which writes it as text in any of the
+`red_logging.fmts` formats, or with `red_logging.decode.iter_records()`.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from red_logging.formatters._binary import BinaryFormatter, TemplateDictionary
+
+class BinaryFileHandler(logging.FileHandler):
+    """Write log records to a file as binary frames, with a dictionary of message templates.
+
+    Each time the file is opened, a new session starts in the file, and the dictionary is written again
+    as records use it. So appending to a file from a new process, or after the handler is reopened, is safe.
+
+    A text formatter set on the handler (i.e. by a dictConfig `formatter` key) is ignored. Set a
+    `BinaryFormatter` to change how exceptions are formatted.
+
+    Params:
+        filename (str): The name/path of the file to log records to.
+        mode (str): The mode to open the file in, `a` (append) or `w` (truncate).
+        delay (bool): When `True`, the file is not opened until the first record is written.
+        max_entries (int): Start a new dictionary in the file once it holds this many entries.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        delay: bool = False,
+        max_entries: int = 65536,
+    ) -> None:
+        self.dictionary: TemplateDictionary = TemplateDictionary(max_entries)
+        self._binary_formatter: BinaryFormatter = BinaryFormatter()
+
+        super().__init__(
+            filename, mode=mode if "b" in mode else f"{mode}b", encoding=None, delay=delay
+        )
+
+    def _open(self):
+        """Open the log file in binary mode, and start a new session in it."""
+        stream = self._builtin_open(self.baseFilename, self.mode)
+        stream.write(self.dictionary.start())
+
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record's binary frames to the file."""
+        if self.stream is None:
+            if self.mode != "wb" or not self._closed:
+                self.stream = self._open()
+        if self.stream is None:
+            return
+
+        try:
+            formatter: logging.Formatter | None = self.formatter
+            if not isinstance(formatter, BinaryFormatter):
+                formatter = self._binary_formatter
+
+            data: bytes = formatter.encode(record, self.dictionary)
+            try:
+                self.stream.write(data)
+                self.flush()
+            except Exception:
+                ## The frames may define entries later records refer to
+                self.dictionary.invalidate()
+                raise
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,156 @@
+"""A FileHandler that collects formatted records in memory and writes them to disk in batches.
+
+The stdlib `FileHandler` writes & flushes each record as it is emitted, which is 1 `write()` syscall
+per log line. `BufferedFileHandler` encodes each record and appends it to a buffer, then writes the
+whole buffer with a single `write()` when the buffer reaches `flush_bytes`, when the oldest record in
+the buffer is `flush_interval_ms` old, or when a record at `flush_level` (default `ERROR`) or above is
+emitted. The buffer is also written when the handler is flushed or closed, i.e. by `logging.shutdown()`.
+"""
+
+from __future__ import annotations
+
+import locale
+import logging
+import threading
+import time
+import traceback
+import typing as t
+
+from red_logging.formatters import format_bytes
+
+class BufferedFileHandler(logging.FileHandler):
+    """Write log records to a file in batches, instead of 1 write per record.
+
+    Params:
+        filename (str): The name/path of the file to log messages to.
+        mode (str): The mode to open the file in, `a` (append) or `w` (truncate).
+        encoding (str | None): The encoding to use for log messages. Defaults to the locale's encoding.
+        delay (bool): When `True`, the file is not opened until the first batch is written.
+        errors (str | None): How encoding errors are handled, i.e. `strict`, `replace`.
+        flush_bytes (int): Write the buffer once it holds this many bytes.
+        flush_interval_ms (int): Write the buffer once its oldest record is this many milliseconds old.
+            A background thread checks the buffer's age, so quiet periods are also flushed. `0` disables
+            the timer, and the buffer is only written when it is full, at `flush_level`, or on close.
+        flush_level (str | int): Records at this level or higher are written immediately, along with
+            everything buffered before them.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+        flush_bytes: int = 65536,
+        flush_interval_ms: int = 1000,
+        flush_level: t.Union[str, int] = logging.ERROR,
+    ) -> None:
+        self.flush_bytes: int = flush_bytes
+        self.flush_interval: float = flush_interval_ms / 1000
+        self.flush_level: int = logging._checkLevel(flush_level)
+
+        self._buffer: list[bytes] = []
+        self._buffered_bytes: int = 0
+        self._buffered_since: float | None = None
+
+        super().__init__(
+            filename, mode=mode, encoding=encoding, delay=delay, errors=errors
+        )
+
+        ## FileHandler stores the encoding as 'locale' when none is given
+        self._encoding: str = (
+            locale.getpreferredencoding(False)
+            if self.encoding in (None, "locale")
+            else self.encoding
+        )
+
+        self._stop_timer: threading.Event = threading.Event()
+        self._timer: threading.Thread | None = None
+        if self.flush_interval > 0:
+            self._timer = threading.Thread(
+                target=self._flush_on_interval,
+                name=f"BufferedFileHandler({self.baseFilename})",
+                daemon=True,
+            )
+            self._timer.start()
+
+    def _open(self):
+        """Open the log file in unbuffered binary mode, so each batch is 1 `write()` call."""
+        open_func = self._builtin_open
+        _mode: str = self.mode if "b" in self.mode else f"{self.mode}b"
+
+        return open_func(self.baseFilename, _mode, buffering=0)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format & encode a record and add it to the buffer, writing the buffer if a threshold is reached."""
+        try:
+            data: bytes = format_bytes(self, record, self._encoding, self.errors or "strict")
+
+            if not self._buffer:
+                self._buffered_since = time.monotonic()
+            self._buffer.append(data)
+            self._buffered_bytes += len(data)
+
+            if (
+                self._buffered_bytes >= self.flush_bytes
+                or record.levelno >= self.flush_level
+            ):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write everything in the buffer to the log file with a single `write()`."""
+        self.acquire()
+        try:
+            if not self._buffer:
+                return
+
+            data: bytes = b"".join(self._buffer)
+            self._buffer.clear()
+            self._buffered_bytes = 0
+            self._buffered_since = None
+
+            if self.stream is None:
+                if self.mode == "w" and self._closed:
+                    return
+                self.stream = self._open()
+
+            view: memoryview = memoryview(data)
+            while view:
+                written: int = self.stream.write(view)
+                view = view[written:]
+        finally:
+            self.release()
+
+    def _flush_on_interval(self) -> None:
+        """Write the buffer from a background thread once its oldest record reaches `flush_interval`."""
+        wait: float = self.flush_interval
+        while not self._stop_timer.wait(wait):
+            buffered_since: float | None = self._buffered_since
+            if buffered_since is None:
+                wait = self.flush_interval
+                continue
+
+            age: float = time.monotonic() - buffered_since
+            if age >= self.flush_interval:
+                try:
+                    self.flush()
+                except Exception:
+                    ## There is no record to pass to handleError(), so mimic its output
+                    if logging.raiseExceptions:
+                        traceback.print_exc()
+                wait = self.flush_interval
+            else:
+                wait = self.flush_interval - age
+
+    def close(self) -> None:
+        """Stop the flush timer, then write the buffer and close the file."""
+        self._stop_timer.set()
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join()
+
+        super().close()
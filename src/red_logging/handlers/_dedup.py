@@ -0,0 +1,172 @@
+"""A handler that collapses repeated records into a single "message repeated N times" record.
+
+`DedupHandler` wraps a `target` handler. A record is passed to the target the first time it is seen.
+Copies of it, with the same logger name, level, message template & args, are only counted while it is
+one of the last `window` distinct records. With `window=1`, only consecutive duplicates are collapsed.
+
+The count is passed to the target as a summary record when the run ends (a different record pushes it
+out of the window), when `timeout` seconds pass since the first held duplicate, or when the handler is
+flushed or closed. The summary is a copy of the last duplicate, so its timestamp is the time of the last
+repeat. It has "(message repeated N times)" added to its message, and `repeated` & `first_repeated`
+attributes for formatters that want them.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import logging.handlers
+import threading
+import time
+
+class _Run:
+    __slots__ = ("record", "count", "first")
+
+    def __init__(self, record: logging.LogRecord) -> None:
+        self.record: logging.LogRecord = record
+        self.count: int = 0
+        self.first: float = 0.0
+
+
+class DedupHandler(logging.handlers.MemoryHandler):
+    """Pass records to a target handler, collapsing duplicates into summary records.
+
+    Params:
+        target (logging.Handler | None): The handler to pass records & summaries to.
+        window (int): How many distinct recent records to track. `1` only collapses consecutive duplicates.
+        timeout (float): The most seconds a duplicate is held before its summary is sent.
+        flushOnClose (bool): When `True`, send held summaries when the handler is closed.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler | None = None,
+        window: int = 1,
+        timeout: float = 5.0,
+        flushOnClose: bool = True,
+    ) -> None:
+        if window < 1 or timeout <= 0:
+            raise ValueError("window must be at least 1, and timeout must be > 0.")
+
+        super().__init__(window, target=target, flushOnClose=flushOnClose)
+
+        self.window: int = window
+        self.timeout: float = timeout
+        self.held: int = 0
+        self.summaries: int = 0
+        self._runs: collections.OrderedDict[tuple, _Run] = collections.OrderedDict()
+        self._stopping: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name=self.__class__.__name__, daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count the record if it repeats a recent one, otherwise pass it to the target."""
+        try:
+            self._dedup(record)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _dedup(self, record: logging.LogRecord) -> None:
+        try:
+            key: tuple = (record.name, record.levelno, record.msg, record.args)
+            run: _Run | None = self._runs.get(key)
+        except TypeError:
+            ## Unhashable msg or args (i.e. a dict), which cannot be compared cheaply
+            self._forward(record)
+
+            return
+
+        if run is not None:
+            self._runs.move_to_end(key)
+            if run.count and record.created - run.first >= self.timeout:
+                self._summarize(run)
+            if not run.count:
+                run.first = record.created
+            run.count += 1
+            run.record = record
+            self.held += 1
+
+            return
+
+        self._runs[key] = _Run(record)
+        if len(self._runs) > self.window:
+            self._summarize(self._runs.popitem(last=False)[1])
+        self._forward(record)
+
+    def _forward(self, record: logging.LogRecord) -> None:
+        if self.target is not None and record.levelno >= self.target.level:
+            self.target.handle(record)
+
+    def _summarize(self, run: _Run) -> None:
+        """Pass a summary of a run's held duplicates to the target, and reset its count."""
+        if not run.count:
+            return
+
+        try:
+            message: str = run.record.getMessage()
+        except Exception:
+            ## The args do not match the template. The summary is also sent from the timeout thread &
+            #  flush(), where an error would stop the thread or abort shutdown
+            message = str(run.record.msg)
+
+        summary: logging.LogRecord = logging.makeLogRecord(run.record.__dict__)
+        summary.msg = f"{message} (message repeated {run.count} times)"
+        summary.args = ()
+        summary.exc_info = None
+        summary.exc_text = None
+        summary.repeated = run.count
+        summary.first_repeated = run.first
+
+        run.count = 0
+        self.summaries += 1
+        self._forward(summary)
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.timeout / 2):
+            ## Never block on the handler's lock: logging.shutdown() holds it while closing this handler,
+            #  and close() waits for this thread
+            if not self.lock.acquire(timeout=self.timeout / 2):
+                continue
+            try:
+                now: float = time.time()
+                for run in self._runs.values():
+                    if run.count and now - run.first >= self.timeout:
+                        self._summarize(run)
+            finally:
+                self.lock.release()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Return `False`, records are passed on by `emit()` instead of buffered for a flush."""
+        return False
+
+    def flush(self) -> None:
+        """Send the summaries of all held duplicates, then flush the target."""
+        with self.lock:
+            for run in self._runs.values():
+                self._summarize(run)
+            if self.target is not None:
+                self.target.flush()
+
+    def close(self) -> None:
+        """Stop the timeout thread, and send held summaries if `flushOnClose` is `True`."""
+        self._stopping.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        try:
+            if self.flushOnClose:
+                self.flush()
+        finally:
+            with self.lock:
+                self.target = None
+                self._runs.clear()
+                logging.Handler.close(self)
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} window={self.window} timeout={self.timeout} ({level})>"
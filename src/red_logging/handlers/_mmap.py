@@ -0,0 +1,222 @@
+"""An append-only file handler that copies records into a memory-mapped file instead of calling `write()`.
+
+The log file is pre-sized in chunks (`chunk_size`) and mapped into memory, so appending a record is a
+memory copy into the page cache, with no syscall. When a record does not fit, the file is grown by
+another chunk and remapped, or rotated if it has reached `maxBytes`.
+
+File layout:
+
+- A fixed-size header (`MMAP_HEADER_SIZE` bytes): an 8 byte magic value (`MMAP_MAGIC`), followed by
+  the committed length of the log data as an unsigned 64-bit little-endian int.
+- The log data, followed by zeroed space reserved for future records.
+
+The committed length is only updated after a record has been copied, so if the process crashes, a reader
+knows exactly where the valid data ends. Use `read_mmap_log()` to read the data back. When the handler is
+closed cleanly, the file is truncated to the end of the committed data.
+"""
+
+from __future__ import annotations
+
+import locale
+import logging
+import mmap
+import os
+import struct
+import typing as t
+
+from red_logging.formatters import format_bytes
+
+MMAP_MAGIC: bytes = b"RLMMAP01"
+MMAP_HEADER: struct.Struct = struct.Struct("<8sQ")
+MMAP_HEADER_SIZE: int = 64
+## Offset of the committed length in the header, after the magic
+_COMMITTED_OFFSET: int = len(MMAP_MAGIC)
+_COMMITTED: struct.Struct = struct.Struct("<Q")
+
+
+def read_mmap_log(filename: t.Union[str, os.PathLike]) -> bytes:
+    """Return the committed log data from a file written by `MmapFileHandler`.
+
+    Params:
+        filename (str | PathLike): The memory-mapped log file.
+
+    Returns:
+        (bytes): The log data, up to the committed length in the file's header.
+
+    Raises:
+        ValueError: When the file does not start with a `MmapFileHandler` header.
+
+    """
+    with open(filename, "rb") as f:
+        header: bytes = f.read(MMAP_HEADER_SIZE)
+        if len(header) < MMAP_HEADER.size:
+            raise ValueError(f"'{filename}' is too short to be a memory-mapped log file.")
+
+        magic, committed = MMAP_HEADER.unpack_from(header)
+        if magic != MMAP_MAGIC:
+            raise ValueError(f"'{filename}' is not a memory-mapped log file.")
+
+        return f.read(committed)
+
+
+class MmapFileHandler(logging.Handler):
+    """Append log records to a memory-mapped file that grows (or rotates) in chunks.
+
+    Params:
+        filename (str): The name/path of the file to log messages to.
+        chunk_size (int): How many bytes to grow the file by when it is full. Rounded up to a multiple
+            of the OS's memory page size.
+        maxBytes (int): Rotate the file when its log data would exceed this many bytes. `0` disables rotation.
+        backupCount (int): Number of rotated log files to keep. `0` disables rotation.
+        encoding (str | None): The encoding to use for log messages. Defaults to the locale's encoding.
+        errors (str | None): How encoding errors are handled, i.e. `strict`, `replace`.
+    """
+
+    terminator: str = "\n"
+
+    def __init__(
+        self,
+        filename: str,
+        chunk_size: int = 4 * 1024 * 1024,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str | None = None,
+        errors: str | None = None,
+    ) -> None:
+        super().__init__()
+
+        self.baseFilename: str = os.path.abspath(os.fspath(filename))
+        self.chunk_size: int = max(
+            mmap.ALLOCATIONGRANULARITY,
+            -(-chunk_size // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY,
+        )
+        self.maxBytes: int = maxBytes
+        self.backupCount: int = backupCount
+        self.encoding: str = (
+            locale.getpreferredencoding(False) if encoding is None else encoding
+        )
+        self.errors: str = errors or "strict"
+
+        self._fd: int | None = None
+        self._mm: mmap.mmap | None = None
+        self._capacity: int = 0
+        self._offset: int = MMAP_HEADER_SIZE
+        self._open()
+
+    def _open(self) -> None:
+        """Open & map the log file, continuing after its committed data if it already exists."""
+        self._fd = os.open(self.baseFilename, os.O_RDWR | os.O_CREAT, 0o644)
+        size: int = os.fstat(self._fd).st_size
+
+        if size == 0:
+            committed: int = 0
+        else:
+            header: bytes = os.pread(self._fd, MMAP_HEADER.size, 0)
+            magic, committed = (
+                MMAP_HEADER.unpack(header)
+                if len(header) == MMAP_HEADER.size
+                else (b"", 0)
+            )
+            if magic != MMAP_MAGIC:
+                os.close(self._fd)
+                self._fd = None
+                raise ValueError(
+                    f"'{self.baseFilename}' exists and is not a memory-mapped log file."
+                )
+
+        self._offset = MMAP_HEADER_SIZE + committed
+        self._map(max(size, self._offset + 1))
+
+        if size == 0:
+            MMAP_HEADER.pack_into(self._mm, 0, MMAP_MAGIC, 0)
+
+    def _map(self, min_size: int) -> None:
+        """(Re)map the file, growing it to at least `min_size` bytes in whole chunks."""
+        if self._mm is not None:
+            self._mm.close()
+
+        capacity: int = -(-min_size // self.chunk_size) * self.chunk_size
+        if capacity > os.fstat(self._fd).st_size:
+            os.ftruncate(self._fd, capacity)
+
+        self._mm = mmap.mmap(self._fd, capacity)
+        self._capacity = capacity
+
+    def _close_file(self) -> None:
+        """Unmap the file and truncate it to the end of the committed data."""
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+
+        if self._fd is not None:
+            os.ftruncate(self._fd, self._offset)
+            os.close(self._fd)
+            self._fd = None
+
+    def doRollover(self) -> None:
+        """Close the current file and rotate it, like a `RotatingFileHandler`."""
+        self._close_file()
+
+        for i in range(self.backupCount - 1, 0, -1):
+            sfn: str = f"{self.baseFilename}.{i}"
+            dfn: str = f"{self.baseFilename}.{i + 1}"
+            if os.path.exists(sfn):
+                os.replace(sfn, dfn)
+        os.replace(self.baseFilename, f"{self.baseFilename}.1")
+
+        self._open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Copy a formatted record into the mapped file, then commit its length in the header."""
+        try:
+            data: bytes = format_bytes(self, record, self.encoding, self.errors)
+            start: int = self._offset
+            end: int = start + len(data)
+
+            if (
+                self.maxBytes > 0
+                and self.backupCount > 0
+                and start > MMAP_HEADER_SIZE
+                and end - MMAP_HEADER_SIZE > self.maxBytes
+            ):
+                self.doRollover()
+                start = self._offset
+                end = start + len(data)
+
+            if end > self._capacity:
+                self._map(end)
+
+            mm: mmap.mmap = self._mm
+            mm[start:end] = data
+            ## Commit only after the record is fully copied
+            _COMMITTED.pack_into(mm, _COMMITTED_OFFSET, end - MMAP_HEADER_SIZE)
+            self._offset = end
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Ask the OS to write the mapped pages to disk."""
+        self.acquire()
+        try:
+            if self._mm is not None:
+                self._mm.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Unmap the file and truncate it to the end of the committed data."""
+        self.acquire()
+        try:
+            self._close_file()
+        finally:
+            self.release()
+
+        super().close()
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.baseFilename} ({level})>"
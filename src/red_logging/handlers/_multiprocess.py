@@ -0,0 +1,170 @@
+"""A size-based rotating file handler that is safe to share between processes, i.e. pre-fork servers.
+
+When several processes log to the same file with a stdlib `RotatingFileHandler`, each one rotates the
+file on its own schedule, so rotations are duplicated and lines are lost when a file is renamed out
+from under another process. `MultiProcessRotatingFileHandler` avoids this without locking on every record:
+
+- Each record is encoded and written with a single `os.write()` to a file opened with `O_APPEND`, which
+  the OS appends atomically, so lines from different processes never interleave.
+- Before writing, the log file's path is `stat()`-ed. If the path now points to a different file than
+  the one this process has open, another process rotated it, and the new file is opened.
+- When the file is full, an exclusive POSIX advisory lock (`fcntl.flock()`) is taken on a separate lock
+  file. The size is checked again while holding the lock, so only 1 process performs the rename chain;
+  the others see the new file and reopen it.
+
+The rename chain is the same as the stdlib `RotatingFileHandler`, so `backupCount` works the same way.
+This handler requires a POSIX platform (Linux, macOS, BSD).
+"""
+
+from __future__ import annotations
+
+import locale
+import logging
+import os
+import typing as t
+
+from red_logging.formatters import format_bytes
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class MultiProcessRotatingFileHandler(logging.Handler):
+    """Rotate a log file by size, coordinating rollovers between processes with an advisory lock.
+
+    Params:
+        filename (str): The name/path of the file to log messages to.
+        maxBytes (int): The maximum size of the file (in bytes) before it is rotated. `0` disables rotation.
+        backupCount (int): Number of rotated log files to keep. `0` disables rotation.
+        encoding (str | None): The encoding to use for log messages. Defaults to the locale's encoding.
+        errors (str | None): How encoding errors are handled, i.e. `strict`, `replace`.
+        lock_filename (str | None): The file to take the rollover lock on. Defaults to `<filename>.lock`.
+    """
+
+    terminator: str = "\n"
+
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str | None = None,
+        errors: str | None = None,
+        lock_filename: str | None = None,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError(
+                "MultiProcessRotatingFileHandler requires fcntl, which is only available on POSIX platforms."
+            )
+
+        super().__init__()
+
+        self.baseFilename: str = os.path.abspath(os.fspath(filename))
+        self.lockFilename: str = os.path.abspath(
+            os.fspath(lock_filename or f"{self.baseFilename}.lock")
+        )
+        self.maxBytes: int = maxBytes
+        self.backupCount: int = backupCount
+        self.encoding: str = (
+            locale.getpreferredencoding(False) if encoding is None else encoding
+        )
+        self.errors: str = errors or "strict"
+
+        self._fd: int | None = None
+        self._ino: tuple[int, int] | None = None
+        self._open()
+
+    def _open(self) -> None:
+        """(Re)open the log file for appending, and remember which file it is."""
+        if self._fd is not None:
+            os.close(self._fd)
+
+        self._fd = os.open(
+            self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        _stat: os.stat_result = os.fstat(self._fd)
+        self._ino = (_stat.st_dev, _stat.st_ino)
+
+    def _current_size(self) -> int | None:
+        """Return the size of the file at `baseFilename`, reopening it first if another process rotated it."""
+        try:
+            _stat: os.stat_result = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            ## Mid-rotation in another process, or the file was removed
+            self._open()
+
+            return 0
+
+        if (_stat.st_dev, _stat.st_ino) != self._ino:
+            self._open()
+
+        return _stat.st_size
+
+    def _rotate_backups(self) -> None:
+        """Rename `app.log` -> `app.log.1` -> `app.log.2` ..., dropping the oldest backup."""
+        for i in range(self.backupCount - 1, 0, -1):
+            sfn: str = f"{self.baseFilename}.{i}"
+            dfn: str = f"{self.baseFilename}.{i + 1}"
+            if os.path.exists(sfn):
+                os.replace(sfn, dfn)
+
+        os.replace(self.baseFilename, f"{self.baseFilename}.1")
+
+    def doRollover(self, incoming: int = 0) -> None:
+        """Rotate the log file, unless another process has already done it.
+
+        Params:
+            incoming (int): The size of the record waiting to be written, used to re-check if the
+                file still needs to be rotated after the lock is taken.
+        """
+        lock_fd: int = os.open(self.lockFilename, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            try:
+                size: int = self._current_size()
+                ## Another process may have rotated the file while this one waited for the lock
+                if 0 < size and size + incoming >= self.maxBytes:
+                    self._rotate_backups()
+                    self._open()
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        finally:
+            os.close(lock_fd)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record with a single `O_APPEND` write, rotating the file first if it is full."""
+        try:
+            data: bytes = format_bytes(self, record, self.encoding, self.errors)
+
+            if self.maxBytes > 0 and self.backupCount > 0:
+                size: int = self._current_size()
+                if size + len(data) >= self.maxBytes:
+                    self.doRollover(incoming=len(data))
+
+            view: memoryview = memoryview(data)
+            while view:
+                written: int = os.write(self._fd, view)
+                view = view[written:]
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Close the log file."""
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+
+        super().close()
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.baseFilename} ({level})>"
@@ -0,0 +1,130 @@
+"""A QueueHandler that owns its QueueListener, so it can be built from a logging dictConfig.
+
+The handler is referenced in a dictConfig with the `()` key and a list of handler names, i.e.
+`{"()": "red_logging.handlers.QueuedHandler", "handlers": ["console", "app_file"]}`. The named
+handlers are looked up when the handler is initialized, or when the first record arrives if
+`dictConfig()` has not built them yet. A `QueueListener` is attached to them and its thread is
+started. Calling `.close()` (which `logging.shutdown()` does at exit) drains the queue and stops
+the listener thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import queue
+import typing as t
+
+def _get_handler_by_name(name: str) -> logging.Handler | None:
+    """Return a handler that was configured with `name`, or `None` if it does not exist yet."""
+    ## logging.getHandlerByName() was added in Python 3.12
+    _getter = getattr(logging, "getHandlerByName", None)
+    if _getter is not None:
+        return _getter(name)
+
+    return logging._handlers.get(name)
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """A QueueListener that waits for room on a full queue when it is stopped."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class QueuedHandler(logging.handlers.QueueHandler):
+    """Put log records on a queue, and write them to other handlers from a background thread.
+
+    Params:
+        handlers (list[str | logging.Handler]): The handlers (or handler names) the listener thread
+            should pass records to. Handler names must exist in the same logging dictConfig.
+        queue_size (int): The maximum number of records the queue can hold. `0` means no limit.
+        block (bool): What to do when the queue is full. When `True`, the logging call waits for
+            space on the queue. When `False`, the record is dropped and `.dropped` is incremented.
+        respect_handler_level (bool): When `True`, the listener checks each handler's level before
+            passing a record to it.
+    """
+
+    def __init__(
+        self,
+        handlers: list[t.Union[str, logging.Handler]] = None,
+        queue_size: int = 0,
+        block: bool = False,
+        respect_handler_level: bool = True,
+    ) -> None:
+        if not handlers:
+            raise ValueError("QueuedHandler needs at least 1 handler to write to.")
+
+        super().__init__(queue.Queue(maxsize=queue_size))
+
+        self.block: bool = block
+        self.dropped: int = 0
+        self.respect_handler_level: bool = respect_handler_level
+        self.listener: logging.handlers.QueueListener | None = None
+        self._targets: list[t.Union[str, logging.Handler]] = list(handlers)
+        self._closed: bool = False
+
+        ## dictConfig() builds handlers in order of their names, so the target handlers might
+        #  not exist yet. In that case, the listener is started when the first record arrives.
+        if all(
+            isinstance(handler, logging.Handler)
+            or _get_handler_by_name(handler) is not None
+            for handler in self._targets
+        ):
+            self.start()
+
+    def start(self) -> None:
+        """Look up the target handlers and start the listener thread."""
+        _handlers: list[logging.Handler] = []
+        for handler in self._targets:
+            if isinstance(handler, logging.Handler):
+                _handlers.append(handler)
+                continue
+
+            _handler: logging.Handler | None = _get_handler_by_name(handler)
+            if _handler is None:
+                raise ValueError(f"Unable to find handler '{handler}' for QueuedHandler.")
+
+            _handlers.append(_handler)
+
+        self.listener = _QueueListener(
+            self.queue, *_handlers, respect_handler_level=self.respect_handler_level
+        )
+        self.listener.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Start the listener if it is not running yet, then put the record on the queue."""
+        if self.listener is None:
+            if self._closed:
+                return
+
+            try:
+                self.start()
+            except Exception:
+                self.handleError(record)
+
+                return
+
+        super().emit(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, or drop it if the queue is full and `block=False`."""
+        try:
+            self.queue.put(record, block=self.block)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Stop the listener thread after it has written any records left in the queue."""
+        self.acquire()
+        try:
+            listener = self.listener
+            self.listener = None
+            self._closed = True
+        finally:
+            self.release()
+
+        if listener is not None:
+            listener.stop()
+
+        super().close()
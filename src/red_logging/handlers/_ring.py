@@ -0,0 +1,162 @@
+"""A flight-recorder handler, which keeps the most recent records and dumps them when an error is logged.
+
+Loggers can keep a DEBUG level while the handlers that write to disk stay at INFO. `RingBufferHandler`
+holds the last `capacity` records in a ring of slots that is allocated once, when the handler is
+created. Storing a record only replaces a slot, and the oldest record is dropped (without being
+formatted) when the ring is full. When a record at `flushLevel` or above arrives, the ring is
+dumped, oldest first, to the `target` handler, so the error is written with the DEBUG records that
+led up to it.
+
+`RingBufferHandler` is a `MemoryHandler`, so `logging.config.dictConfig()` resolves its `target`
+from a handler name, i.e. `{"class": "red_logging.handlers.RingBufferHandler", "target": "crash_file"}`.
+"""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import sys
+import typing as t
+
+class RingBufferHandler(logging.handlers.MemoryHandler):
+    """Keep the last `capacity` records, and pass them to a target handler when an error is logged.
+
+    Unlike a `MemoryHandler`, a full buffer is not flushed. The oldest record is replaced instead, so
+    records only reach the target when one at `flushLevel` or above arrives, or when `dump()` is called.
+
+    Params:
+        capacity (int): The number of records to keep.
+        flushLevel (int | str): Dump the ring when a record at this level or above arrives.
+        target (logging.Handler | None): The handler to dump records to. Its level should be low enough
+            to accept the buffered records, i.e. `DEBUG`.
+        flushOnClose (bool): When `True`, dump the ring when the handler is closed.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        flushLevel: t.Union[int, str] = logging.ERROR,
+        target: logging.Handler | None = None,
+        flushOnClose: bool = False,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, not {capacity}.")
+
+        super().__init__(
+            capacity,
+            flushLevel=logging._checkLevel(flushLevel),
+            target=target,
+            flushOnClose=flushOnClose,
+        )
+
+        self.buffer: list[logging.LogRecord | None] = [None] * capacity
+        self.dumps: int = 0
+        self.overwritten: int = 0
+        self._next: int = 0
+        self._full: bool = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the record in the next slot, and dump the ring if the record is at `flushLevel`."""
+        if self._full:
+            self.overwritten += 1
+        self.buffer[self._next] = record
+        self._next += 1
+        if self._next == self.capacity:
+            self._next = 0
+            self._full = True
+
+        if record.levelno >= self.flushLevel:
+            self.dump()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Return `True` if the record should trigger a dump of the ring."""
+        return record.levelno >= self.flushLevel
+
+    def records(self) -> list[logging.LogRecord]:
+        """Return the records in the ring, oldest first."""
+        with self.lock:
+            return self._ordered()
+
+    def _ordered(self) -> list[logging.LogRecord]:
+        if self._full:
+            return self.buffer[self._next :] + self.buffer[: self._next]
+
+        return self.buffer[: self._next]
+
+    def dump(self) -> None:
+        """Pass the records in the ring to the target handler, oldest first, and empty the ring.
+
+        The records are kept if there is no target handler.
+        """
+        with self.lock:
+            if self.target is None:
+                return
+
+            ## Walk the ring in place, oldest first, instead of building an ordered list of it
+            buffer: list[logging.LogRecord | None] = self.buffer
+            start: int = self._next if self._full else 0
+            for i in range(self._occupied()):
+                record: logging.LogRecord = buffer[(start + i) % self.capacity]
+                if record.levelno >= self.target.level:
+                    self.target.handle(record)
+            self.target.flush()
+
+            self._clear()
+            self.dumps += 1
+
+    def _occupied(self) -> int:
+        return self.capacity if self._full else self._next
+
+    def _clear(self) -> None:
+        """Empty the occupied slots, without allocating a new ring."""
+        buffer: list[logging.LogRecord | None] = self.buffer
+        for i in range(self._occupied()):
+            buffer[i] = None
+        self._next = 0
+        self._full = False
+
+    def flush(self) -> None:
+        """Flush the target handler. Buffered records are only written by `dump()`.
+
+        `logging.shutdown()` calls `.flush()` on every handler at exit, which would otherwise write
+        the whole ring to the target when no error happened.
+        """
+        with self.lock:
+            if self.target is not None:
+                self.target.flush()
+
+    def close(self) -> None:
+        """Dump the ring if `flushOnClose` is `True`, then drop the buffered records."""
+        try:
+            if self.flushOnClose:
+                self.dump()
+        finally:
+            with self.lock:
+                self.target = None
+                self._clear()
+                logging.Handler.close(self)
+
+    def memory_usage(self) -> int:
+        """Return an estimate of the memory held by the ring, in bytes.
+
+        Counts the ring itself, and each buffered record with its attribute dict and message.
+        Objects shared with the rest of the program (like the values in `args`) are not counted.
+        """
+        with self.lock:
+            size: int = sys.getsizeof(self.buffer)
+            for record in self._ordered():
+                size += (
+                    sys.getsizeof(record)
+                    + sys.getsizeof(record.__dict__)
+                    + sys.getsizeof(record.msg)
+                )
+
+            return size
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+        flush_level: str = logging.getLevelName(self.flushLevel)
+
+        return (
+            f"<{self.__class__.__name__} capacity={self.capacity} flushLevel={flush_level} ({level})>"
+        )
@@ -0,0 +1,275 @@
+"""Rotating file handlers that rename, compress & delete rotated files on a background thread.
+
+The stdlib rotating handlers run the whole rollover inside `emit()`, while the handler's lock is held,
+so every thread that logs waits for the rename chain & old backup cleanup to finish. These handlers
+only do 1 rename (the current log file to a temporary "staged" name) and open a fresh file on the
+logging thread. The rest of the rollover (shifting backups, renaming the staged file to its final name,
+compressing it and deleting old backups) is handed to a background worker thread. Jobs run in the
+order they were submitted, so `backupCount` behaves the same as it does in the stdlib handlers.
+
+Rotated files can be compressed with `gzip`, `bz2` or `lzma`. When compression is enabled and no
+`namer` is set, the compression's extension (`.gz`, `.bz2`, `.xz`) is added to rotated file names.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import logging
+import logging.handlers
+import lzma
+import os
+import queue
+import shutil
+import threading
+import time
+import traceback
+import typing as t
+
+COMPRESSION_OPENERS: dict[str, t.Callable[..., t.IO[bytes]]] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "lzma": lzma.open,
+}
+COMPRESSION_EXTENSIONS: dict[str, str] = {"gzip": ".gz", "bz2": ".bz2", "lzma": ".xz"}
+
+
+def compress_file(source: str, dest: str, compression: str) -> None:
+    """Compress `source` into `dest` with one of the stdlib compression modules, then remove `source`.
+
+    Params:
+        source (str): Path to the file to compress.
+        dest (str): Path to the compressed file. It is written to a temporary file first, then
+            renamed, so a partial `dest` is never left behind.
+        compression (str): `gzip`, `bz2` or `lzma`.
+    """
+    opener = COMPRESSION_OPENERS[compression]
+    tmp_dest: str = f"{dest}.tmp"
+
+    with open(source, "rb") as src, opener(tmp_dest, "wb") as dst:
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+    os.replace(tmp_dest, dest)
+    os.remove(source)
+
+
+class _RotationWorker:
+    """Run rollover jobs one at a time, in the order they were submitted, on a daemon thread."""
+
+    def __init__(self, name: str) -> None:
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, func: t.Callable[..., None], *args: t.Any) -> None:
+        self._jobs.put((func, args))
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+
+            func, args = job
+            try:
+                func(*args)
+            except Exception:
+                ## There is no record to pass to handleError(), so mimic its output
+                if logging.raiseExceptions:
+                    traceback.print_exc()
+
+    def stop(self) -> None:
+        """Wait for all submitted jobs to finish, then stop the thread."""
+        if self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join()
+
+
+class _BackgroundRotationMixin:
+    """Shared setup for handlers that finish their rollovers on a `_RotationWorker`."""
+
+    baseFilename: str
+    namer: t.Callable[[str], str] | None
+
+    def _init_background_rotation(self, compression: str | None) -> None:
+        if compression is not None and compression not in COMPRESSION_OPENERS:
+            raise ValueError(
+                f"Invalid compression: '{compression}'. Must be one of {list(COMPRESSION_OPENERS)}"
+            )
+
+        self.compression: str | None = compression
+        if compression is not None and self.namer is None:
+            self.namer = self._compression_namer
+
+        self._worker: _RotationWorker = _RotationWorker(
+            name=f"{self.__class__.__name__}({self.baseFilename})"
+        )
+
+    def _compression_namer(self, default_name: str) -> str:
+        return f"{default_name}{COMPRESSION_EXTENSIONS[self.compression]}"
+
+    def _stage(self, source: str) -> str | None:
+        """Rename the current log file out of the way, so a new one can be opened right away."""
+        if not os.path.exists(source):
+            return None
+
+        staged: str = f"{source}.rotating-{time.monotonic_ns()}"
+        os.rename(source, staged)
+
+        return staged
+
+    def _finish(self, staged: str, dest: str) -> None:
+        """Move a staged log file to its rotated name, compressing it if configured."""
+        if os.path.exists(dest):
+            os.remove(dest)
+
+        if self.compression is not None:
+            compress_file(staged, dest, self.compression)
+        else:
+            os.rename(staged, dest)
+
+    def _stop_worker(self) -> None:
+        self._worker.stop()
+
+
+class BackgroundRotatingFileHandler(
+    _BackgroundRotationMixin, logging.handlers.RotatingFileHandler
+):
+    """A RotatingFileHandler that renames, compresses & deletes rotated files on a background thread.
+
+    Params:
+        filename (str): The name/path of the file to log messages to.
+        mode (str): The mode to open the file in.
+        maxBytes (int): The maximum size of the file (in bytes) before it is rotated.
+        backupCount (int): Number of rotated log files to keep.
+        encoding (str | None): The encoding to use for log messages.
+        delay (bool): When `True`, the file is not opened until the first record is emitted.
+        errors (str | None): How encoding errors are handled.
+        compression (str | None): Compress rotated files with `gzip`, `bz2` or `lzma`. `None` disables compression.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+        compression: str | None = None,
+    ) -> None:
+        super().__init__(
+            filename,
+            mode=mode,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+            errors=errors,
+        )
+        self._init_background_rotation(compression=compression)
+
+    def doRollover(self) -> None:
+        """Stage the current log file and open a new one. The backups are rotated by the worker thread."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if self.backupCount > 0:
+            staged: str | None = self._stage(self.baseFilename)
+            if staged is not None:
+                self._worker.submit(self._rotate_backups, staged)
+
+        if not self.delay:
+            self.stream = self._open()
+
+    def _rotate_backups(self, staged: str) -> None:
+        """Shift each backup up by 1 (dropping the oldest), then move the staged file to backup `.1`."""
+        for i in range(self.backupCount - 1, 0, -1):
+            sfn: str = self.rotation_filename(f"{self.baseFilename}.{i}")
+            dfn: str = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+            if os.path.exists(sfn):
+                if os.path.exists(dfn):
+                    os.remove(dfn)
+                os.rename(sfn, dfn)
+
+        self._finish(staged, self.rotation_filename(f"{self.baseFilename}.1"))
+
+    def close(self) -> None:
+        """Close the log file, then wait for any pending rollovers to finish."""
+        try:
+            super().close()
+        finally:
+            self._stop_worker()
+
+
+class BackgroundTimedRotatingFileHandler(
+    _BackgroundRotationMixin, logging.handlers.TimedRotatingFileHandler
+):
+    """A TimedRotatingFileHandler that renames, compresses & deletes rotated files on a background thread.
+
+    Params:
+        filename (str): The name/path of the file to log messages to.
+        when (str): The type of interval to rotate on, i.e. `S`, `M`, `H`, `D`, `midnight`, `W0`-`W6`.
+        interval (int): Rotate every `interval` occurrences of `when`.
+        backupCount (int): Number of rotated log files to keep.
+        encoding (str | None): The encoding to use for log messages.
+        delay (bool): When `True`, the file is not opened until the first record is emitted.
+        utc (bool): When `True`, rotation times & file names use UTC instead of local time.
+        atTime (datetime.time | None): The time of day to rotate at, for `midnight` & weekly rotation.
+        errors (str | None): How encoding errors are handled.
+        compression (str | None): Compress rotated files with `gzip`, `bz2` or `lzma`. `None` disables compression.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        when: str = "h",
+        interval: int = 1,
+        backupCount: int = 0,
+        encoding: str | None = None,
+        delay: bool = False,
+        utc: bool = False,
+        atTime: t.Any = None,
+        errors: str | None = None,
+        compression: str | None = None,
+    ) -> None:
+        super().__init__(
+            filename,
+            when=when,
+            interval=interval,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+            utc=utc,
+            atTime=atTime,
+            errors=errors,
+        )
+        self._init_background_rotation(compression=compression)
+
+    def rotate(self, source: str, dest: str) -> None:
+        """Stage the current log file. It is moved to `dest` and old backups are deleted by the worker thread."""
+        staged: str | None = self._stage(source)
+        if staged is not None:
+            self._worker.submit(self._rotate_backups, staged, dest)
+
+    def getFilesToDelete(self) -> list[str]:
+        """Return no files, old backups are deleted by the worker thread after each rotation."""
+        return []
+
+    def _rotate_backups(self, staged: str, dest: str) -> None:
+        self._finish(staged, dest)
+
+        if self.backupCount > 0:
+            for s in logging.handlers.TimedRotatingFileHandler.getFilesToDelete(self):
+                os.remove(s)
+
+    def close(self) -> None:
+        """Close the log file, then wait for any pending rollovers to finish."""
+        try:
+            super().close()
+        finally:
+            self._stop_worker()
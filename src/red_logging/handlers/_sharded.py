@@ -0,0 +1,131 @@
+"""A file handler that writes 1 file ("shard") per process, i.e. `app.log` -> `app.<pid>.log`.
+
+Because each process has its own file, there is no contention between processes at all. The shards
+can be combined into a single, time-ordered stream with `python -m red_logging.merge`.
+
+Before a record is formatted, the handler sets 2 attributes on it, which can be used in a format string:
+
+- `%(seq)d`: A sequence number that increases by 1 for each record written to the shard.
+- `%(created_ns)d`: The record's creation time, in nanoseconds since the epoch, from `time.time_ns()`.
+
+`created_ns` is set when the record is created, by a record factory the handler installs (wrapping the
+current factory) the first time a `ShardedFileHandler` is created. `record.created` is a float, which
+cannot hold a nanosecond timestamp at today's epoch. A record created before the factory was installed
+gets its `created_ns` when it is emitted.
+
+`red_logging.fmts.MESSAGE_FMT_SHARDED` starts with both of these, so the merge tool can order records
+from different processes exactly. Shards written with other formats that start with a timestamp, like
+`MESSAGE_FMT_STANDARD`, can also be merged, using the timestamp's resolution.
+
+If the process forks after the handler is created (i.e. gunicorn with `--preload`), the child process
+switches to its own shard automatically.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+from pathlib import Path
+import time
+import typing as t
+import weakref
+
+_SHARDED_HANDLERS: weakref.WeakSet = weakref.WeakSet()
+
+
+def shard_filename(filename: t.Union[str, Path], pid: int | None = None) -> str:
+    """Return the name of a process's shard of a log file, i.e. `logs/app.log` -> `logs/app.1234.log`.
+
+    Params:
+        filename (str | Path): The log file name the shards are based on.
+        pid (int | None): The process ID to build the shard name for. Defaults to the current process.
+
+    Returns:
+        (str): The shard's file name.
+
+    """
+    pid = os.getpid() if pid is None else pid
+    _path: Path = Path(filename)
+    if _path.suffix:
+        return str(_path.with_name(f"{_path.stem}.{pid}{_path.suffix}"))
+
+    return f"{_path}.{pid}"
+
+
+def _reopen_shards_in_child() -> None:
+    """Point every ShardedFileHandler at a new shard for this (forked) process."""
+    for handler in list(_SHARDED_HANDLERS):
+        handler._switch_shard()
+
+
+def _install_record_factory() -> None:
+    """Wrap the current record factory, so each record gets a `created_ns` when it is created."""
+    factory: t.Callable[..., logging.LogRecord] = logging.getLogRecordFactory()
+    if getattr(factory, "sets_created_ns", False):
+        return
+
+    def record_factory(*args: t.Any, **kwargs: t.Any) -> logging.LogRecord:
+        record: logging.LogRecord = factory(*args, **kwargs)
+        record.created_ns = time.time_ns()
+
+        return record
+
+    record_factory.sets_created_ns = True
+    logging.setLogRecordFactory(record_factory)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_shards_in_child)
+
+
+class ShardedFileHandler(logging.FileHandler):
+    """Write log records to a file named after the current process ID.
+
+    Params:
+        filename (str): The log file name to build shard names from, i.e. `app.log` for `app.<pid>.log`.
+        mode (str): The mode to open the shard in.
+        encoding (str | None): The encoding to use for log messages.
+        delay (bool): When `True`, the shard is not opened until the first record is emitted.
+        errors (str | None): How encoding errors are handled.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+    ) -> None:
+        self.shardBasename: str = os.path.abspath(os.fspath(filename))
+        self._seq: t.Iterator[int] = itertools.count(1)
+
+        super().__init__(
+            shard_filename(self.shardBasename),
+            mode=mode,
+            encoding=encoding,
+            delay=delay,
+            errors=errors,
+        )
+        _SHARDED_HANDLERS.add(self)
+        _install_record_factory()
+
+    def _switch_shard(self) -> None:
+        """Close the parent's shard in this process and use this process's own shard."""
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except Exception:
+                pass
+            self.stream = None
+        self.baseFilename = shard_filename(self.shardBasename)
+        self._seq = itertools.count(1)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Set the record's sequence number & nanosecond timestamp, then write it to the shard."""
+        record.seq = next(self._seq)
+        if "created_ns" not in record.__dict__:
+            record.created_ns = time.time_ns()
+
+        super().emit(record)
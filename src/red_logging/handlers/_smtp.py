@@ -0,0 +1,259 @@
+"""An SMTP handler that sends 1 digest email per window, instead of 1 email per record.
+
+The stdlib `SMTPHandler` connects to the mail server & sends an email inside `emit()`, for every record.
+`DigestSMTPHandler` only counts records in `emit()`, grouped by level, logger name & message template
+(the unformatted `msg`, i.e. `"Connection to %s failed"`), and keeps a formatted example of the first
+record in each group. Every `window_seconds`, a background thread sends a digest of the groups.
+
+At most `max_emails_per_hour` digests are sent in any hour. When the limit is reached, records keep
+being counted, and the next digest covers the whole period since the last one that was sent. If a digest
+cannot be sent, its counts are kept for the next attempt.
+"""
+
+from __future__ import annotations
+
+import collections
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+import email.utils
+import logging
+import smtplib
+import ssl
+import threading
+import time
+import traceback
+import typing as t
+
+## Records that do not fit in `max_groups` are counted under this key
+_OVERFLOW_KEY: tuple[str, str, str] = ("", "", "")
+
+
+@dataclass
+class _DigestGroup:
+    """Counts for records with the same level, logger name & message template."""
+
+    count: int = 0
+    first: float = 0.0
+    last: float = 0.0
+    example: str = ""
+
+    def merge(self, other: _DigestGroup) -> None:
+        if not self.count:
+            self.first, self.example = other.first, other.example
+        self.count += other.count
+        self.first = min(self.first, other.first)
+        self.last = max(self.last, other.last)
+
+
+@dataclass
+class _Digest:
+    groups: dict[tuple[str, str, str], _DigestGroup] = field(default_factory=dict)
+    records: int = 0
+
+
+class DigestSMTPHandler(logging.Handler):
+    """Collect log records into a digest email, sent from a background thread at most once per window.
+
+    Params:
+        mailhost (str | tuple[str, int]): The mail server, i.e. `"localhost"` or `("smtp.example.com", 587)`.
+        fromaddr (str): The address the digest is sent from.
+        toaddrs (str | list[str]): The address(es) the digest is sent to.
+        subject (str): The digest's subject. The number of records in the digest is added to it.
+        credentials (tuple[str, str] | None): A `(username, password)` to log in to the mail server with.
+        secure (tuple | None): When not `None`, use STARTTLS. Like `SMTPHandler`, an empty tuple, or a
+            tuple of `(keyfile,)` or `(keyfile, certfile)`.
+        timeout (float): Timeout (in seconds) for the SMTP connection.
+        window_seconds (float): How long to collect records before sending a digest.
+        max_emails_per_hour (int): The most digests to send in any hour. `0` means no limit.
+        max_groups (int): The most groups to keep in 1 digest. Records that do not fit are only counted.
+    """
+
+    def __init__(
+        self,
+        mailhost: t.Union[str, tuple[str, int], list],
+        fromaddr: str,
+        toaddrs: t.Union[str, list[str]],
+        subject: str,
+        credentials: tuple[str, str] | None = None,
+        secure: tuple | None = None,
+        timeout: float = 5.0,
+        window_seconds: float = 60.0,
+        max_emails_per_hour: int = 12,
+        max_groups: int = 100,
+    ) -> None:
+        super().__init__()
+
+        if isinstance(mailhost, (list, tuple)):
+            self.mailhost, self.mailport = mailhost
+        else:
+            self.mailhost, self.mailport = mailhost, None
+        self.fromaddr: str = fromaddr
+        self.toaddrs: list[str] = [toaddrs] if isinstance(toaddrs, str) else list(toaddrs)
+        self.subject: str = subject
+        self.credentials: tuple[str, str] | None = (
+            tuple(credentials) if credentials else None
+        )
+        self.secure: tuple | None = tuple(secure) if secure is not None else None
+        self.timeout: float = timeout
+        self.window_seconds: float = window_seconds
+        self.max_emails_per_hour: int = max_emails_per_hour
+        self.max_groups: int = max_groups
+
+        self.sent: int = 0
+        self._digest: _Digest = _Digest()
+        self._sent_times: collections.deque[float] = collections.deque()
+        ## Never take the handler's own lock on the sender thread: logging.shutdown() holds it
+        #  while calling flush(), which waits for `_send_lock`
+        self._send_lock: threading.Lock = threading.Lock()
+        self._digest_lock: threading.Lock = threading.Lock()
+        self._stopping: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name=self.__class__.__name__, daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count the record in its group. The first record in a group is formatted as the group's example."""
+        try:
+            key: tuple[str, str, str] = (record.levelname, record.name, str(record.msg))
+            with self._digest_lock:
+                digest: _Digest = self._digest
+                group: _DigestGroup | None = digest.groups.get(key)
+                if group is None:
+                    if len(digest.groups) >= self.max_groups:
+                        key = _OVERFLOW_KEY
+                        group = digest.groups.setdefault(
+                            key, _DigestGroup(first=record.created)
+                        )
+                    else:
+                        group = digest.groups[key] = _DigestGroup(
+                            first=record.created, example=self.format(record)
+                        )
+
+                group.count += 1
+                group.last = record.created
+                digest.records += 1
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.window_seconds):
+            self.send_digest()
+
+    def _allowed(self) -> bool:
+        """Return `True` if another email can be sent without going over `max_emails_per_hour`."""
+        if not self.max_emails_per_hour:
+            return True
+
+        hour_ago: float = time.monotonic() - 3600
+        while self._sent_times and self._sent_times[0] <= hour_ago:
+            self._sent_times.popleft()
+
+        return len(self._sent_times) < self.max_emails_per_hour
+
+    def send_digest(self) -> bool:
+        """Send the records collected so far as a digest, unless the hourly limit has been reached.
+
+        Returns:
+            (bool): `True` if a digest was sent.
+
+        """
+        with self._send_lock:
+            if not self._digest.records or not self._allowed():
+                return False
+
+            with self._digest_lock:
+                digest: _Digest = self._digest
+                self._digest = _Digest()
+
+            try:
+                self._send(self.build_message(digest))
+            except Exception:
+                ## Keep the counts, so they are sent with the next digest
+                self._restore(digest)
+                if logging.raiseExceptions:
+                    traceback.print_exc()
+
+                return False
+
+            self._sent_times.append(time.monotonic())
+            self.sent += 1
+
+            return True
+
+    def _restore(self, digest: _Digest) -> None:
+        with self._digest_lock:
+            for key, group in digest.groups.items():
+                self._digest.groups.setdefault(key, _DigestGroup()).merge(group)
+            self._digest.records += digest.records
+
+    def build_message(self, digest: _Digest) -> EmailMessage:
+        """Build the digest email, with the largest groups first."""
+        groups: list[tuple[tuple[str, str, str], _DigestGroup]] = sorted(
+            digest.groups.items(), key=lambda item: item[1].count, reverse=True
+        )
+        first: float = min(group.first for _, group in groups)
+        last: float = max(group.last for _, group in groups)
+
+        lines: list[str] = [
+            f"{digest.records} log record(s) in {len(groups)} group(s), "
+            f"from {_timestamp(first)} to {_timestamp(last)}.",
+            "",
+        ]
+        for (levelname, name, template), group in groups:
+            if (levelname, name, template) == _OVERFLOW_KEY:
+                lines.append(
+                    f"{group.count} x records in groups over the limit of {self.max_groups}"
+                )
+            else:
+                lines.append(f"{group.count} x [{levelname}] [{name}] {template}")
+            lines.append(f"    first: {_timestamp(group.first)}, last: {_timestamp(group.last)}")
+            if group.example:
+                lines.extend(f"    | {line}" for line in group.example.splitlines())
+            lines.append("")
+
+        msg: EmailMessage = EmailMessage()
+        msg["From"] = self.fromaddr
+        msg["To"] = ",".join(self.toaddrs)
+        msg["Subject"] = f"{self.subject} ({digest.records} records)"
+        msg["Date"] = email.utils.localtime()
+        msg.set_content("\n".join(lines))
+
+        return msg
+
+    def _send(self, msg: EmailMessage) -> None:
+        port: int = self.mailport or smtplib.SMTP_PORT
+        with smtplib.SMTP(self.mailhost, port, timeout=self.timeout) as smtp:
+            if self.secure is not None:
+                ## SMTP.starttls() only takes a context from Python 3.12, so build one from the
+                #  (keyfile, certfile) tuple, as SMTPHandler.emit() does
+                keyfile: str | None = self.secure[0] if len(self.secure) > 0 else None
+                certfile: str | None = self.secure[1] if len(self.secure) > 1 else None
+                context: ssl.SSLContext = ssl._create_stdlib_context(
+                    certfile=certfile, keyfile=keyfile
+                )
+                smtp.ehlo()
+                smtp.starttls(context=context)
+                smtp.ehlo()
+            if self.credentials:
+                smtp.login(*self.credentials)
+            smtp.send_message(msg)
+
+    def flush(self) -> None:
+        """Send the records collected so far, unless the hourly limit has been reached."""
+        self.send_digest()
+
+    def close(self) -> None:
+        """Stop the background thread, and send a final digest if the hourly limit allows."""
+        self._stopping.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.send_digest()
+
+        super().close()
+
+
+def _timestamp(created: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
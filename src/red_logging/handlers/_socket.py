@@ -0,0 +1,340 @@
+"""A socket handler that sends many records per frame from a background thread.
+
+The stdlib `SocketHandler` pickles & sends 1 record per `send()` call, and when the connection is down,
+it tries to reconnect on the thread that is logging. `BatchedSocketHandler` only puts records on a
+queue. A sender thread collects them into batches, and sends each batch as a single frame. If the
+connection fails, the sender reconnects with exponential backoff while records wait in the queue.
+Once the queue is full, new records are dropped (and counted in `.dropped`) instead of blocking.
+
+Wire format: each frame is a 4 byte, big-endian unsigned length, followed by that many bytes of a
+pickled list of `LogRecord` attribute dicts. This is the same framing as the stdlib `SocketHandler`,
+whose frames hold a single pickled dict. `decode_frame()` accepts both, and `iter_frames()` reads
+frames from a socket file, so a receiver can rebuild records with `logging.makeLogRecord()`.
+
+A receiver written for the stdlib `SocketHandler` (`logging.makeLogRecord(pickle.loads(chunk))`, as in
+the logging cookbook) cannot read a list. With `frame_per_record=True`, each record is written as its
+own stdlib frame, holding 1 pickled dict. The frames of a batch are still sent with 1 `sendall()`.
+
+Like the stdlib `SocketHandler`, frames are pickles, so only read them from trusted senders, or decode them
+with `restricted=True`, which refuses to load anything but builtin values.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import pickle
+import queue
+import socket
+import struct
+import threading
+import time
+import typing as t
+
+from red_logging.formatters import FORMAT_CACHE_ATTRIBUTE
+
+FRAME_HEADER: struct.Struct = struct.Struct(">L")
+
+
+def record_to_dict(record: logging.LogRecord) -> dict[str, t.Any]:
+    """Return a picklable copy of a record's attributes, with its message & traceback already formatted.
+
+    Params:
+        record (logging.LogRecord): The record to convert.
+
+    Returns:
+        (dict[str, Any]): The record's attributes, which can be turned back into a record with
+            `logging.makeLogRecord()`.
+
+    """
+    if record.exc_info and not record.exc_text:
+        record.exc_text = logging.Formatter().formatException(record.exc_info)
+
+    record_dict: dict[str, t.Any] = dict(record.__dict__)
+    record_dict["msg"] = record.getMessage()
+    record_dict["args"] = None
+    record_dict["exc_info"] = None
+    record_dict.pop("message", None)
+    record_dict.pop(FORMAT_CACHE_ATTRIBUTE, None)
+
+    return record_dict
+
+
+def encode_frame(records: list[dict[str, t.Any]]) -> bytes:
+    """Pack a list of record dicts into a single length-prefixed frame.
+
+    Params:
+        records (list[dict[str, Any]]): Record dicts, i.e. from `record_to_dict()`.
+
+    Returns:
+        (bytes): The frame, ready to send.
+
+    """
+    payload: bytes = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def encode_record_frames(records: list[dict[str, t.Any]]) -> bytes:
+    """Pack each record dict into its own length-prefixed frame, as the stdlib `SocketHandler` does.
+
+    Params:
+        records (list[dict[str, Any]]): Record dicts, i.e. from `record_to_dict()`.
+
+    Returns:
+        (bytes): The frames, 1 per record, ready to send together.
+
+    """
+    frames: list[bytes] = []
+    for record_dict in records:
+        payload: bytes = pickle.dumps(record_dict, protocol=pickle.HIGHEST_PROTOCOL)
+        frames.append(FRAME_HEADER.pack(len(payload)))
+        frames.append(payload)
+
+    return b"".join(frames)
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """An Unpickler that refuses to load any class or function, so only builtin values are accepted."""
+
+    def find_class(self, module: str, name: str) -> t.Any:
+        raise pickle.UnpicklingError(f"Refusing to unpickle '{module}.{name}' from a log frame")
+
+
+def decode_frame(payload: bytes, restricted: bool = False) -> list[dict[str, t.Any]]:
+    """Unpack the payload of a frame (without its length prefix) into a list of record dicts.
+
+    Params:
+        payload (bytes): A frame payload from a `BatchedSocketHandler` or a stdlib `SocketHandler`.
+        restricted (bool): When `True`, frames that contain anything other than builtin values (strings,
+            numbers, lists, dicts, etc.) raise a `pickle.UnpicklingError` instead of importing classes.
+
+    Returns:
+        (list[dict[str, Any]]): The record dicts in the frame. Pass each to `logging.makeLogRecord()`.
+
+    """
+    obj: t.Any = (
+        _RestrictedUnpickler(io.BytesIO(payload)).load()
+        if restricted
+        else pickle.loads(payload)
+    )
+    if isinstance(obj, dict):
+        ## A stdlib SocketHandler frame holds a single record
+        return [obj]
+
+    return list(obj)
+
+
+def iter_frames(rfile: t.BinaryIO) -> t.Iterator[list[dict[str, t.Any]]]:
+    """Read frames from a binary stream (i.e. `socket.makefile("rb")`) until it is closed.
+
+    Params:
+        rfile (BinaryIO): The stream to read from.
+
+    Returns:
+        (Iterator[list[dict[str, Any]]]): The record dicts in each frame. A partial frame at the end
+            of the stream (i.e. the sender disconnected mid-frame) is ignored.
+
+    """
+    while True:
+        header: bytes = rfile.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            return
+
+        (length,) = FRAME_HEADER.unpack(header)
+        payload: bytes = rfile.read(length)
+        if len(payload) < length:
+            return
+
+        yield decode_frame(payload)
+
+
+class BatchedSocketHandler(logging.Handler):
+    """Send log records to a TCP socket in batches, from a background thread.
+
+    Params:
+        host (str): Host IP/FQDN.
+        port (int): Host port where log messages should be sent.
+        batch_size (int): The maximum number of records to send in 1 frame.
+        flush_interval_ms (int): How long to wait for more records before sending a batch that is not full.
+        queue_size (int): The maximum number of records waiting to be sent. `0` means no limit.
+        retry_start (float): Seconds to wait before the first reconnect attempt.
+        retry_max (float): The longest wait (in seconds) between reconnect attempts.
+        retry_factor (float): Multiply the wait by this after each failed attempt.
+        timeout (float): Timeout (in seconds) for connecting & sending.
+        frame_per_record (bool): When `True`, send each record in its own frame, holding 1 pickled dict,
+            which any receiver for the stdlib `SocketHandler` can read. When `False`, each batch is 1
+            frame holding a pickled list, which only `decode_frame()` reads.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        batch_size: int = 256,
+        flush_interval_ms: int = 100,
+        queue_size: int = 10000,
+        retry_start: float = 0.5,
+        retry_max: float = 30.0,
+        retry_factor: float = 2.0,
+        timeout: float = 5.0,
+        frame_per_record: bool = False,
+    ) -> None:
+        super().__init__()
+
+        self.host: str = host
+        self.port: int = port
+        self.batch_size: int = max(1, batch_size)
+        self.flush_interval: float = flush_interval_ms / 1000
+        self.retry_start: float = retry_start
+        self.retry_max: float = retry_max
+        self.retry_factor: float = retry_factor
+        self.timeout: float = timeout
+        self.frame_per_record: bool = frame_per_record
+        self.dropped: int = 0
+
+        self.sock: socket.socket | None = None
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stopping: threading.Event = threading.Event()
+        self._retry_period: float = retry_start
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name=f"{self.__class__.__name__}({host}:{port})",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Put a copy of the record on the send queue, or drop it if the queue is full."""
+        try:
+            self._queue.put_nowait(record_to_dict(record))
+        except queue.Full:
+            self.dropped += 1
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _collect(self) -> list[dict[str, t.Any]]:
+        """Wait for the next batch of records, returning early once `flush_interval` passes."""
+        batch: list[dict[str, t.Any]] = []
+        deadline: float | None = None
+
+        while len(batch) < self.batch_size:
+            try:
+                if self._stopping.is_set():
+                    ## Closing, send whatever is left without waiting for more
+                    batch.append(self._queue.get_nowait())
+                    continue
+
+                timeout: float = (
+                    self.flush_interval
+                    if deadline is None
+                    else deadline - time.monotonic()
+                )
+                if timeout <= 0:
+                    break
+
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                if batch or self._stopping.is_set():
+                    break
+
+                continue
+
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+
+        return batch
+
+    def _connect(self) -> bool:
+        """Try to connect. On failure, wait out the backoff period (unless the handler is closing)."""
+        try:
+            self.sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except OSError:
+            self._stopping.wait(self._retry_period)
+            self._retry_period = min(self._retry_period * self.retry_factor, self.retry_max)
+
+            return False
+
+        self._retry_period = self.retry_start
+
+        return True
+
+    def _send(self, frame: bytes) -> bool:
+        if self.sock is None and not self._connect():
+            return False
+
+        try:
+            self.sock.sendall(frame)
+        except OSError:
+            self._close_socket()
+
+            return False
+
+        return True
+
+    def _close_socket(self) -> None:
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def _run(self) -> None:
+        frame: bytes | None = None
+
+        while True:
+            if frame is None:
+                batch: list[dict[str, t.Any]] = self._collect()
+                if not batch:
+                    if self._stopping.is_set():
+                        break
+
+                    continue
+
+                try:
+                    frame = (
+                        encode_record_frames(batch) if self.frame_per_record else encode_frame(batch)
+                    )
+                except Exception:
+                    ## i.e. an unpicklable `extra` value, send the records 1 at a time, skipping bad ones
+                    frame = b"".join(self._encode_each(batch))
+
+            ## A frame that fails to send is kept, and sent again after reconnecting
+            if self._send(frame):
+                frame = None
+            elif self._stopping.is_set():
+                break
+
+        self._close_socket()
+
+    def _encode_each(self, batch: list[dict[str, t.Any]]) -> t.Iterator[bytes]:
+        for record_dict in batch:
+            try:
+                yield (
+                    encode_record_frames([record_dict])
+                    if self.frame_per_record
+                    else encode_frame([record_dict])
+                )
+            except Exception:
+                self.handleError(logging.makeLogRecord(record_dict))
+
+    def close(self, timeout: float | None = None) -> None:
+        """Send the records left in the queue, then stop the sender thread.
+
+        Params:
+            timeout (float | None): How long to wait for the queue to be sent. Defaults to the handler's
+                `timeout`. Records that cannot be sent before then (i.e. while disconnected) are lost.
+        """
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join(self.timeout if timeout is None else timeout)
+
+        super().close()
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.host}:{self.port} ({level})>"
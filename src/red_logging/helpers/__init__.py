@@ -11,3 +11,4 @@ from .__methods import (
     save_configdict,
     setup_logging,
 )
+from ._introspection import configure_record_introspection, used_record_attributes
@@ -16,6 +16,7 @@ from red_logging.__base import BASE_LOGGING_CONFIG_DICT
 from red_logging.config_classes.formatters import FormatterConfig
 from red_logging.config_classes.handlers import (
     FileHandlerConfig,
+    QueuedHandlerConfig,
     QueueHandlerConfig,
     QueueListenerConfig,
     RotatingFileHandlerConfig,
@@ -28,11 +29,13 @@ from red_logging.config_classes.loggers import (
     LoggerFactory,
 )
 from red_logging.config_classes.types import (
+    FORMATTER_CLASSES_TYPE,
     HANDLER_CLASSES_TYPE,
     HANDLER_CLASSES_TYPE_ANNOTATION,
     LOGGING_CONFIG_DICT_TYPE,
     LOGGING_CONFIG_DICT_TYPE_ANNOTATION,
 )
+from red_logging.filters import FILTER_CLASSES_TYPE
 from red_logging.fmts import (
     DATE_FMT_DATE_ONLY,
     DATE_FMT_STANDARD,
@@ -43,6 +46,17 @@ from red_logging.fmts import (
     red_logging_DETAIL_FMT,
     red_logging_FMT,
 )
+from red_logging.loggers import configure_logger_gates
+
+from ._introspection import configure_record_introspection
+
+## Handler classes that have a version which does not block the asyncio event loop
+_ASYNC_HANDLER_CLASSES: dict[str, str] = {
+    "logging.StreamHandler": "red_logging.handlers.AsyncStreamHandler",
+    "logging.FileHandler": "red_logging.handlers.AsyncFileHandler",
+    "logging.handlers.SocketHandler": "red_logging.handlers.AsyncSocketHandler",
+}
+
 
 def ensure_logdir(p: t.Union[str, Path] = None) -> None:
     """Ensure a directory exists.
@@ -91,6 +105,9 @@ def get_rotatingfilehandler_config(
     filename: t.Union[str, Path] = None,
     maxBytes: int = 100000,
     backupCount: int = 3,
+    background: bool = False,
+    compression: str | None = None,
+    multiprocess: bool = False,
     as_dict: bool = False,
 ) -> dict[str, dict[str, t.Any]] | RotatingFileHandlerConfig:
     """Return a RotatingFileHandlerConfig, or a dict representing a RotatingFileHandler.
@@ -104,6 +121,11 @@ def get_rotatingfilehandler_config(
             this method will handle creating them.
         maxBytes (int): The maximum size (in bytes) before a logfile is rotated.
         backupCount (int): The number of backups to keep as log files rotate.
+        background (bool): If `True`, rotated files are renamed/compressed/deleted on a background thread
+            instead of the thread that triggered the rollover.
+        compression (str | None): Compress rotated files with `gzip`, `bz2` or `lzma`. Requires `background=True`.
+        multiprocess (bool): If `True`, rollovers are coordinated with other processes logging to the same
+            file using a POSIX advisory lock, for pre-fork servers like gunicorn.
         as_dict (bool): If `True`, return the configuration as a dict that can be joined into `dictConfig()`.
 
     Returns:
@@ -129,6 +151,9 @@ def get_rotatingfilehandler_config(
             filename=filename,
             maxBytes=maxBytes,
             backupCount=backupCount,
+            background=background,
+            compression=compression,
+            multiprocess=multiprocess,
         )
 
         if as_dict:
@@ -277,13 +302,104 @@ def get_logger_config(
         raise exc
 
 
+def _queue_configdict_handlers(
+    logging_config: dict[str, t.Any],
+    queue_size: int = 0,
+    queue_block: bool = False,
+    queue_handler_name: str = "queued",
+) -> dict[str, t.Any]:
+    """Put the handlers of the root logger & each logger in a logging config dict behind a QueuedHandler.
+
+    Description:
+        Each distinct list of handler names (i.e. `["console", "app_file"]`) is replaced with a
+        single QueuedHandler that writes to those handlers from a listener thread. In the common case,
+        where all loggers share the same handlers, this results in a single queue for the whole config.
+
+    Params:
+        logging_config (dict[str, Any]): An assembled logging dictConfig dict. This dict is modified in place.
+        queue_size (int): The maximum number of records each queue can hold. `0` means no limit.
+        queue_block (bool): When `True`, logging calls wait for room on a full queue instead of dropping records.
+        queue_handler_name (str): The name to give the QueuedHandler. When more than 1 queue is needed,
+            a number is appended to each additional queue's name, i.e. `queued_1`.
+
+    Returns:
+        (dict[str, Any]): The modified logging config dict.
+
+    """
+    _targets: list[dict[str, t.Any]] = [logging_config["root"]] + list(
+        logging_config["loggers"].values()
+    )
+    queue_names: dict[tuple[str, ...], str] = {}
+
+    for target in _targets:
+        target_handlers: list[str] = target.get("handlers") or []
+        if not target_handlers:
+            continue
+
+        handler_key: tuple[str, ...] = tuple(target_handlers)
+        if handler_key not in queue_names:
+            _name: str = (
+                queue_handler_name
+                if not queue_names
+                else f"{queue_handler_name}_{len(queue_names)}"
+            )
+            _queue_handler: QueuedHandlerConfig = QueuedHandlerConfig(
+                name=_name,
+                handlers=list(handler_key),
+                queue_size=queue_size,
+                block=queue_block,
+            )
+            logging_config["handlers"].update(_queue_handler.get_configdict())
+            queue_names[handler_key] = _name
+
+        target["handlers"] = [queue_names[handler_key]]
+
+    return logging_config
+
+
+def _async_configdict_handlers(
+    logging_config: dict[str, t.Any], queue_size: int = 0
+) -> dict[str, t.Any]:
+    """Swap the stream, file & socket handlers in a logging config dict for their asyncio versions.
+
+    Description:
+        `logging.StreamHandler`, `logging.FileHandler` & `logging.handlers.SocketHandler` are replaced
+        with `AsyncStreamHandler`, `AsyncFileHandler` & `AsyncSocketHandler`, which only put records on
+        a queue in the event loop. Other handlers are left as they are, and a warning is logged for each.
+
+    Params:
+        logging_config (dict[str, Any]): An assembled logging dictConfig dict. This dict is modified in place.
+        queue_size (int): The maximum number of records each handler's queue can hold. `0` means no limit.
+
+    Returns:
+        (dict[str, Any]): The modified logging config dict.
+
+    """
+    for handler_name, handler_dict in logging_config["handlers"].items():
+        handler_class: str | None = handler_dict.get("class")
+        if handler_class in _ASYNC_HANDLER_CLASSES.values():
+            continue
+
+        if handler_class not in _ASYNC_HANDLER_CLASSES:
+            log.warning(
+                f"Handler '{handler_name}' ({handler_class or handler_dict.get('()')}) has no asyncio version, and may block the event loop."
+            )
+
+            continue
+
+        handler_dict["class"] = _ASYNC_HANDLER_CLASSES[handler_class]
+        handler_dict["queue_size"] = queue_size
+
+    return logging_config
+
+
 def assemble_configdict(
     disable_existing_loggers: bool = False,
     propagate: bool = False,
     root_handlers: list[str] = ["console"],
     root_level: str = "DEBUG",
     formatters: (
-        t.Union[list[FormatterConfig], list[LOGGING_CONFIG_DICT_TYPE_ANNOTATION]] | None
+        t.Union[list[FORMATTER_CLASSES_TYPE], list[LOGGING_CONFIG_DICT_TYPE_ANNOTATION]] | None
     ) = None,
     handlers: (
         t.Union[HANDLER_CLASSES_TYPE_ANNOTATION, LOGGING_CONFIG_DICT_TYPE_ANNOTATION]
@@ -296,6 +412,13 @@ def assemble_configdict(
         ]
         | None
     ) = None,
+    queued: bool = False,
+    queue_size: int = 0,
+    asyncio_handlers: bool = False,
+    filters: (
+        t.Union[list[FILTER_CLASSES_TYPE], list[LOGGING_CONFIG_DICT_TYPE_ANNOTATION]]
+        | None
+    ) = None,
 ) -> dict[str, t.Any]:
     """Build a logging dictConfig dict.
 
@@ -317,14 +440,26 @@ def assemble_configdict(
         propagate (bool): When `True`, log messages will propagate up/down to the root logger.
         root_handlers (list[str]): List of handlers for the root logger. These handler configs must exist in the logging dictConfig.
         root_level (str): The log level for the root logger.
-        formatters (list[FormatterConfig] | list[dict[str, dict[str, t.Any]]] | None): List of logging formatter config objects.
+        formatters (list[FormatterConfig | JSONFormatterConfig | LogfmtFormatterConfig] | list[dict[str, dict[str, t.Any]]] | None): List of logging formatter config objects.
         handlers (list[BaseHandlerConfig | dict[str, dict[str, t.Any]]] | None): List of logging handler config objects.
         loggers (list[LoggerConfig | LoggerFactory | dict[str, dict[str, t.Any]]]] | None): List of logging logger config objects.
+        queued (bool): When `True`, the handlers of the root logger & all loggers are moved behind a
+            `QueuedHandler`. Logging calls only put records on a queue, and a listener thread does the writing.
+        queue_size (int): When `queued=True` or `asyncio_handlers=True`, the maximum number of records each queue
+            can hold. `0` means no limit.
+        asyncio_handlers (bool): When `True`, stream, file & socket handlers are replaced with their asyncio versions
+            (i.e. `red_logging.handlers.AsyncFileHandler`), which never block the event loop. Await
+            `red_logging.handlers.shutdown_async_handlers()` before the event loop stops. Cannot be used with `queued=True`.
+        filters (list[FILTER_CLASSES_TYPE | dict[str, dict[str, t.Any]]] | None): List of logging filter config objects, i.e.
+            `red_logging.filters.RateLimitFilterConfig`. Handlers reference them by name in their `filters` param.
 
     Returns:
         (dict[str, Any]): An initialized logging config dict created from inputs. Used with `logging.config.dictConfig()`
 
     """
+    if queued and asyncio_handlers:
+        raise ValueError("queued and asyncio_handlers cannot both be True")
+
     ## Get base logging configDict object, with empty formatters, loggers, etc
     logging_config: dict[str, t.Any] = BASE_LOGGING_CONFIG_DICT
 
@@ -347,13 +482,14 @@ def assemble_configdict(
     formatter_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
     handler_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
     logger_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
+    filter_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
 
     if formatters is not None:
         ## Formatters passed to function, parse and add to config
         for formatter_dict in formatters:
             if isinstance(formatter_dict, dict):
                 pass
-            elif isinstance(formatter_dict, FormatterConfig):
+            elif isinstance(formatter_dict, FORMATTER_CLASSES_TYPE):
                 try:
                     formatter_dict: dict = formatter_dict.get_configdict()
                 except Exception as exc:
@@ -402,6 +538,24 @@ def assemble_configdict(
 
             logger_configdicts.update(logger_dict)
 
+    if filters:
+        ## Filters passed to function, parse and add to config
+        for filter_dict in filters:
+            if isinstance(filter_dict, dict):
+                pass
+            elif isinstance(filter_dict, FILTER_CLASSES_TYPE):
+                try:
+                    filter_dict = filter_dict.get_configdict()
+                except Exception as exc:
+                    msg = Exception(
+                        f"Unhandled exception getting config dict for *FilterConfig object. Details: {exc}"
+                    )
+                    log.error(msg)
+
+                    raise exc
+
+            filter_configdicts.update(filter_dict)
+
     ## Create a copy of the original config
     try:
         return_dict = deepcopy(logging_config)
@@ -417,6 +571,20 @@ def assemble_configdict(
     return_dict["formatters"] = formatter_configdicts
     return_dict["handlers"] = handler_configdicts
     return_dict["loggers"] = logger_configdicts
+    if filter_configdicts:
+        return_dict["filters"] = filter_configdicts
+
+    if queued:
+        ## Move handlers behind a queue, written to by a listener thread
+        return_dict = _queue_configdict_handlers(
+            logging_config=return_dict, queue_size=queue_size
+        )
+
+    if asyncio_handlers:
+        ## Swap handlers for versions that only enqueue records in the event loop
+        return_dict = _async_configdict_handlers(
+            logging_config=return_dict, queue_size=queue_size
+        )
 
     ## Return initialized logging config
     return return_dict
@@ -489,7 +657,21 @@ def setup_logging(
     extra_handlers: list = [],
     extra_loggers: list = [],
     disable_logger_names: list = [],
+    queued: bool = False,
+    queue_size: int = 0,
+    asyncio_handlers: bool = False,
+    extra_filters: list = [],
+    auto_introspection: bool = False,
 ):
+    """Assemble a logging config from the app's settings & extra config classes, and apply it.
+
+    Params:
+        auto_introspection (bool): When `True`, stop collecting the `LogRecord` attributes (thread,
+            process & caller info) no formatter, filter or handler in the config (or already attached
+            to another logger) reads, with `configure_record_introspection()`. The switches are global.
+            With the caller lookup off, `stack_info=True` does nothing.
+
+    """
     app_formatter = get_formatter_config(fmt=log_fmt, datefmt=log_datefmt)
     app_console_handler = get_streamhandler_config(level="DEBUG")
     app_logger = get_logger_config(name=app_name, level=log_level)
@@ -511,10 +693,18 @@ def setup_logging(
         formatters=_formatters,
         handlers=_handlers,
         loggers=_loggers,
+        queued=queued,
+        queue_size=queue_size,
+        asyncio_handlers=asyncio_handlers,
+        filters=extra_filters,
     )
 
     logging.config.dictConfig(config=logging_config)
 
+    configure_logger_gates(logging_config)
+    if auto_introspection:
+        configure_record_introspection(logging_config)
+
     if disable_logger_names:
         for extra_logger in disable_logger_names:
             try:
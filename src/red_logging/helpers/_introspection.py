@@ -0,0 +1,451 @@
+"""Turn off the `LogRecord` attributes a logging config never reads.
+
+Every `LogRecord` looks up the thread, process & multiprocessing process name it was created in, and
+`Logger.findCaller()` walks the stack for the caller's `pathname`, `lineno` & `funcName`, unless the
+`logging` module is told not to. A format like `MESSAGE_FMT_BASIC` reads none of them.
+
+`used_record_attributes()` reads an assembled dictConfig dict and returns every record attribute its
+formatters, filters & handlers read, along with the attributes read by handlers already attached to
+loggers outside the config (i.e. a library's own handler). `configure_record_introspection()` then
+lowers `logging.logThreads`, `logging.logProcesses`, `logging.logMultiprocessing` (and
+`logging.logAsyncioTasks` on Python 3.12+), and the caller lookup, so only the attributes in that set
+are collected.
+
+A switch is only ever lowered from the value it had before red_logging changed it, never turned on
+over a value set by the program. A config the analysis cannot see into (a custom formatter, filter or
+handler class, a filter function, or a handler that sends whole records somewhere else, like a
+`SocketHandler`) restores those values. The switches are global, so they apply to every logger in the
+process, including filters & handlers added after the config is applied.
+
+With the caller lookup off, `stack_info=True` does nothing, because the stack is captured by the same
+lookup. Pass `keep=["stack_info"]` to keep it.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import pkgutil
+import re
+import string
+import typing as t
+
+from red_logging.filters import (
+    CompiledFilter,
+    ExpressionFilter,
+    FilterConfig,
+    KeyedSamplingFilter,
+    RateLimitFilter,
+    RateSamplingFilter,
+    critical_filter,
+    debug_filter,
+    error_filter,
+    info_filter,
+    warning_filter,
+)
+from red_logging.filters.expression_filters._expression_filters import RECORD_ATTRIBUTES
+from red_logging.formatters import (
+    BinaryFormatter,
+    CachedTimeFormatter,
+    CompiledFormatter,
+    JSONFormatter,
+    LogfmtFormatter,
+)
+from red_logging.formatters._structured import DEFAULT_FIELDS
+
+## The attributes each `logging` module switch collects
+INTROSPECTION_SWITCHES: dict[str, frozenset[str]] = {
+    "logThreads": frozenset({"thread", "threadName"}),
+    "logProcesses": frozenset({"process"}),
+    "logMultiprocessing": frozenset({"processName"}),
+    ## Python 3.12+
+    "logAsyncioTasks": frozenset({"taskName"}),
+}
+## The attributes Logger.findCaller() collects. `stack_info` is captured by the same stack walk
+CALLER_ATTRIBUTES: frozenset[str] = frozenset(
+    {"pathname", "filename", "module", "lineno", "funcName", "stack_info"}
+)
+
+## The attributes a BinaryFormatter writes to its call site & context frames
+_BINARY_ATTRIBUTES: frozenset[str] = frozenset(
+    {"pathname", "funcName", "lineno", "thread", "threadName", "process", "processName"}
+)
+_LEVEL_FILTERS: frozenset[t.Callable] = frozenset(
+    {debug_filter, info_filter, warning_filter, error_filter, critical_filter}
+)
+## Formatters whose output is their format string, formatted by their style
+_FORMAT_STRING_FORMATTERS: frozenset[type] = frozenset(
+    {logging.Formatter, CachedTimeFormatter, CompiledFormatter}
+)
+## Handlers that send whole records (or their whole __dict__) to another process or host
+_FORWARDING_HANDLERS: frozenset[str] = frozenset(
+    {
+        "logging.handlers.SocketHandler",
+        "logging.handlers.DatagramHandler",
+        "logging.handlers.HTTPHandler",
+        "red_logging.handlers.AsyncSocketHandler",
+        "red_logging.handlers.BatchedSocketHandler",
+    }
+)
+## Handlers that read record attributes themselves, not only through their formatter
+_HANDLER_ATTRIBUTES: dict[str, frozenset[str]] = {
+    "red_logging.handlers.BinaryFileHandler": _BINARY_ATTRIBUTES,
+}
+
+## Each format style's character, by its logging style class
+_STYLE_CHARACTERS: dict[type, str] = {
+    style_class: character for character, (style_class, _default) in logging._STYLES.items()
+}
+## The switch values before configure_record_introspection() changed them, and the values it set
+_SAVED_SWITCHES: dict[str, tuple[t.Any, t.Any]] = {}
+
+_PERCENT_FIELD: re.Pattern = re.compile(r"%\(([^)]*)\)")
+_FIELD_NAME: re.Pattern = re.compile(r"\w+")
+
+
+def _resolve(obj: t.Any) -> t.Any:
+    """Import an import path string, or return `obj`. Return `None` if the path cannot be imported."""
+    if not isinstance(obj, str):
+        return obj
+
+    try:
+        return pkgutil.resolve_name(obj)
+    except (ImportError, AttributeError, ValueError):
+        return None
+
+
+def _format_fields(fmt: str, style: str = "%") -> frozenset[str] | None:
+    """Return the record attributes a format string reads.
+
+    Params:
+        fmt (str): The format string, i.e. `"%(asctime)s %(levelname)-8s %(message)s"`.
+        style (str): The format's style, `%`, `{` or `$`.
+
+    Returns:
+        (frozenset[str] | None): The attribute names, or `None` if the style is not 1 of the 3.
+
+    """
+    if style == "%":
+        return frozenset(_PERCENT_FIELD.findall(fmt))
+
+    fields: set[str] = set()
+    if style == "{":
+        try:
+            parsed: list = list(string.Formatter().parse(fmt))
+        except ValueError:
+            return None
+        for _literal, field_name, _spec, _conversion in parsed:
+            match: re.Match | None = _FIELD_NAME.match(field_name or "")
+            if match:
+                fields.add(match.group())
+    elif style == "$":
+        for match in string.Template.pattern.finditer(fmt):
+            if match["named"] or match["braced"]:
+                fields.add(match["named"] or match["braced"])
+    else:
+        return None
+
+    return frozenset(fields)
+
+
+def _formatter_attributes(formatter: dict[str, t.Any]) -> frozenset[str] | None:
+    """Return the attributes a dictConfig formatter entry reads, or `None` if they cannot be known."""
+    factory: t.Any = _resolve(formatter.get("()", formatter.get("class", "logging.Formatter")))
+
+    if factory in _FORMAT_STRING_FORMATTERS:
+        ## A "()" factory is passed `fmt`, a "class" is passed `format`
+        fmt: str | None = formatter.get("fmt", formatter.get("format"))
+        style: str = formatter.get("style", "%")
+        if fmt is None:
+            return frozenset({"message"})
+        return _format_fields(fmt, style)
+
+    if factory in (JSONFormatter, LogfmtFormatter):
+        fields: t.Sequence[str] | None = formatter.get("fields")
+        return frozenset(fields if fields is not None else DEFAULT_FIELDS)
+
+    if factory is BinaryFormatter:
+        return _BINARY_ATTRIBUTES
+
+    return None
+
+
+def _filter_object_attributes(_filter: t.Any) -> frozenset[str] | None:
+    """Return the attributes a filter (an import path, function or object) reads, or `None` if unknown."""
+    _filter = _resolve(_filter)
+
+    if _filter.__class__ is logging.Filter and "filter" not in _filter.__dict__:
+        return frozenset({"name"})
+    if isinstance(_filter, logging.Filter) and _filter.__dict__.get("filter") in _LEVEL_FILTERS:
+        ## i.e. from FilterConfig.get_filter()
+        return frozenset({"levelno"})
+    if isinstance(_filter, ExpressionFilter):
+        return _expression_fields(_filter.expression)
+    if isinstance(_filter, RateSamplingFilter):
+        return frozenset({"levelno"})
+    if isinstance(_filter, KeyedSamplingFilter):
+        return frozenset({"levelno", _filter.key})
+    if isinstance(_filter, RateLimitFilter):
+        return frozenset({"levelno", "pathname", "lineno", "created"})
+
+    try:
+        if _filter in _LEVEL_FILTERS:
+            return frozenset({"levelno"})
+    except TypeError:
+        ## Unhashable
+        pass
+
+    return None
+
+
+def _expression_fields(expression: str) -> frozenset[str]:
+    """Return the record attributes a filter expression reads."""
+    return frozenset(
+        node.id
+        for node in ast.walk(ast.parse(expression, mode="eval"))
+        if isinstance(node, ast.Name) and node.id in RECORD_ATTRIBUTES
+    )
+
+
+def _filter_attributes(_filter: dict[str, t.Any]) -> frozenset[str] | None:
+    """Return the attributes a dictConfig filter entry reads, or `None` if they cannot be known."""
+    if "()" not in _filter:
+        ## A logging.Filter, which checks the logger name
+        return frozenset({"name"})
+
+    factory: t.Any = _resolve(_filter["()"])
+    config: t.Any = getattr(factory, "__self__", None)
+    if isinstance(config, FilterConfig):
+        ## FilterConfig.get_filter, bound to the config
+        if config.expression is not None:
+            return _expression_fields(config.expression)
+        return frozenset({"levelno"}) if config.func in _LEVEL_FILTERS else None
+
+    if factory is ExpressionFilter:
+        return _expression_fields(_filter["expression"])
+    if factory is RateSamplingFilter:
+        return frozenset({"levelno"})
+    if factory is KeyedSamplingFilter:
+        return frozenset({"levelno", _filter.get("key", "request_id")})
+    if factory is RateLimitFilter:
+        return frozenset({"levelno", "pathname", "lineno", "created"})
+    if factory is CompiledFilter:
+        attributes: set[str] = {"levelno", "name"}
+        for nested in _filter.get("filters") or []:
+            nested_attributes: frozenset[str] | None = _filter_object_attributes(nested)
+            if nested_attributes is None:
+                return None
+            attributes |= nested_attributes
+        return frozenset(attributes)
+
+    return None
+
+
+def _handler_attributes(handler: dict[str, t.Any]) -> frozenset[str] | None:
+    """Return the attributes a dictConfig handler entry reads itself, or `None` if they cannot be known."""
+    handler_class: t.Any = handler.get("()", handler.get("class"))
+    if not isinstance(handler_class, str):
+        return None
+
+    if handler_class in _FORWARDING_HANDLERS:
+        return None
+    if handler_class in _HANDLER_ATTRIBUTES:
+        return _HANDLER_ATTRIBUTES[handler_class]
+    if handler_class.startswith(("logging.", "red_logging.handlers.")):
+        ## Everything else these handlers write comes from their formatter
+        return frozenset()
+
+    return None
+
+
+def _formatter_object_attributes(formatter: logging.Formatter | None) -> frozenset[str] | None:
+    """Return the attributes a formatter object reads, or `None` if they cannot be known."""
+    if formatter is None:
+        ## Handler.format() falls back to logging's default formatter, "%(message)s"
+        return frozenset({"message"})
+
+    if formatter.__class__ in _FORMAT_STRING_FORMATTERS:
+        style: str | None = _STYLE_CHARACTERS.get(formatter._style.__class__)
+        return _format_fields(formatter._style._fmt, style) if style is not None else None
+
+    if isinstance(formatter, (JSONFormatter, LogfmtFormatter)):
+        return frozenset(formatter.fields)
+
+    if formatter.__class__ is BinaryFormatter:
+        return _BINARY_ATTRIBUTES
+
+    return None
+
+
+def _handler_object_attributes(handler: logging.Handler) -> frozenset[str] | None:
+    """Return the attributes a handler object, its formatter & its filters read, or `None` if unknown."""
+    handler_class: type = handler.__class__
+    module: str = handler_class.__module__
+    if module.startswith("red_logging.handlers."):
+        ## i.e. `red_logging.handlers._binary`, which the handlers are exported from
+        module = "red_logging.handlers"
+    attributes: frozenset[str] | None = _handler_attributes(
+        {"class": f"{module}.{handler_class.__qualname__}"}
+    )
+
+    for part in [_formatter_object_attributes(handler.formatter)] + [
+        _filter_object_attributes(_filter) for _filter in handler.filters
+    ]:
+        if attributes is None or part is None:
+            return None
+        attributes |= part
+
+    return attributes
+
+
+def _existing_handler_attributes(config: dict[str, t.Any]) -> frozenset[str] | None:
+    """Return the attributes read by handlers & logger filters the config did not create, or `None`.
+
+    `dictConfig()` only replaces the handlers of the loggers in its config. Other existing loggers keep
+    theirs, and still need every attribute their formatters & filters read.
+    """
+    config_handlers: dict[str, t.Any] = config.get("handlers") or {}
+    config_loggers: dict[str, t.Any] = config.get("loggers") or {}
+
+    loggers: list[logging.Logger] = [logging.root] + [
+        logger
+        for logger in list(logging.root.manager.loggerDict.values())
+        if isinstance(logger, logging.Logger)
+    ]
+    attributes: set[str] = set()
+    for logger in loggers:
+        if logger.disabled:
+            continue
+
+        configured: bool = (
+            logger.name in config_loggers if logger is not logging.root else bool(config.get("root"))
+        )
+        if not configured:
+            for _filter in logger.filters:
+                filter_attributes: frozenset[str] | None = _filter_object_attributes(_filter)
+                if filter_attributes is None:
+                    return None
+                attributes |= filter_attributes
+
+        for handler in logger.handlers:
+            ## Created from the config, so its entry was already read
+            if handler.name in config_handlers and logging._handlers.get(handler.name) is handler:
+                continue
+            handler_attributes: frozenset[str] | None = _handler_object_attributes(handler)
+            if handler_attributes is None:
+                return None
+            attributes |= handler_attributes
+
+    return frozenset(attributes)
+
+
+def used_record_attributes(config: dict[str, t.Any]) -> frozenset[str] | None:
+    """Return every `LogRecord` attribute the formatters, filters & handlers in a dictConfig dict read.
+
+    Handlers already attached to loggers outside the config, and their formatters, are included,
+    since a new config does not remove them.
+
+    Params:
+        config (dict[str, Any]): An assembled logging dictConfig dict, i.e. from `assemble_configdict()`.
+
+    Returns:
+        (frozenset[str] | None): The attribute names, or `None` if a formatter, filter or handler
+            could read any attribute.
+
+    """
+    attributes: set[str] = {"message"}
+
+    for formatter in (config.get("formatters") or {}).values():
+        formatter_attributes: frozenset[str] | None = _formatter_attributes(formatter)
+        if formatter_attributes is None:
+            return None
+        attributes |= formatter_attributes
+
+    for _filter in (config.get("filters") or {}).values():
+        filter_attributes: frozenset[str] | None = _filter_attributes(_filter)
+        if filter_attributes is None:
+            return None
+        attributes |= filter_attributes
+
+    targets: list[dict[str, t.Any]] = list((config.get("handlers") or {}).values())
+    targets += list((config.get("loggers") or {}).values())
+    if config.get("root"):
+        targets.append(config["root"])
+
+    for target in targets:
+        ## Filter objects can be given directly, instead of by name
+        for _filter in target.get("filters") or []:
+            if isinstance(_filter, str) and _filter in (config.get("filters") or {}):
+                continue
+            filter_attributes = _filter_object_attributes(_filter)
+            if filter_attributes is None:
+                return None
+            attributes |= filter_attributes
+
+    for handler in (config.get("handlers") or {}).values():
+        handler_attributes: frozenset[str] | None = _handler_attributes(handler)
+        if handler_attributes is None:
+            return None
+        attributes |= handler_attributes
+
+    existing_attributes: frozenset[str] | None = _existing_handler_attributes(config)
+    if existing_attributes is None:
+        return None
+    attributes |= existing_attributes
+
+    return frozenset(attributes)
+
+
+def _prior_value(switch: str, current: t.Any) -> t.Any:
+    """Return a switch's value before red_logging changed it, unless the program has set it since."""
+    saved: tuple[t.Any, t.Any] | None = _SAVED_SWITCHES.get(switch)
+    if saved is not None and saved[1] == current:
+        return saved[0]
+
+    return current
+
+
+def configure_record_introspection(
+    config: dict[str, t.Any], keep: t.Iterable[str] = ()
+) -> dict[str, bool]:
+    """Collect only the `LogRecord` attributes a dictConfig dict reads.
+
+    Description:
+        Each switch is lowered from the value it had before red_logging changed it, so a later config
+        that needs an attribute gets it back, but a switch the program turned off stays off. When
+        `used_record_attributes()` returns `None`, every switch is set back to that value.
+
+    Params:
+        config (dict[str, Any]): An assembled logging dictConfig dict, i.e. from `assemble_configdict()`.
+        keep (Iterable[str]): Attributes to collect even if the config does not read them, i.e.
+            `["stack_info"]`, or attributes read by code outside the config.
+
+    Returns:
+        (dict[str, bool]): Each switch (`logThreads`, `logProcesses`, ..., `findCaller`), and whether
+            it is on.
+
+    """
+    used: frozenset[str] | None = used_record_attributes(config)
+    if used is not None:
+        used |= frozenset(keep)
+
+    applied: dict[str, bool] = {}
+    for switch, switch_attributes in INTROSPECTION_SWITCHES.items():
+        if not hasattr(logging, switch):
+            continue
+        prior: t.Any = _prior_value(switch, getattr(logging, switch))
+        value: t.Any = prior and (used is None or not used.isdisjoint(switch_attributes))
+        _SAVED_SWITCHES[switch] = (prior, value)
+        setattr(logging, switch, value)
+        applied[switch] = bool(value)
+
+    ## Logger.findCaller() is skipped when _srcfile is None
+    prior_srcfile: str | None = _prior_value("_srcfile", logging._srcfile)
+    srcfile: str | None = (
+        prior_srcfile if used is None or not used.isdisjoint(CALLER_ATTRIBUTES) else None
+    )
+    _SAVED_SWITCHES["_srcfile"] = (prior_srcfile, srcfile)
+    logging._srcfile = srcfile
+    applied["findCaller"] = srcfile is not None
+
+    return applied
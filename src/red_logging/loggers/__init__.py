@@ -0,0 +1,25 @@
+"""Logger classes that can be set with `logging.setLoggerClass()`.
+
+`CachedCallerLogger` finds the caller's `pathname`, `lineno` & `funcName` (for formats like
+`MESSAGE_FMT_STANDARD`) with a dict lookup per stack frame, instead of a path check.
+
+Gates drop a logger's logging calls before a `LogRecord` is created, i.e.
+`install_gates(logging.getLogger("app.health"), [TemplateGate(["^heartbeat"])])`, or with the `gates`
+of a `LoggerConfig`.
+
+`Lazy` args, and a `LazyAdapter` that wraps function args in them, are computed only when a record is
+formatted, i.e. `log.debug("state: %s", Lazy(dump, state))`.
+"""
+
+from __future__ import annotations
+
+from ._caller import CachedCallerLogger, clear_caller_cache
+from ._gates import (
+    GATE_TYPE,
+    TemplateGate,
+    configure_logger_gates,
+    get_gates,
+    install_gates,
+    remove_gates,
+)
+from ._lazy import Lazy, LazyAdapter
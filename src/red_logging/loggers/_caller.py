@@ -0,0 +1,87 @@
+"""A Logger that caches which stack frames are inside `logging`, by source file.
+
+To fill in a record's `pathname`, `lineno` & `funcName`, `Logger.findCaller()` walks back from itself
+to the first frame outside the `logging` module. For each frame it calls `os.path.normcase()` on the
+frame's filename, and compares it with the `logging` source path (and checks for `importlib`'s
+bootstrap frames). The answer only depends on the frame's code object's `co_filename`, so
+`CachedCallerLogger` keeps it in a dict keyed by that string, whose hash Python caches. Each frame
+after the first call from a file costs 1 dict lookup.
+
+The walk itself, `stacklevel` & `stack_info` are exactly `logging.Logger.findCaller()`'s, and an uncached
+frame is checked with the same function `logging` uses, so records are identical. The line number &
+function name are read from the caller's frame, as `logging` does.
+
+Only loggers created after `logging.setLoggerClass(CachedCallerLogger)` use it, so call it before
+importing modules that call `logging.getLogger()` at import time. The root logger is not affected.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import sys
+import traceback
+import types
+
+## The most filenames to remember. Code created at runtime (i.e. by exec()) can have any filename
+_MAX_CACHED_FILES: int = 4096
+
+## co_filename -> whether frames of code from that file are internal to logging. Not keyed by the code
+#  object, whose hash is computed from its contents on every lookup
+_internal_files: dict[str, bool] = {}
+## The logging._srcfile the cache was filled with
+_cached_srcfile: str | None = logging._srcfile
+
+
+def clear_caller_cache() -> None:
+    """Forget which source files are internal to `logging`."""
+    global _cached_srcfile
+
+    _internal_files.clear()
+    _cached_srcfile = logging._srcfile
+
+
+class CachedCallerLogger(logging.Logger):
+    """A `logging.Logger` that finds the caller of a logging call with 1 dict lookup per frame.
+
+    Records are identical to `logging.Logger`'s. Set it as the class for new loggers with
+    `logging.setLoggerClass(CachedCallerLogger)`.
+    """
+
+    def findCaller(
+        self, stack_info: bool = False, stacklevel: int = 1
+    ) -> tuple[str, int, str, str | None]:
+        """Return the caller's filename, line number, function name & (optional) stack, like `logging.Logger`."""
+        if logging._srcfile != _cached_srcfile:
+            ## The answers depend on the path logging compares filenames with
+            clear_caller_cache()
+
+        ## This frame, like logging.currentframe() in Logger.findCaller(). It is skipped by the walk
+        f: types.FrameType = sys._getframe(0)
+        internal_files: dict[str, bool] = _internal_files
+        while stacklevel > 0:
+            next_f: types.FrameType | None = f.f_back
+            if next_f is None:
+                break
+            f = next_f
+            filename: str = f.f_code.co_filename
+            internal: bool | None = internal_files.get(filename)
+            if internal is None:
+                internal = logging._is_internal_frame(f)
+                if len(internal_files) < _MAX_CACHED_FILES:
+                    internal_files[filename] = internal
+            if not internal:
+                stacklevel -= 1
+
+        co: types.CodeType = f.f_code
+        sinfo: str | None = None
+        if stack_info:
+            with io.StringIO() as sio:
+                sio.write("Stack (most recent call last):\n")
+                traceback.print_stack(f, file=sio)
+                sinfo = sio.getvalue()
+                if sinfo[-1] == "\n":
+                    sinfo = sinfo[:-1]
+
+        return co.co_filename, f.f_lineno, co.co_name, sinfo
+
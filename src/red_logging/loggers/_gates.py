@@ -0,0 +1,164 @@
+"""Gates, which drop logging calls before a `LogRecord` is created.
+
+A logger's filters see a record only after `Logger.makeRecord()` has built it, and after
+`Logger.findCaller()` has walked the stack for its caller. A gate is a predicate on the values a logging
+call already has: the logger's name, the level & the message template (`msg`, before `args` are merged).
+When a gate returns `False`, the call returns before any of that work is done.
+
+`install_gates()` wraps a logger's `_log()` method on the logger itself, so it works on any existing
+logger, of any class. `Logger.isEnabledFor()` is still checked first, so a gate only sees calls at an
+enabled level. Like a logger's filters, a logger's gates only see calls made on that logger, not calls
+made on its child loggers.
+
+A gate can be any callable taking `(name, levelno, msg)`. `TemplateGate` drops templates matching any of
+a list of regexes, i.e. `TemplateGate(["^heartbeat", "cache (hit|miss)"])`, and remembers the answer for
+each template, so a gated call costs a dict lookup.
+"""
+
+from __future__ import annotations
+
+import logging
+import pkgutil
+import re
+import typing as t
+
+GATE_TYPE = t.Union[str, dict, t.Callable[[str, int, t.Any], bool]]
+
+## The most templates a TemplateGate remembers. A logger that logs unbounded distinct messages (i.e.
+#  f-strings) cannot grow the cache past this
+_MAX_CACHED_TEMPLATES: int = 1024
+
+
+class TemplateGate:
+    """Drop logging calls whose message template matches a regex, before a record is created.
+
+    Params:
+        templates (Sequence[str]): Regexes, searched for in each call's `msg`, i.e. `"^heartbeat"`. A call
+            is dropped if any of them match. A `msg` that is not a `str` is never dropped.
+        keep_level (str | int | None): Always keep calls at this level or above. `None` gates every level.
+    """
+
+    def __init__(
+        self, templates: t.Sequence[str], keep_level: t.Union[str, int, None] = None
+    ) -> None:
+        if isinstance(templates, str):
+            raise TypeError("templates must be a list of regexes, not a str.")
+
+        self.templates: list[str] = list(templates)
+        self.keep_level: int = (
+            logging._checkLevel(keep_level) if keep_level is not None else logging.CRITICAL + 1
+        )
+        ## 1 pattern, so a template is searched once however many regexes there are
+        self._pattern: re.Pattern | None = (
+            re.compile("|".join(f"(?:{template})" for template in self.templates))
+            if self.templates
+            else None
+        )
+        ## template -> keep
+        self._keep: dict[str, bool] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.templates!r}>"
+
+    def __call__(self, name: str, levelno: int, msg: t.Any) -> bool:
+        """Return `True` to keep a logging call, `False` to drop it."""
+        if levelno >= self.keep_level or msg.__class__ is not str:
+            return True
+
+        keep: bool | None = self._keep.get(msg)
+        if keep is None:
+            keep = self._pattern is None or self._pattern.search(msg) is None
+            if len(self._keep) < _MAX_CACHED_TEMPLATES:
+                self._keep[msg] = keep
+
+        return keep
+
+
+def _resolve_gate(gate: GATE_TYPE) -> t.Callable[[str, int, t.Any], bool]:
+    """Return a gate from a gate, an import path, or a dict of `TemplateGate` params."""
+    if isinstance(gate, str):
+        ## An import path, i.e. `app.logging_gates.drop_heartbeats`
+        gate = pkgutil.resolve_name(gate)
+    elif isinstance(gate, dict):
+        gate = TemplateGate(**gate)
+
+    if not callable(gate):
+        raise TypeError(f"Gate {gate!r} is not callable.")
+
+    return gate
+
+
+def get_gates(logger: logging.Logger) -> tuple[t.Callable[[str, int, t.Any], bool], ...]:
+    """Return the gates installed on a logger."""
+    gated_log: t.Any = logger.__dict__.get("_log")
+
+    return getattr(gated_log, "gates", ())
+
+
+def remove_gates(logger: logging.Logger) -> None:
+    """Remove the gates installed on a logger, if it has any."""
+    if get_gates(logger):
+        del logger.__dict__["_log"]
+
+
+def install_gates(logger: logging.Logger, gates: t.Sequence[GATE_TYPE]) -> None:
+    """Drop a logger's logging calls before a record is created, when any gate returns `False`.
+
+    Any gates the logger already has are replaced. An empty list removes them.
+
+    Params:
+        logger (logging.Logger): The logger to gate.
+        gates (Sequence[str | dict | callable]): Gates, called with `(name, levelno, msg)` in order.
+            A `str` is an import path, and a `dict` holds the params of a `TemplateGate`.
+
+    Raises:
+        TypeError: When a gate is not callable.
+
+    """
+    remove_gates(logger)
+    resolved: tuple[t.Callable[[str, int, t.Any], bool], ...] = tuple(
+        _resolve_gate(gate) for gate in gates
+    )
+    if not resolved:
+        return
+
+    name: str = logger.name
+    log: t.Callable = logger._log
+
+    def _log(
+        level: int,
+        msg: t.Any,
+        args: t.Any,
+        exc_info: t.Any = None,
+        extra: t.Mapping[str, t.Any] | None = None,
+        stack_info: bool = False,
+        stacklevel: int = 1,
+    ) -> None:
+        for gate in resolved:
+            if not gate(name, level, msg):
+                return
+
+        ## This frame is outside logging, so findCaller() has to look 1 frame further for the caller
+        log(level, msg, args, exc_info, extra, stack_info, stacklevel + 1)
+
+    _log.gates = resolved
+    ## An instance attribute, so Logger.info() & friends call it instead of Logger._log()
+    logger._log = _log
+
+
+def configure_logger_gates(config: dict[str, t.Any]) -> None:
+    """Install the `gates` of each logger in a dictConfig dict, i.e. from a `LoggerConfig`.
+
+    `logging.config.dictConfig()` ignores a logger's `gates` key, so call this after it. Loggers in the
+    config without `gates` have any gates they had removed.
+
+    Params:
+        config (dict[str, Any]): An assembled logging dictConfig dict, i.e. from `assemble_configdict()`.
+
+    """
+    loggers: dict[str, dict[str, t.Any]] = dict(config.get("loggers") or {})
+    if config.get("root") is not None:
+        loggers[""] = config["root"]
+
+    for name, logger_dict in loggers.items():
+        install_gates(logging.getLogger(name), logger_dict.get("gates") or [])
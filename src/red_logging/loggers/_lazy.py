@@ -0,0 +1,136 @@
+"""Lazy logging arguments, which are only computed when a record is formatted.
+
+`logging` already defers `msg % args` until a handler formats the record, but not the work done to build
+the args: `log.debug("state: %s", dump(state))` calls `dump()` even when the record is then dropped by a
+level, a filter or every handler. Wrapping the call in a `Lazy` defers it:
+
+```python
+log.debug("state: %s", Lazy(dump, state))
+```
+
+A `Lazy` calls its function the first time it is formatted (`str()`, `repr()`, `format()`, or `%d`/`%f`),
+and keeps the result, so a record formatted by several handlers computes it once. A `Lazy` is pickled as
+its `str()`, so records with lazy `extra` values can still be sent by a `SocketHandler`.
+
+`LazyAdapter` wraps a logger, and wraps each function passed as an arg (or as an `extra` value) in a
+`Lazy`, so a call site only needs a `lambda`:
+
+```python
+log = LazyAdapter(logging.getLogger(__name__))
+log.debug("state: %s", lambda: dump(state))
+```
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import types
+import typing as t
+
+## Args LazyAdapter calls at format time. Classes & other callable objects are logged as they are
+_DEFERRED_TYPES: tuple[type, ...] = (
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+    functools.partial,
+)
+## Set when the function has not been called yet
+_UNSET: t.Any = object()
+
+
+class Lazy:
+    """A logging arg whose value is computed by `func(*args, **kwargs)` when a record is formatted.
+
+    Params:
+        func (callable): The function that computes the value.
+        *args (Any): Positional args for `func`.
+        **kwargs (Any): Keyword args for `func`.
+    """
+
+    __slots__ = ("func", "args", "kwargs", "_value")
+
+    def __init__(self, func: t.Callable[..., t.Any], *args: t.Any, **kwargs: t.Any) -> None:
+        self.func: t.Callable[..., t.Any] = func
+        self.args: tuple = args
+        self.kwargs: dict[str, t.Any] = kwargs
+        self._value: t.Any = _UNSET
+
+    @property
+    def evaluated(self) -> bool:
+        """Whether the value has been computed."""
+        return self._value is not _UNSET
+
+    @property
+    def value(self) -> t.Any:
+        """Compute the value the first time it is read, and return it."""
+        value: t.Any = self._value
+        if value is _UNSET:
+            ## 2 threads formatting the same record can both compute it, and either result is kept
+            value = self._value = self.func(*self.args, **self.kwargs)
+
+        return value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+    ## `%d`, `%x` & `%f` format an object through these
+    def __index__(self) -> int:
+        return self.value.__index__()
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __reduce__(self) -> tuple:
+        return (str, (str(self),))
+
+
+def _deferred(value: t.Any) -> t.Any:
+    return Lazy(value) if isinstance(value, _DEFERRED_TYPES) else value
+
+
+class LazyAdapter(logging.LoggerAdapter):
+    """A `LoggerAdapter` that calls the functions passed as args or `extra` values only when a record is formatted.
+
+    Each function is wrapped in a `Lazy`. A single `dict` arg (for `%(key)s` formats) has its function
+    values wrapped. Records are created only for enabled levels, as with a `Logger`.
+
+    Params:
+        logger (logging.Logger): The logger to log to.
+        extra (Mapping[str, Any] | None): Values added to every record, like a `LoggerAdapter`'s.
+    """
+
+    def process(
+        self, msg: t.Any, kwargs: t.MutableMapping[str, t.Any]
+    ) -> tuple[t.Any, t.MutableMapping[str, t.Any]]:
+        """Merge the adapter's `extra` with the call's, so a call's `extra` is not replaced."""
+        if self.extra:
+            kwargs["extra"] = {**self.extra, **(kwargs.get("extra") or {})}
+
+        return msg, kwargs
+
+    def log(self, level: int, msg: t.Any, *args: t.Any, **kwargs: t.Any) -> None:
+        """Log `msg % args` at `level`, wrapping functions in `args` & `extra` in a `Lazy`."""
+        if not self.isEnabledFor(level):
+            return
+
+        msg, kwargs = self.process(msg, kwargs)
+        if len(args) == 1 and isinstance(args[0], dict) and args[0]:
+            args = ({key: _deferred(value) for key, value in args[0].items()},)
+        else:
+            args = tuple(_deferred(arg) for arg in args)
+        if kwargs.get("extra"):
+            kwargs["extra"] = {key: _deferred(value) for key, value in kwargs["extra"].items()}
+        ## This frame is outside logging, so findCaller() has to look 1 frame further for the caller
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+
+        self.logger.log(level, msg, *args, **kwargs)
@@ -0,0 +1,9 @@
+"""Merge log files written by several processes into a single, time-ordered stream.
+
+Run as a module to merge the shards of a `ShardedFileHandler`, i.e.
+`python -m red_logging.merge --shards-of logs/app.log -o logs/app.merged.log`, or pass the files to merge.
+"""
+
+from __future__ import annotations
+
+from ._merge import find_shards, iter_records, merge_records
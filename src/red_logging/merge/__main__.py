@@ -0,0 +1,50 @@
+"""Entry point for `python -m red_logging.merge`."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from red_logging.fmts import DATE_FMT_STANDARD
+from red_logging.merge._merge import find_shards, merge_records
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m red_logging.merge",
+        description="Merge log files from several processes into a single, time-ordered stream.",
+    )
+    parser.add_argument("paths", nargs="*", help="Log files to merge.")
+    parser.add_argument(
+        "--shards-of",
+        metavar="FILENAME",
+        help="Merge every shard a ShardedFileHandler wrote for FILENAME, i.e. app.log -> app.<pid>.log.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="File to write merged records to. Defaults to stdout."
+    )
+    parser.add_argument(
+        "--datefmt",
+        default=DATE_FMT_STANDARD,
+        help="The datefmt used for asctime in the log files.",
+    )
+    args = parser.parse_args(argv)
+
+    paths: list[str] = list(args.paths)
+    if args.shards_of:
+        paths.extend(find_shards(args.shards_of))
+    if not paths:
+        parser.error("No log files to merge.")
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for text in merge_records(paths, datefmt=args.datefmt):
+            out.write(text)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Merge log files from several processes (i.e. `ShardedFileHandler` shards) into 1 time-ordered stream.
+
+Each file is read 1 record at a time, and the records are combined with a heap-based k-way merge
+(`heapq.merge()`), so memory use depends on the number of files, not their size.
+
+The sort key for each record is taken from the start of its first line:
+
+- Lines written with `MESSAGE_FMT_SHARDED` start with `<created_ns> <seq>`, which orders records exactly.
+- Lines written with `MESSAGE_FMT_STANDARD`, `MESSAGE_FMT_DETAILED`, `MESSAGE_FMT_BASIC` or the `red_logging`
+  formats start with an `asctime` timestamp (optionally in brackets), which is parsed with `datefmt`.
+
+Lines that do not start with a key (i.e. traceback lines) belong to the record before them, and are kept
+with it. Records with the same timestamp keep the order of the files they came from.
+"""
+
+from __future__ import annotations
+
+import heapq
+from pathlib import Path
+import re
+import time
+import typing as t
+
+from red_logging.fmts import DATE_FMT_STANDARD
+
+## `<created_ns> <seq> ...`, written by MESSAGE_FMT_SHARDED
+SHARDED_KEY_PATTERN: re.Pattern = re.compile(r"^(\d{16,}) (\d+) ")
+## `[2024-01-01 12:00:00] ...` or `2024-01-01 12:00:00,123 ...`
+ASCTIME_KEY_PATTERN: re.Pattern = re.compile(
+    r"^\[?(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})(?:[,.](\d{1,6}))?\]?"
+)
+
+RECORD_KEY_TYPE = tuple[int, int, int]
+
+
+class _KeyParser:
+    """Parse the sort key from the first line of a record, caching the last `asctime` it parsed."""
+
+    def __init__(self, datefmt: str = DATE_FMT_STANDARD) -> None:
+        self.datefmt: str = datefmt
+        self._last_asctime: str | None = None
+        self._last_ns: int = 0
+
+    def __call__(self, line: str) -> int | tuple[int, int] | None:
+        """Return `(created_ns, seq)`, `created_ns`, or `None` if the line does not start a record."""
+        match: re.Match | None = SHARDED_KEY_PATTERN.match(line)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+
+        match = ASCTIME_KEY_PATTERN.match(line)
+        if not match:
+            return None
+
+        asctime: str = match.group(1)
+        if asctime != self._last_asctime:
+            try:
+                _struct = time.strptime(asctime.replace("T", " "), self.datefmt)
+            except ValueError:
+                return None
+            self._last_asctime = asctime
+            self._last_ns = int(time.mktime(_struct)) * 1_000_000_000
+
+        fraction: str | None = match.group(2)
+        if fraction:
+            return self._last_ns + int(fraction.ljust(9, "0"))
+
+        return self._last_ns
+
+
+def iter_records(
+    path: t.Union[str, Path], shard: int = 0, datefmt: str = DATE_FMT_STANDARD
+) -> t.Iterator[tuple[RECORD_KEY_TYPE, str]]:
+    """Yield `(sort_key, text)` for each record in a log file, in file order.
+
+    Params:
+        path (str | Path): The log file to read.
+        shard (int): A number for this file, used to break ties between files.
+        datefmt (str): The format of `asctime` timestamps in the file.
+
+    Returns:
+        (Iterator[tuple[tuple[int, int, int], str]]): The sort key and full text (including continuation
+            lines & newlines) of each record.
+
+    """
+    parse_key: _KeyParser = _KeyParser(datefmt=datefmt)
+    key: RECORD_KEY_TYPE = (0, shard, 0)
+    lines: list[str] = []
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line_no, line in enumerate(f):
+            parsed = parse_key(line)
+            if parsed is None:
+                ## Continuation of the previous record
+                lines.append(line)
+                continue
+
+            if lines:
+                yield key, "".join(lines)
+
+            ## Never let a file's keys go backwards (i.e. after a clock change), so
+            #  each file stays sorted for the merge
+            if isinstance(parsed, tuple):
+                key = (max(parsed[0], key[0]), shard, parsed[1])
+            else:
+                ## Keep file order for records with the same timestamp
+                key = (max(parsed, key[0]), shard, line_no)
+            lines = [line]
+
+    if lines:
+        yield key, "".join(lines)
+
+
+def merge_records(
+    paths: list[t.Union[str, Path]], datefmt: str = DATE_FMT_STANDARD
+) -> t.Iterator[str]:
+    """Merge log files into a single stream of records, ordered by time.
+
+    Params:
+        paths (list[str | Path]): The log files to merge.
+        datefmt (str): The format of `asctime` timestamps in the files.
+
+    Returns:
+        (Iterator[str]): The text of each record, oldest first.
+
+    """
+    _streams = [
+        iter_records(path, shard=shard, datefmt=datefmt)
+        for shard, path in enumerate(paths)
+    ]
+
+    for _key, text in heapq.merge(*_streams, key=lambda record: record[0]):
+        yield text
+
+
+def find_shards(filename: t.Union[str, Path]) -> list[str]:
+    """Return the shard files that exist for a `ShardedFileHandler` log file name.
+
+    Params:
+        filename (str | Path): The log file name given to the ShardedFileHandler, i.e. `logs/app.log`.
+
+    Returns:
+        (list[str]): Paths of the shards, i.e. `["logs/app.1234.log", "logs/app.1240.log"]`.
+
+    """
+    _path: Path = Path(filename)
+    if not _path.parent.is_dir():
+        return []
+
+    _stem: str = _path.stem if _path.suffix else _path.name
+    _pattern: re.Pattern = re.compile(
+        rf"^{re.escape(_stem)}\.\d+{re.escape(_path.suffix)}$"
+    )
+
+    return sorted(str(p) for p in _path.parent.iterdir() if _pattern.match(p.name))
@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from ._test_handlers import queued_logging_config
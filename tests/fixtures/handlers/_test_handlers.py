@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pytest import fixture
+import red_logging
+
+@fixture
+def queued_logging_config(tmp_path: Path) -> dict:
+    _formatter: red_logging.config_classes.FormatterConfig = (
+        red_logging.get_formatter_config(name="default")
+    )
+    _handler: red_logging.config_classes.FileHandlerConfig = (
+        red_logging.config_classes.FileHandlerConfig(
+            name="test_file",
+            level="DEBUG",
+            formatter="default",
+            filename=str(tmp_path / "queued.log"),
+        )
+    )
+    _logger: red_logging.config_classes.LoggerConfig = red_logging.get_logger_config(
+        name="test_queued", handlers=["test_file"], level="DEBUG"
+    )
+
+    return red_logging.assemble_configdict(
+        root_handlers=["test_file"],
+        formatters=[_formatter],
+        handlers=[_handler],
+        loggers=[_logger],
+        queued=True,
+        queue_size=1000,
+    )
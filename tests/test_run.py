@@ -18,3 +18,154 @@ from .test_suites.validation_tests.expect_pass import (
 )
 
 log.info("Running validation tests, expect fails")
+
+log.info("Running handler tests")
+
+from .test_suites.handler_tests.async_handlers import (
+    test_async_file_handler_config_with_shutdown,
+    test_async_socket_handler_sends_pickled_records,
+    test_async_stream_handler_does_not_block_loop,
+)
+from .test_suites.handler_tests.binary import (
+    test_binary_decoder_rejects_undefined_ids,
+    test_binary_file_handler_config_and_decode_cli,
+    test_binary_file_handler_decodes_to_same_text,
+    test_binary_file_handler_failed_emit_starts_new_session,
+    test_binary_file_handler_sessions_on_reopen_and_full_dictionary,
+)
+from .test_suites.handler_tests.buffered import (
+    test_buffered_handler_batches_records,
+    test_buffered_handler_config_class,
+    test_buffered_handler_flushes_on_error_level,
+    test_buffered_handler_flushes_on_interval,
+)
+from .test_suites.handler_tests.collector import (
+    test_collector_many_concurrent_producers,
+    test_collector_rejects_unsafe_and_oversized_frames,
+    test_collector_writes_rotated_files,
+)
+from .test_suites.handler_tests.dedup import (
+    test_dedup_handler_collapses_consecutive_duplicates,
+    test_dedup_handler_config_class,
+    test_dedup_handler_mismatched_args,
+    test_dedup_handler_window_and_timeout,
+)
+from .test_suites.handler_tests.multiprocess import (
+    test_multiprocess_handler_reopens_after_external_rotation,
+    test_multiprocess_rotation_no_lost_or_duplicate_lines,
+    test_rotating_handler_config_multiprocess_class,
+)
+from .test_suites.handler_tests.queued import (
+    test_queue_listener_config_class,
+    test_queued_configdict,
+    test_queued_handler_drops_when_full,
+    test_queued_handler_writes_records,
+)
+from .test_suites.handler_tests.ring import (
+    test_ring_buffer_dumps_on_error,
+    test_ring_buffer_handler_config_class,
+    test_ring_buffer_keeps_last_records,
+)
+from .test_suites.handler_tests.rotating import (
+    test_background_rotation_compresses_backups,
+    test_background_rotation_matches_stdlib,
+    test_background_timed_rotation_keeps_backup_count,
+    test_rotating_handler_config_background_class,
+)
+from .test_suites.handler_tests.sharded import (
+    test_merge_sharded_records,
+    test_merge_standard_format_records,
+    test_sharded_handler_created_ns,
+    test_sharded_handler_writes_pid_shard,
+)
+from .test_suites.handler_tests.mmap import (
+    test_mmap_handler_committed_length_survives_crash,
+    test_mmap_handler_config_rotates,
+    test_mmap_handler_grows_and_truncates,
+)
+from .test_suites.handler_tests.smtp import (
+    test_digest_smtp_handler_config_class,
+    test_digest_smtp_handler_groups_records,
+    test_digest_smtp_handler_rate_limit_keeps_counts,
+    test_digest_smtp_handler_starttls_context,
+)
+from .test_suites.handler_tests.socket import (
+    test_batched_socket_handler_config_and_stdlib_frames,
+    test_batched_socket_handler_frame_per_record,
+    test_batched_socket_handler_reconnects_without_blocking,
+    test_batched_socket_handler_sends_frames,
+)
+
+log.info("Running filter tests")
+
+from .test_suites.filter_tests.compiled import (
+    test_compile_handler_filters_and_names,
+    test_compiled_filter_config_in_configdict,
+    test_compiled_filter_matches_filter_chain,
+)
+from .test_suites.filter_tests.expression import (
+    test_expression_filter_config_saved_as_json,
+    test_expression_filter_matches_hand_written_function,
+    test_expression_filter_rejects_unsafe_expressions,
+)
+from .test_suites.filter_tests.ratelimit import (
+    test_rate_limit_filter_config_in_configdict,
+    test_rate_limit_filter_lru_keys,
+    test_rate_limit_filter_reports_summary_on_refill,
+    test_rate_limit_filter_reports_unreported_counts,
+    test_rate_limit_filter_token_bucket,
+)
+from .test_suites.filter_tests.sampling import (
+    test_keyed_sampling_filter_is_deterministic,
+    test_rate_sampling_filter_rates_per_level,
+    test_sampling_filter_configs_in_configdict,
+)
+
+log.info("Running formatter tests")
+
+from .test_suites.formatter_tests.cached_time import (
+    test_cached_time_formatter_config_in_configdict,
+    test_cached_time_formatter_matches_stdlib_across_dst,
+    test_cached_time_formatter_utc_and_converter_changes,
+)
+from .test_suites.formatter_tests.compiled import (
+    test_compiled_formatter_config_in_configdict,
+    test_compiled_formatter_matches_stdlib_output,
+    test_compiled_formatter_missing_field_error,
+)
+from .test_suites.formatter_tests.shared import (
+    test_shared_formatter_config_in_configdict,
+    test_shared_formatter_encoded_bytes,
+    test_shared_formatter_formats_once_per_record,
+)
+from .test_suites.formatter_tests.structured import (
+    test_json_formatter_config_writes_ndjson,
+    test_json_formatter_fields_extras_and_fallback,
+    test_logfmt_formatter_quoting,
+)
+
+log.info("Running helper tests")
+
+from .test_suites.helper_tests.introspection import (
+    test_configure_record_introspection_existing_handlers,
+    test_configure_record_introspection_switches,
+    test_setup_logging_auto_introspection,
+    test_used_record_attributes_per_config,
+)
+
+log.info("Running logger tests")
+
+from .test_suites.logger_tests.caller import (
+    test_cached_caller_logger_matches_stdlib_records,
+    test_cached_caller_logger_set_logger_class,
+    test_cached_caller_logger_srcfile_changes,
+)
+from .test_suites.logger_tests.gates import (
+    test_install_gates_resolves_and_replaces,
+    test_logger_config_gates_in_configdict,
+    test_template_gate_drops_before_record_created,
+)
+from .test_suites.logger_tests.lazy import (
+    test_lazy_adapter_defers_functions,
+    test_lazy_computed_once_only_when_emitted,
+)
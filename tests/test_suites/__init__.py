@@ -1,3 +1,10 @@
 from __future__ import annotations
 
-from . import validation_tests
+from . import (
+    filter_tests,
+    formatter_tests,
+    handler_tests,
+    helper_tests,
+    logger_tests,
+    validation_tests,
+)
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_compile_handler_filters_and_names,
+    test_compiled_filter_config_in_configdict,
+    test_compiled_filter_matches_filter_chain,
+)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import logging.config
+from pathlib import Path
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.filter_tests.compiled")
+
+
+def _no_secrets(record: logging.LogRecord) -> bool:
+    return "password" not in str(record.msg)
+
+
+def _records() -> list[logging.LogRecord]:
+    return [
+        logging.makeLogRecord({"name": name, "levelno": levelno, "msg": msg})
+        for name, levelno, msg in itertools.product(
+            ["app", "app.db", "application", "other", "app.db.pool"],
+            [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR],
+            ["connected", "password=hunter2"],
+        )
+    ]
+
+
+@mark.filters
+def test_compiled_filter_matches_filter_chain():
+    filters: list = [
+        red_logging.filters.info_filter,
+        logging.Filter("app"),
+        red_logging.filters.FilterConfig(name="no_secrets", func=_no_secrets).get_filter(),
+        red_logging.filters.warning_filter,
+        red_logging.filters.RateSamplingFilter(rate=1.0),
+    ]
+    chained = logging.Handler()
+    for _filter in filters:
+        chained.addFilter(_filter)
+    compiled = red_logging.filters.CompiledFilter(filters)
+
+    for record in _records():
+        assert bool(compiled.filter(record)) == bool(chained.filter(record)), record
+
+    ## Both level filters fold into 1 comparison, and only opaque filters are called
+    assert compiled.source.count("record.levelno") == 1
+    assert "record.levelno < 30" in compiled.source
+    assert compiled.source.count("_call") == 2
+
+
+@mark.filters
+def test_compile_handler_filters_and_names():
+    handler = logging.Handler()
+    handler.addFilter(red_logging.filters.error_filter)
+    handler.addFilter(_no_secrets)
+    expected: list[bool] = [bool(handler.filter(record)) for record in _records()]
+
+    compiled = red_logging.filters.compile_handler_filters(handler)
+    assert handler.filters == [compiled]
+    assert [bool(handler.filter(record)) for record in _records()] == expected
+
+    ## `names` allows any of several logger trees, without matching "application" for "app"
+    by_name = red_logging.filters.CompiledFilter(names=["app", "other"], level="INFO")
+    passed: set[str] = {r.name for r in _records() if by_name.filter(r)}
+    assert passed == {"app", "app.db", "app.db.pool", "other"}
+
+
+@mark.filters
+def test_compiled_filter_config_in_configdict(tmp_path: Path):
+    log_file: Path = tmp_path / "compiled.log"
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="plain", fmt="%(name)s %(message)s")],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="compiled_file",
+                    level="DEBUG",
+                    formatter="plain",
+                    filename=str(log_file),
+                    filters=["app_info"],
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name=name, handlers=["compiled_file"], level="DEBUG", propagate=False
+                )
+                for name in ("app", "other")
+            ],
+            filters=[
+                red_logging.filters.CompiledFilterConfig(
+                    name="app_info",
+                    filters=["red_logging.filters.info_filter", _no_secrets],
+                    names=["app"],
+                )
+            ],
+        )
+    )
+    try:
+        logging.getLogger("app").debug("debug")
+        logging.getLogger("app.db").info("connected")
+        logging.getLogger("app.db").info("password=hunter2")
+        logging.getLogger("other").warning("not from app")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text() == "app.db connected\n"
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_expression_filter_config_saved_as_json,
+    test_expression_filter_matches_hand_written_function,
+    test_expression_filter_rejects_unsafe_expressions,
+)
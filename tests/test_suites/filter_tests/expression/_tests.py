@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+from pytest import mark, raises
+import red_logging
+
+log = logging.getLogger("tests.test_suites.filter_tests.expression")
+
+EXPRESSION: str = (
+    'levelno >= WARNING and name.startswith("app.db") and not msg.startswith("heartbeat")'
+)
+
+
+def _hand_written(record: logging.LogRecord) -> bool:
+    return (
+        record.levelno >= logging.WARNING
+        and record.name.startswith("app.db")
+        and not record.msg.startswith("heartbeat")
+    )
+
+
+@mark.filters
+def test_expression_filter_matches_hand_written_function():
+    _filter = red_logging.filters.ExpressionFilter(EXPRESSION)
+
+    for name, levelno, msg in itertools.product(
+        ["app", "app.db", "app.db.pool", "other"],
+        [logging.DEBUG, logging.WARNING, logging.CRITICAL],
+        ["heartbeat ok", "query failed: %s"],
+    ):
+        record = logging.makeLogRecord({"name": name, "levelno": levelno, "msg": msg})
+        assert bool(_filter.filter(record)) == _hand_written(record), record
+
+    ## `message` is the formatted message, and `extra.<key>` is None when the record lacks the key
+    _extra = red_logging.filters.ExpressionFilter(
+        'extra.tenant in ("acme", "globex") or "timeout" in message.lower()'
+    )
+    assert _extra.filter(logging.makeLogRecord({"msg": "ok", "tenant": "acme"}))
+    assert not _extra.filter(logging.makeLogRecord({"msg": "ok", "tenant": "initech"}))
+    assert _extra.filter(logging.makeLogRecord({"msg": "%s", "args": ("Read TIMEOUT",)}))
+    assert not _extra.filter(logging.makeLogRecord({"msg": "ok"}))
+
+    ## A record the expression cannot be evaluated for is kept
+    assert _filter.filter(
+        logging.makeLogRecord({"name": "app.db", "levelno": logging.ERROR, "msg": ValueError()})
+    )
+
+
+@mark.filters
+def test_expression_filter_rejects_unsafe_expressions():
+    for expression in [
+        '__import__("os").system("true")',
+        "msg.__class__",
+        "record.levelno > 10",
+        "msg.format(0)",
+        "[x for x in msg]",
+        "(lambda: True)()",
+        "msg[0] == 'a'",
+        "levelno > 10 if True else False",
+        "levelno >",
+    ]:
+        with raises(ValueError):
+            red_logging.filters.compile_expression(expression)
+
+    with raises(ValueError):
+        red_logging.filters.FilterConfig(name="bad", expression="open('/etc/passwd')")
+    with raises(ValueError):
+        red_logging.filters.FilterConfig(name="empty")
+
+
+@mark.filters
+def test_expression_filter_config_saved_as_json(tmp_path: Path):
+    log_file: Path = tmp_path / "expression.log"
+    config_file: Path = tmp_path / "logging_config.json"
+    red_logging.helpers.save_configdict(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="plain", fmt="%(name)s %(message)s")],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="db_file",
+                    level="DEBUG",
+                    formatter="plain",
+                    filename=str(log_file),
+                    filters=["db_warnings"],
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="app", handlers=["db_file"], level="DEBUG", propagate=False
+                )
+            ],
+            filters=[red_logging.filters.FilterConfig(name="db_warnings", expression=EXPRESSION)],
+        ),
+        output_file=config_file,
+    )
+
+    logging.config.dictConfig(json.loads(config_file.read_text()))
+    try:
+        logging.getLogger("app.db").warning("heartbeat late")
+        logging.getLogger("app.db").warning("query failed")
+        logging.getLogger("app.db").info("query ok")
+        logging.getLogger("app.web").error("not from app.db")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text() == "app.db query failed\n"
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_rate_limit_filter_config_in_configdict,
+    test_rate_limit_filter_lru_keys,
+    test_rate_limit_filter_reports_summary_on_refill,
+    test_rate_limit_filter_reports_unreported_counts,
+    test_rate_limit_filter_token_bucket,
+)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+from pathlib import Path
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.filter_tests.ratelimit")
+
+
+def _record(created: float, lineno: int = 10, levelno: int = logging.WARNING) -> logging.LogRecord:
+    return logging.makeLogRecord(
+        {
+            "msg": "disk %s is slow",
+            "args": ("sda",),
+            "levelno": levelno,
+            "pathname": "app.py",
+            "lineno": lineno,
+            "created": created,
+        }
+    )
+
+
+@mark.filters
+def test_rate_limit_filter_token_bucket():
+    _filter = red_logging.filters.RateLimitFilter(rate=2.0, burst=3)
+
+    ## A burst of 3 is allowed, then the call site is limited until tokens refill
+    kept: list[bool] = [_filter.filter(_record(100.0)) for _ in range(10)]
+    assert kept == [True] * 3 + [False] * 7
+    assert _filter.suppressed == 7
+
+    ## Another call site has its own bucket
+    assert _filter.filter(_record(100.0, lineno=20))
+
+    ## 0.5s refills 1 token at 2/s. The record that spends it carries the count, and its message
+    #  template is unchanged
+    record: logging.LogRecord = _record(100.5)
+    assert _filter.filter(record)
+    assert record.suppressed == 7
+    assert record.msg == "disk %s is slow"
+    assert not _filter.filter(_record(100.5))
+
+    ## A second filter adds the records it dropped to the count, instead of repeating a summary
+    _handler_filter = red_logging.filters.RateLimitFilter(rate=1.0, burst=1)
+    assert _handler_filter.filter(_record(300.0, lineno=30))
+    assert not _handler_filter.filter(_record(300.0, lineno=30))
+    record = _record(301.0, lineno=30)
+    record.suppressed = 4
+    assert _handler_filter.filter(record)
+    assert record.suppressed == 5 and record.getMessage() == "disk sda is slow"
+
+    ## Refilling never goes over the burst size
+    assert [_filter.filter(_record(200.0)) for _ in range(5)] == [True] * 3 + [False] * 2
+
+
+@mark.filters
+def test_rate_limit_filter_lru_keys():
+    _filter = red_logging.filters.RateLimitFilter(rate=1.0, burst=1, max_keys=3)
+
+    for lineno in (1, 2, 3):
+        assert _filter.filter(_record(0.0, lineno=lineno))
+    ## Using line 1 again makes line 2 the least recently used
+    assert not _filter.filter(_record(0.0, lineno=1))
+    assert _filter.filter(_record(0.0, lineno=4))
+
+    assert len(_filter) == 3
+    assert _filter.evicted == 1
+    ## Line 2 was evicted, so it starts with a full bucket. Line 1 is still limited.
+    assert _filter.filter(_record(0.0, lineno=2))
+    assert not _filter.filter(_record(0.0, lineno=1))
+
+    ## keep_level bypasses the limit
+    _errors_kept = red_logging.filters.RateLimitFilter(rate=1.0, burst=1, keep_level="ERROR")
+    assert all(_errors_kept.filter(_record(0.0, levelno=logging.ERROR)) for _ in range(5))
+
+
+@mark.filters
+def test_rate_limit_filter_reports_unreported_counts():
+    summaries: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = summaries.append
+    summary_logger: logging.Logger = logging.getLogger("red_logging.ratelimit")
+    summary_logger.addHandler(handler)
+    _filter = red_logging.filters.RateLimitFilter(rate=1.0, burst=1, max_keys=1)
+    try:
+        assert _filter.filter(_record(0.0, lineno=1))
+        assert not any(_filter.filter(_record(0.0, lineno=1)) for _ in range(3))
+        ## Evicting line 1's bucket reports its count
+        assert _filter.filter(_record(0.0, lineno=2))
+        assert not any(_filter.filter(_record(0.0, lineno=2)) for _ in range(2))
+        ## Line 2 never logs again, so its count is only reported when asked (or at exit)
+        assert _filter.report_suppressed() == 2
+        assert _filter.report_suppressed() == 0
+        ## Summary records are never limited by the filter
+        assert all(_filter.filter(summary) for summary in summaries * 3)
+    finally:
+        summary_logger.removeHandler(handler)
+
+    assert [(r.getMessage(), r.suppressed) for r in summaries] == [
+        ("Suppressed 3 messages from app.py:1", 3),
+        ("Suppressed 2 messages from app.py:2", 2),
+    ]
+
+
+@mark.filters
+def test_rate_limit_filter_reports_summary_on_refill():
+    summaries: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = summaries.append
+    summary_logger: logging.Logger = logging.getLogger("red_logging.ratelimit")
+    summary_logger.addHandler(handler)
+    _filter = red_logging.filters.RateLimitFilter(rate=1.0, burst=1)
+    try:
+        assert _filter.filter(_record(0.0))
+        assert not any(_filter.filter(_record(0.0)) for _ in range(4))
+        assert summaries == []
+
+        ## The refill lets a record through, and the summary is logged with it
+        record: logging.LogRecord = _record(2.0)
+        assert _filter.filter(record)
+        assert record.suppressed == 4 and record.getMessage() == "disk sda is slow"
+        ## Already reported, so nothing is left for report_suppressed() or exit
+        assert _filter.report_suppressed() == 0
+    finally:
+        summary_logger.removeHandler(handler)
+
+    assert [(r.getMessage(), r.suppressed) for r in summaries] == [
+        ("Suppressed 4 messages from app.py:10", 4)
+    ]
+
+
+@mark.filters
+def test_rate_limit_filter_config_in_configdict(tmp_path: Path):
+    log_file: Path = tmp_path / "limited.log"
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="plain", fmt="%(message)s")],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="limited_file",
+                    level="DEBUG",
+                    formatter="plain",
+                    filename=str(log_file),
+                    filters=["per_call_site"],
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="test_ratelimit", handlers=["limited_file"], level="DEBUG"
+                )
+            ],
+            filters=[
+                red_logging.filters.RateLimitFilterConfig(
+                    name="per_call_site", rate=0.001, burst=5
+                )
+            ],
+        )
+    )
+    try:
+        _log: logging.Logger = logging.getLogger("test_ratelimit")
+        for i in range(1000):
+            _log.warning("retrying %d", i)
+        _log.info("a different call site")
+        assert _log.handlers[0].filters[0].report_suppressed() == 995
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text().splitlines() == [
+        "retrying 0",
+        "retrying 1",
+        "retrying 2",
+        "retrying 3",
+        "retrying 4",
+        "a different call site",
+    ]
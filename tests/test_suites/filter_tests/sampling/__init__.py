@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_keyed_sampling_filter_is_deterministic,
+    test_rate_sampling_filter_rates_per_level,
+    test_sampling_filter_configs_in_configdict,
+)
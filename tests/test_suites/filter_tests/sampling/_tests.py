@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+from pathlib import Path
+
+from pytest import mark, raises
+import red_logging
+
+log = logging.getLogger("tests.test_suites.filter_tests.sampling")
+
+
+def _record(levelno: int = logging.INFO, **extra) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": "message", "levelno": levelno, **extra})
+
+
+@mark.filters
+def test_rate_sampling_filter_rates_per_level():
+    _filter = red_logging.filters.RateSamplingFilter(
+        rate=1.0, rates={"DEBUG": 0.0, "INFO": 0.1}
+    )
+
+    assert not any(_filter.filter(_record(logging.DEBUG)) for _ in range(1000))
+    assert all(_filter.filter(_record(logging.WARNING)) for _ in range(1000))
+
+    kept: int = sum(_filter.filter(_record(logging.INFO)) for _ in range(20_000))
+    assert 1_600 < kept < 2_400, f"Expected ~10% of INFO records, kept {kept}"
+
+    with raises(ValueError):
+        red_logging.filters.RateSamplingFilter(rate=1.5)
+
+
+@mark.filters
+def test_keyed_sampling_filter_is_deterministic():
+    _filter = red_logging.filters.KeyedSamplingFilter(rate=0.1, key="request_id")
+    _other = red_logging.filters.KeyedSamplingFilter(rate=0.1, key="request_id")
+
+    request_ids: list[str] = [f"req-{i}" for i in range(20_000)]
+    kept: list[str] = [
+        request_id
+        for request_id in request_ids
+        if _filter.filter(_record(request_id=request_id))
+    ]
+    assert 1_600 < len(kept) < 2_400, f"Expected ~10% of requests, kept {len(kept)}"
+
+    ## Every record for a request gets the same decision, from any filter with the same salt
+    assert all(_other.filter(_record(request_id=request_id)) for request_id in kept)
+    assert all(_filter.filter(_record(logging.DEBUG, request_id=request_id)) for request_id in kept)
+
+    dropped: str = next(r for r in request_ids if r not in set(kept))
+    assert not _filter.filter(_record(request_id=dropped))
+    ## Warnings & above are kept, and so are records without a request ID
+    assert _filter.filter(_record(logging.ERROR, request_id=dropped))
+    assert _filter.filter(_record())
+
+    ## A different salt samples a different set of requests
+    _salted = red_logging.filters.KeyedSamplingFilter(rate=0.1, salt="v2")
+    assert {r for r in request_ids if _salted.sampled(r)} != set(kept)
+
+
+@mark.filters
+def test_sampling_filter_configs_in_configdict(tmp_path: Path):
+    log_file: Path = tmp_path / "sampled.log"
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="plain", fmt="%(message)s")],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="sampled_file",
+                    level="DEBUG",
+                    formatter="plain",
+                    filename=str(log_file),
+                    filters=["sample_requests", "no_debug"],
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="test_sampling", handlers=["sampled_file"], level="DEBUG"
+                )
+            ],
+            filters=[
+                red_logging.filters.KeyedSamplingFilterConfig(
+                    name="sample_requests", rate=0.5
+                ),
+                red_logging.filters.RateSamplingFilterConfig(
+                    name="no_debug", rates={"DEBUG": 0.0}
+                ),
+            ],
+        )
+    )
+    _sampler = red_logging.filters.KeyedSamplingFilter(rate=0.5)
+    try:
+        _log: logging.Logger = logging.getLogger("test_sampling")
+        for i in range(200):
+            _log.info(f"request {i}", extra={"request_id": i})
+            _log.debug(f"request {i} debug", extra={"request_id": i})
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text().splitlines() == [
+        f"request {i}" for i in range(200) if _sampler.sampled(i)
+    ]
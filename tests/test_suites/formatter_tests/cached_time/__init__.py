@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_cached_time_formatter_config_in_configdict,
+    test_cached_time_formatter_matches_stdlib_across_dst,
+    test_cached_time_formatter_utc_and_converter_changes,
+)
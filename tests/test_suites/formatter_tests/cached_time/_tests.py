@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import logging.config
+import os
+from pathlib import Path
+import time
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.formatter_tests.cached_time")
+
+## 2024-03-10 06:59:58 UTC, 2s before US clocks skip 02:00-03:00, & 2024-11-03 05:59:58 UTC, before
+#  01:00-02:00 happens twice
+DST_CHANGES: list[int] = [1710053998, 1730613598]
+
+
+@contextlib.contextmanager
+def _timezone(tz: str):
+    previous: str | None = os.environ.get("TZ")
+    os.environ["TZ"] = tz
+    time.tzset()
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = previous
+        time.tzset()
+
+
+def _record(created: float) -> logging.LogRecord:
+    record = logging.makeLogRecord({"name": "app", "msg": "tick"})
+    record.created = created
+    record.msecs = int((created - int(created)) * 1000) + 0.0
+
+    return record
+
+
+@mark.formatters
+def test_cached_time_formatter_matches_stdlib_across_dst():
+    fmt: str = red_logging.fmts.MESSAGE_FMT_STANDARD
+
+    with _timezone("America/New_York"):
+        for datefmt in [None, red_logging.fmts.DATE_FMT_STANDARD, "%Y-%m-%d %H:%M:%S %Z"]:
+            stdlib = logging.Formatter(fmt, datefmt)
+            cached = red_logging.formatters.CachedTimeFormatter(fmt, datefmt)
+            compiled = red_logging.formatters.CompiledFormatter(fmt, datefmt)
+
+            for start in DST_CHANGES:
+                ## 4 records per second, across the change, & back to an earlier second
+                for created in [start + step / 4 for step in range(16)] + [start + 0.5, start + 3.75]:
+                    record = _record(created)
+                    expected: str = stdlib.format(record)
+                    assert cached.format(record) == expected, (datefmt, created)
+                    assert compiled.format(record) == expected, (datefmt, created)
+
+        ## The local hour really did skip & repeat
+        hours = [time.localtime(start + 3600 * n).tm_hour for start in DST_CHANGES for n in (0, 1)]
+        assert hours == [1, 3, 1, 1]
+
+
+@mark.formatters
+def test_cached_time_formatter_utc_and_converter_changes():
+    record = _record(DST_CHANGES[0] + 0.25)
+
+    with _timezone("America/New_York"):
+        utc = red_logging.formatters.CachedTimeFormatter("%(asctime)s", utc=True)
+        assert utc.format(record) == "2024-03-10 06:59:58,250"
+
+        ## Changing the converter is picked up in the same second
+        local = red_logging.formatters.CachedTimeFormatter("%(asctime)s")
+        assert local.format(record) == "2024-03-10 01:59:58,250"
+        local.converter = time.gmtime
+        assert local.format(record) == "2024-03-10 06:59:58,250"
+
+        ## Times before the epoch round down, like time.gmtime()
+        stdlib_utc = logging.Formatter("%(asctime)s")
+        stdlib_utc.converter = time.gmtime
+        for created in [-1.5, -0.5, 0.25]:
+            record = _record(created)
+            assert utc.format(record) == stdlib_utc.format(record), created
+
+
+@mark.formatters
+def test_cached_time_formatter_config_in_configdict(tmp_path: Path):
+    log_file: Path = tmp_path / "cached_time.log"
+    formatter = red_logging.config_classes.FormatterConfig(
+        name="utc",
+        fmt="%(asctime)s %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%SZ",
+        cache_time=True,
+        utc=True,
+    )
+    assert formatter.get_configdict() == {
+        "utc": {
+            "()": "red_logging.formatters.CachedTimeFormatter",
+            "fmt": "%(asctime)s %(message)s",
+            "datefmt": "%Y-%m-%dT%H:%M:%SZ",
+            "style": "%",
+            "validate": True,
+            "utc": True,
+        }
+    }
+
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[formatter],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="utc_file", level="DEBUG", formatter="utc", filename=str(log_file)
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="app", handlers=["utc_file"], level="DEBUG", propagate=False
+                )
+            ],
+        )
+    )
+    try:
+        handler = logging.getLogger("app").handlers[0]
+        assert isinstance(handler.formatter, red_logging.formatters.CachedTimeFormatter)
+        assert handler.formatter.converter is time.gmtime
+        before: float = time.time()
+        logging.getLogger("app").info("tick")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text() in {
+        time.strftime("%Y-%m-%dT%H:%M:%SZ tick\n", time.gmtime(before + delta)) for delta in (0, 1)
+    }
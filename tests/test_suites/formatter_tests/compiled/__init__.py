@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_compiled_formatter_config_in_configdict,
+    test_compiled_formatter_matches_stdlib_output,
+    test_compiled_formatter_missing_field_error,
+)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+from pathlib import Path
+import sys
+
+from pytest import mark, raises
+import red_logging
+
+log = logging.getLogger("tests.test_suites.formatter_tests.compiled")
+
+## Fields with padding, zero-fill, precision & repr conversions, plus escaped `%` and literal braces
+EXTRA_FMTS: list[str] = [
+    "%(lineno)05d|%(relativeCreated).3f|%(levelno)+d|%(msg)r",
+    "100%% {%(name).3s} %(funcName)-12s|%(process)x|%(message)10s|%(args)-20a",
+    "",
+]
+
+
+def _records() -> list[logging.LogRecord]:
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    records: list[logging.LogRecord] = []
+    for args, exc in [((), None), (("wörld", 3), None), (("x", 1), exc_info)]:
+        msg: str = "héllo %s %d" if args else "héllo"
+        record = logging.LogRecord(
+            "app.db", logging.WARNING, "/srv/app/db.py", 42, msg, args, exc, func="query"
+        )
+        ## Attributes used by MESSAGE_FMT_SHARDED
+        record.seq = 7
+        record.created_ns = 1_700_000_000_123_456_789
+        records.append(record)
+
+    return records
+
+
+@mark.formatters
+def test_compiled_formatter_matches_stdlib_output():
+    fmts: list[str] = [
+        value
+        for name, value in vars(red_logging.fmts).items()
+        if "FMT" in name and not name.startswith("DATE") and isinstance(value, str)
+    ]
+    assert red_logging.fmts.MESSAGE_FMT_BASIC in fmts
+
+    for fmt in fmts + EXTRA_FMTS:
+        for datefmt in [None, red_logging.fmts.DATE_FMT_STANDARD]:
+            stdlib = logging.Formatter(fmt, datefmt)
+            compiled = red_logging.formatters.CompiledFormatter(fmt, datefmt)
+            assert compiled.source is not None, fmt
+
+            for record in _records():
+                expected: str = stdlib.format(record)
+                record.exc_text = None
+                assert compiled.format(record) == expected, (fmt, compiled.source)
+
+    ## Defaults fill fields a record does not have, like logging.Formatter's
+    defaults = {"tenant": "-"}
+    record = _records()[0]
+    assert red_logging.formatters.CompiledFormatter(
+        "%(tenant)s %(message)s", defaults=defaults
+    ).format(record) == logging.Formatter("%(tenant)s %(message)s", defaults=defaults).format(record)
+
+    ## Other styles, and `*` widths, are left to logging.Formatter
+    assert red_logging.formatters.CompiledFormatter("{message}", style="{").source is None
+    assert red_logging.formatters.CompiledFormatter("%(lineno)*d", validate=False).source is None
+
+
+@mark.formatters
+def test_compiled_formatter_missing_field_error():
+    record = _records()[0]
+    fmt: str = "%(levelname)-8s %(tenant)s %(message)s"
+
+    with raises(ValueError) as stdlib_error:
+        logging.Formatter(fmt).format(record)
+    with raises(ValueError) as compiled_error:
+        red_logging.formatters.CompiledFormatter(fmt).format(record)
+
+    assert str(compiled_error.value) == str(stdlib_error.value)
+
+
+@mark.formatters
+def test_compiled_formatter_config_in_configdict(tmp_path: Path):
+    log_file: Path = tmp_path / "compiled.log"
+    formatter = red_logging.config_classes.FormatterConfig(
+        name="compiled", fmt="%(levelname)-8s %(name)s: %(message)s", datefmt=None, compiled=True
+    )
+    assert formatter.get_configdict()["compiled"]["()"] == "red_logging.formatters.CompiledFormatter"
+    assert "()" not in red_logging.get_formatter_config(name="plain").get_configdict()["plain"]
+
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[formatter],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="compiled_file", level="DEBUG", formatter="compiled", filename=str(log_file)
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="app", handlers=["compiled_file"], level="DEBUG", propagate=False
+                )
+            ],
+        )
+    )
+    try:
+        handler = logging.getLogger("app").handlers[0]
+        assert isinstance(handler.formatter, red_logging.formatters.CompiledFormatter)
+        logging.getLogger("app.db").info("query %s", "ok")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text() == "INFO     app.db: query ok\n"
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_shared_formatter_config_in_configdict,
+    test_shared_formatter_encoded_bytes,
+    test_shared_formatter_formats_once_per_record,
+)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import logging.config
+from pathlib import Path
+import pickle
+
+import red_logging
+from red_logging.formatters import (
+    FORMAT_CACHE_ATTRIBUTE,
+    CompiledFormatter,
+    JSONFormatter,
+)
+
+from pytest import mark
+
+log = logging.getLogger("tests.test_suites.formatter_tests.shared")
+
+
+class _CountingFormatter(CompiledFormatter):
+    def __init__(self, *args, **kwargs) -> None:
+        self.calls: int = 0
+        super().__init__(*args, **kwargs)
+
+    def format(self, record: logging.LogRecord) -> str:
+        self.calls += 1
+        return super().format(record)
+
+
+def _logger(name: str, formatters: list[logging.Formatter]) -> tuple[logging.Logger, list[io.StringIO]]:
+    logger = logging.Logger(name)
+    streams: list[io.StringIO] = []
+    for formatter in formatters:
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        streams.append(stream)
+
+    return logger, streams
+
+
+@mark.formatters
+def test_shared_formatter_formats_once_per_record():
+    fmt: str = red_logging.fmts.MESSAGE_FMT_STANDARD
+    shared = _CountingFormatter(fmt, red_logging.fmts.DATE_FMT_STANDARD, share_output=True)
+    other = _CountingFormatter("%(levelname)s %(message)s", share_output=True)
+    unshared = CompiledFormatter(fmt, red_logging.fmts.DATE_FMT_STANDARD)
+    logger, streams = _logger("tests.shared", [shared, shared, other, shared, unshared])
+
+    logger.info("hello %s", "world")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+
+    ## 1 call per record for each formatter, with the same output as a formatter per handler
+    assert shared.calls == 2 and other.calls == 2
+    assert streams[0].getvalue() == streams[1].getvalue() == streams[3].getvalue()
+    assert streams[0].getvalue() == streams[4].getvalue()
+    assert streams[2].getvalue().startswith("INFO hello world\nERROR failed\nTraceback")
+
+    ## A handler filter that rewrites the message, or adds an attribute, gets a fresh format
+    logger.handlers[1].addFilter(lambda record: setattr(record, "msg", "rewritten") or True)
+    logger.handlers[3].addFilter(lambda record: setattr(record, "tenant", "a") or True)
+    logger.warning("original")
+    assert streams[0].getvalue().endswith("original\n")
+    assert streams[1].getvalue().endswith("rewritten\n")
+    assert streams[3].getvalue().endswith("rewritten\n")
+    assert shared.calls == 5
+
+    ## The cache is not sent with a record, or written as a JSON extra
+    record = logging.makeLogRecord({"msg": "m"})
+    shared.format(record)
+    assert FORMAT_CACHE_ATTRIBUTE in record.__dict__
+    assert pickle.loads(pickle.dumps(record.__dict__))[FORMAT_CACHE_ATTRIBUTE] == {}
+    assert FORMAT_CACHE_ATTRIBUTE not in red_logging.handlers.record_to_dict(record)
+    assert FORMAT_CACHE_ATTRIBUTE not in json.loads(JSONFormatter(share_output=True).format(record))
+
+
+@mark.formatters
+def test_shared_formatter_encoded_bytes(tmp_path: Path):
+    shared = CompiledFormatter("%(levelname)s %(message)s", share_output=True)
+    handlers: list[logging.Handler] = [
+        red_logging.handlers.BufferedFileHandler(tmp_path / "a.log", flush_bytes=0),
+        red_logging.handlers.MultiProcessRotatingFileHandler(tmp_path / "b.log"),
+        red_logging.handlers.BufferedFileHandler(tmp_path / "c.log", encoding="utf-16", flush_bytes=0),
+    ]
+    for handler in handlers:
+        handler.setFormatter(shared)
+
+    record = logging.makeLogRecord({"msg": "héllo %s", "args": ("wörld",), "levelname": "INFO"})
+    encoded: list[bytes] = [
+        red_logging.formatters.format_bytes(handler, record, encoding, "strict")
+        for handler, encoding in zip(handlers, ["utf-8", "utf-8", "utf-16"])
+    ]
+    ## The same bytes object for the same encoding
+    assert encoded[0] is encoded[1]
+    assert encoded[2] == "INFO héllo wörld\n".encode("utf-16")
+
+    for handler in handlers:
+        handler.handle(record)
+        handler.close()
+    assert (tmp_path / "a.log").read_bytes() == (tmp_path / "b.log").read_bytes() == encoded[0]
+    assert (tmp_path / "c.log").read_text(encoding="utf-16") == "INFO héllo wörld\n"
+
+
+@mark.formatters
+def test_shared_formatter_config_in_configdict():
+    formatter_config = red_logging.config_classes.formatters.FormatterConfig(
+        name="shared", fmt="%(levelname)s %(message)s", share_output=True
+    )
+    formatter_dict: dict = formatter_config.get_configdict()["shared"]
+    assert formatter_dict["()"] == "red_logging.formatters.CachedTimeFormatter"
+    assert formatter_dict["share_output"] is True
+    json_dict: dict = red_logging.config_classes.formatters.JSONFormatterConfig(
+        name="json", share_output=True
+    ).get_configdict()["json"]
+    assert json_dict["share_output"] is True
+
+    streams: dict[str, io.StringIO] = {"first": io.StringIO(), "second": io.StringIO()}
+    config: dict = red_logging.assemble_configdict(
+        root_handlers=[], formatters=[formatter_config], handlers=[], loggers=[]
+    )
+    config["handlers"] = {
+        name: {"class": "logging.StreamHandler", "formatter": "shared", "stream": stream}
+        for name, stream in streams.items()
+    }
+    config["loggers"] = {
+        "tests.shared.config": {"handlers": list(streams), "level": "INFO", "propagate": False}
+    }
+    try:
+        logging.config.dictConfig(config)
+        logging.getLogger("tests.shared.config").info("configured")
+        assert logging.getLogger("tests.shared.config").handlers[0].formatter.share_output
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert streams["first"].getvalue() == streams["second"].getvalue() == "INFO configured\n"
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_json_formatter_config_writes_ndjson,
+    test_json_formatter_fields_extras_and_fallback,
+    test_logfmt_formatter_quoting,
+)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+import sys
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.formatter_tests.structured")
+
+
+class Unprintable:
+    def __str__(self) -> str:
+        raise RuntimeError("no str")
+
+
+def _record(**extra) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "app.db", logging.WARNING, "/srv/app/db.py", 42, 'query "%s"\nfailed', ("ü",), None
+    )
+    record.__dict__.update(extra)
+
+    return record
+
+
+@mark.formatters
+def test_json_formatter_fields_extras_and_fallback():
+    circular: list = []
+    circular.append(circular)
+    record = _record(
+        request_id="r-1",
+        attempt=3,
+        ratio=0.5,
+        cached=False,
+        user=None,
+        tags={"a": [1, 2.5, None]},
+        unprintable=Unprintable(),
+        circular=circular,
+        rows=list(range(1000)),
+        nan=float("nan"),
+    )
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record.exc_info = sys.exc_info()
+
+    formatter = red_logging.formatters.JSONFormatter(
+        fields=["levelname", "name", "message", "lineno"],
+        rename={"levelname": "level"},
+        max_fallback_length=64,
+    )
+    line: str = formatter.format(record)
+    assert "\n" not in line
+    data: dict = json.loads(line)
+
+    assert list(data)[:5] == ["level", "name", "message", "lineno", "exc_info"]
+    assert data["level"] == "WARNING" and data["lineno"] == 42
+    assert data["message"] == 'query "ü"\nfailed'
+    assert data["exc_info"].endswith("ValueError: boom")
+    assert {key: data[key] for key in ["request_id", "attempt", "ratio", "cached", "user", "tags"]} == {
+        "request_id": "r-1",
+        "attempt": 3,
+        "ratio": 0.5,
+        "cached": False,
+        "user": None,
+        "tags": {"a": [1, 2.5, None]},
+    }
+    ## Values JSON cannot encode directly are written as bounded strings
+    assert data["unprintable"] == "<unprintable Unprintable>"
+    assert data["circular"] == "[[...]]"
+    assert data["rows"] == json.dumps(list(range(1000)), separators=(",", ":"))[:64] + "..."
+    assert '"nan":NaN' in line
+
+    ## Without extras, only the fields are written
+    formatter = red_logging.formatters.JSONFormatter(fields=["message"], extras=False)
+    assert formatter.format(_record(request_id="r-1")) == '{"message":"query \\"ü\\"\\nfailed"}'
+
+
+@mark.formatters
+def test_logfmt_formatter_quoting():
+    formatter = red_logging.formatters.LogfmtFormatter(
+        fields=["levelname", "message"], rename={"levelname": "level"}, max_fallback_length=8
+    )
+    record = _record(
+        request_id="r-1",
+        empty="",
+        user=None,
+        attempt=3,
+        path="a b=c",
+        obj=list(range(10)),
+        **{"bad key": 1},
+    )
+
+    assert formatter.format(record) == (
+        'level=WARNING message="query \\"ü\\"\\nfailed" request_id=r-1 empty="" user= attempt=3'
+        ' path="a b=c" obj="[0, 1, 2..." bad_key=1'
+    )
+
+
+@mark.formatters
+def test_json_formatter_config_writes_ndjson(tmp_path: Path):
+    log_file: Path = tmp_path / "app.ndjson"
+    config_file: Path = tmp_path / "logging_config.json"
+    red_logging.helpers.save_configdict(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[
+                red_logging.config_classes.formatters.JSONFormatterConfig(
+                    name="ndjson",
+                    fields=["asctime", "levelname", "message"],
+                    rename={"asctime": "time", "levelname": "level"},
+                    datefmt="%Y-%m-%dT%H:%M:%SZ",
+                    utc=True,
+                )
+            ],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="ndjson_file", level="DEBUG", formatter="ndjson", filename=str(log_file)
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="app", handlers=["ndjson_file"], level="DEBUG", propagate=False
+                )
+            ],
+        ),
+        output_file=config_file,
+    )
+
+    logging.config.dictConfig(json.loads(config_file.read_text()))
+    try:
+        logging.getLogger("app").info("started %s", "worker", extra={"request_id": "r-1"})
+        logging.getLogger("app").error("line 1\nline 2")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    lines: list[dict] = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [{k: v for k, v in line.items() if k != "time"} for line in lines] == [
+        {"level": "INFO", "message": "started worker", "request_id": "r-1"},
+        {"level": "ERROR", "message": "line 1\nline 2"},
+    ]
+    assert all(line["time"].endswith("Z") and "T" in line["time"] for line in lines)
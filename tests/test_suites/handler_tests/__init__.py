@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from . import async_handlers, binary, buffered, collector, dedup, mmap, multiprocess, queued, ring, rotating, sharded, smtp, socket
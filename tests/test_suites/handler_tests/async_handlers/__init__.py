@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_async_file_handler_config_with_shutdown,
+    test_async_socket_handler_sends_pickled_records,
+    test_async_stream_handler_does_not_block_loop,
+)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import logging.config
+from pathlib import Path
+import pickle
+import struct
+import time
+
+from pytest import mark, raises
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.async_handlers")
+
+
+class SlowStream:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write(self, s: str) -> int:
+        time.sleep(0.01)
+        self.lines.extend(s.splitlines())
+
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+
+@mark.handlers
+def test_async_stream_handler_does_not_block_loop():
+    stream = SlowStream()
+    handler = red_logging.handlers.AsyncStreamHandler(stream=stream, batch_size=10)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    async def main() -> float:
+        start: float = time.perf_counter()
+        for i in range(100):
+            handler.handle(logging.makeLogRecord({"msg": f"message {i}"}))
+            await asyncio.sleep(0)
+        elapsed: float = time.perf_counter() - start
+
+        await handler.shutdown()
+
+        return elapsed
+
+    try:
+        elapsed: float = asyncio.run(main())
+    finally:
+        handler.close()
+
+    ## 10 batches of 10 records, each write sleeps 10ms on the writer thread
+    assert elapsed < 0.05
+    assert stream.lines == [f"message {i}" for i in range(100)]
+
+
+@mark.handlers
+def test_async_file_handler_config_with_shutdown(tmp_path: Path):
+    logfile: Path = tmp_path / "app.log"
+    logging_config: dict = red_logging.assemble_configdict(
+        root_handlers=[],
+        formatters=[red_logging.get_formatter_config(name="default", fmt="%(message)s")],
+        handlers=[
+            red_logging.config_classes.FileHandlerConfig(
+                name="app_file", formatter="default", filename=str(logfile)
+            )
+        ],
+        loggers=[
+            red_logging.get_logger_config(name="async_test", handlers=["app_file"], level="DEBUG")
+        ],
+        asyncio_handlers=True,
+    )
+    assert (
+        logging_config["handlers"]["app_file"]["class"]
+        == red_logging.config_classes.handlers.AsyncFileHandlerConfig(name="x").get_handler_class()
+    )
+
+    logging.config.dictConfig(logging_config)
+
+    async def main() -> None:
+        _log = logging.getLogger("async_test")
+        for i in range(1000):
+            _log.info(f"message {i}")
+        await red_logging.handlers.shutdown_async_handlers()
+
+        assert len(logfile.read_text().splitlines()) == 1000
+
+        ## Records left in the queue when asyncio.run() returns are still written
+        _log.info("message 1000")
+
+    try:
+        asyncio.run(main())
+        ## Outside of an event loop, records are written right away
+        logging.getLogger("async_test").info("message 1001")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert logfile.read_text().splitlines() == [f"message {i}" for i in range(1002)]
+
+    with raises(ValueError):
+        red_logging.assemble_configdict(queued=True, asyncio_handlers=True)
+
+
+@mark.handlers
+def test_async_socket_handler_sends_pickled_records():
+    received: list[str] = []
+
+    async def read_records(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                length: int = struct.unpack(">L", await reader.readexactly(4))[0]
+                record_dict: dict = pickle.loads(await reader.readexactly(length))
+                received.append(logging.makeLogRecord(record_dict).getMessage())
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(read_records, "127.0.0.1", 0)
+        port: int = server.sockets[0].getsockname()[1]
+        handler = red_logging.handlers.AsyncSocketHandler("127.0.0.1", port)
+        try:
+            for i in range(50):
+                handler.handle(logging.makeLogRecord({"msg": "message %d", "args": (i,)}))
+            await handler.shutdown()
+        finally:
+            handler.close()
+
+        for _ in range(100):
+            if len(received) == 50:
+                break
+            await asyncio.sleep(0.01)
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(main())
+
+    assert received == [f"message {i}" for i in range(50)]
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_binary_decoder_rejects_undefined_ids,
+    test_binary_file_handler_config_and_decode_cli,
+    test_binary_file_handler_decodes_to_same_text,
+    test_binary_file_handler_failed_emit_starts_new_session,
+    test_binary_file_handler_sessions_on_reopen_and_full_dictionary,
+)
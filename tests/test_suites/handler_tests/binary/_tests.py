@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import enum
+import io
+import logging
+import logging.config
+from pathlib import Path
+
+from pytest import mark, raises
+import red_logging
+from red_logging.decode.__main__ import main as decode_main
+from red_logging.formatters import _binary
+
+log = logging.getLogger("tests.test_suites.handler_tests.binary")
+
+
+class Color(enum.IntEnum):
+    RED = 1
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _log_sample_records(logger: logging.Logger) -> None:
+    logger.info("query %s took %d ms (%.2f%%)", "wörld", 12, 99.5)
+    logger.warning("no args")
+    logger.debug("flags %s %s %s %r", True, False, None, "quoted")
+    logger.info("mapping %(user)s", {"user": "bob"})
+    logger.info("enum %s, big %d, bytes %s", Color.RED, 1 << 70, b"raw")
+    logger.info(ValueError("a non-str message"))
+    logger.info("with stack", stack_info=True)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed %s", "badly")
+
+
+def _setup_logger(name: str, *handlers: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    for handler in handlers:
+        logger.addHandler(handler)
+
+    return logger
+
+
+@mark.handlers
+def test_binary_file_handler_decodes_to_same_text(tmp_path: Path):
+    log_file: Path = tmp_path / "app.rlog"
+    binary = red_logging.handlers.BinaryFileHandler(str(log_file))
+    captured = ListHandler()
+    logger = _setup_logger("tests.binary.same_text", binary, captured)
+    try:
+        _log_sample_records(logger)
+        _log_sample_records(logger)
+    finally:
+        for handler in (binary, captured):
+            logger.removeHandler(handler)
+        binary.close()
+
+    fmts: list[str] = [
+        value
+        for name, value in vars(red_logging.fmts).items()
+        if "FMT" in name and not name.startswith("DATE") and isinstance(value, str)
+    ]
+    for seq, record in enumerate(captured.records, start=1):
+        record.seq = seq
+        record.created_ns = int(record.created * 1_000_000_000)
+
+    for fmt in fmts:
+        formatter = logging.Formatter(fmt, red_logging.fmts.DATE_FMT_STANDARD)
+        expected: list[str] = [formatter.format(record) + "\n" for record in captured.records]
+        assert list(red_logging.decode.decode_records([log_file], formatter=formatter)) == expected, fmt
+
+    ## relativeCreated is rebuilt from the start time stored in the file
+    with open(log_file, "rb") as stream:
+        decoded: list[logging.LogRecord] = list(red_logging.decode.iter_records(stream))
+    assert [record.relativeCreated for record in decoded] == [
+        record.relativeCreated for record in captured.records
+    ]
+    assert binary.dictionary.sessions == 1
+
+
+@mark.handlers
+def test_binary_file_handler_sessions_on_reopen_and_full_dictionary(tmp_path: Path):
+    log_file: Path = tmp_path / "app.rlog"
+    formatter = logging.Formatter("%(levelname)s %(message)s")
+
+    ## A small dictionary is restarted as it fills, and a new handler appends a new session
+    messages: list[str] = []
+    for run in range(2):
+        binary = red_logging.handlers.BinaryFileHandler(str(log_file), max_entries=8)
+        logger = _setup_logger(f"tests.binary.sessions.{run}", binary)
+        try:
+            for i in range(20):
+                ## Distinct templates, like f-strings, fill the dictionary
+                logger.info(f"run {run} message {i} %s", i % 3)
+                messages.append(f"INFO run {run} message {i} {i % 3}\n")
+        finally:
+            logger.removeHandler(binary)
+            binary.close()
+        assert binary.dictionary.sessions > 2
+
+    assert list(red_logging.decode.decode_records([log_file], formatter=formatter)) == messages
+
+
+@mark.handlers
+def test_binary_file_handler_failed_emit_starts_new_session(tmp_path: Path):
+    log_file: Path = tmp_path / "app.rlog"
+    binary = red_logging.handlers.BinaryFileHandler(str(log_file))
+    errors: list[logging.LogRecord] = []
+    binary.handleError = errors.append
+    logger = _setup_logger("tests.binary.failed_emit", binary)
+    try:
+        logger.info("before %s", 1)
+        ## A levelno that does not fit its frame, after the record's new strings were added
+        logger.log(70_000, "custom level %s", 2)
+        logger.info("after %s", 3)
+
+        ## A write that fails after the record's frames were encoded
+        write = binary.stream.write
+        binary.stream.write = lambda data: (_ for _ in ()).throw(OSError("disk full"))
+        logger.info("lost %s", 4)
+        binary.stream.write = write
+        logger.info("lost %s", 5)
+    finally:
+        logger.removeHandler(binary)
+        binary.close()
+
+    assert len(errors) == 2
+    assert binary.dictionary.sessions == 3
+    formatter = logging.Formatter("%(name)s %(message)s")
+    assert list(red_logging.decode.decode_records([log_file], formatter=formatter)) == [
+        "tests.binary.failed_emit before 1\n",
+        "tests.binary.failed_emit after 3\n",
+        "tests.binary.failed_emit lost 5\n",
+    ]
+
+
+@mark.handlers
+def test_binary_decoder_rejects_undefined_ids():
+    header: bytes = _binary.SESSION.pack(_binary.FRAME_SESSION, _binary.MAGIC, _binary.VERSION, 0.0)
+    record: bytes = _binary.RECORD.pack(_binary.FRAME_RECORD, 0.0, 5, 6, 0, 0, 0)
+    site: bytes = _binary.SITE.pack(_binary.FRAME_SITE, 0, 20, 1, 2, 3, 4, 5, 1)
+    for data in (header + record, header + site):
+        with raises(ValueError, match="never defined"):
+            list(red_logging.decode.iter_records(io.BytesIO(data)))
+
+
+@mark.handlers
+def test_binary_file_handler_config_and_decode_cli(tmp_path: Path, capsys):
+    log_file: Path = tmp_path / "app.rlog"
+    text_file: Path = tmp_path / "app.log"
+
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="default")],
+            handlers=[
+                red_logging.config_classes.handlers.BinaryFileHandlerConfig(
+                    name="binary_file", level="DEBUG", filename=str(log_file), max_entries=1024
+                )
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="app", handlers=["binary_file"], level="DEBUG", propagate=False
+                )
+            ],
+        )
+    )
+    try:
+        handler = logging.getLogger("app").handlers[0]
+        assert isinstance(handler, red_logging.handlers.BinaryFileHandler)
+        logging.getLogger("app.db").info("query %s", "ok")
+        logging.getLogger("app.db").error("query %s", "failed")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    fmt: str = "%(levelname)s:%(name)s:%(message)s"
+    assert decode_main([str(log_file), "--fmt", fmt, "-o", str(text_file)]) == 0
+    assert text_file.read_text() == "INFO:app.db:query ok\nERROR:app.db:query failed\n"
+
+    assert decode_main([str(log_file), "--fmt", "MESSAGE_FMT_BASIC"]) == 0
+    lines: list[str] = capsys.readouterr().out.splitlines()
+    assert [line.split(" : ")[1] for line in lines] == ["query ok", "query failed"]
+    assert "ERROR   " in lines[1]
+
+    ## A file cut off in the middle of a record is reported, not decoded as garbage
+    log_file.write_bytes(log_file.read_bytes()[:-3])
+    assert decode_main([str(log_file)]) == 1
+    assert "Truncated binary log" in capsys.readouterr().err
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_buffered_handler_batches_records,
+    test_buffered_handler_config_class,
+    test_buffered_handler_flushes_on_error_level,
+    test_buffered_handler_flushes_on_interval,
+)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+from pathlib import Path
+import time
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.buffered")
+
+
+def _make_record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test_buffered", level, __file__, 1, msg, None, None)
+
+
+@mark.handlers
+def test_buffered_handler_batches_records(tmp_path: Path):
+    log_file: Path = tmp_path / "buffered.log"
+    handler = red_logging.handlers.BufferedFileHandler(
+        log_file, flush_bytes=1024, flush_interval_ms=0
+    )
+    try:
+        for i in range(10):
+            handler.handle(_make_record(f"message {i}"))
+
+        assert log_file.read_text() == "", ValueError(
+            "Records should be buffered until a threshold is reached"
+        )
+
+        for i in range(10, 100):
+            handler.handle(_make_record(f"message {i}"))
+
+        assert 0 < len(log_file.read_text().splitlines()) < 100
+    finally:
+        handler.close()
+
+    lines: list[str] = log_file.read_text().splitlines()
+    assert lines == [f"message {i}" for i in range(100)]
+
+
+@mark.handlers
+def test_buffered_handler_flushes_on_error_level(tmp_path: Path):
+    log_file: Path = tmp_path / "buffered.log"
+    handler = red_logging.handlers.BufferedFileHandler(
+        log_file, flush_bytes=1024 * 1024, flush_interval_ms=0, flush_level="ERROR"
+    )
+    try:
+        handler.handle(_make_record("info message"))
+        handler.handle(_make_record("error message", level=logging.ERROR))
+
+        assert log_file.read_text().splitlines() == ["info message", "error message"]
+    finally:
+        handler.close()
+
+
+@mark.handlers
+def test_buffered_handler_flushes_on_interval(tmp_path: Path):
+    log_file: Path = tmp_path / "buffered.log"
+    handler = red_logging.handlers.BufferedFileHandler(
+        log_file, flush_bytes=1024 * 1024, flush_interval_ms=20
+    )
+    try:
+        handler.handle(_make_record("info message"))
+
+        deadline: float = time.monotonic() + 2
+        while not log_file.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert log_file.read_text() == "info message\n"
+    finally:
+        handler.close()
+
+
+@mark.handlers
+def test_buffered_handler_config_class(tmp_path: Path):
+    log_file: Path = tmp_path / "buffered.log"
+    _handler = red_logging.config_classes.handlers.BufferedFileHandlerConfig(
+        name="buffered", level="DEBUG", filename=str(log_file), flush_interval_ms=0
+    )
+    _logger = red_logging.get_logger_config(
+        name="test_buffered_config", handlers=["buffered"]
+    )
+
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[], handlers=[_handler], loggers=[_logger]
+        )
+    )
+    try:
+        logging.getLogger("test_buffered_config").info("configured message")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text() == "configured message\n"
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_collector_many_concurrent_producers,
+    test_collector_rejects_unsafe_and_oversized_frames,
+    test_collector_writes_rotated_files,
+)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import logging.config
+import logging.handlers
+from pathlib import Path
+import pickle
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.collector")
+
+
+async def _wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline: float = asyncio.get_running_loop().time() + timeout
+    while not predicate() and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+
+
+def _frame(record_dicts: list[dict]) -> bytes:
+    return red_logging.handlers.encode_frame(record_dicts)
+
+
+@mark.handlers
+def test_collector_writes_rotated_files(tmp_path: Path):
+    logfile: Path = tmp_path / "collected" / "collector.log"
+    logging.config.dictConfig(
+        red_logging.collector.get_collector_configdict(
+            filename=str(logfile), maxBytes=4096, backupCount=3, fmt="%(name)s %(message)s"
+        )
+    )
+    collector = red_logging.collector.LogCollector(port=0)
+
+    async def main() -> None:
+        await collector.start()
+
+        ## 1 stdlib SocketHandler & 1 BatchedSocketHandler, on their own threads
+        def _produce() -> None:
+            stdlib_handler = logging.handlers.SocketHandler("127.0.0.1", collector.port)
+            batched_handler = red_logging.handlers.BatchedSocketHandler(
+                "127.0.0.1", collector.port, flush_interval_ms=10
+            )
+            try:
+                for i in range(100):
+                    record = logging.makeLogRecord(
+                        {"name": "producer.stdlib", "levelno": 20, "msg": "message %d", "args": (i,)}
+                    )
+                    stdlib_handler.handle(record)
+                    batched_handler.handle(
+                        logging.makeLogRecord(
+                            {"name": "producer.batched", "levelno": 20, "msg": f"message {i}"}
+                        )
+                    )
+            finally:
+                stdlib_handler.close()
+                batched_handler.close()
+
+        await asyncio.to_thread(_produce)
+        await _wait_for(lambda: collector.records == 200)
+        await collector.stop()
+
+    try:
+        asyncio.run(main())
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert collector.records == 200
+    assert collector.errors == 0
+
+    files: list[Path] = sorted(logfile.parent.glob("collector.log*"))
+    assert len(files) > 1
+    lines: list[str] = [
+        line for f in files for line in f.read_text().splitlines()
+    ]
+    for name in ("producer.stdlib", "producer.batched"):
+        assert sorted(line for line in lines if line.startswith(name)) == sorted(
+            f"{name} message {i}" for i in range(100)
+        )
+
+
+@mark.handlers
+def test_collector_many_concurrent_producers():
+    received: list[logging.LogRecord] = []
+
+    class _ListHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            received.append(record)
+
+    collector_logger = logging.getLogger("collector_test.records")
+    collector_logger.propagate = False
+    list_handler = _ListHandler()
+    collector_logger.addHandler(list_handler)
+    collector = red_logging.collector.LogCollector(
+        port=0, logger_name="collector_test.records"
+    )
+    producers: int = 500
+
+    async def produce(n: int) -> None:
+        _reader, writer = await asyncio.open_connection("127.0.0.1", collector.port)
+        frames: bytes = b"".join(
+            _frame([{"name": f"producer.{n}", "msg": f"message {i}", "levelno": 20}])
+            for i in range(10)
+        )
+        ## Split the frames at odd boundaries, to exercise partial frames
+        for start in range(0, len(frames), 37):
+            writer.write(frames[start : start + 37])
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    async def main() -> None:
+        await collector.start()
+        await asyncio.gather(*(produce(n) for n in range(producers)))
+        await _wait_for(lambda: collector.records == producers * 10)
+        await collector.stop()
+
+    try:
+        asyncio.run(main())
+    finally:
+        collector_logger.removeHandler(list_handler)
+
+    assert collector.records == producers * 10
+    by_producer: dict[str, list[str]] = {}
+    for record in received:
+        by_producer.setdefault(record.name, []).append(record.getMessage())
+    assert len(by_producer) == producers
+    assert all(msgs == [f"message {i}" for i in range(10)] for msgs in by_producer.values())
+
+
+@mark.handlers
+def test_collector_rejects_unsafe_and_oversized_frames():
+    collector_logger = logging.getLogger("collector_test.rejects")
+    collector_logger.propagate = False
+    collector = red_logging.collector.LogCollector(
+        port=0, logger_name="collector_test.rejects", max_frame_bytes=1024
+    )
+
+    async def main() -> None:
+        await collector.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", collector.port)
+
+        ## A frame that would import a class is skipped, the connection stays open
+        payload: bytes = pickle.dumps([{"msg": "x", "extra": Path("/")}])
+        writer.write(red_logging.handlers.FRAME_HEADER.pack(len(payload)) + payload)
+        writer.write(_frame([{"msg": "ok", "levelno": 20}]))
+        await writer.drain()
+        await _wait_for(lambda: collector.records == 1)
+
+        ## A frame over max_frame_bytes closes the connection
+        writer.write(red_logging.handlers.FRAME_HEADER.pack(1024 * 1024))
+        await writer.drain()
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b""
+        writer.close()
+
+        await collector.stop()
+
+    asyncio.run(main())
+
+    assert collector.records == 1
+    assert collector.errors == 2
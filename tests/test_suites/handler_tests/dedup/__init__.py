@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_dedup_handler_collapses_consecutive_duplicates,
+    test_dedup_handler_config_class,
+    test_dedup_handler_mismatched_args,
+    test_dedup_handler_window_and_timeout,
+)
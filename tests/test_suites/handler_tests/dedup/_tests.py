@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import io
+import logging
+import logging.config
+from pathlib import Path
+import time
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.dedup")
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def _record(msg: str, *args, created: float | None = None) -> logging.LogRecord:
+    record_dict: dict = {"name": "app", "msg": msg, "args": args, "levelno": logging.WARNING}
+    if created is not None:
+        record_dict["created"] = created
+    return logging.makeLogRecord(record_dict)
+
+
+@mark.handlers
+def test_dedup_handler_collapses_consecutive_duplicates():
+    target = ListHandler()
+    handler = red_logging.handlers.DedupHandler(target=target, timeout=60)
+    try:
+        for _ in range(1000):
+            handler.handle(_record("retrying %s", "db"))
+        handler.handle(_record("retrying %s", "cache"))
+        handler.handle(_record("connected"))
+        handler.handle(_record("connected"))
+    finally:
+        handler.close()
+
+    assert target.messages == [
+        "retrying db",
+        "retrying db (message repeated 999 times)",
+        "retrying cache",
+        "connected",
+        "connected (message repeated 1 times)",
+    ]
+    assert handler.held == 1000
+
+
+@mark.handlers
+def test_dedup_handler_window_and_timeout():
+    target = ListHandler()
+    handler = red_logging.handlers.DedupHandler(target=target, window=2, timeout=10)
+    try:
+        ## Interleaved duplicates are collapsed while both fit in the window
+        for i in range(10):
+            handler.handle(_record("ping", created=100.0 + i))
+            handler.handle(_record("pong", created=100.0 + i))
+        assert target.messages == ["ping", "pong"]
+
+        ## A duplicate arriving `timeout` after the first held one sends the summary so far
+        handler.handle(_record("ping", created=120.0))
+        assert target.messages[-1] == "ping (message repeated 9 times)"
+
+        ## A 3rd distinct record pushes the least recent out of the window
+        handler.handle(_record("other", created=121.0))
+        assert target.messages[-2:] == ["pong (message repeated 9 times)", "other"]
+    finally:
+        handler.close()
+
+    assert target.messages[-1] == "ping (message repeated 1 times)"
+
+
+@mark.handlers
+def test_dedup_handler_mismatched_args():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    ## The target reports the first record's formatting error itself
+    target.handleError = lambda record: None
+    handler = red_logging.handlers.DedupHandler(target=target, timeout=60)
+    logger = logging.Logger("tests.dedup.mismatched")
+    logger.addHandler(handler)
+    try:
+        logger.warning("bad %d", "notint")
+        logger.warning("bad %d", "notint")
+        ## Ends the run, so the summary is built from the mismatched record
+        logger.warning("other")
+
+        logger.warning("bad %d", "again")
+        logger.warning("bad %d", "again")
+        handler.flush()
+    finally:
+        handler.close()
+
+    assert stream.getvalue().splitlines() == [
+        "bad %d (message repeated 1 times)",
+        "other",
+        "bad %d (message repeated 1 times)",
+    ]
+
+
+@mark.handlers
+def test_dedup_handler_config_class(tmp_path: Path):
+    log_file: Path = tmp_path / "dedup.log"
+    _dedup = red_logging.config_classes.handlers.DedupHandlerConfig(
+        name="dedup", target="app_file", timeout=0.2
+    )
+    assert _dedup.get_handler_class() == "red_logging.handlers.DedupHandler"
+
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="plain", fmt="%(message)s")],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="app_file", level="DEBUG", formatter="plain", filename=str(log_file)
+                ),
+                _dedup,
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="test_dedup", handlers=["dedup"], level="DEBUG", propagate=False
+                )
+            ],
+        )
+    )
+    try:
+        _log: logging.Logger = logging.getLogger("test_dedup")
+        for _ in range(50):
+            _log.error("worker crashed, restarting")
+
+        ## The timeout thread sends the summary without another record arriving
+        deadline: float = time.monotonic() + 5
+        while "repeated" not in log_file.read_text() and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert log_file.read_text().splitlines() == [
+        "worker crashed, restarting",
+        "worker crashed, restarting (message repeated 49 times)",
+    ]
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_mmap_handler_committed_length_survives_crash,
+    test_mmap_handler_config_rotates,
+    test_mmap_handler_grows_and_truncates,
+)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+from pathlib import Path
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.mmap")
+
+
+@mark.handlers
+def test_mmap_handler_grows_and_truncates(tmp_path: Path):
+    logfile: Path = tmp_path / "app.log"
+    handler = red_logging.handlers.MmapFileHandler(logfile, chunk_size=1)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    chunk_size: int = handler.chunk_size
+    try:
+        for i in range(2000):
+            handler.handle(logging.makeLogRecord({"msg": f"message {i:05d} " + "x" * 32}))
+        ## The file is pre-sized in whole chunks while the handler is open
+        assert logfile.stat().st_size % chunk_size == 0
+        assert logfile.stat().st_size > chunk_size
+    finally:
+        handler.close()
+
+    data: bytes = red_logging.handlers.read_mmap_log(logfile)
+    lines: list[str] = data.decode().splitlines()
+    assert len(lines) == 2000
+    assert lines[-1].startswith("message 01999")
+    ## A clean close trims the file to the header & committed data
+    assert logfile.stat().st_size == 64 + len(data)
+
+
+@mark.handlers
+def test_mmap_handler_committed_length_survives_crash(tmp_path: Path):
+    logfile: Path = tmp_path / "app.log"
+    handler = red_logging.handlers.MmapFileHandler(logfile)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    for i in range(3):
+        handler.handle(logging.makeLogRecord({"msg": f"message {i}"}))
+
+    ## Without closing (i.e. the process was killed), the zeroed tail of the chunk is ignored
+    assert red_logging.handlers.read_mmap_log(logfile) == b"message 0\nmessage 1\nmessage 2\n"
+    handler._mm.close()
+    handler._mm = None
+    handler._fd = None
+
+    ## A new handler continues after the committed data
+    handler = red_logging.handlers.MmapFileHandler(logfile)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "message 3"}))
+    finally:
+        handler.close()
+
+    assert red_logging.handlers.read_mmap_log(logfile).decode().splitlines() == [
+        f"message {i}" for i in range(4)
+    ]
+
+
+@mark.handlers
+def test_mmap_handler_config_rotates(tmp_path: Path):
+    logfile: Path = tmp_path / "app.log"
+    handler_config = red_logging.config_classes.handlers.MmapFileHandlerConfig(
+        name="mmap",
+        formatter="default",
+        filename=str(logfile),
+        maxBytes=1024,
+        backupCount=2,
+    )
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {"default": {"format": "%(message)s"}},
+            "handlers": handler_config.get_configdict(),
+            "loggers": {"mmap_test": {"handlers": ["mmap"], "level": "DEBUG"}},
+        }
+    )
+    try:
+        _log = logging.getLogger("mmap_test")
+        for i in range(100):
+            _log.info(f"message {i:03d} " + "x" * 32)
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    files: list[Path] = [logfile, Path(f"{logfile}.1"), Path(f"{logfile}.2")]
+    assert all(f.exists() for f in files)
+    assert not Path(f"{logfile}.3").exists()
+    for f in files:
+        assert len(red_logging.handlers.read_mmap_log(f)) <= 1024
+
+    assert red_logging.handlers.read_mmap_log(logfile).decode().splitlines()[-1].startswith(
+        "message 099"
+    )
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_multiprocess_handler_reopens_after_external_rotation,
+    test_multiprocess_rotation_no_lost_or_duplicate_lines,
+    test_rotating_handler_config_multiprocess_class,
+)
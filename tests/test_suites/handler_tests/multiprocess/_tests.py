@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections import Counter
+import logging
+import logging.config
+import multiprocessing
+import os
+from pathlib import Path
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.multiprocess")
+
+PROCESS_COUNT: int = 8
+LINES_PER_PROCESS: int = 2000
+
+
+def _write_lines(log_file: str, worker: int) -> None:
+    """Configure logging like a pre-fork worker would, then write numbered lines."""
+    _handler = red_logging.get_rotatingfilehandler_config(
+        name="shared_file",
+        formatter="plain",
+        filename=log_file,
+        maxBytes=32 * 1024,
+        backupCount=1000,
+        multiprocess=True,
+    )
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[red_logging.get_formatter_config(name="plain", fmt="%(message)s")],
+            handlers=[_handler],
+            loggers=[red_logging.get_logger_config(name="worker", handlers=["shared_file"])],
+        )
+    )
+
+    _log = logging.getLogger("worker")
+    for i in range(LINES_PER_PROCESS):
+        _log.info(f"worker={worker} line={i} pid={os.getpid()}")
+
+    logging.shutdown()
+
+
+@mark.handlers
+def test_multiprocess_rotation_no_lost_or_duplicate_lines(tmp_path: Path):
+    log_file: Path = tmp_path / "shared.log"
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_write_lines, args=(str(log_file), n))
+        for n in range(PROCESS_COUNT)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=120)
+        assert proc.exitcode == 0
+
+    log_files: list[Path] = [
+        p for p in tmp_path.iterdir() if p.name.startswith("shared.log") and not p.name.endswith(".lock")
+    ]
+    assert len(log_files) > 2, ValueError("Expected the shared file to have rotated")
+
+    lines: Counter = Counter()
+    for p in log_files:
+        for line in p.read_text().splitlines():
+            lines[" ".join(line.split()[:2])] += 1
+
+    expected: set[str] = {
+        f"worker={n} line={i}"
+        for n in range(PROCESS_COUNT)
+        for i in range(LINES_PER_PROCESS)
+    }
+    assert set(lines) == expected, ValueError("Lines were lost or corrupted")
+    assert max(lines.values()) == 1, ValueError("Lines were duplicated")
+
+    ## Processes that checked the size before a rollover may each add 1 more line
+    for p in log_files:
+        assert p.stat().st_size < 32 * 1024 + PROCESS_COUNT * 64
+
+
+@mark.handlers
+def test_multiprocess_handler_reopens_after_external_rotation(tmp_path: Path):
+    log_file: Path = tmp_path / "app.log"
+    handler = red_logging.handlers.MultiProcessRotatingFileHandler(
+        log_file, maxBytes=1024 * 1024, backupCount=1
+    )
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "before"}))
+        ## Simulate another process rotating the file
+        os.replace(log_file, f"{log_file}.1")
+        handler.handle(logging.makeLogRecord({"msg": "after"}))
+    finally:
+        handler.close()
+
+    assert Path(f"{log_file}.1").read_text() == "before\n"
+    assert log_file.read_text() == "after\n"
+
+
+@mark.handlers
+def test_rotating_handler_config_multiprocess_class():
+    _handler = red_logging.config_classes.RotatingFileHandlerConfig(
+        name="rotating", filename="app.log", multiprocess=True
+    )
+
+    assert (
+        _handler.get_configdict()["rotating"]["class"]
+        == "red_logging.handlers.MultiProcessRotatingFileHandler"
+    )
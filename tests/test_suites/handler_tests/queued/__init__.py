@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_queue_listener_config_class,
+    test_queued_configdict,
+    test_queued_handler_drops_when_full,
+    test_queued_handler_writes_records,
+)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+import logging.handlers
+from pathlib import Path
+import threading
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.queued")
+
+
+@mark.handlers
+def test_queued_configdict(queued_logging_config: dict):
+    log.debug(f"[FIXTURE: queued_logging_config] ({type(queued_logging_config)})")
+
+    assert "queued" in queued_logging_config["handlers"], ValueError(
+        "Queued logging config should have a 'queued' handler"
+    )
+    assert queued_logging_config["handlers"]["queued"]["handlers"] == ["test_file"]
+    assert queued_logging_config["root"]["handlers"] == ["queued"]
+    assert queued_logging_config["loggers"]["test_queued"]["handlers"] == ["queued"]
+
+
+@mark.handlers
+def test_queued_handler_writes_records(queued_logging_config: dict):
+    log_file: Path = Path(queued_logging_config["handlers"]["test_file"]["filename"])
+
+    logging.config.dictConfig(queued_logging_config)
+    try:
+        queued_handler = logging.getLogger("test_queued").handlers[0]
+        assert isinstance(queued_handler, red_logging.handlers.QueuedHandler)
+
+        _log = logging.getLogger("test_queued")
+        for i in range(100):
+            _log.info(f"queued message {i}")
+
+        assert queued_handler.listener is not None, ValueError(
+            "Listener should have started when the first record was logged"
+        )
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert queued_handler.listener is None, ValueError(
+        "Reconfiguring logging should have stopped the listener"
+    )
+    lines: list[str] = log_file.read_text().splitlines()
+    assert len(lines) == 100
+    assert lines[-1].endswith("queued message 99")
+
+
+@mark.handlers
+def test_queued_handler_drops_when_full():
+    release: threading.Event = threading.Event()
+
+    class _BlockingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            release.wait()
+
+    target = _BlockingHandler()
+    queued_handler = red_logging.handlers.QueuedHandler(
+        handlers=[target], queue_size=2, block=False
+    )
+    _log = logging.getLogger("test_queued_full")
+    _log.propagate = False
+    _log.addHandler(queued_handler)
+    try:
+        for i in range(10):
+            _log.warning(f"message {i}")
+
+        ## 1 record held by the listener thread + 2 on the queue
+        assert 7 <= queued_handler.dropped <= 8
+    finally:
+        release.set()
+        _log.removeHandler(queued_handler)
+        queued_handler.close()
+
+
+@mark.handlers
+def test_queue_listener_config_class():
+    _listener = red_logging.config_classes.handlers.QueueListenerConfig(
+        name="listener", queue=None, handlers=["console"]
+    )
+
+    assert (
+        _listener.get_configdict()["listener"]["class"]
+        == "logging.handlers.QueueListener"
+    )
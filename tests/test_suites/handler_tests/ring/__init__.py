@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_ring_buffer_dumps_on_error,
+    test_ring_buffer_handler_config_class,
+    test_ring_buffer_keeps_last_records,
+)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+from pathlib import Path
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.ring")
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _record(msg: str, levelno: int = logging.DEBUG) -> logging.LogRecord:
+    return logging.makeLogRecord(
+        {"msg": msg, "levelno": levelno, "levelname": logging.getLevelName(levelno)}
+    )
+
+
+@mark.handlers
+def test_ring_buffer_keeps_last_records():
+    target = ListHandler()
+    handler = red_logging.handlers.RingBufferHandler(capacity=5, target=target)
+    ring_id: int = id(handler.buffer)
+
+    for i in range(12):
+        handler.handle(_record(f"debug {i}"))
+
+    ## A full ring replaces its oldest record instead of flushing, and is never reallocated
+    assert target.records == []
+    assert id(handler.buffer) == ring_id and len(handler.buffer) == 5
+    assert [r.msg for r in handler.records()] == [f"debug {i}" for i in range(7, 12)]
+    assert handler.overwritten == 7
+    assert handler.memory_usage() > 0
+
+    ## logging.shutdown() calls flush(), which should not dump the ring
+    handler.flush()
+    assert target.records == []
+    handler.close()
+    assert target.records == []
+
+
+@mark.handlers
+def test_ring_buffer_dumps_on_error():
+    target = ListHandler()
+    handler = red_logging.handlers.RingBufferHandler(capacity=3, target=target)
+    ring: list = handler.buffer
+
+    for i in range(5):
+        handler.handle(_record(f"debug {i}"))
+    handler.handle(_record("failed", logging.ERROR))
+
+    assert [r.msg for r in target.records] == ["debug 3", "debug 4", "failed"]
+    assert handler.records() == []
+    ## The slots are emptied in place
+    assert handler.buffer is ring and ring == [None, None, None]
+    assert handler.dumps == 1
+
+    ## Records after a dump start a new ring, and the target's level still applies
+    target.setLevel(logging.INFO)
+    handler.handle(_record("after"))
+    handler.handle(_record("info", logging.INFO))
+    handler.handle(_record("critical", logging.CRITICAL))
+    handler.close()
+
+    assert [r.msg for r in target.records][3:] == ["info", "critical"]
+
+
+@mark.handlers
+def test_ring_buffer_handler_config_class(tmp_path: Path):
+    crash_file: Path = tmp_path / "crash.log"
+    app_file: Path = tmp_path / "app.log"
+    _ring = red_logging.config_classes.handlers.RingBufferHandlerConfig(
+        name="flight_recorder", capacity=100, target="crash_file"
+    )
+    assert _ring.get_handler_class() == "red_logging.handlers.RingBufferHandler"
+
+    logging.config.dictConfig(
+        red_logging.assemble_configdict(
+            root_handlers=[],
+            formatters=[
+                red_logging.get_formatter_config(name="plain", fmt="%(levelname)s %(message)s")
+            ],
+            handlers=[
+                red_logging.config_classes.FileHandlerConfig(
+                    name="app_file", level="INFO", formatter="plain", filename=str(app_file)
+                ),
+                red_logging.config_classes.FileHandlerConfig(
+                    name="crash_file", level="DEBUG", formatter="plain", filename=str(crash_file)
+                ),
+                _ring,
+            ],
+            loggers=[
+                red_logging.get_logger_config(
+                    name="test_ring",
+                    handlers=["app_file", "flight_recorder"],
+                    level="DEBUG",
+                    propagate=False,
+                )
+            ],
+        )
+    )
+    try:
+        _log: logging.Logger = logging.getLogger("test_ring")
+        _log.debug("cache miss")
+        _log.info("request started")
+        _log.error("request failed")
+        _log.debug("not dumped")
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+
+    assert app_file.read_text() == "INFO request started\nERROR request failed\n"
+    assert crash_file.read_text() == (
+        "DEBUG cache miss\nINFO request started\nERROR request failed\n"
+    )
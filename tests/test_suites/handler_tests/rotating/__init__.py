@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_background_rotation_compresses_backups,
+    test_background_rotation_matches_stdlib,
+    test_background_timed_rotation_keeps_backup_count,
+    test_rotating_handler_config_background_class,
+)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import logging.handlers
+from pathlib import Path
+
+from pytest import mark, raises
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.rotating")
+
+
+def _make_record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test_rotating", logging.INFO, __file__, 1, msg, None, None)
+
+
+def _log_lines(handler: logging.Handler, count: int) -> None:
+    for i in range(count):
+        handler.handle(_make_record(f"line {i:04d} " + "x" * 40))
+
+
+@mark.handlers
+def test_background_rotation_matches_stdlib(tmp_path: Path):
+    stdlib_file: Path = tmp_path / "stdlib" / "app.log"
+    background_file: Path = tmp_path / "background" / "app.log"
+    stdlib_file.parent.mkdir()
+    background_file.parent.mkdir()
+
+    stdlib_handler = logging.handlers.RotatingFileHandler(
+        stdlib_file, maxBytes=1000, backupCount=3
+    )
+    background_handler = red_logging.handlers.BackgroundRotatingFileHandler(
+        background_file, maxBytes=1000, backupCount=3
+    )
+    for handler in (stdlib_handler, background_handler):
+        _log_lines(handler, 200)
+        handler.close()
+
+    stdlib_files: dict[str, str] = {
+        p.name: p.read_text() for p in stdlib_file.parent.iterdir()
+    }
+    background_files: dict[str, str] = {
+        p.name: p.read_text() for p in background_file.parent.iterdir()
+    }
+
+    assert sorted(background_files) == ["app.log", "app.log.1", "app.log.2", "app.log.3"]
+    assert background_files == stdlib_files
+
+
+@mark.handlers
+def test_background_rotation_compresses_backups(tmp_path: Path):
+    log_file: Path = tmp_path / "app.log"
+    handler = red_logging.handlers.BackgroundRotatingFileHandler(
+        log_file, maxBytes=1000, backupCount=2, compression="gzip"
+    )
+    _log_lines(handler, 200)
+    handler.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "app.log",
+        "app.log.1.gz",
+        "app.log.2.gz",
+    ]
+    newest_backup: list[str] = (
+        gzip.decompress((tmp_path / "app.log.1.gz").read_bytes()).decode().splitlines()
+    )
+    current: list[str] = log_file.read_text().splitlines()
+    assert int(newest_backup[-1].split()[1]) + 1 == int(current[0].split()[1])
+
+
+@mark.handlers
+def test_background_timed_rotation_keeps_backup_count(tmp_path: Path):
+    log_file: Path = tmp_path / "app.log"
+    handler = red_logging.handlers.BackgroundTimedRotatingFileHandler(
+        log_file, when="S", backupCount=2, compression="bz2"
+    )
+    for i in range(5):
+        ## Force a rollover with a unique timestamp suffix on each pass
+        handler.rolloverAt = handler.rolloverAt - 3600 * (i + 1)
+        _log_lines(handler, 5)
+    handler.close()
+
+    backups: list[str] = sorted(
+        p.name for p in tmp_path.iterdir() if p.name != "app.log"
+    )
+    assert len(backups) == 2
+    assert all(name.endswith(".bz2") for name in backups)
+
+
+@mark.handlers
+def test_rotating_handler_config_background_class():
+    _handler = red_logging.config_classes.RotatingFileHandlerConfig(
+        name="rotating", filename="app.log", background=True, compression="lzma"
+    )
+    handler_dict: dict = _handler.get_configdict()["rotating"]
+
+    assert handler_dict["class"] == "red_logging.handlers.BackgroundRotatingFileHandler"
+    assert handler_dict["compression"] == "lzma"
+
+    with raises(ValueError):
+        red_logging.config_classes.RotatingFileHandlerConfig(
+            name="rotating", filename="app.log", compression="lzma"
+        ).get_configdict()
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_merge_sharded_records,
+    test_merge_standard_format_records,
+    test_sharded_handler_created_ns,
+    test_sharded_handler_writes_pid_shard,
+)
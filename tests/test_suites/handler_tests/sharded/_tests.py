@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import time
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.sharded")
+
+
+@mark.handlers
+def test_sharded_handler_writes_pid_shard(tmp_path: Path):
+    handler = red_logging.handlers.ShardedFileHandler(tmp_path / "app.log")
+    handler.setFormatter(logging.Formatter(red_logging.fmts.MESSAGE_FMT_SHARDED))
+    try:
+        for i in range(3):
+            handler.handle(logging.makeLogRecord({"msg": f"message {i}"}))
+    finally:
+        handler.close()
+
+    shard: Path = tmp_path / f"app.{os.getpid()}.log"
+    assert red_logging.merge.find_shards(tmp_path / "app.log") == [str(shard)]
+
+    lines: list[str] = shard.read_text().splitlines()
+    assert [int(line.split()[1]) for line in lines] == [1, 2, 3]
+    created_ns: list[int] = [int(line.split()[0]) for line in lines]
+    assert created_ns == sorted(created_ns)
+
+
+@mark.handlers
+def test_sharded_handler_created_ns(tmp_path: Path):
+    factory = logging.getLogRecordFactory()
+    handler = red_logging.handlers.ShardedFileHandler(tmp_path / "app.log", delay=True)
+    handler.setFormatter(logging.Formatter(red_logging.fmts.MESSAGE_FMT_SHARDED))
+    try:
+        ## Set by the record factory when the record is created, not derived from the float `created`
+        before: int = time.time_ns()
+        record: logging.LogRecord = logging.makeLogRecord({"msg": "created"})
+        assert before <= record.created_ns <= time.time_ns()
+        assert abs(record.created_ns / 1e9 - record.created) < 1
+
+        ## A record made without the factory gets it when emitted
+        record = logging.LogRecord("tests", logging.INFO, __file__, 1, "direct", None, None)
+        assert "created_ns" not in record.__dict__
+        handler.handle(record)
+        assert isinstance(record.created_ns, int)
+    finally:
+        handler.close()
+        logging.setLogRecordFactory(factory)
+
+
+@mark.handlers
+def test_merge_sharded_records(tmp_path: Path):
+    shard_a: Path = tmp_path / "app.100.log"
+    shard_b: Path = tmp_path / "app.200.log"
+    shard_a.write_text(
+        "1700000000000000001 1 [2023-11-14 22:13:20] [INFO] a1\n"
+        "1700000000000000005 2 [2023-11-14 22:13:20] [ERROR] a2\n"
+        "Traceback (most recent call last):\n"
+        "ValueError: boom\n"
+    )
+    shard_b.write_text(
+        "1700000000000000003 1 [2023-11-14 22:13:20] [INFO] b1\n"
+        "1700000000000000009 2 [2023-11-14 22:13:20] [INFO] b2\n"
+    )
+
+    merged: list[str] = list(
+        red_logging.merge.merge_records(red_logging.merge.find_shards(tmp_path / "app.log"))
+    )
+
+    assert [record.split()[-1] for record in merged] == ["a1", "b1", "boom", "b2"]
+    assert merged[2].splitlines()[1:] == [
+        "Traceback (most recent call last):",
+        "ValueError: boom",
+    ]
+
+
+@mark.handlers
+def test_merge_standard_format_records(tmp_path: Path):
+    formatter = logging.Formatter(
+        red_logging.fmts.MESSAGE_FMT_STANDARD, red_logging.fmts.DATE_FMT_STANDARD
+    )
+    files: list[Path] = [tmp_path / "worker_1.log", tmp_path / "worker_2.log"]
+    for n, created in enumerate([(100, 102, 104), (101, 103, 103)]):
+        lines: list[str] = []
+        for i, ts in enumerate(created):
+            record = logging.makeLogRecord({"msg": f"w{n}-{i}", "created": 1_700_000_000 + ts})
+            lines.append(formatter.format(record))
+        files[n].write_text("\n".join(lines) + "\n")
+
+    merged: list[str] = [
+        record.rstrip().split()[-1]
+        for record in red_logging.merge.merge_records(files)
+    ]
+
+    assert merged == ["w0-0", "w1-0", "w0-1", "w1-1", "w1-2", "w0-2"]
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_digest_smtp_handler_config_class,
+    test_digest_smtp_handler_groups_records,
+    test_digest_smtp_handler_rate_limit_keeps_counts,
+    test_digest_smtp_handler_starttls_context,
+)
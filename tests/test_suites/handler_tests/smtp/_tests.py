@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from email import message_from_bytes
+from email.message import Message
+import logging
+import logging.config
+import smtplib
+import socketserver
+import ssl
+import threading
+import time
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.smtp")
+
+
+class MailReceiver(socketserver.ThreadingTCPServer):
+    """A loopback stand-in for a mail server, which speaks just enough SMTP to accept messages."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+        super().__init__(("127.0.0.1", 0), MailRequestHandler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> None:
+        deadline: float = time.monotonic() + timeout
+        while len(self.messages) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class MailRequestHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        self.reply("220 localhost")
+        for raw in self.rfile:
+            command: str = raw.decode().strip().upper()
+            if command.startswith("DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines: list[bytes] = []
+                for data in self.rfile:
+                    if data.rstrip(b"\r\n") == b".":
+                        break
+                    lines.append(data[1:] if data.startswith(b"..") else data)
+                self.server.messages.append(message_from_bytes(b"".join(lines)))
+                self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 Bye")
+                return
+            else:
+                ## EHLO, HELO, MAIL, RCPT, RSET, NOOP
+                self.reply("250 OK")
+
+
+@mark.handlers
+def test_digest_smtp_handler_groups_records():
+    server = MailReceiver()
+    handler = red_logging.handlers.DigestSMTPHandler(
+        ("127.0.0.1", server.port),
+        "from@example.com",
+        "to@example.com",
+        "Errors",
+        window_seconds=3600,
+    )
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    try:
+        for i in range(50):
+            handler.handle(
+                logging.makeLogRecord(
+                    {"msg": "Connection to %s failed", "args": (f"host{i}",), "levelno": 40, "levelname": "ERROR", "name": "root"}
+                )
+            )
+        for i in range(5):
+            handler.handle(
+                logging.makeLogRecord({"msg": "Disk full", "levelno": 40, "levelname": "ERROR", "name": "root"})
+            )
+
+        ## Nothing is sent until the window ends or the handler is flushed
+        assert server.messages == []
+        assert handler.send_digest()
+        assert not handler.send_digest(), "An empty digest should not be sent"
+    finally:
+        handler.close()
+        server.stop()
+
+    assert len(server.messages) == 1
+    msg: Message = server.messages[0]
+    assert msg["Subject"] == "Errors (55 records)"
+    body: str = msg.get_payload()
+    assert "50 x [ERROR] [root] Connection to %s failed" in body
+    assert "5 x [ERROR] [root] Disk full" in body
+    assert body.index("50 x") < body.index("5 x"), "The largest group should come first"
+    assert "| ERROR Connection to host0 failed" in body
+    assert "host1" not in body, "Only the first record in a group is kept as the example"
+
+
+@mark.handlers
+def test_digest_smtp_handler_rate_limit_keeps_counts():
+    server = MailReceiver()
+    handler = red_logging.handlers.DigestSMTPHandler(
+        ("127.0.0.1", server.port),
+        "from@example.com",
+        ["to@example.com"],
+        "Errors",
+        window_seconds=3600,
+        max_emails_per_hour=1,
+        max_groups=2,
+    )
+    try:
+        for i in range(3):
+            handler.handle(logging.makeLogRecord({"msg": f"first {i}", "levelno": 40}))
+        assert handler.send_digest()
+
+        for i in range(4):
+            handler.handle(logging.makeLogRecord({"msg": f"second {i}", "levelno": 40}))
+        assert not handler.send_digest(), "The hourly limit should hold back the 2nd digest"
+
+        ## Lift the limit, the held back records should all be in the next digest
+        handler.max_emails_per_hour = 0
+        assert handler.send_digest()
+    finally:
+        handler.close()
+        server.stop()
+
+    assert handler.sent == 2
+    assert [msg["Subject"] for msg in server.messages] == [
+        "Errors (3 records)",
+        "Errors (4 records)",
+    ]
+    body: str = server.messages[1].get_payload()
+    assert "2 x records in groups over the limit of 2" in body
+
+
+@mark.handlers
+def test_digest_smtp_handler_starttls_context(monkeypatch):
+    ## The loopback server cannot speak TLS, so record what the handler passes to STARTTLS instead
+    loaded: list[tuple] = []
+    starttls_calls: list[tuple] = []
+    monkeypatch.setattr(
+        ssl.SSLContext,
+        "load_cert_chain",
+        lambda self, certfile, keyfile=None, password=None: loaded.append((certfile, keyfile)),
+    )
+    monkeypatch.setattr(
+        smtplib.SMTP,
+        "starttls",
+        lambda self, *args, **kwargs: starttls_calls.append((args, kwargs)) or (220, b"Ready"),
+    )
+
+    server = MailReceiver()
+    handler = red_logging.handlers.DigestSMTPHandler(
+        ("127.0.0.1", server.port),
+        "from@example.com",
+        "to@example.com",
+        "Errors",
+        secure=("key.pem", "cert.pem"),
+        window_seconds=3600,
+    )
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "Disk full", "levelno": 40, "levelname": "ERROR"}))
+        assert handler.send_digest()
+    finally:
+        handler.close()
+        server.stop()
+
+    assert loaded == [("cert.pem", "key.pem")]
+    [(args, kwargs)] = starttls_calls
+    assert args == () and isinstance(kwargs["context"], ssl.SSLContext)
+    assert len(server.messages) == 1
+
+
+@mark.handlers
+def test_digest_smtp_handler_config_class():
+    server = MailReceiver()
+    _handler = red_logging.config_classes.handlers.DigestSMTPHandlerConfig(
+        name="digest",
+        formatter="default",
+        mailhost=["127.0.0.1", server.port],
+        toaddrs=["to@example.com"],
+        subject="Digest",
+        window_seconds=3600,
+    )
+    assert _handler.get_handler_class() == "red_logging.handlers.DigestSMTPHandler"
+
+    logging_config: dict = red_logging.assemble_configdict(
+        root_handlers=[],
+        formatters=[red_logging.get_formatter_config(name="default")],
+        handlers=[_handler],
+        loggers=[
+            red_logging.get_logger_config(
+                name="test_digest", handlers=["digest"], level="DEBUG", propagate=False
+            )
+        ],
+    )
+    logging.config.dictConfig(logging_config)
+    try:
+        _log: logging.Logger = logging.getLogger("test_digest")
+        _log.info("Not sent, the handler's level is ERROR")
+        for _ in range(10):
+            _log.error("Something broke")
+
+        ## Flush & close the way logging.shutdown() does, while holding the handler's lock
+        handler: logging.Handler = _log.handlers[0]
+        handler.acquire()
+        try:
+            handler.flush()
+            handler.close()
+        finally:
+            handler.release()
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+        server.stop()
+
+    assert len(server.messages) == 1
+    assert server.messages[0]["Subject"] == "Digest (10 records)"
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_batched_socket_handler_config_and_stdlib_frames,
+    test_batched_socket_handler_frame_per_record,
+    test_batched_socket_handler_reconnects_without_blocking,
+    test_batched_socket_handler_sends_frames,
+)
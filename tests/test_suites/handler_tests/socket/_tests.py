@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import logging
+import logging.config
+import logging.handlers
+import pickle
+import socket
+import socketserver
+import threading
+import time
+
+from pytest import mark
+import red_logging
+
+log = logging.getLogger("tests.test_suites.handler_tests.socket")
+
+
+class FrameReceiver(socketserver.ThreadingTCPServer):
+    """A loopback stand-in for a log server, which keeps every frame it receives."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, port: int = 0) -> None:
+        self.frames: list[list[dict]] = []
+        super().__init__(("127.0.0.1", port), FrameRequestHandler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    @property
+    def messages(self) -> list[str]:
+        return [
+            logging.makeLogRecord(record_dict).getMessage()
+            for frame in list(self.frames)
+            for record_dict in frame
+        ]
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> None:
+        deadline: float = time.monotonic() + timeout
+        while len(self.messages) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class FrameRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for frame in red_logging.handlers.iter_frames(self.rfile):
+            self.server.frames.append(frame)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@mark.handlers
+def test_batched_socket_handler_sends_frames():
+    server = FrameReceiver()
+    handler = red_logging.handlers.BatchedSocketHandler(
+        "127.0.0.1", server.port, batch_size=100
+    )
+    try:
+        for i in range(1000):
+            handler.handle(logging.makeLogRecord({"msg": "message %d", "args": (i,)}))
+        handler.close()
+
+        server.wait_for(1000)
+        assert server.messages == [f"message {i}" for i in range(1000)]
+        assert len(server.frames) <= 20
+    finally:
+        handler.close()
+        server.stop()
+
+
+@mark.handlers
+def test_batched_socket_handler_reconnects_without_blocking():
+    port: int = _free_port()
+    handler = red_logging.handlers.BatchedSocketHandler(
+        "127.0.0.1", port, flush_interval_ms=10, retry_start=0.05, retry_max=0.2
+    )
+    server: FrameReceiver | None = None
+    try:
+        start: float = time.perf_counter()
+        for i in range(100):
+            handler.handle(logging.makeLogRecord({"msg": f"message {i}"}))
+        ## No server is listening, but logging calls do not wait for the connection
+        assert time.perf_counter() - start < 0.5
+
+        time.sleep(0.2)
+        server = FrameReceiver(port=port)
+        server.wait_for(100)
+        assert server.messages == [f"message {i}" for i in range(100)]
+        assert handler.dropped == 0
+    finally:
+        handler.close()
+        if server is not None:
+            server.stop()
+
+
+@mark.handlers
+def test_batched_socket_handler_config_and_stdlib_frames():
+    server = FrameReceiver()
+    handler_config = red_logging.config_classes.handlers.BatchedSocketHandlerConfig(
+        name="log_server", host="127.0.0.1", port=server.port, flush_interval_ms=10
+    )
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": handler_config.get_configdict(),
+            "loggers": {"socket_test": {"handlers": ["log_server"], "level": "DEBUG"}},
+        }
+    )
+    ## The receiver also reads frames from a stdlib SocketHandler
+    stdlib_handler = logging.handlers.SocketHandler("127.0.0.1", server.port)
+    try:
+        logging.getLogger("socket_test").info("from batched")
+        stdlib_handler.handle(logging.makeLogRecord({"msg": "from stdlib"}))
+
+        server.wait_for(2)
+        assert sorted(server.messages) == ["from batched", "from stdlib"]
+    finally:
+        stdlib_handler.close()
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+        server.stop()
+
+
+class StdlibRecordReceiver(socketserver.ThreadingTCPServer):
+    """A receiver written for the stdlib SocketHandler, as in the logging cookbook."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        self.records: list[logging.LogRecord] = []
+        super().__init__(("127.0.0.1", 0), StdlibRecordRequestHandler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class StdlibRecordRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            chunk: bytes = self.connection.recv(4)
+            if len(chunk) < 4:
+                return
+            length: int = int.from_bytes(chunk, "big")
+            chunk = self.connection.recv(length)
+            while len(chunk) < length:
+                chunk += self.connection.recv(length - len(chunk))
+            self.server.records.append(logging.makeLogRecord(pickle.loads(chunk)))
+
+
+@mark.handlers
+def test_batched_socket_handler_frame_per_record():
+    server = StdlibRecordReceiver()
+    handler_config = red_logging.config_classes.handlers.BatchedSocketHandlerConfig(
+        name="stdlib_server", host="127.0.0.1", port=server.server_address[1], frame_per_record=True
+    )
+    assert handler_config.get_configdict()["stdlib_server"]["frame_per_record"] is True
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": handler_config.get_configdict(),
+            "loggers": {"socket_stdlib_test": {"handlers": ["stdlib_server"], "level": "DEBUG"}},
+        }
+    )
+    try:
+        for i in range(50):
+            logging.getLogger("socket_stdlib_test").info("record %d", i)
+
+        deadline: float = time.monotonic() + 5
+        while len(server.records) < 50 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+        server.stop()
+
+    assert [record.getMessage() for record in server.records] == [f"record {i}" for i in range(50)]
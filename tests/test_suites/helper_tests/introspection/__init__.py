@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_configure_record_introspection_existing_handlers,
+    test_configure_record_introspection_switches,
+    test_setup_logging_auto_introspection,
+    test_used_record_attributes_per_config,
+)
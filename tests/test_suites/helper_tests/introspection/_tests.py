@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import io
+import logging
+import logging.config
+
+from pytest import mark
+import red_logging
+from red_logging.helpers import (
+    assemble_configdict,
+    configure_record_introspection,
+    get_formatter_config,
+    get_streamhandler_config,
+    setup_logging,
+    used_record_attributes,
+)
+
+log = logging.getLogger("tests.test_suites.helper_tests.introspection")
+
+SWITCHES: list[str] = ["logThreads", "logProcesses", "logMultiprocessing", "_srcfile"]
+
+
+@contextmanager
+def _restore_switches():
+    saved: dict = {name: getattr(logging, name) for name in SWITCHES}
+    ## Handlers attached by pytest & earlier tests are read too, so detach them while the test runs
+    loggers: list[logging.Logger] = [logging.root] + [
+        logger for logger in logging.root.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+    handlers: dict = {logger: logger.handlers[:] for logger in loggers}
+    for logger in loggers:
+        logger.handlers.clear()
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(logging, name, value)
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+        for logger, logger_handlers in handlers.items():
+            logger.handlers[:] = logger_handlers
+
+
+def _configdict(fmt: str, **kwargs) -> dict:
+    return assemble_configdict(
+        formatters=[get_formatter_config(fmt=fmt)],
+        handlers=[get_streamhandler_config()],
+        root_handlers=["console"],
+        **kwargs,
+    )
+
+
+@mark.helpers
+def test_used_record_attributes_per_config():
+    with _restore_switches():
+        _check_used_record_attributes()
+
+
+def _check_used_record_attributes():
+    basic: frozenset = used_record_attributes(_configdict(red_logging.fmts.MESSAGE_FMT_BASIC))
+    assert basic == {"asctime", "levelname", "message"}
+
+    detailed: frozenset = used_record_attributes(_configdict(red_logging.fmts.MESSAGE_FMT_DETAILED))
+    assert {"module", "lineno", "funcName", "pathname"} <= detailed
+
+    ## `{` & `$` formats, with attribute access & format specs
+    for fmt, style in [("{levelname:<8} {thread!r} {name.upper}", "{"), ("$levelname ${thread}", "$")]:
+        config: dict = _configdict(red_logging.fmts.MESSAGE_FMT_BASIC)
+        config["formatters"]["default"].update({"format": fmt, "style": style})
+        assert used_record_attributes(config) >= {"levelname", "thread"}
+
+    ## Filters add what they read
+    filtered: frozenset = used_record_attributes(
+        _configdict(
+            red_logging.fmts.MESSAGE_FMT_BASIC,
+            filters=[
+                red_logging.filters.FilterConfig(name="info", func=red_logging.filters.info_filter),
+                red_logging.filters.FilterConfig(name="expr", expression="processName == 'MainProcess'"),
+                red_logging.filters.RateLimitFilterConfig(name="limit"),
+                red_logging.filters.CompiledFilterConfig(
+                    name="compiled", filters=["red_logging.filters.warning_filter"]
+                ),
+            ],
+        )
+    )
+    assert {"levelno", "processName", "pathname", "lineno", "name"} <= filtered
+    assert "thread" not in filtered
+
+    json_config: dict = assemble_configdict(
+        formatters=[red_logging.config_classes.formatters.JSONFormatterConfig(name="default", fields=["message", "threadName"])],
+        handlers=[get_streamhandler_config()],
+        root_handlers=["console"],
+    )
+    assert used_record_attributes(json_config) == {"message", "threadName"}
+
+    ## Anything the analysis cannot see into keeps every attribute
+    custom_filter: dict = _configdict(
+        red_logging.fmts.MESSAGE_FMT_BASIC,
+        filters=[red_logging.filters.FilterConfig(name="custom", func=lambda record: True)],
+    )
+    assert used_record_attributes(custom_filter) is None
+
+    custom_formatter: dict = _configdict(red_logging.fmts.MESSAGE_FMT_BASIC)
+    custom_formatter["formatters"]["default"]["()"] = "tests.custom.Formatter"
+    assert used_record_attributes(custom_formatter) is None
+
+    socket: dict = _configdict(red_logging.fmts.MESSAGE_FMT_BASIC)
+    socket["handlers"]["socket"] = {"class": "logging.handlers.SocketHandler", "host": "localhost", "port": 9020}
+    assert used_record_attributes(socket) is None
+
+    binary: dict = _configdict(red_logging.fmts.MESSAGE_FMT_BASIC)
+    binary["handlers"]["binary"] = {"class": "red_logging.handlers.BinaryFileHandler", "filename": "app.rlog"}
+    assert {"thread", "process", "funcName"} <= used_record_attributes(binary)
+
+
+@mark.helpers
+def test_configure_record_introspection_switches():
+    with _restore_switches():
+        applied: dict = configure_record_introspection(_configdict(red_logging.fmts.MESSAGE_FMT_BASIC))
+        assert not any(applied.values())
+        assert logging._srcfile is None
+
+        record = logging.getLogger("tests.introspection").makeRecord("x", logging.INFO, "(unknown file)", 0, "m", (), None)
+        assert record.thread is None and record.process is None
+
+        ## A thread field only turns threads back on, and `keep` adds the caller lookup
+        applied = configure_record_introspection(
+            _configdict("%(threadName)s %(message)s"), keep=["stack_info"]
+        )
+        assert applied["logThreads"] and applied["findCaller"]
+        assert not applied["logProcesses"] and not applied["logMultiprocessing"]
+        assert logging._srcfile is not None
+
+        ## An unknown config restores the values the switches had before they were lowered
+        config: dict = _configdict(red_logging.fmts.MESSAGE_FMT_BASIC)
+        config["formatters"]["default"]["()"] = lambda: logging.Formatter()
+        assert all(configure_record_introspection(config).values())
+
+        ## A switch the program turned off is never turned back on
+        logging.logProcesses = False
+        applied = configure_record_introspection(config)
+        assert not applied["logProcesses"] and not logging.logProcesses
+        assert applied["logThreads"]
+
+
+@mark.helpers
+def test_configure_record_introspection_existing_handlers():
+    with _restore_switches():
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(threadName)s %(lineno)d %(message)s"))
+        lib: logging.Logger = logging.getLogger("tests.introspection.lib")
+        lib.addHandler(handler)
+        try:
+            assert used_record_attributes(_configdict(red_logging.fmts.MESSAGE_FMT_BASIC)) >= {
+                "threadName",
+                "lineno",
+            }
+            setup_logging(
+                app_name="introspection",
+                log_fmt=red_logging.fmts.MESSAGE_FMT_BASIC,
+                auto_introspection=True,
+            )
+            assert logging.logThreads and logging._srcfile is not None
+            assert not logging.logProcesses
+
+            lib.info("hello", stack_info=True)
+            assert stream.getvalue().startswith("MainThread ")
+            assert "hello\nStack (most recent call last):" in stream.getvalue()
+
+            ## A handler the analysis cannot see into keeps every switch
+            handler.setFormatter(type("Custom", (logging.Formatter,), {})())
+            assert used_record_attributes(_configdict(red_logging.fmts.MESSAGE_FMT_BASIC)) is None
+        finally:
+            lib.removeHandler(handler)
+
+
+@mark.helpers
+def test_setup_logging_auto_introspection():
+    with _restore_switches():
+        stream = io.StringIO()
+        setup_logging(app_name="introspection", log_fmt=red_logging.fmts.MESSAGE_FMT_BASIC)
+        ## Off by default
+        assert logging.logThreads and logging._srcfile is not None
+
+        setup_logging(
+            app_name="introspection",
+            log_fmt="%(levelname)s %(funcName)s %(message)s",
+            auto_introspection=True,
+        )
+        ## Only the caller lookup is needed
+        assert logging._srcfile is not None
+        assert not logging.logThreads and not logging.logProcesses
+
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(funcName)s %(message)s"))
+        _log = logging.getLogger("introspection")
+        _log.addHandler(handler)
+        _log.warning("hello")
+        assert stream.getvalue() == "test_setup_logging_auto_introspection hello\n"
+
+        setup_logging(
+            app_name="introspection", log_fmt=red_logging.fmts.MESSAGE_FMT_BASIC, auto_introspection=True
+        )
+        assert logging._srcfile is None
+
+        setup_logging(app_name="introspection", log_fmt=red_logging.fmts.MESSAGE_FMT_BASIC)
+        ## Left as the last config set them
+        assert logging._srcfile is None
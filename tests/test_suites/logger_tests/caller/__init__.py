@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_cached_caller_logger_matches_stdlib_records,
+    test_cached_caller_logger_set_logger_class,
+    test_cached_caller_logger_srcfile_changes,
+)
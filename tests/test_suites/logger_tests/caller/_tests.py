@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+
+from pytest import mark
+from red_logging.loggers import CachedCallerLogger, clear_caller_cache
+
+log = logging.getLogger("tests.test_suites.logger_tests.caller")
+
+CALLER_ATTRIBUTES: list[str] = ["pathname", "filename", "module", "lineno", "funcName", "stack_info"]
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _loggers() -> tuple[logging.Logger, logging.Logger, _ListHandler]:
+    handler = _ListHandler()
+    stdlib = logging.Logger("tests.caller.stdlib")
+    cached = CachedCallerLogger("tests.caller.cached")
+    for logger in (stdlib, cached):
+        logger.addHandler(handler)
+
+    return stdlib, cached, handler
+
+
+def _wrapper(logger: logging.Logger, msg: str) -> None:
+    ## Reports the wrapper's caller
+    logger.warning(msg, stacklevel=2)
+
+
+class _Service:
+    def run(self, logger: logging.Logger) -> None:
+        logger.info("from a method", stack_info=True)
+
+
+def _caller_values(records: list[logging.LogRecord]) -> list[tuple]:
+    return [tuple(getattr(record, name) for name in CALLER_ATTRIBUTES) for record in records]
+
+
+@mark.loggers
+def test_cached_caller_logger_matches_stdlib_records():
+    stdlib, cached, handler = _loggers()
+
+    ## Each call is made by both loggers from the same line, so stack info matches too
+    for _ in range(2):
+        for logger in (stdlib, cached):
+            logger.info("plain")
+            logger.error("with stack", stack_info=True)
+            _wrapper(logger, "wrapped")
+            _Service().run(logger)
+            logging.LoggerAdapter(logger, {"request_id": 1}).info("adapted")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("failed")
+            ## Deeper than the stack, which stops at the outermost frame
+            logger.info("too deep", stacklevel=10_000)
+
+    values: list[tuple] = _caller_values(handler.records)
+    per_pass: int = len(values) // 4
+    for offset in (0, 2 * per_pass):
+        assert values[offset : offset + per_pass] == values[offset + per_pass : offset + 2 * per_pass]
+
+    plain: logging.LogRecord = handler.records[per_pass]
+    assert plain.funcName == "test_cached_caller_logger_matches_stdlib_records"
+    assert plain.filename == "_tests.py" and plain.module == "_tests"
+    assert handler.records[per_pass + 2].funcName == "test_cached_caller_logger_matches_stdlib_records"
+    assert handler.records[per_pass + 3].funcName == "run"
+    assert handler.records[per_pass + 3].stack_info.startswith("Stack (most recent call last):")
+
+
+@mark.loggers
+def test_cached_caller_logger_srcfile_changes():
+    stdlib, cached, handler = _loggers()
+    srcfile: str | None = logging._srcfile
+
+    try:
+        cached.info("cached")
+        ## With the caller lookup off, no frame is inspected
+        logging._srcfile = None
+        cached.info("no caller")
+        ## A different source path is compared with every frame again
+        logging._srcfile = __file__
+        for logger in (stdlib, cached):
+            logger.info("from this file")
+    finally:
+        logging._srcfile = srcfile
+        clear_caller_cache()
+
+    cached_record, no_caller, stdlib_file, cached_file = handler.records
+    assert cached_record.funcName == "test_cached_caller_logger_srcfile_changes"
+    assert no_caller.funcName == "(unknown function)" and no_caller.pathname == "(unknown file)"
+    ## logging's own frames are no longer skipped, and this file's are
+    assert _caller_values([stdlib_file]) == _caller_values([cached_file])
+    assert cached_file.funcName == "_log"
+
+
+@mark.loggers
+def test_cached_caller_logger_set_logger_class():
+    logging.setLoggerClass(CachedCallerLogger)
+    try:
+        logger: logging.Logger = logging.getLogger("tests.caller.logger_class")
+    finally:
+        logging.setLoggerClass(logging.Logger)
+
+    assert isinstance(logger, CachedCallerLogger)
+    assert logger.findCaller()[2] == "test_cached_caller_logger_set_logger_class"
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_install_gates_resolves_and_replaces,
+    test_logger_config_gates_in_configdict,
+    test_template_gate_drops_before_record_created,
+)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import logging
+import logging.config
+
+from pytest import mark, raises
+import red_logging
+from red_logging.loggers import (
+    CachedCallerLogger,
+    TemplateGate,
+    configure_logger_gates,
+    get_gates,
+    install_gates,
+    remove_gates,
+)
+
+log = logging.getLogger("tests.test_suites.logger_tests.gates")
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _wrapper(logger: logging.Logger, msg: str) -> None:
+    logger.info(msg, stacklevel=2)
+
+
+def drop_debug(name: str, levelno: int, msg: object) -> bool:
+    return levelno > logging.DEBUG
+
+
+@mark.loggers
+def test_template_gate_drops_before_record_created():
+    for logger in (logging.Logger("tests.gates.stdlib"), CachedCallerLogger("tests.gates.cached")):
+        handler = _ListHandler()
+        logger.addHandler(handler)
+        made: list[str] = []
+        make_record = logger.makeRecord
+        logger.makeRecord = lambda *args, **kwargs: made.append(args[4]) or make_record(*args, **kwargs)
+
+        install_gates(logger, [TemplateGate(["^heartbeat", r"cache (hit|miss)"], keep_level="ERROR")])
+        logger.info("heartbeat %d", 1)
+        logger.debug("user %s cache hit", "a")
+        logger.info("request %s done", "GET /")
+        logger.error("heartbeat failed")
+        logger.info({"heartbeat": 1})
+        _wrapper(logger, "wrapped")
+        logging.LoggerAdapter(logger, {}).info("heartbeat from an adapter")
+
+        ## Dropped calls never reach makeRecord()
+        assert made == ["request %s done", "heartbeat failed", {"heartbeat": 1}, "wrapped"]
+        assert [record.msg for record in handler.records] == made
+
+        ## The caller is the same as without the gate
+        request, error, _mapping, wrapped = handler.records
+        assert request.funcName == "test_template_gate_drops_before_record_created"
+        assert request.pathname == __file__
+        assert wrapped.funcName == "test_template_gate_drops_before_record_created"
+
+        remove_gates(logger)
+        logger.info("heartbeat %d", 2)
+        assert handler.records[-1].args == (2,)
+
+
+@mark.loggers
+def test_install_gates_resolves_and_replaces():
+    logger = logging.Logger("tests.gates.resolve")
+    handler = _ListHandler()
+    logger.addHandler(handler)
+
+    install_gates(
+        logger,
+        [
+            "tests.test_suites.logger_tests.gates._tests.drop_debug",
+            {"templates": ["^noise"]},
+        ],
+    )
+    assert get_gates(logger)[0] is drop_debug
+    assert isinstance(get_gates(logger)[1], TemplateGate)
+
+    logger.setLevel(logging.DEBUG)
+    logger.debug("debug")
+    logger.info("noise")
+    logger.info("kept")
+    assert [record.msg for record in handler.records] == ["kept"]
+
+    ## Installing again replaces the gates, and an empty list removes them
+    install_gates(logger, [lambda name, levelno, msg: name != "tests.gates.resolve"])
+    assert len(get_gates(logger)) == 1
+    logger.info("dropped")
+    install_gates(logger, [])
+    assert get_gates(logger) == () and "_log" not in logger.__dict__
+    logger.debug("debug")
+    assert [record.msg for record in handler.records] == ["kept", "debug"]
+
+    with raises(TypeError):
+        install_gates(logger, [42])
+    with raises(TypeError):
+        TemplateGate("^noise")
+
+
+@mark.loggers
+def test_logger_config_gates_in_configdict():
+    logger_config = red_logging.config_classes.loggers.LoggerConfig(
+        name="tests.gates.config",
+        level="DEBUG",
+        handlers=[],
+        gates=[{"templates": ["^heartbeat"], "keep_level": "WARNING"}],
+    )
+    config: dict = red_logging.assemble_configdict(
+        root_handlers=[], loggers=[logger_config], handlers=[], formatters=[]
+    )
+    assert config["loggers"]["tests.gates.config"]["gates"] == [
+        {"templates": ["^heartbeat"], "keep_level": "WARNING"}
+    ]
+    ## Dict gates can be saved in a JSON config
+    json.dumps(config)
+    ## Without gates, the key is left out
+    assert "gates" not in red_logging.get_logger_config(name="x", as_dict=True)["x"]
+
+    try:
+        logging.config.dictConfig(config)
+        configure_logger_gates(config)
+        logger: logging.Logger = logging.getLogger("tests.gates.config")
+        handler = _ListHandler()
+        logger.addHandler(handler)
+
+        logger.info("heartbeat")
+        logger.warning("heartbeat")
+        assert [record.levelname for record in handler.records] == ["WARNING"]
+
+        ## A config without the logger's gates removes them
+        del config["loggers"]["tests.gates.config"]["gates"]
+        configure_logger_gates(config)
+        assert get_gates(logger) == ()
+    finally:
+        remove_gates(logging.getLogger("tests.gates.config"))
+        logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from ._tests import (
+    test_lazy_adapter_defers_functions,
+    test_lazy_computed_once_only_when_emitted,
+)
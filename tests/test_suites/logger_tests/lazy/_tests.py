@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import io
+import logging
+import pickle
+import sys
+
+from pytest import mark
+from red_logging.loggers import Lazy, LazyAdapter
+
+log = logging.getLogger("tests.test_suites.logger_tests.lazy")
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def __call__(self, value: int) -> int:
+        self.calls.append(value)
+        return value * 2
+
+
+def _logger(name: str, *streams: io.StringIO, fmt: str = "%(message)s") -> logging.Logger:
+    logger = logging.Logger(name)
+    for stream in streams:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter(fmt))
+        logger.addHandler(handler)
+
+    return logger
+
+
+@mark.loggers
+def test_lazy_computed_once_only_when_emitted():
+    compute = _Counter()
+    first, second = io.StringIO(), io.StringIO()
+    logger = _logger("tests.lazy.logger", first, second)
+    logger.setLevel(logging.INFO)
+
+    ## Dropped by the logger's level, and by a filter
+    logger.debug("dropped %s", Lazy(compute, 1))
+    logger.addFilter(lambda record: record.levelno < logging.ERROR)
+    logger.error("filtered %s", Lazy(compute, 2))
+    assert compute.calls == []
+
+    ## Formatted by 2 handlers, computed once
+    lazy = Lazy(compute, 3)
+    assert not lazy.evaluated
+    logger.info("str %s, int %d, hex %x, float %.1f, repr %r", lazy, lazy, lazy, lazy, Lazy(str, "x"))
+    assert lazy.evaluated
+    assert compute.calls == [3]
+    assert first.getvalue() == second.getvalue() == "str 6, int 6, hex 6, float 6.0, repr 'x'\n"
+    assert f"{Lazy(compute, 4):>4}" == "   8"
+
+    ## Pickled as its text, i.e. in a lazy `extra` value sent by a SocketHandler
+    assert pickle.loads(pickle.dumps(Lazy(lambda: [1, 2]))) == "[1, 2]"
+
+
+@mark.loggers
+def test_lazy_adapter_defers_functions():
+    compute = _Counter()
+    stream = io.StringIO()
+    logger = _logger(
+        "tests.lazy.adapter", stream, fmt="%(funcName)s:%(lineno)d %(user)s %(message)s"
+    )
+    logger.setLevel(logging.INFO)
+    adapter = LazyAdapter(logger, {"user": "anonymous"})
+
+    adapter.debug("dropped %s", lambda: compute(1))
+    line: int = sys._getframe().f_lineno + 1
+    adapter.info("value %s", lambda: compute(2))
+    adapter.info("mapping %(value)s", {"value": lambda: compute(3)}, extra={"user": lambda: "lazy"})
+    ## Classes & callable objects are logged as they are
+    adapter.warning("class %s, object %s", int, compute)
+
+    assert compute.calls == [2, 3]
+    lines: list[str] = stream.getvalue().splitlines()
+    assert lines[0] == f"test_lazy_adapter_defers_functions:{line} anonymous value 4"
+    assert lines[1].endswith(" lazy mapping 6")
+    assert lines[2].endswith(f" anonymous class {int}, object {compute}")